@@ -0,0 +1,126 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Model Artefaktı Benchmark'ı
+============================================================
+Aynı modelleri joblib (.pkl) ve bellek eşlemeli artefakt
+(src/artifact.py) olarak kaydeder ve her biçimi temiz bir
+süreçte yükler:
+
+- disk boyutu
+- yükleme süresi (sayfa önbelleği ısınmışken, süreç başına)
+- yüklemenin sürecin yığınına eklediği anonim bellek (başka
+  süreçlerle paylaşılamaz); eşlenmiş diziler buna girmez, sayfa
+  önbelleğinden okunur ve aynı artefaktı açan süreçlerce paylaşılır
+- ilk tahmin süresi (eşlenmiş sayfalar ilk erişimde okunur)
+
+Son olarak iki biçimin tahminleri karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_artifact.py
+    python benchmarks/bench_artifact.py 60000        # eğitim yorumu sayısı
+"""
+
+import os
+import sys
+import time
+import tempfile
+import multiprocessing
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.preprocessing import normalize_batch
+from src.model import SentimentModel
+from src.spam_detector import SpamDetector
+from src.serve import bellek_olcumu
+from bench_serve import modelleri_hazirla
+
+
+TEKRAR = 3
+
+
+def _dizin_boyutu(yol: str) -> int:
+    """Dosya veya dizin boyutu (bayt)."""
+    if os.path.isdir(yol):
+        return sum(os.path.getsize(os.path.join(yol, ad)) for ad in os.listdir(yol))
+    return os.path.getsize(yol)
+
+
+def _yukleme_olcumu(duygu_yolu: str, spam_yolu: str, yorumlar: List[str], baglanti):
+    """Temiz süreçte iki modeli yükler, süre ve bellek ölçümlerini gönderir."""
+    sys.stdout = open(os.devnull, "w")
+    metinler = normalize_batch(yorumlar)
+    once = bellek_olcumu()
+
+    baslangic = time.perf_counter()
+    duygu_modeli = SentimentModel.load(duygu_yolu)
+    spam_modeli = SpamDetector.load(spam_yolu)
+    yukleme = time.perf_counter() - baslangic
+    sonra = bellek_olcumu()
+
+    baslangic = time.perf_counter()
+    duygu_modeli.predict_proba(metinler)
+    spam_modeli.model_skorlari(metinler)
+    ilk_tahmin = time.perf_counter() - baslangic
+
+    baglanti.send({
+        "yukleme_ms": yukleme * 1000,
+        "anonim_mb": sonra["anonim"] - once["anonim"],
+        "rss_mb": sonra["rss"] - once["rss"],
+        "ilk_tahmin_ms": ilk_tahmin * 1000
+    })
+
+
+def olc(duygu_yolu: str, spam_yolu: str, yorumlar: List[str]) -> Dict[str, float]:
+    """TEKRAR ayrı süreçte ölçer, ortanca değerleri döndürür."""
+    baglam = multiprocessing.get_context("spawn")
+    olcumler = []
+    for _ in range(TEKRAR):
+        ana_uc, isci_ucu = baglam.Pipe()
+        surec = baglam.Process(target=_yukleme_olcumu, args=(duygu_yolu, spam_yolu, yorumlar, isci_ucu))
+        surec.start()
+        olcumler.append(ana_uc.recv())
+        surec.join()
+    return {ad: float(np.median([o[ad] for o in olcumler])) for ad in olcumler[0]}
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MODEL ARTEFAKTI BENCHMARK")
+    print("=" * 60)
+
+    adet = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+
+    with tempfile.TemporaryDirectory() as klasor:
+        duygu_pkl, spam_pkl, yorumlar = modelleri_hazirla(klasor, adet)
+        yorumlar = yorumlar[:256]
+
+        duygu_modeli = SentimentModel.load(duygu_pkl)
+        spam_modeli = SpamDetector.load(spam_pkl)
+        duygu_artefakt = duygu_modeli.save_artifact(os.path.join(klasor, "duygu"))
+        spam_artefakt = spam_modeli.save_artifact(os.path.join(klasor, "spam"))
+
+        print(f"\n  {'biçim':<10} {'disk':>9} {'yükleme':>10} {'anonim':>10} "
+              f"{'RSS':>10} {'ilk tahmin':>11}")
+        for ad, duygu_yolu, spam_yolu in (
+            ("joblib", duygu_pkl, spam_pkl),
+            ("artefakt", duygu_artefakt, spam_artefakt)
+        ):
+            boyut = (_dizin_boyutu(duygu_yolu) + _dizin_boyutu(spam_yolu)) / 2**20
+            sonuc = olc(duygu_yolu, spam_yolu, yorumlar)
+            print(f"  {ad:<10} {boyut:>6.1f} MB {sonuc['yukleme_ms']:>7.1f} ms "
+                  f"{sonuc['anonim_mb']:>7.1f} MB {sonuc['rss_mb']:>7.1f} MB "
+                  f"{sonuc['ilk_tahmin_ms']:>8.1f} ms")
+
+        # Parite: iki biçim aynı tahminleri üretmeli
+        metinler = normalize_batch(yorumlar)
+        duygu_2 = SentimentModel.load(duygu_artefakt)
+        spam_2 = SpamDetector.load(spam_artefakt)
+        duygu_farki = np.abs(duygu_modeli.predict_proba(metinler) - duygu_2.predict_proba(metinler)).max()
+        spam_farki = np.abs(
+            spam_modeli.model_skorlari(metinler)["spam_olasiligi"]
+            - spam_2.model_skorlari(metinler)["spam_olasiligi"]
+        ).max()
+        print(f"\n[BİLGİ] En büyük olasılık farkı: duygu {duygu_farki:.2e}, spam {spam_farki:.2e}")
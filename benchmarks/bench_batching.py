@@ -0,0 +1,102 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Mikro Gruplama Benchmark'ı
+============================================================
+Eşzamanlı iş parçacıklarından gelen tek yorumluk analiz_yap
+isteklerini mikro gruplamalı ve gruplamasız çalıştırır;
+çıktı hızını, p50/p99 gecikmeyi ve toplayıcı ölçümlerini
+(grup boyutu, bekleme süresi) raporlar.
+
+Kullanım:
+    python benchmarks/bench_batching.py
+    python benchmarks/bench_batching.py 32 200      # iş parçacığı, iş parçacığı başına istek
+"""
+
+import os
+import sys
+import time
+import random
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.preprocessing import normalize_batch
+from src.model import SentimentModel
+from src.spam_detector import SpamDetector
+from src.analysis import YorumAnalizcisi
+from bench_preprocessing import sentetik_yorumlar
+
+
+# ============================================================
+# HAZIRLIK
+# ============================================================
+
+def modelleri_hazirla():
+    """Sentetik veriyle duygu ve spam modellerini eğitir."""
+    ham = sentetik_yorumlar(20000, tohum=7)
+    metinler = normalize_batch(ham)
+    rastgele = random.Random(7)
+    duygu_modeli = SentimentModel().fit(metinler, [rastgele.randint(0, 2) for _ in metinler])
+    spam_modeli = SpamDetector()
+    spam_modeli.fit(ham, metinler)
+    return duygu_modeli, spam_modeli
+
+
+def yuk_uret(analizci: YorumAnalizcisi, yorumlar: List[str], is_parcacigi: int, adet: int) -> np.ndarray:
+    """`is_parcacigi` iş parçacığının her biri `adet` istek gönderir; gecikmeleri döndürür."""
+    gecikmeler: List[List[float]] = [[] for _ in range(is_parcacigi)]
+
+    def calis(k: int):
+        rastgele = random.Random(k)
+        for _ in range(adet):
+            yorum = rastgele.choice(yorumlar)
+            baslangic = time.perf_counter()
+            analizci.analiz_yap(yorum)
+            gecikmeler[k].append(time.perf_counter() - baslangic)
+
+    iscilar = [threading.Thread(target=calis, args=(k,)) for k in range(is_parcacigi)]
+    for isci in iscilar:
+        isci.start()
+    for isci in iscilar:
+        isci.join()
+    return np.concatenate([np.array(g) for g in gecikmeler])
+
+
+def olc(ad: str, analizci: YorumAnalizcisi, yorumlar: List[str], is_parcacigi: int, adet: int,
+        max_wait_ms: Optional[float] = None):
+    """Bir yapılandırmayı çalıştırır ve tek satırlık özet yazdırır."""
+    if max_wait_ms is not None:
+        analizci.mikro_gruplamayi_baslat(max_wait_ms=max_wait_ms)
+
+    baslangic = time.perf_counter()
+    gecikmeler = yuk_uret(analizci, yorumlar, is_parcacigi, adet)
+    sure = time.perf_counter() - baslangic
+
+    p50, p99 = np.percentile(gecikmeler, [50, 99]) * 1e3
+    satir = f"  {ad:<22} {len(gecikmeler) / sure:>8.0f} istek/sn   p50: {p50:>7.2f} ms   p99: {p99:>7.2f} ms"
+    if analizci.toplayici is not None:
+        stats = analizci.toplayici.stats()
+        satir += f"   ort. grup: {stats['ortalama_grup']:>5.1f}   bekleme p99: {stats['bekleme_ms']['p99']:.2f} ms"
+        analizci.kapat()
+    print(satir)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MİKRO GRUPLAMA BENCHMARK")
+    print("=" * 60)
+
+    is_parcacigi = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    adet = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    duygu_modeli, spam_modeli = modelleri_hazirla()
+    yorumlar = sentetik_yorumlar(5000, tohum=11)
+    print(f"\n[BİLGİ] {is_parcacigi} iş parçacığı x {adet} istek\n")
+
+    olc("gruplamasız", YorumAnalizcisi(duygu_modeli, spam_modeli), yorumlar, is_parcacigi, adet)
+    for bekleme in (1, 2, 5, 10):
+        olc(f"mikro grup ({bekleme} ms)", YorumAnalizcisi(duygu_modeli, spam_modeli),
+            yorumlar, is_parcacigi, adet, max_wait_ms=bekleme)
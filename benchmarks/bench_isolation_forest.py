@@ -0,0 +1,120 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - IsolationForest Benchmark'ı
+============================================================
+SpamDetector'ın IsolationForest'ını farklı TruncatedSVD izdüşüm
+boyutlarında eğitir ve ham seyrek TF-IDF üzerinde eğitilmiş
+ormanla karşılaştırır:
+
+- eğitim süresi (SVD + orman)
+- toplu çıkarım süresi (sklearn) ve tek yorum p50 gecikmesi
+  (derlenmiş orman, izdüşüm dahil)
+- ham TF-IDF ormanıyla uyum: anomali kümelerinin Jaccard
+  benzerliği ve skorların Spearman sıra korelasyonu
+- kararlılık: aynı girdide yalnızca tohumu farklı iki ormanın
+  anomali kümelerinin Jaccard benzerliği. Ham seyrek TF-IDF'de
+  ağaçlar çoğunlukla sıfır sütunlarda bölündüğü için bu değer
+  düşüktür; ham ormanla uyum bu tavanla birlikte okunmalıdır.
+
+Kullanım:
+    python benchmarks/bench_isolation_forest.py
+    python benchmarks/bench_isolation_forest.py data/TRSAv1.csv 50000
+"""
+
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+from scipy.stats import spearmanr
+from sklearn.decomposition import TruncatedSVD
+from sklearn.ensemble import IsolationForest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ISOLATION_FOREST_CONFIG, SPAM_TFIDF_CONFIG, RANDOM_SEED
+from src.anomaly import DerlenmisOrman
+from src.preprocessing import normalize_batch, akilli_csv_oku, metin_sutunu_bul
+from bench_preprocessing import sentetik_yorumlar
+
+
+# 0 = ham seyrek TF-IDF
+BOYUTLAR = [0, 8, 16, 32, 64, 128]
+
+
+def metinleri_hazirla() -> List[str]:
+    """Komut satırında CSV verilmişse onu, yoksa sentetik yorumları kullanır."""
+    adet = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    if len(sys.argv) > 1:
+        df = akilli_csv_oku(sys.argv[1])
+        ham = df[metin_sutunu_bul(df)].astype(str).tolist()[:adet]
+    else:
+        ham = sentetik_yorumlar(adet, tohum=3)
+    return normalize_batch(ham)
+
+
+def tek_gecikme_us(svd, orman: DerlenmisOrman, matris, adet: int = 300) -> float:
+    """Tek satırlık izdüşüm + derlenmiş orman skorunun p50 gecikmesi (µs)."""
+    sureler = np.empty(adet)
+    for i in range(adet):
+        satir = matris[i:i + 1]
+        baslangic = time.perf_counter()
+        girdi = np.asarray(satir @ svd.components_.T, dtype=np.float32) if svd is not None else satir
+        orman.skorlar(girdi)
+        sureler[i] = time.perf_counter() - baslangic
+    return float(np.percentile(sureler, 50) * 1e6)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ISOLATION FOREST İZDÜŞÜM BENCHMARK")
+    print("=" * 60)
+
+    metinler = metinleri_hazirla()
+    matris = TfidfVectorizer(**SPAM_TFIDF_CONFIG).fit_transform(metinler)
+    print(f"[BİLGİ] {matris.shape[0]:,} yorum, {matris.shape[1]:,} TF-IDF sütunu\n")
+
+    print(f"  {'boyut':>6} {'svd sn':>8} {'orman sn':>9} {'toplu sn':>9} "
+          f"{'tek µs':>8} {'jaccard':>8} {'spearman':>9} {'kararlılık':>11}")
+
+    referans_skor = None
+    referans_anomali = None
+    for boyut in BOYUTLAR:
+        baslangic = time.perf_counter()
+        if boyut:
+            svd = TruncatedSVD(n_components=boyut, random_state=RANDOM_SEED)
+            girdi = svd.fit_transform(matris).astype(np.float32)
+        else:
+            svd, girdi = None, matris
+        svd_suresi = time.perf_counter() - baslangic
+
+        baslangic = time.perf_counter()
+        orman = IsolationForest(**ISOLATION_FOREST_CONFIG).fit(girdi)
+        orman_suresi = time.perf_counter() - baslangic
+
+        baslangic = time.perf_counter()
+        skorlar = -orman.score_samples(girdi)
+        toplu_suresi = time.perf_counter() - baslangic
+
+        derlenmis = DerlenmisOrman.from_forest(orman)
+        tek = tek_gecikme_us(svd, derlenmis, matris)
+        anomali = skorlar > derlenmis.esik
+
+        if referans_skor is None:
+            referans_skor, referans_anomali = skorlar, anomali
+        birlesim = (anomali | referans_anomali).sum()
+        jaccard = (anomali & referans_anomali).sum() / birlesim if birlesim else 1.0
+        spearman = spearmanr(skorlar, referans_skor).statistic
+
+        ayarlar = dict(ISOLATION_FOREST_CONFIG, random_state=RANDOM_SEED + 1)
+        ikinci = IsolationForest(**ayarlar).fit(girdi).predict(girdi) == -1
+        kararlilik = (anomali & ikinci).sum() / max(1, (anomali | ikinci).sum())
+
+        ad = "ham" if boyut == 0 else str(boyut)
+        print(f"  {ad:>6} {svd_suresi:>8.2f} {orman_suresi:>9.2f} {toplu_suresi:>9.2f} "
+              f"{tek:>8.1f} {jaccard:>8.3f} {spearman:>9.3f} {kararlilik:>11.3f}")
+
+    print("\n[BİLGİ] jaccard/spearman ham seyrek TF-IDF ormanına göredir;"
+          " kararlılık farklı tohumlu iki ormanın uyumudur.")
@@ -0,0 +1,135 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Normalizasyon Benchmark'ı
+============================================================
+Eski (her çağrıda derlenen beş re.sub + ayrı tokenizasyon) normalizasyon
+ile derlenmiş/birleşik geçişli yeni yolu karşılaştırır, saniyedeki
+belge sayısını raporlar ve çıktıların birebir aynı olduğunu doğrular.
+
+Kullanım:
+    python benchmarks/bench_preprocessing.py
+    python benchmarks/bench_preprocessing.py data/TRSAv1.csv 50000
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import unicodedata
+from typing import List
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import preprocessing
+from src.preprocessing import (
+    turkce_metin_normalize_et,
+    normalize_batch,
+    akilli_csv_oku,
+    metin_sutunu_bul
+)
+
+
+# ============================================================
+# ESKİ UYGULAMA (KARŞILAŞTIRMA İÇİN)
+# ============================================================
+
+def eski_normalize_et(metin: str, stemming_uygula: bool = True) -> str:
+    """v1.0.0 normalizasyonunun birebir kopyası."""
+    if not isinstance(metin, str):
+        metin = "" if pd.isna(metin) else str(metin)
+    
+    sonuc = unicodedata.normalize("NFKC", metin).strip().lower()
+    sonuc = re.sub(r"(https?://\S+|www\.\S+)", " <url> ", sonuc)
+    sonuc = re.sub(r"\b[\w\.-]+@[\w\.-]+\.\w+\b", " <email> ", sonuc)
+    sonuc = re.sub(r"\b(\+?90)?\s?(\(?\d{3}\)?)\s?\d{3}\s?\d{2}\s?\d{2}\b", " <phone> ", sonuc)
+    sonuc = re.sub(r"(.)\1{2,}", r"\1\1", sonuc)
+    sonuc = re.sub(r"\s+", " ", sonuc).strip()
+    
+    stemmer = preprocessing.stemmer
+    if stemming_uygula and sonuc and preprocessing.STEMMER_AVAILABLE and stemmer is not None:
+        kokler = []
+        for kelime in sonuc.split():
+            if kelime.startswith("<") and kelime.endswith(">"):
+                kokler.append(kelime)
+            else:
+                try:
+                    kok = stemmer.stem(kelime)
+                    kokler.append(kok if kok else kelime)
+                except Exception:
+                    kokler.append(kelime)
+        sonuc = " ".join(kokler)
+    
+    return sonuc
+
+
+# ============================================================
+# VERİ
+# ============================================================
+
+ORNEK_PARCALAR = [
+    "Kargo çok hızlı geldi", "paketleme özenliydi", "ürün beklediğim gibi",
+    "HARIKA BİR ÜRÜN!!!", "fiyatına göre idare eder", "satıcı çok ilgiliydi",
+    "kutu yırtık geldi, iade ettim", "çoooook güzel 😍😍😍",
+    "detaylar için www.indirim.com", "bana yazın: satis@magaza.com",
+    "bilgi: 0532 123 45 67", "kalitesi berbat, asla almayın",
+    "tavsiye ederim", "3 gün içinde teslim edildi", "beden tam oldu",
+]
+
+
+def sentetik_yorumlar(adet: int, tohum: int = 42) -> List[str]:
+    """Gerçek veri yoksa tekrarlı, karışık uzunlukta yorumlar üretir."""
+    rastgele = random.Random(tohum)
+    return [
+        ". ".join(rastgele.choices(ORNEK_PARCALAR, k=rastgele.randint(1, 6)))
+        for _ in range(adet)
+    ]
+
+
+def yorumlari_yukle() -> List[str]:
+    """Komut satırında CSV verilmişse onu, yoksa sentetik veriyi kullanır."""
+    adet = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    if len(sys.argv) > 1:
+        veri = akilli_csv_oku(sys.argv[1])
+        sutun = metin_sutunu_bul(veri)
+        if sutun is None:
+            raise ValueError("Metin sütunu bulunamadı!")
+        return veri[sutun].astype(str).head(adet).tolist()
+    return sentetik_yorumlar(adet)
+
+
+# ============================================================
+# ÖLÇÜM
+# ============================================================
+
+def olc(ad: str, fonksiyon, metinler: List[str]) -> List[str]:
+    """Fonksiyonu çalıştırır ve belge/saniye yazdırır."""
+    baslangic = time.perf_counter()
+    sonuc = fonksiyon(metinler)
+    gecen_sure = time.perf_counter() - baslangic
+    print(f"  {ad:<32} {len(metinler) / gecen_sure:>12,.0f} belge/sn  ({gecen_sure:.2f} sn)")
+    return sonuc
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("NORMALİZASYON BENCHMARK")
+    print("=" * 60)
+    
+    metinler = yorumlari_yukle()
+    print(f"[BİLGİ] {len(metinler):,} yorum, stemmer: {preprocessing.STEMMER_AVAILABLE}\n")
+    
+    for stemming in (True, False):
+        print(f"--- stemming_uygula={stemming} ---")
+        preprocessing.stem_cache.clear()
+        eski = olc("Eski (Series.apply)", lambda m: pd.Series(m).apply(eski_normalize_et, args=(stemming,)).tolist(), metinler)
+        tekli = olc("Yeni tekli (turkce_metin_...)", lambda m: [turkce_metin_normalize_et(x, stemming) for x in m], metinler)
+        toplu = olc("Yeni toplu (normalize_batch)", lambda m: normalize_batch(m, stemming), metinler)
+        
+        farkli = sum(1 for a, b, c in zip(eski, tekli, toplu) if not (a == b == c))
+        print(f"[{'OK' if farkli == 0 else 'HATA'}] Farklı çıktı sayısı: {farkli}")
+        if stemming:
+            print(f"[BİLGİ] Kök önbelleği: {preprocessing.kok_onbellegi_istatistikleri()}")
+        print()
@@ -0,0 +1,77 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Skorlayıcı Benchmark'ı
+============================================================
+Tek yorumluk isteklerde SentimentModel Pipeline'ı
+(predict + predict_proba) ile derlenmiş LinearScorer'ı
+karşılaştırır; p50/p99 gecikmeyi raporlar ve olasılıkların
+Pipeline ile sayısal olarak aynı olduğunu doğrular.
+
+Kullanım:
+    python benchmarks/bench_scorer.py
+    python benchmarks/bench_scorer.py models/sentiment_model.pkl 2000
+"""
+
+import os
+import sys
+import time
+import random
+from typing import Callable, List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.preprocessing import normalize_batch
+from src.model import SentimentModel
+from src.scorer import LinearScorer, parite_kontrolu
+from bench_preprocessing import sentetik_yorumlar
+
+
+# ============================================================
+# HAZIRLIK
+# ============================================================
+
+def model_hazirla() -> SentimentModel:
+    """Komut satırında model verilmişse onu yükler, yoksa sentetik veriyle eğitir."""
+    if len(sys.argv) > 1:
+        return SentimentModel.load(sys.argv[1])
+
+    metinler = normalize_batch(sentetik_yorumlar(20000, tohum=7))
+    rastgele = random.Random(7)
+    etiketler = [rastgele.randint(0, 2) for _ in metinler]
+    return SentimentModel().fit(metinler, etiketler)
+
+
+def gecikme_olc(ad: str, fonksiyon: Callable[[str], object], metinler: List[str]):
+    """Her metni tek tek işler ve p50/p99 gecikmeyi yazdırır."""
+    sureler = np.empty(len(metinler))
+    for i, metin in enumerate(metinler):
+        baslangic = time.perf_counter()
+        fonksiyon(metin)
+        sureler[i] = time.perf_counter() - baslangic
+
+    p50, p99 = np.percentile(sureler, [50, 99]) * 1e6
+    print(f"  {ad:<34} p50: {p50:>8.1f} µs   p99: {p99:>8.1f} µs")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SKORLAYICI BENCHMARK")
+    print("=" * 60)
+
+    model = model_hazirla()
+    adet = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    metinler = normalize_batch(sentetik_yorumlar(adet, tohum=11))
+
+    baslangic = time.perf_counter()
+    skorlayici = LinearScorer.from_model(model)
+    print(f"[BİLGİ] Skorlayıcı derlendi ({time.perf_counter() - baslangic:.2f} sn, "
+          f"{len(skorlayici.agirliklar):,} ağırlık satırı)\n")
+
+    gecikme_olc("Pipeline (predict + predict_proba)",
+                lambda m: (model.predict([m]), model.predict_proba([m])), metinler)
+    gecikme_olc("LinearScorer.skorla", skorlayici.skorla, metinler)
+
+    fark = parite_kontrolu(model, metinler, skorlayici)
+    print(f"\n[OK] Parite: en büyük olasılık farkı {fark:.2e}")
@@ -0,0 +1,200 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Çok İşçili Bellek Benchmark'ı
+============================================================
+Büyük sözlüklü bir duygu modeliyle N işçinin bellek kullanımını
+üç senaryoda karşılaştırır:
+
+- bağımsız: her işçi modelleri kendisi yükler (N ayrı süreç)
+- ön-çatallı: modeller ana süreçte yüklenir, işçiler os.fork()
+  ile başlar (src/serve.py), gc.freeze() yok
+- ön-çatallı + gc.freeze: paylasima_hazirla() ile
+
+Her işçi aynı yükü çalıştırır, ardından uzun süre çalışan bir
+işçide kaçınılmaz olan tam GC taramasını (gc.collect) yapar ve
+kendi USS/PSS değerini ölçer. Toplam PSS, node'daki gerçek
+kullanımdır.
+
+Kullanım:
+    python benchmarks/bench_serve.py
+    python benchmarks/bench_serve.py 4 60000        # işçi sayısı, eğitim yorumu
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import random
+import tempfile
+import multiprocessing
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.preprocessing import normalize_batch
+from src.model import SentimentModel
+from src.spam_detector import SpamDetector
+from src.analysis import YorumAnalizcisi
+from src.serve import bellek_olcumu, paylasima_hazirla
+from bench_preprocessing import sentetik_yorumlar
+
+
+HECELER = ["ka", "ra", "te", "li", "mu", "so", "ne", "da", "bi", "ol", "ur", "an", "es", "ki", "ya", "gu"]
+
+
+# ============================================================
+# HAZIRLIK
+# ============================================================
+
+def buyuk_sozluklu_yorumlar(adet: int, kelime_sayisi: int = 40000, tohum: int = 3) -> List[str]:
+    """
+    Gerçek veriye benzer büyüklükte sözlük üreten sentetik yorumlar.
+
+    Kelimeler hecelerden üretilir ve Zipf dağılımıyla seçilir; bigramlarla
+    birlikte sözlük yüz binlerce terime ulaşır.
+    """
+    rastgele = random.Random(tohum)
+    kelimeler = list({
+        "".join(rastgele.choices(HECELER, k=rastgele.randint(2, 5))) for _ in range(kelime_sayisi * 2)
+    })[:kelime_sayisi]
+    agirliklar = 1.0 / np.arange(1, len(kelimeler) + 1)
+    agirliklar /= agirliklar.sum()
+    secim = np.random.default_rng(tohum)
+    kaliplar = sentetik_yorumlar(adet, tohum=tohum)
+    return [
+        kalip + " " + " ".join(secim.choice(kelimeler, size=secim.integers(5, 25), p=agirliklar))
+        for kalip in kaliplar
+    ]
+
+
+def modelleri_hazirla(klasor: str, adet: int) -> Tuple[str, str, List[str]]:
+    """Modelleri eğitip klasöre kaydeder; (duygu yolu, spam yolu, örnek yorumlar) döndürür."""
+    ham = buyuk_sozluklu_yorumlar(adet)
+    metinler = normalize_batch(ham)
+    rastgele = random.Random(7)
+    duygu_modeli = SentimentModel().fit(metinler, [rastgele.randint(0, 2) for _ in metinler])
+    spam_modeli = SpamDetector()
+    spam_modeli.fit(ham, metinler)
+
+    duygu_yolu = os.path.join(klasor, "duygu.pkl")
+    spam_yolu = os.path.join(klasor, "spam.pkl")
+    duygu_modeli.save(duygu_yolu)
+    spam_modeli.save(spam_yolu)
+    sozluk = len(duygu_modeli.pipeline.named_steps["tfidf"].vocabulary_)
+    print(f"\n[BİLGİ] Duygu sözlüğü: {sozluk:,} terim, model dosyası: "
+          f"{os.path.getsize(duygu_yolu) / 2**20:.1f} MB\n")
+    return duygu_yolu, spam_yolu, ham[:5000]
+
+
+def analizci_yukle(duygu_yolu: str, spam_yolu: str) -> YorumAnalizcisi:
+    """Ölçüm için tekrar sayacı, önbellek ve mikro gruplama olmadan yükler."""
+    return YorumAnalizcisi.yukle(duygu_yolu, spam_yolu, tekrar_sayaci=False,
+                                 mikro_gruplama=False, onbellek=False)
+
+
+def yuk_calistir(analizci: YorumAnalizcisi, yorumlar: List[str]):
+    """Tek yorumluk ve toplu istekler; ardından tam GC taraması."""
+    for yorum in yorumlar[:1000]:
+        analizci.analiz_kayitlari([yorum])
+    for bas in range(0, len(yorumlar), 64):
+        analizci.analiz_kayitlari(yorumlar[bas:bas + 64])
+    gc.collect()
+
+
+# ============================================================
+# SENARYOLAR
+# ============================================================
+
+def _bagimsiz_isci(duygu_yolu: str, spam_yolu: str, yorumlar: List[str], baglanti):
+    """Bağımsız işçi: modelleri kendisi yükler."""
+    sys.stdout = open(os.devnull, "w")
+    analizci = analizci_yukle(duygu_yolu, spam_yolu)
+    yuk_calistir(analizci, yorumlar)
+    baglanti.send(bellek_olcumu())
+    baglanti.recv()
+
+
+def bagimsiz(duygu_yolu: str, spam_yolu: str, yorumlar: List[str], isci: int) -> List[Dict[str, float]]:
+    """N ayrı süreç (spawn) başlatır, ölçümleri toplar."""
+    baglam = multiprocessing.get_context("spawn")
+    surecler, baglantilar = [], []
+    for _ in range(isci):
+        ana_uc, isci_ucu = baglam.Pipe()
+        surec = baglam.Process(target=_bagimsiz_isci, args=(duygu_yolu, spam_yolu, yorumlar, isci_ucu))
+        surec.start()
+        surecler.append(surec)
+        baglantilar.append(ana_uc)
+    olcumler = [b.recv() for b in baglantilar]
+    for b in baglantilar:
+        b.send("bitti")
+    for surec in surecler:
+        surec.join()
+    return olcumler
+
+
+def on_catalli(analizci: YorumAnalizcisi, yorumlar: List[str], isci: int) -> List[Dict[str, float]]:
+    """Yüklü analizciyi N kez çatallar; her işçi yükü çalıştırıp ölçer."""
+    olcumler, pidler, okuma_uclari, yazma_uclari = [], [], [], []
+    for _ in range(isci):
+        olcum_r, olcum_w = os.pipe()
+        devam_r, devam_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(olcum_r)
+            os.close(devam_w)
+            yuk_calistir(analizci, yorumlar)
+            os.write(olcum_w, json.dumps(bellek_olcumu()).encode())
+            os.read(devam_r, 1)
+            os._exit(0)
+        os.close(olcum_w)
+        os.close(devam_r)
+        pidler.append(pid)
+        okuma_uclari.append(olcum_r)
+        yazma_uclari.append(devam_w)
+
+    for uc in okuma_uclari:
+        olcumler.append(json.loads(os.read(uc, 4096).decode()))
+        os.close(uc)
+    for uc in yazma_uclari:
+        os.write(uc, b"x")
+        os.close(uc)
+    for pid in pidler:
+        os.waitpid(pid, 0)
+    return olcumler
+
+
+def yazdir(ad: str, ana: Dict[str, float], olcumler: List[Dict[str, float]]):
+    """Senaryo özeti: işçi başına USS/PSS ve node toplamı."""
+    uss = np.mean([o["uss"] for o in olcumler])
+    pss = np.mean([o["pss"] for o in olcumler])
+    toplam = sum(o["pss"] for o in olcumler) + (ana["pss"] if ana else 0.0)
+    print(f"  {ad:<26} işçi USS: {uss:>7.1f} MB   işçi PSS: {pss:>7.1f} MB   "
+          f"toplam PSS: {toplam:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ÇOK İŞÇİLİ BELLEK BENCHMARK")
+    print("=" * 60)
+
+    isci = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    adet = int(sys.argv[2]) if len(sys.argv) > 2 else 60000
+
+    with tempfile.TemporaryDirectory() as klasor:
+        duygu_yolu, spam_yolu, yorumlar = modelleri_hazirla(klasor, adet)
+        print(f"[BİLGİ] {isci} işçi, işçi başına {len(yorumlar):,} yorumluk yük\n")
+
+        yazdir("bağımsız", {}, bagimsiz(duygu_yolu, spam_yolu, yorumlar, isci))
+
+        baslangic = time.perf_counter()
+        analizci = analizci_yukle(duygu_yolu, spam_yolu)
+        print(f"  (ana süreçte yükleme: {time.perf_counter() - baslangic:.2f} sn)")
+        paylasima_hazirla(analizci, gc_dondur=False)
+        yazdir("ön-çatallı", bellek_olcumu(), on_catalli(analizci, yorumlar, isci))
+
+        gc.collect()
+        gc.freeze()
+        yazdir("ön-çatallı + gc.freeze", bellek_olcumu(), on_catalli(analizci, yorumlar, isci))
@@ -0,0 +1,79 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Tek Yorum Benchmark'ı
+============================================================
+Tek yorumluk duygu skorunu üç yoldan ölçer: toplu yoldan önceki
+analiz_yap adımları (normalize + ortak n-gram + LinearScorer),
+küçük grupta da Pipeline'a düşen toplu yol ve güncel
+analiz_kayitlari. p50/p99 gecikmeyi ve eski yola göre en büyük
+olasılık farkını raporlar; tam analiz_yap gecikmesi de yazdırılır.
+
+Kullanım:
+    python benchmarks/bench_single_review.py
+    python benchmarks/bench_single_review.py 5000     # yorum sayısı
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.preprocessing import turkce_metin_normalize_et
+from src.analysis import YorumAnalizcisi
+from bench_preprocessing import sentetik_yorumlar
+from bench_batching import modelleri_hazirla
+from bench_scorer import gecikme_olc
+
+
+# ============================================================
+# YOLLAR
+# ============================================================
+
+def eski_tek_yorum(analizci: YorumAnalizcisi, yorum: str) -> np.ndarray:
+    """Toplu yoldan önceki analiz_yap duygu adımları."""
+    normalize = turkce_metin_normalize_et(yorum)
+    paket = analizci.ozellik_cikarici.donustur([normalize], ngram_dondur=True)
+    return analizci.duygu_skorlayici.skorla(normalize, paket["ngramlar"]["duygu"][0])[1]
+
+
+def toplu_tek_yorum(analizci: YorumAnalizcisi, yorum: str) -> np.ndarray:
+    """analiz_kayitlari ile tek yorumun duygu olasılıkları."""
+    kayit = analizci.analiz_kayitlari([yorum], spam=False, aspekt=False)[0]
+    return np.array(list(kayit["duygu"]["olasiliklar"].values()))
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEK YORUM BENCHMARK")
+    print("=" * 60)
+
+    adet = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    duygu_modeli, spam_modeli = modelleri_hazirla()
+    yorumlar = sentetik_yorumlar(adet, tohum=11)
+
+    analizci = YorumAnalizcisi(duygu_modeli=duygu_modeli, spam_modeli=spam_modeli)
+    # Skorlayıcısız kopya: küçük grubu da Pipeline ile skorlar
+    pipeline_analizcisi = YorumAnalizcisi(duygu_modeli=duygu_modeli, spam_modeli=spam_modeli)
+    pipeline_analizcisi.duygu_skorlayici = None
+
+    for yorum in yorumlar[:50]:
+        analizci.analiz_yap(yorum)
+        pipeline_analizcisi.analiz_yap(yorum)
+    print()
+
+    gecikme_olc("Eski tek yorum (LinearScorer)", lambda y: eski_tek_yorum(analizci, y), yorumlar)
+    gecikme_olc("analiz_kayitlari (Pipeline)", lambda y: toplu_tek_yorum(pipeline_analizcisi, y), yorumlar)
+    gecikme_olc("analiz_kayitlari (LinearScorer)", lambda y: toplu_tek_yorum(analizci, y), yorumlar)
+    gecikme_olc("analiz_yap (tam)", analizci.analiz_yap, yorumlar)
+
+    fark = max(
+        float(np.abs(toplu_tek_yorum(analizci, yorum) - eski_tek_yorum(analizci, yorum)).max())
+        for yorum in yorumlar
+    )
+    print(f"\n[OK] Parite: eski tek yorum yoluna göre en büyük olasılık farkı {fark:.2e}")
+
+    analizci.kapat()
+    pipeline_analizcisi.kapat()
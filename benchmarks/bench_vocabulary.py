@@ -0,0 +1,179 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Kompakt Sözlük Benchmark'ı
+============================================================
+Büyük sözlüklü bir duygu modelinde TfidfVectorizer.vocabulary_
+Python sözlüğünü src/vocabulary.py KompaktSozluk ile karşılaştırır:
+
+- bellek: sözlüğün sürecin yığınına eklediği anonim bellek (temiz
+  süreçte, diziler artefakttaki gibi .npy'den bellek eşlemesiyle);
+  eşlenmiş diziler sayfa önbelleğinden okunur, süreçlerce paylaşılır
+- arama hızı: ayrılmış yorumların n-gram'ları için arama başına ns
+  (sözlükte olan / olmayan ayrı)
+- uçtan uca: LinearScorer tek yorum p50 ve Pipeline predict_proba
+  toplu çıktı hızı
+
+Son olarak tüm n-gram indekslerinin ve transform() çıktısının
+sözlükle birebir aynı olduğu doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_vocabulary.py
+    python benchmarks/bench_vocabulary.py 120000     # eğitim yorumu sayısı
+"""
+
+import os
+import gc
+import sys
+import time
+import random
+import tempfile
+import multiprocessing
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.preprocessing import normalize_batch
+from src.model import SentimentModel
+from src.scorer import LinearScorer
+from src.vocabulary import KompaktSozluk, terim_tablosu, yuva_tablosu
+from src.serve import bellek_olcumu
+from bench_serve import buyuk_sozluklu_yorumlar
+
+
+# ============================================================
+# BELLEK
+# ============================================================
+
+DIZILER = ("baytlar", "ofsetler", "indeksler", "yuvalar", "idf")
+
+
+def dizileri_yaz(klasor: str, sozluk: Dict[str, int], idf: np.ndarray):
+    """Sözlük dizilerini artefakttaki gibi .npy olarak yazar."""
+    baytlar, ofsetler, indeksler = terim_tablosu(sozluk)
+    degerler = (baytlar, ofsetler, indeksler, yuva_tablosu(baytlar, ofsetler), idf)
+    for ad, deger in zip(DIZILER, degerler):
+        np.save(os.path.join(klasor, f"{ad}.npy"), deger, allow_pickle=False)
+
+
+def _bellek_olcumu(yol: str, bicim: str, baglanti):
+    """Temiz süreçte sözlüğü kurar, eklediği bellek ve kurulum süresini gönderir."""
+    sys.stdout = open(os.devnull, "w")
+    diziler = {ad: np.load(os.path.join(yol, f"{ad}.npy"), mmap_mode="r") for ad in DIZILER}
+    gc.collect()
+    once = bellek_olcumu()
+
+    baslangic = time.perf_counter()
+    kompakt = KompaktSozluk(diziler["baytlar"], diziler["ofsetler"], diziler["indeksler"], diziler["yuvalar"])
+    if bicim == "dict":
+        sozluk = dict(kompakt.items())
+        del kompakt
+    elif bicim == "kompakt + katmanlar":
+        sozluk = kompakt.hizlandir(diziler["idf"])
+    else:
+        sozluk = kompakt
+    kurulum = time.perf_counter() - baslangic
+    gc.collect()
+    sonra = bellek_olcumu()
+
+    baglanti.send({
+        "kurulum_ms": kurulum * 1000,
+        "anonim_mb": sonra["anonim"] - once["anonim"],
+        "terim": len(sozluk)
+    })
+
+
+def bellek_karsilastir(yol: str):
+    """Her biçimi ayrı bir süreçte (spawn) ölçer."""
+    baglam = multiprocessing.get_context("spawn")
+    print(f"\n  {'biçim':<22} {'kurulum':>10} {'anonim bellek':>14} {'terim başına':>13}")
+    for bicim in ("dict", "kompakt", "kompakt + katmanlar"):
+        ana_uc, isci_ucu = baglam.Pipe()
+        surec = baglam.Process(target=_bellek_olcumu, args=(yol, bicim, isci_ucu))
+        surec.start()
+        sonuc = ana_uc.recv()
+        surec.join()
+        bayt = sonuc["anonim_mb"] * 2**20 / sonuc["terim"]
+        print(f"  {bicim:<22} {sonuc['kurulum_ms']:>7.1f} ms {sonuc['anonim_mb']:>11.1f} MB "
+              f"{bayt:>10.0f} B")
+
+
+# ============================================================
+# HIZ
+# ============================================================
+
+def arama_olc(sozluk, ngramlar: List[str]) -> float:
+    """Arama başına ortalama ns (en iyi 3 tekrar)."""
+    get = sozluk.get
+    sureler = []
+    for _ in range(3):
+        baslangic = time.perf_counter()
+        for ngram in ngramlar:
+            get(ngram)
+        sureler.append(time.perf_counter() - baslangic)
+    return min(sureler) / max(len(ngramlar), 1) * 1e9
+
+
+def gecikme_p50(fonksiyon: Callable[[str], object], metinler: List[str]) -> float:
+    """Tek tek işlenen metinlerde p50 gecikme (µs)."""
+    sureler = np.empty(len(metinler))
+    for i, metin in enumerate(metinler):
+        baslangic = time.perf_counter()
+        fonksiyon(metin)
+        sureler[i] = time.perf_counter() - baslangic
+    return float(np.percentile(sureler, 50) * 1e6)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("KOMPAKT SÖZLÜK BENCHMARK")
+    print("=" * 60)
+
+    adet = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+
+    metinler = normalize_batch(buyuk_sozluklu_yorumlar(adet))
+    rastgele = random.Random(7)
+    model = SentimentModel().fit(metinler, [rastgele.randint(0, 2) for _ in metinler])
+    tfidf = model.pipeline.named_steps["tfidf"]
+    sozluk = tfidf.vocabulary_
+    print(f"\n[BİLGİ] Sözlük: {len(sozluk):,} terim")
+
+    with tempfile.TemporaryDirectory() as klasor:
+        dizileri_yaz(klasor, sozluk, tfidf.idf_)
+        bellek_karsilastir(klasor)
+
+    # Arama hızı: ayrılmış yorumların n-gram'ları
+    ayrilmis = normalize_batch(buyuk_sozluklu_yorumlar(3000, tohum=11))
+    analizor = tfidf.build_analyzer()
+    ngramlar = [ngram for metin in ayrilmis for ngram in analizor(metin)]
+    olanlar = [n for n in ngramlar if n in sozluk]
+    olmayanlar = [n for n in ngramlar if n not in sozluk]
+    print(f"\n[BİLGİ] {len(ngramlar):,} n-gram, sözlükte olan: %{100 * len(olanlar) / len(ngramlar):.1f}")
+
+    katmansiz = KompaktSozluk.sozlukten(sozluk)
+    kompakt = KompaktSozluk.sozlukten(sozluk).hizlandir(tfidf.idf_)
+    print(f"\n  {'arama (ns)':<22} {'tümü':>8} {'olan':>8} {'olmayan':>8}")
+    for ad, yapi in (("dict", sozluk), ("kompakt", katmansiz), ("kompakt + katmanlar", kompakt)):
+        print(f"  {ad:<22} {arama_olc(yapi, ngramlar):>8.0f} {arama_olc(yapi, olanlar):>8.0f} "
+              f"{arama_olc(yapi, olmayanlar):>8.0f}")
+
+    # Uçtan uca: aynı model, yalnızca vocabulary_ değişir
+    tek = ayrilmis[:2000]
+    print(f"\n  {'uçtan uca':<22} {'skorlayıcı p50':>15} {'predict_proba':>16}")
+    for ad, yapi in (("dict", sozluk), ("kompakt + katmanlar", kompakt)):
+        tfidf.vocabulary_ = yapi
+        skorlayici = LinearScorer.from_model(model)
+        p50 = gecikme_p50(skorlayici.karar_skorlari, tek)
+        baslangic = time.perf_counter()
+        model.predict_proba(ayrilmis)
+        toplu = len(ayrilmis) / (time.perf_counter() - baslangic)
+        print(f"  {ad:<22} {p50:>12.1f} µs {toplu:>11,.0f} yorum/sn")
+
+    # Parite: indeksler ve transform() çıktısı birebir aynı olmalı
+    tfidf.vocabulary_ = sozluk
+    X_sozluk = tfidf.transform(ayrilmis)
+    tfidf.vocabulary_ = kompakt
+    X_kompakt = tfidf.transform(ayrilmis)
+    farkli = sum(sozluk.get(n) != kompakt.get(n) for n in ngramlar)
+    print(f"\n[BİLGİ] Farklı indeks: {farkli}, farklı matris girdisi: {(X_sozluk != X_kompakt).nnz}")
@@ -41,6 +41,30 @@ GITHUB_DATASET_URLS = [
 # Yerel veri dosyası
 LOCAL_DATASET_PATH = DATA_DIR / "TRSAv1.csv"
 
+# ============================================================
+# ÖN İŞLEME AYARLARI
+# ============================================================
+
+# Kelime kökü (stem) önbelleği
+STEM_CACHE_CONFIG = {
+    "max_size": 200000,                         # En fazla tutulacak kelime (0 = kapalı)
+    "path": MODELS_DIR / "stem_cache.json",     # Isınmış önbellek dosyası
+    "preload": True                             # Açılışta dosyadan yükle
+}
+
+# Çok çekirdekli normalizasyon (veri_hazirla)
+PARALLEL_NORMALIZATION_CONFIG = {
+    "n_jobs": 1,                    # İşlem sayısı (-1 = tüm çekirdekler)
+    "chunk_size": 10000,            # Görev başına yorum sayısı
+    "min_parallel_size": 50000      # Bu sayının altında seri çalışır
+}
+
+# Normalize edilmiş korpus önbelleği (veri_hazirla)
+CORPUS_CACHE_CONFIG = {
+    "enabled": True,
+    "dir": DATA_DIR / "cache"       # Önbellek dosyalarının klasörü
+}
+
 # ============================================================
 # MODEL AYARLARI
 # ============================================================
@@ -61,6 +85,15 @@ SENTIMENT_MODEL_PATH = MODELS_DIR / "sentiment_model.pkl"
 SPAM_MODEL_PATH = MODELS_DIR / "spam_model.pkl"
 TFIDF_VECTORIZER_PATH = MODELS_DIR / "tfidf_vectorizer.pkl"
 
+# Bellek eşlemeli model artefaktları (src/artifact.py): pickle içermeyen
+# dizinler; servis bunları .pkl dosyalarına tercih eder
+SENTIMENT_ARTIFACT_PATH = MODELS_DIR / "sentiment_model"
+SPAM_ARTIFACT_PATH = MODELS_DIR / "spam_model"
+ARTIFACT_CONFIG = {
+    "prefer": True,             # Artefakt varsa .pkl yerine onu yükle
+    "mmap": True                # Dizileri bellek eşlemesiyle aç (süreçler paylaşır)
+}
+
 # ============================================================
 # TF-IDF AYARLARI
 # ============================================================
@@ -72,6 +105,44 @@ TFIDF_CONFIG = {
     "max_features": None,       # Özellik sınırı yok
 }
 
+# Duygu modeli özellik çıkarıcısı:
+#   "tfidf"   -> TfidfVectorizer (sözlük korpusla büyür)
+#   "hashing" -> HashingVectorizer + IDF (sözlüksüz, bellek sabit)
+SENTIMENT_FEATURIZER = "tfidf"
+
+# Hashing modu ayarları
+HASHING_CONFIG = {
+    "n_features": 2 ** 20,      # Özellik uzayı boyutu
+    "ngram_range": (1, 2),      # Unigram ve bigram
+    "alternate_sign": False     # IDF ile uyum için yalnızca pozitif sayımlar
+}
+
+# Artımlı (partial_fit) eğitim: hashing + SGDClassifier
+# IDF, ilk idf_warmup_docs belge görülene kadar her parçada yeniden hesaplanır,
+# sonra dondurulur: SGD ağırlıkları eski IDF ile öğrenildiğinden sonraki
+# güncellemeler özellikleri yeniden ölçeklemez (None: hiç dondurma, kayma olur)
+INCREMENTAL_CONFIG = {
+    "loss": "log_loss",         # predict_proba için lojistik kayıp
+    "alpha": 1e-6,              # L2 düzenlileştirme
+    "chunk_size": 50000,        # CSV'den okunan parça başına yorum
+    "idf_warmup_docs": 50000    # IDF'in dondurulduğu belge sayısı
+}
+
+# Model sıkıştırma: tüm sınıflarda |ağırlık| < min_weight olan özellikler atılır
+COMPACTION_CONFIG = {
+    "min_weight": 1e-2,
+    "dtype": "float32"
+}
+
+# Kompakt terim sözlüğü (src/vocabulary.py): vocabulary_ Python sözlüğü
+# yerine dizilerle tutulur (daha az bellek, arama başına daha yavaş)
+VOCABULARY_CONFIG = {
+    "compact": True,            # Yüklenen modellerde sözlüğü KompaktSozluk'a çevir
+    "min_terms": 20000,         # Bundan küçük sözlükler Python sözlüğü kalır
+    "hot_terms": 4096,          # En sık (en düşük idf) terimler ayrıca Python sözlüğünde
+    "filter": True              # Sözlük dışı n-gram'ları hash() süzgeciyle erken ele
+}
+
 # ============================================================
 # SPAM TESPİTİ AYARLARI
 # ============================================================
@@ -84,6 +155,42 @@ ISOLATION_FOREST_CONFIG = {
     "n_jobs": -1
 }
 
+# IsolationForest girdisi: spam TF-IDF'nin TruncatedSVD izdüşümü
+#   (benchmarks/bench_isolation_forest.py ile boyut/uyum dengesi ölçülür)
+ANOMALY_PROJECTION_CONFIG = {
+    "n_components": 32,             # İzdüşüm boyutu (0 = ham seyrek TF-IDF)
+    "fit_sample": 50000,            # SVD bu kadar satırlık örneklem üzerinde öğrenilir
+    "compiled_max_rows": 1000       # Bu boyuta kadar gruplar derlenmiş ormandan geçer
+}
+
+# Yakın kopya kampanya tespiti (MinHash + LSH)
+#   bands=16, num_perm=64 (bant başına 4 satır) -> 0.6 Jaccard benzerliğinde
+#   ~%89, 0.8'de ~%100 aday olma olasılığı
+NEAR_DUPLICATE_CONFIG = {
+    "enabled": True,
+    "shingle_size": 5,          # Bayt cinsinden parça uzunluğu
+    "num_perm": 64,             # MinHash imza uzunluğu
+    "bands": 16,                # LSH bant sayısı (num_perm'i tam bölmeli)
+    "threshold": 0.6,           # Doğrulama için en düşük tahmini Jaccard
+    "cluster_threshold": 0.4,   # Küme temsilcisine en düşük benzerlik (zincirleme sınırı)
+    "min_cluster_size": 10,     # Bu boyuttaki kümeler kampanya sayılır
+    "chunk_shingles": 2_000_000 # İmza hesabında grup başına parça sayısı
+}
+
+# Servis sırasında canlı tekrar sayacı (pencereli count-min sketch)
+#   Bellek: buckets * depth * width * 4 bayt (varsayılan ~12.6 MB, sabit)
+STREAM_FREQUENCY_CONFIG = {
+    "enabled": True,
+    "width": 131072,                            # Satır başına sayaç
+    "depth": 4,                                 # Hash satırı sayısı
+    "window_seconds": 3600,                     # "Son N saniyede" penceresi
+    "buckets": 6,                               # Pencerenin alt bölümleri
+    "min_count": 10,                            # Bu sayıdan sonra spam sinyali
+    "path": MODELS_DIR / "frequency_sketch.npz",  # Anlık görüntü dosyası
+    "snapshot_every": 5000,                     # Kaç eklemede bir diske yazılır (arka planda)
+    "snapshot_interval": 60                     # Ön-çatallı serviste ana sürecin yazma aralığı (sn)
+}
+
 # Spam tespiti için TF-IDF
 SPAM_TFIDF_CONFIG = {
     "max_features": 2000,
@@ -105,6 +212,11 @@ GENERIC_NEGATIVE_PHRASES = [
     "dolandiricilik", "iade", "pismanlik"
 ]
 
+# Gerçek şikayet kelimeleri (uzun şikayetler spam sayılmaz)
+COMPLAINT_KEYWORDS = [
+    "iade", "degisim", "kirik", "bozuk", "gecikti"
+]
+
 # ============================================================
 # ASPEKT ANALİZİ AYARLARI
 # ============================================================
@@ -170,7 +282,47 @@ GRADIO_CONFIG = {
     "title": "Türkçe E-Ticaret Yorum Analizi",
     "share": True,              # Public link oluştur
     "server_port": 7860,
-    "theme": "default"
+    "theme": "default",
+    "concurrency_limit": 16     # Eşzamanlı istek (mikro gruplama için > 1)
+}
+
+# ============================================================
+# REST API AYARLARI
+# ============================================================
+
+API_CONFIG = {
+    "host": "0.0.0.0",
+    "port": 8000,
+    "max_workers": 4,           # Çıkarım iş parçacığı havuzu boyutu
+    "max_pending": 64,          # Aynı anda kabul edilen istek; fazlası 503
+    "max_batch_size": 1000,     # Toplu istekte en fazla yorum
+    "max_text_length": 5000     # Yorum başına en fazla karakter
+}
+
+# Eşzamanlı tek yorumluk istekleri tek toplu çağrıda işleme
+MICRO_BATCH_CONFIG = {
+    "enabled": True,
+    "max_wait_ms": 2,           # İlk istekten sonra en uzun bekleme
+    "max_batch_size": 64        # Gruptaki en fazla istek
+}
+
+# Ön-çatallı çok işçili servis (src/serve.py)
+SERVE_CONFIG = {
+    "workers": 2,               # İşçi süreç sayısı
+    "gc_freeze": True,          # Çatallamadan önce nesneleri GC'den dondur
+    "shared_sketch": True,      # Tekrar sayacı tüm işçilerde ortak
+    "graceful_timeout": 30,     # Kapanışta işçileri bekleme süresi (saniye)
+    "report_interval": 0        # Bellek raporu aralığı (saniye, 0 = kapalı)
+}
+
+# Normalize metin → model çıktısı önbelleği (src/result_cache.py)
+RESULT_CACHE_CONFIG = {
+    "enabled": True,
+    "max_size": 100000,         # Bellekteki en fazla kayıt (bölüm x metin)
+    "ttl_seconds": 0,           # Kayıt ömrü (0 = süresiz)
+    "backend": None,            # "sqlite" = süreçler arası ortak disk önbelleği
+    "path": DATA_DIR / "cache" / "sonuc_onbellegi.sqlite",
+    "disk_max_size": 1000000    # Disk önbelleğindeki en fazla kayıt
 }
 
 # ============================================================
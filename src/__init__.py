@@ -6,15 +6,79 @@ Türkçe E-Ticaret Yorum Analizi - src Paketi
 
 from .preprocessing import (
     turkce_metin_normalize_et,
+    normalize_batch,
+    StemCache,
+    kok_onbellegi_istatistikleri,
     akilli_csv_oku,
+    akilli_csv_oku_parcali,
     metin_sutunu_bul,
-    etiket_sutunu_bul
+    etiket_sutunu_bul,
+    csv_semasi,
+    egitim_parcalari
 )
 
 from .model import (
     SentimentModel,
     load_sentiment_model,
-    train_sentiment_model
+    train_sentiment_model,
+    train_sentiment_model_incremental
+)
+
+from .features import (
+    OrtakOzellikCikarici
+)
+
+from .keyword_matcher import (
+    AnahtarKelimeEslestirici,
+    varsayilan_eslestirici
+)
+
+from .aspects import (
+    AspektMotoru
+)
+
+from .near_duplicate import (
+    YakinKopyaIndeksi
+)
+
+from .frequency_sketch import (
+    TekrarSayaci,
+    tekrar_sayaci_olustur
+)
+
+from .anomaly import (
+    DerlenmisOrman
+)
+
+from .batching import (
+    MikroToplayici
+)
+
+from .result_cache import (
+    SonucOnbellegi,
+    DiskOnbellegi,
+    sonuc_onbellegi_olustur
+)
+
+from .vocabulary import (
+    KompaktSozluk,
+    sozlukleri_kompaktla
+)
+
+from .artifact import (
+    artefakt_kaydet,
+    artefakt_yukle,
+    varsayilan_model_yolu
+)
+
+from .analysis import (
+    YorumAnalizcisi,
+    analiz_yap_toplu
+)
+
+from .scorer import (
+    LinearScorer,
+    parite_kontrolu
 )
 
 from .spam_detector import (
@@ -0,0 +1,777 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Analiz Servisi
+============================================================
+Spam, duygu ve aspekt analizini arayüzden bağımsız olarak
+birleştirir. Gradio arayüzü (src/app.py) ve toplu işleme
+betikleri aynı mantığı kullanır.
+
+İki giriş noktası vardır:
+- analiz_yap: tek yorum, arayüz için biçimlendirilmiş sözlük
+- analiz_yap_toplu: yorum grubu, sayısal sütunlu DataFrame.
+  Metinler bir kez normalize edilir, bir kez tokenize edilir
+  ve her model için tek predict_proba çağrılır.
+- analiz_kayitlari: aynı toplu yol, JSON'a yazılabilir kayıtlar
+  (REST servisi, src/api.py)
+
+Model çıktıları yalnızca normalize metne bağlıdır: bir grupta tekrar
+eden metinler bir kez hesaplanır, sonuç önbelleğinde (src/result_cache.py)
+bulunanlar hiç hesaplanmaz.
+
+Kullanım:
+    from src.analysis import YorumAnalizcisi
+
+    analizci = YorumAnalizcisi.yukle()
+    analizci.analiz_yap("Kargo hızlı geldi, ürün harika")
+    tablo = analizci.analiz_yap_toplu(yorum_listesi)
+"""
+
+import os
+import sys
+import json
+import uuid
+import atexit
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Proje yolunu ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from .preprocessing import normalize_batch
+    from .model import SentimentModel
+    from .scorer import LinearScorer
+    from .features import OrtakOzellikCikarici
+    from .aspects import AspektMotoru
+    from .spam_detector import SpamDetector
+    from .frequency_sketch import TekrarSayaci, tekrar_sayaci_olustur
+    from .batching import MikroToplayici
+    from .result_cache import SonucOnbellegi, sonuc_onbellegi_olustur
+    from .artifact import artefakt_mi, artefakt_ozeti, varsayilan_model_yolu
+    from .vocabulary import sozlukleri_kompaktla
+except ImportError:
+    from preprocessing import normalize_batch  # type: ignore[no-redef]
+    from model import SentimentModel  # type: ignore[no-redef]
+    from scorer import LinearScorer  # type: ignore[no-redef]
+    from features import OrtakOzellikCikarici  # type: ignore[no-redef]
+    from aspects import AspektMotoru  # type: ignore[no-redef]
+    from spam_detector import SpamDetector  # type: ignore[no-redef]
+    from frequency_sketch import TekrarSayaci, tekrar_sayaci_olustur  # type: ignore[no-redef]
+    from batching import MikroToplayici  # type: ignore[no-redef]
+    from result_cache import SonucOnbellegi, sonuc_onbellegi_olustur  # type: ignore[no-redef]
+    from artifact import artefakt_mi, artefakt_ozeti, varsayilan_model_yolu  # type: ignore[no-redef]
+    from vocabulary import sozlukleri_kompaktla  # type: ignore[no-redef]
+
+# Konfigürasyon
+try:
+    from config import (
+        SENTIMENT_CLASSES,
+        STREAM_FREQUENCY_CONFIG,
+        MICRO_BATCH_CONFIG,
+        VOCABULARY_CONFIG,
+        ASPECT_KEYWORDS
+    )
+except ImportError:
+    SENTIMENT_CLASSES = {0: "Negatif", 1: "Nötr", 2: "Pozitif"}
+    STREAM_FREQUENCY_CONFIG = {"enabled": True, "snapshot_every": 5000, "snapshot_interval": 60}
+    MICRO_BATCH_CONFIG = {"enabled": True, "max_wait_ms": 2, "max_batch_size": 64}
+    VOCABULARY_CONFIG = {"compact": True}
+    ASPECT_KEYWORDS = {}
+
+
+# Toplu sonuçta aspekt bulunmayan satırların değeri
+ASPEKT_YOK = -1
+
+
+# ============================================================
+# ANALİZ SERVİSİ
+# ============================================================
+
+class YorumAnalizcisi:
+    """
+    Yüklü modeller üzerinde yorum analizi.
+
+    Duygu modeli varsa derlenmiş LinearScorer, iki model için ortak
+    özellik çıkarıcı ve (verilmişse) canlı tekrar sayacı burada kurulur.
+    Eksik modeller analiz sonucunda uyarı olarak görünür.
+
+    Attributes:
+        duygu_modeli: Eğitilmiş SentimentModel veya None
+        spam_modeli: Eğitilmiş SpamDetector veya None
+        duygu_skorlayici: Küçük gruplar (tek yorum dahil) için derlenmiş
+            skorlayıcı; en fazla AspektMotoru.KUCUK_GRUP eksik metin
+        ozellik_cikarici: İki model için tek geçişli özellik çıkarıcı
+        aspekt_motoru: Toplu aspekt bazlı duygu analizi
+        tekrar_sayaci: Canlı tekrar sayacı (spam modeline bağlanır)
+        toplayici: Eşzamanlı tek yorumluk istekler için mikro toplayıcı
+            (mikro_gruplamayi_baslat() ile)
+        goruntu_kaydedici: False ise tekrar sayacı bu süreçte periyodik
+            olarak yazılmaz (ön-çatallı serviste ana süreç yazar)
+        onbellek: Normalize metin → model çıktısı önbelleği veya None
+        model_surumu: Önbellek anahtarlarındaki model sürümü
+    """
+
+    def __init__(
+        self,
+        duygu_modeli: Optional[SentimentModel] = None,
+        spam_modeli: Optional[SpamDetector] = None,
+        tekrar_sayaci: Optional[TekrarSayaci] = None,
+        onbellek: Optional[SonucOnbellegi] = None,
+        model_surumu: Optional[str] = None
+    ):
+        """
+        Args:
+            duygu_modeli: Eğitilmiş SentimentModel
+            spam_modeli: Eğitilmiş SpamDetector
+            tekrar_sayaci: Spam analizinde kullanılacak canlı tekrar sayacı
+            onbellek: Sonuç önbelleği (opsiyonel)
+            model_surumu: Modellerin sürümü (None ise bu nesneye özgü
+                rastgele sürüm; önbellek başka modellerle paylaşılmaz)
+        """
+        self.duygu_modeli = duygu_modeli
+        self.spam_modeli = spam_modeli
+        self.tekrar_sayaci = tekrar_sayaci
+
+        # Sürüm değişince önbellekteki eski model çıktıları geçersizdir
+        self.model_surumu = model_surumu or uuid.uuid4().hex
+        self.onbellek = onbellek
+        if onbellek is not None:
+            onbellek.surum_ayarla(self.model_surumu)
+
+        # Tek yorumluk istekler Pipeline yerine derlenmiş skorlayıcıdan geçer
+        self.duygu_skorlayici: Optional[LinearScorer] = None
+        if duygu_modeli is not None:
+            try:
+                self.duygu_skorlayici = LinearScorer.from_model(duygu_modeli)
+            except Exception as e:
+                print(f"[UYARI] Skorlayıcı derlenemedi, Pipeline kullanılacak: {e}")
+
+        # Her iki model için metin tek geçişte tokenize edilir
+        self.ozellik_cikarici: Optional[OrtakOzellikCikarici] = None
+        if duygu_modeli is not None or spam_modeli is not None:
+            try:
+                self.ozellik_cikarici = OrtakOzellikCikarici(duygu_modeli, spam_modeli)
+            except Exception as e:
+                print(f"[UYARI] Ortak özellik çıkarıcı kurulamadı: {e}")
+
+        # Aspekt cümleleri tek otomat geçişiyle bulunur, birlikte skorlanır
+        self.aspekt_motoru: Optional[AspektMotoru] = None
+        if duygu_modeli is not None:
+            self.aspekt_motoru = AspektMotoru(duygu_modeli, self.duygu_skorlayici)
+
+        if spam_modeli is not None:
+            spam_modeli.tekrar_sayaci = tekrar_sayaci
+
+        self.toplayici: Optional[MikroToplayici] = None
+
+        # Tekrar sayacı görüntüsü istek iş parçacığında değil, arka planda yazılır
+        self.goruntu_kaydedici = True
+        self._goruntu_istegi = threading.Event()
+        self._goruntu_is_parcacigi: Optional[threading.Thread] = None
+        self._goruntu_durdur = False
+        self._kayit_kilidi = threading.Lock()
+
+    @classmethod
+    def yukle(
+        cls,
+        duygu_yolu: Optional[str] = None,
+        spam_yolu: Optional[str] = None,
+        tekrar_sayaci: bool = True,
+        mikro_gruplama: Optional[bool] = None,
+        onbellek: Optional[bool] = None
+    ) -> "YorumAnalizcisi":
+        """
+        Eğitilmiş modelleri diskten yükler.
+
+        Args:
+            duygu_yolu: Duygu modeli dosyası veya artefakt dizini (None ise
+                varsa artefakt, yoksa .pkl; bkz. varsayilan_model_yolu)
+            spam_yolu: Spam modeli dosyası veya artefakt dizini (None ise aynı)
+            tekrar_sayaci: True ise canlı tekrar sayacı diskteki görüntüden
+                başlatılır ve çıkışta kaydedilir
+            mikro_gruplama: True ise eşzamanlı analiz_yap çağrıları
+                gruplanır (None ise MICRO_BATCH_CONFIG["enabled"])
+            onbellek: True ise sonuç önbelleği kurulur (None ise
+                RESULT_CACHE_CONFIG["enabled"]); sürüm model dosyalarının
+                içeriğinden türetilir, aynı modelleri yükleyen süreçler
+                disk katmanını ortak kullanır. Önbellek yoksa sürüm
+                hesaplanmaz
+
+        Returns:
+            YorumAnalizcisi: Yüklenemeyen modeller None olarak kalır
+        """
+        duygu_yolu = str(duygu_yolu or varsayilan_model_yolu("duygu"))
+        spam_yolu = str(spam_yolu or varsayilan_model_yolu("spam"))
+        try:
+            duygu_modeli = SentimentModel.load(duygu_yolu)
+            print("[OK] Duygu modeli yüklendi")
+        except Exception as e:
+            print(f"[UYARI] Duygu modeli yüklenemedi: {e}")
+            print("        Önce 'python src/model.py' çalıştırın")
+            duygu_modeli = None
+
+        try:
+            spam_modeli = SpamDetector.load(spam_yolu)
+            print("[OK] Spam modeli yüklendi")
+        except Exception as e:
+            print(f"[UYARI] Spam modeli yüklenemedi: {e}")
+            print("        Önce 'python src/spam_detector.py' çalıştırın")
+            spam_modeli = None
+
+        # .pkl'den gelen büyük sözlükler skorlayıcılar kurulmadan dizilere
+        # çevrilir (artefakttan yüklenenler zaten kompakttır)
+        if VOCABULARY_CONFIG.get("compact", True):
+            sozlukleri_kompaktla(duygu_modeli, spam_modeli)
+
+        # Canlı tekrar sayacı: yeniden başlatmalar arasında diskten devam eder
+        sayac = tekrar_sayaci_olustur() if tekrar_sayaci else None
+
+        sonuc_onbellegi = None
+        if onbellek is None or onbellek:
+            sonuc_onbellegi = sonuc_onbellegi_olustur()
+            if sonuc_onbellegi is None and onbellek:
+                sonuc_onbellegi = SonucOnbellegi()
+        # Sürüm yalnızca önbellek anahtarıdır; önbellek yoksa dosyalar okunmaz
+        surum = None
+        if sonuc_onbellegi is not None:
+            surum = model_surumu(
+                duygu_yolu if duygu_modeli is not None else None,
+                spam_yolu if spam_modeli is not None else None
+            )
+        analizci = cls(duygu_modeli, spam_modeli, sayac, sonuc_onbellegi, surum)
+        if sayac is not None:
+            atexit.register(analizci.tekrar_sayacini_kaydet)
+        if MICRO_BATCH_CONFIG.get("enabled", True) if mikro_gruplama is None else mikro_gruplama:
+            analizci.mikro_gruplamayi_baslat()
+        return analizci
+
+    # ============================================================
+    # MİKRO GRUPLAMA
+    # ============================================================
+
+    def mikro_gruplamayi_baslat(
+        self,
+        max_wait_ms: Optional[float] = None,
+        max_batch_size: Optional[int] = None
+    ) -> MikroToplayici:
+        """
+        Eşzamanlı tek yorumluk istekleri analiz_kayitlari üzerinden gruplar.
+
+        Başlatıldıktan sonra analiz_yap ve REST servisinin tek yorumluk uç
+        noktaları toplayıcıdan geçer; her grup model başına tek
+        predict_proba çağırır.
+
+        Args:
+            max_wait_ms: En uzun bekleme (None ise MICRO_BATCH_CONFIG)
+            max_batch_size: En büyük grup (None ise MICRO_BATCH_CONFIG)
+        """
+        if self.toplayici is None:
+            self.toplayici = MikroToplayici(self.analiz_kayitlari, max_wait_ms, max_batch_size)
+        return self.toplayici
+
+    def kapat(self):
+        """Mikro toplayıcıyı ve görüntü iş parçacığını durdurur, tekrar sayacını diske yazar."""
+        if self.toplayici is not None:
+            self.toplayici.kapat()
+            self.toplayici = None
+        if self._goruntu_is_parcacigi is not None:
+            self._goruntu_durdur = True
+            self._goruntu_istegi.set()
+            self._goruntu_is_parcacigi.join()
+            self._goruntu_is_parcacigi = None
+            self._goruntu_durdur = False
+            self._goruntu_istegi.clear()
+        self.tekrar_sayacini_kaydet()
+
+    # ============================================================
+    # TEKRAR SAYACI
+    # ============================================================
+
+    def tekrar_sayacini_kaydet(self):
+        """Canlı tekrar sayacının anlık görüntüsünü diske yazar."""
+        if self.tekrar_sayaci is None:
+            return
+        # Arka plan iş parçacığı ve çıkış işleyicisi aynı geçici dosyaya yazmasın
+        with self._kayit_kilidi:
+            try:
+                self.tekrar_sayaci.save()
+            except OSError as e:
+                print(f"[UYARI] Tekrar sayacı kaydedilemedi: {e}")
+
+    def _tekrar_sayacini_kontrol_et(self, onceki: int):
+        """
+        Son işlemde `snapshot_every` sınırı geçildiyse görüntü ister.
+
+        ~12 MB'lık .npz yazımı istek gecikmesine girmez: istek iş parçacığı
+        yalnızca arka plandaki görüntü iş parçacığını uyandırır (ilk
+        istekte başlatılır).
+        """
+        aralik = STREAM_FREQUENCY_CONFIG.get("snapshot_every", 0)
+        if self.tekrar_sayaci is None or not aralik or not self.goruntu_kaydedici:
+            return
+        if self.tekrar_sayaci.eklenen // aralik > onceki // aralik:
+            if self._goruntu_is_parcacigi is None:
+                with self._kayit_kilidi:
+                    if self._goruntu_is_parcacigi is None:
+                        self._goruntu_is_parcacigi = threading.Thread(
+                            target=self._goruntu_dongusu, name="tekrar-sayaci-goruntu", daemon=True
+                        )
+                        self._goruntu_is_parcacigi.start()
+            self._goruntu_istegi.set()
+
+    def _goruntu_dongusu(self):
+        """Görüntü isteklerini bekler ve sayacı diske yazar (arka plan)."""
+        while True:
+            self._goruntu_istegi.wait()
+            self._goruntu_istegi.clear()
+            if self._goruntu_durdur:
+                return
+            self.tekrar_sayacini_kaydet()
+
+    # ============================================================
+    # ASPEKT ANALİZİ
+    # ============================================================
+
+    def aspekt_analizi(self, normalize_metin: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Aspekt bazlı duygu analizi yapar.
+
+        Args:
+            normalize_metin: Normalize edilmiş yorum metni
+
+        Returns:
+            dict: Aspekt → {"cumle", "duygu" (sınıf kimliği), "olasiliklar"}
+        """
+        if self.aspekt_motoru is None:
+            return {}
+        return self.aspekt_motoru.analiz(normalize_metin)
+
+    # ============================================================
+    # TEK YORUM
+    # ============================================================
+
+    def analiz_yap(self, yorum: str) -> Dict[str, Any]:
+        """
+        Bir yorumu tam analiz eder.
+
+        Mikro gruplama açıksa istek eşzamanlı diğer isteklerle birlikte
+        tek toplu çağrıda işlenir.
+
+        Args:
+            yorum: Yorum metni
+
+        Returns:
+            dict: Arayüz için biçimlendirilmiş analiz sonuçları
+        """
+        if not yorum or not yorum.strip():
+            return {"hata": "Lütfen bir yorum girin."}
+
+        if self.toplayici is not None:
+            kayit = self.toplayici.isle(yorum)
+        else:
+            kayit = self.analiz_kayitlari([yorum])[0]
+
+        sonuc: Dict[str, Any] = {
+            "girdi": yorum,
+            "normalize": kayit["normalize"]
+        }
+
+        # Spam analizi
+        if "spam" in kayit:
+            sonuc["spam_analizi"] = {
+                "olasilik": f"{kayit['spam']['olasilik']:.1%}",
+                "etiket": kayit["spam"]["etiket"],
+                "aciklama": kayit["spam"]["aciklama"]
+            }
+        else:
+            sonuc["spam_analizi"] = {"uyari": "Spam modeli yüklenmedi"}
+
+        # Duygu analizi
+        if "duygu" in kayit:
+            sonuc["duygu_analizi"] = {
+                "genel_duygu": kayit["duygu"]["etiket"],
+                "olasiliklar": {
+                    ad: f"{olasilik:.1%}" for ad, olasilik in kayit["duygu"]["olasiliklar"].items()
+                }
+            }
+        else:
+            sonuc["duygu_analizi"] = {"uyari": "Duygu modeli yüklenmedi"}
+
+        # Aspekt analizi
+        if kayit.get("aspektler"):
+            sonuc["aspekt_analizi"] = {}
+            for aspekt, detay in kayit["aspektler"].items():
+                aspekt_isim = aspekt.replace("_", "/").title()
+                sonuc["aspekt_analizi"][aspekt_isim] = detay["etiket"]
+        else:
+            sonuc["aspekt_analizi"] = {"bilgi": "Spesifik aspekt bulunamadı"}
+
+        return sonuc
+
+    # ============================================================
+    # TOPLU ANALİZ
+    # ============================================================
+
+    def _toplu_sutunlar(
+        self,
+        yorumlar: Sequence[str],
+        spam: bool = True,
+        duygu: bool = True,
+        aspekt: bool = True
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Toplu analizin ortak gövdesi.
+
+        Sonuçlar DataFrame yerine sütun sözlüğü olarak döner; tek yorumluk
+        gruplarda pandas ek yükü model çağrılarından büyüktür.
+
+        Returns:
+            tuple: (sütun adı → dizi, AspektMotoru.analiz_dizileri() çıktısı
+            veya None)
+        """
+        ham = ["" if y is None else str(y) for y in yorumlar]
+        normalize = normalize_batch(ham)
+        sutunlar: Dict[str, Any] = {"normalize": normalize}
+        if not ham:
+            return sutunlar, None
+
+        spam = spam and self.spam_modeli is not None
+        duygu = duygu and self.duygu_modeli is not None
+        aspekt = aspekt and self.aspekt_motoru is not None
+        spam_skoru = spam and self.spam_modeli.is_trained
+
+        # Model çıktıları tekil normalize metinler için hesaplanır ve
+        # satırlara geri dağıtılır; önbellekte olanlar hiç hesaplanmaz
+        tekil = list(dict.fromkeys(normalize))
+        sira = {metin: i for i, metin in enumerate(tekil)}
+        satirlar = np.fromiter((sira[metin] for metin in normalize), dtype=np.int64, count=len(normalize))
+        bolumler = {
+            bolum: self._onbellekten(bolum, tekil)
+            for bolum, istendi in (("spam", spam_skoru), ("duygu", duygu), ("aspekt", aspekt))
+            if istendi
+        }
+        eksikler = {
+            bolum: [i for i, deger in enumerate(degerler) if deger is None]
+            for bolum, degerler in bolumler.items()
+        }
+
+        # Küçük gruplarda (tek yorum dahil) duygu Pipeline yerine derlenmiş
+        # skorlayıcıyla, ortak n-gram'lardan hesaplanır; seyrek matris kurulmaz
+        kucuk_duygu = (
+            duygu and self.duygu_skorlayici is not None
+            and 0 < len(eksikler["duygu"]) <= AspektMotoru.KUCUK_GRUP
+        )
+
+        # Spam ve duygu eksikleri ortak özellik çıkarıcıdan tek geçişte
+        ozellikli = sorted(set(eksikler.get("spam", [])) | set(eksikler.get("duygu", [])))
+        paket: Dict[str, Any] = {}
+        if ozellikli and self.ozellik_cikarici is not None:
+            paket = self.ozellik_cikarici.donustur(
+                [tekil[i] for i in ozellikli],
+                ngram_dondur=kucuk_duygu,
+                matrissiz=("duygu",) if kucuk_duygu else ()
+            )
+        konum = {i: k for k, i in enumerate(ozellikli)}
+
+        def ozellik_satirlari(ad: str, secim: List[int]):
+            if ad not in paket:
+                return None
+            if len(secim) == len(ozellikli):
+                return paket[ad]
+            return paket[ad][[konum[i] for i in secim]]
+
+        # Spam analizi: model skorları tekil metinlerden, kural sinyalleri
+        # ve canlı tekrar sayacı her satır için yeniden
+        if spam:
+            skorlar = None
+            if spam_skoru:
+                secim = eksikler["spam"]
+                if secim:
+                    yeni = self.spam_modeli.model_skorlari(
+                        [tekil[i] for i in secim], ozellik=ozellik_satirlari("spam", secim)
+                    )
+                    degerler = list(zip(
+                        yeni["spam_olasiligi"].tolist(), yeni["tahmin"].tolist(),
+                        yeni["anomali_skoru"].tolist(), yeni["anomali"].tolist(),
+                        yeni["kume_id"].tolist(), yeni["kume_boyutu"].tolist()
+                    ))
+                    self._onbellege_yaz("spam", bolumler["spam"], secim, degerler, tekil)
+                kolonlar = list(zip(*bolumler["spam"]))
+                skorlar = {
+                    ad: np.asarray(kolon, dtype=tur)[satirlar]
+                    for ad, kolon, tur in zip(
+                        ("spam_olasiligi", "tahmin", "anomali_skoru", "anomali", "kume_id", "kume_boyutu"),
+                        kolonlar, (np.float64, np.int64, np.float64, bool, np.int64, np.int64)
+                    )
+                }
+            onceki = self.tekrar_sayaci.eklenen if self.tekrar_sayaci is not None else 0
+            sonuc = self.spam_modeli.analyze_batch(ham, normalize, as_frame=False, skorlar=skorlar)
+            self._tekrar_sayacini_kontrol_et(onceki)
+            sutunlar["spam_olasiligi"] = sonuc["spam_olasiligi"]
+            sutunlar["spam_tahmin"] = sonuc["tahmin"]
+            for sutun in ("kural_skoru", "anomali_skoru", "anomali"):
+                sutunlar[sutun] = sonuc[sutun]
+            sutunlar["spam_aciklama"] = sonuc["aciklama"]
+            for sutun in ("kume_id", "kume_boyutu", "son_tekrar"):
+                sutunlar[sutun] = sonuc[sutun]
+
+        # Duygu analizi
+        if duygu:
+            secim = eksikler["duygu"]
+            if secim:
+                ozellik = ozellik_satirlari("duygu", secim)
+                if kucuk_duygu:
+                    skorlayici = self.duygu_skorlayici
+                    ngramlar = paket["ngramlar"]["duygu"] if "ngramlar" in paket else None
+                    yeni = np.vstack([
+                        skorlayici.olasiliklar(skorlayici.karar_skorlari(
+                            tekil[i], ngramlar[konum[i]] if ngramlar is not None else None
+                        ))
+                        for i in secim
+                    ])
+                elif ozellik is not None:
+                    yeni = self.ozellik_cikarici.duygu_olasiliklari({"duygu": ozellik})
+                else:
+                    yeni = self.duygu_modeli.predict_proba([tekil[i] for i in secim])
+                self._onbellege_yaz("duygu", bolumler["duygu"], secim, [tuple(o) for o in yeni.tolist()], tekil)
+            olasiliklar = np.asarray(bolumler["duygu"], dtype=np.float64)[satirlar]
+            sutunlar["duygu"] = olasiliklar.argmax(axis=1).astype(np.int64)
+            sutunlar["olasilik_negatif"] = olasiliklar[:, 0]
+            sutunlar["olasilik_notr"] = olasiliklar[:, 1]
+            sutunlar["olasilik_pozitif"] = olasiliklar[:, 2]
+
+        # Aspekt analizi
+        aspektler = None
+        if aspekt:
+            secim = eksikler["aspekt"]
+            if secim:
+                yeni = self.aspekt_motoru.analiz_dizileri([tekil[i] for i in secim])
+                gruplar: List[List[tuple]] = [[] for _ in secim]
+                for k, ad, cumle, sinif, negatif, notr, pozitif in zip(
+                    yeni["metin"].tolist(), yeni["aspekt"], yeni["cumle"], yeni["duygu"].tolist(),
+                    yeni["olasilik_negatif"].tolist(), yeni["olasilik_notr"].tolist(),
+                    yeni["olasilik_pozitif"].tolist()
+                ):
+                    gruplar[k].append((ad, cumle, sinif, negatif, notr, pozitif))
+                self._onbellege_yaz("aspekt", bolumler["aspekt"], secim, [tuple(g) for g in gruplar], tekil)
+            aspektler = _aspekt_sutunlari(bolumler["aspekt"], satirlar)
+
+        return sutunlar, aspektler
+
+    def _onbellekten(self, bolum: str, tekil: List[str]) -> List[Any]:
+        """Tekil metinlerin bölüm sonuçları; önbellekte olmayanlar None."""
+        if self.onbellek is None:
+            return [None] * len(tekil)
+        bulunan = self.onbellek.al_toplu(bolum, tekil)
+        return [bulunan.get(metin) for metin in tekil]
+
+    def _onbellege_yaz(self, bolum: str, degerler: List[Any], secim: List[int],
+                       yeni: List[Any], tekil: List[str]):
+        """Hesaplanan sonuçları listeye yerleştirir ve önbelleğe yazar."""
+        for i, deger in zip(secim, yeni):
+            degerler[i] = deger
+        if self.onbellek is not None:
+            self.onbellek.ekle_toplu(bolum, {tekil[i]: deger for i, deger in zip(secim, yeni)})
+
+    def analiz_yap_toplu(self, yorumlar: Sequence[str], aspekt: bool = True) -> pd.DataFrame:
+        """
+        Bir yorum grubunu analiz eder.
+
+        Metinler normalize_batch ile bir kez normalize edilir, ortak
+        özellik çıkarıcıyla bir kez tokenize edilir; spam ve duygu
+        modelleri grubun tamamı için birer predict_proba çağrısı yapar.
+        Etiketler olasılıklardan türetilir.
+
+        Args:
+            yorumlar: Ham yorum metinleri
+            aspekt: False ise aspekt sütunları hesaplanmaz
+
+        Returns:
+            pd.DataFrame: Girdi sırasıyla satır başına sayısal sonuçlar:
+            normalize; spam_olasiligi, spam_tahmin, kural_skoru,
+            anomali_skoru, anomali, spam_aciklama, kume_id, kume_boyutu,
+            son_tekrar; duygu, olasilik_negatif/notr/pozitif; aspekt başına
+            "aspekt_<ad>" (duygu sınıfı, aspekt geçmiyorsa -1)
+        """
+        sutunlar, aspektler = self._toplu_sutunlar(yorumlar, aspekt=aspekt)
+
+        if aspektler is not None:
+            n = len(sutunlar["normalize"])
+            aspekt_adlari = np.asarray(aspektler["aspekt"], dtype=object)
+            for aspekt_adi in self.aspekt_motoru.aspektler:
+                sutun = np.full(n, ASPEKT_YOK, dtype=np.int64)
+                secili = aspekt_adlari == aspekt_adi
+                sutun[aspektler["metin"][secili]] = aspektler["duygu"][secili]
+                sutunlar[f"aspekt_{aspekt_adi}"] = sutun
+
+        return pd.DataFrame(sutunlar)
+
+    def analiz_kayitlari(
+        self,
+        yorumlar: Sequence[str],
+        spam: bool = True,
+        duygu: bool = True,
+        aspekt: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Bir yorum grubunu analiz eder, JSON'a yazılabilir kayıtlar döndürür.
+
+        analiz_yap_toplu ile aynı tek geçişli yolu kullanır; REST servisi
+        (src/api.py) bu çıktıyı döndürür. Yüklü olmayan modellerin ve
+        istenmeyen bölümlerin anahtarları kayıtta yer almaz.
+
+        Args:
+            yorumlar: Ham yorum metinleri
+            spam: Spam bölümü hesaplansın mı
+            duygu: Duygu bölümü hesaplansın mı
+            aspekt: Aspekt bölümü hesaplansın mı
+
+        Returns:
+            List[dict]: Girdi sırasıyla {"normalize", "spam", "duygu", "aspektler"}
+        """
+        d, aspektler = self._toplu_sutunlar(yorumlar, spam=spam, duygu=duygu, aspekt=aspekt)
+        kayitlar: List[Dict[str, Any]] = [{"normalize": metin} for metin in d["normalize"]]
+
+        if "spam_olasiligi" in d:
+            siniflar = self.spam_modeli.classes
+            for kayit, olasilik, tahmin, kural, anomali_skoru, anomali, aciklama, kume, boyut, tekrar in zip(
+                kayitlar, d["spam_olasiligi"].tolist(), d["spam_tahmin"].tolist(),
+                d["kural_skoru"].tolist(), d["anomali_skoru"].tolist(), d["anomali"].tolist(),
+                d["spam_aciklama"].tolist(), d["kume_id"].tolist(), d["kume_boyutu"].tolist(),
+                d["son_tekrar"].tolist()
+            ):
+                kayit["spam"] = {
+                    "olasilik": olasilik,
+                    "tahmin": tahmin,
+                    "etiket": siniflar[tahmin],
+                    "kural_skoru": kural,
+                    "anomali_skoru": anomali_skoru,
+                    "anomali": anomali,
+                    "aciklama": str(aciklama),
+                    "kume_id": kume,
+                    "kume_boyutu": boyut,
+                    "son_tekrar": tekrar
+                }
+
+        if "duygu" in d:
+            for kayit, sinif, negatif, notr, pozitif in zip(
+                kayitlar, d["duygu"].tolist(), d["olasilik_negatif"].tolist(),
+                d["olasilik_notr"].tolist(), d["olasilik_pozitif"].tolist()
+            ):
+                kayit["duygu"] = {
+                    "sinif": sinif,
+                    "etiket": SENTIMENT_CLASSES[sinif],
+                    "olasiliklar": _olasilik_sozlugu(negatif, notr, pozitif)
+                }
+
+        if aspektler is not None:
+            for kayit in kayitlar:
+                kayit["aspektler"] = {}
+            for i, ad, cumle, sinif, negatif, notr, pozitif in zip(
+                aspektler["metin"].tolist(), aspektler["aspekt"], aspektler["cumle"],
+                aspektler["duygu"].tolist(), aspektler["olasilik_negatif"].tolist(),
+                aspektler["olasilik_notr"].tolist(), aspektler["olasilik_pozitif"].tolist()
+            ):
+                kayitlar[i]["aspektler"][ad] = {
+                    "cumle": cumle,
+                    "sinif": sinif,
+                    "etiket": SENTIMENT_CLASSES[sinif],
+                    "olasiliklar": _olasilik_sozlugu(negatif, notr, pozitif)
+                }
+
+        return kayitlar
+
+
+# ============================================================
+# YARDIMCI FONKSİYONLAR
+# ============================================================
+
+def _olasilik_sozlugu(negatif: float, notr: float, pozitif: float) -> Dict[str, float]:
+    """Sınıf olasılıklarını SENTIMENT_CLASSES adlarıyla eşler."""
+    return {
+        SENTIMENT_CLASSES[0]: float(negatif),
+        SENTIMENT_CLASSES[1]: float(notr),
+        SENTIMENT_CLASSES[2]: float(pozitif)
+    }
+
+
+def _aspekt_sutunlari(metin_aspektleri: List[Sequence[Sequence[Any]]], satirlar: np.ndarray) -> Dict[str, Any]:
+    """
+    Tekil metin başına aspekt listelerini AspektMotoru.analiz_dizileri()
+    sütunlarına (girdi satırı başına) açar.
+    """
+    metin: List[int] = []
+    satir_aspektleri: List[Sequence[Any]] = []
+    for i, tekil_sira in enumerate(satirlar.tolist()):
+        for kayit in metin_aspektleri[tekil_sira]:
+            metin.append(i)
+            satir_aspektleri.append(kayit)
+    olasiliklar = np.array([k[3:6] for k in satir_aspektleri], dtype=np.float64).reshape(-1, 3)
+    return {
+        "metin": np.asarray(metin, dtype=np.int64),
+        "aspekt": [k[0] for k in satir_aspektleri],
+        "cumle": [k[1] for k in satir_aspektleri],
+        "duygu": np.array([k[2] for k in satir_aspektleri], dtype=np.int64),
+        "olasilik_negatif": olasiliklar[:, 0],
+        "olasilik_notr": olasiliklar[:, 1],
+        "olasilik_pozitif": olasiliklar[:, 2]
+    }
+
+
+def model_surumu(*yollar: Optional[str]) -> str:
+    """
+    Model dosyalarının içeriğinden sonuç önbelleği sürümü üretir.
+
+    Aynı dosyaları yükleyen süreçler aynı sürümü bulur (disk önbelleğini
+    paylaşır); dosya veya aspekt anahtar kelimeleri değişince sürüm de
+    değişir. Yüklenmemiş model için None verilir. Artefakt dizinlerinde
+    yalnızca kayıtta manifeste yazılan içerik özeti okunur (diziler
+    açılmaz); özetsiz eski artefaktlarda dosyalar ad sırasıyla okunur.
+    """
+    ozet = hashlib.blake2b(digest_size=16)
+    ozet.update(json.dumps(ASPECT_KEYWORDS, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for yol in yollar:
+        ozet.update(b"\x00")
+        if yol is None:
+            ozet.update(b"yok")
+            continue
+        artefakt_ozet = artefakt_ozeti(yol) if artefakt_mi(yol) else None
+        if artefakt_ozet is not None:
+            ozet.update(artefakt_ozet.encode("ascii"))
+            continue
+        dosyalar = [os.path.join(yol, ad) for ad in sorted(os.listdir(yol))] if os.path.isdir(yol) else [yol]
+        for dosya_yolu in dosyalar:
+            with open(dosya_yolu, "rb") as dosya:
+                for parca in iter(lambda: dosya.read(1 << 20), b""):
+                    ozet.update(parca)
+    return ozet.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def varsayilan_analizci() -> YorumAnalizcisi:
+    """config.py yollarındaki modellerle kurulan ortak analizciyi döndürür."""
+    return YorumAnalizcisi.yukle()
+
+
+def analiz_yap_toplu(
+    yorumlar: Sequence[str],
+    analizci: Optional[YorumAnalizcisi] = None,
+    aspekt: bool = True
+) -> pd.DataFrame:
+    """
+    Yorum grubunu spam, duygu ve aspekt açısından analiz eder.
+
+    Args:
+        yorumlar: Ham yorum metinleri
+        analizci: Kullanılacak analizci (None ise varsayilan_analizci())
+        aspekt: False ise aspekt sütunları hesaplanmaz
+
+    Returns:
+        pd.DataFrame: YorumAnalizcisi.analiz_yap_toplu() çıktısı
+    """
+    return (analizci or varsayilan_analizci()).analiz_yap_toplu(yorumlar, aspekt=aspekt)
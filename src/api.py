@@ -0,0 +1,377 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - REST API Servisi
+============================================================
+Spam, duygu ve aspekt analizini JSON HTTP uç noktaları olarak
+sunar. Gradio gerektirmez, genel tünel açmaz; yük dengeleyici
+arkasında çalıştırılmak içindir.
+
+Çıkarım CPU'ya bağlıdır; olay döngüsünü bloklamaması için
+sınırlı bir iş parçacığı havuzunda çalıştırılır. Tek yorumluk
+istekler mikro toplayıcıda (src/batching.py) gruplanır. Havuzda
+`max_pending` istek bekliyorsa yeni istekler 503 ile reddedilir.
+
+Kullanım:
+    python src/api.py
+
+    veya
+
+    uvicorn src.api:app --host 0.0.0.0 --port 8000
+
+Uç noktalar:
+    GET  /health            Sağlık kontrolü
+    GET  /model             Model bilgileri
+    GET  /metrics           Havuz, mikro gruplama ve sonuç önbelleği ölçümleri
+    POST /analyze           {"yorum": "..."}        → tam analiz
+    POST /analyze/batch     {"yorumlar": ["..."]}   → tam analiz
+    POST /spam[/batch]      Yalnızca spam
+    POST /sentiment[/batch] Yalnızca duygu
+    POST /aspects[/batch]   Yalnızca aspekt
+"""
+
+import os
+import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import partial
+from typing import Annotated, Any, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+# Proje yolunu ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import __version__
+from src.analysis import YorumAnalizcisi
+from src.artifact import varsayilan_model_yolu
+
+# Konfigürasyon
+try:
+    from config import API_CONFIG, SENTIMENT_CLASSES
+except ImportError:
+    API_CONFIG = {
+        "host": "0.0.0.0", "port": 8000, "max_workers": 4,
+        "max_pending": 64, "max_batch_size": 1000, "max_text_length": 5000
+    }
+    SENTIMENT_CLASSES = {0: "Negatif", 1: "Nötr", 2: "Pozitif"}
+
+
+# ============================================================
+# İSTEK ŞEMALARI
+# ============================================================
+
+# Tekil ve toplu uç noktalar yorum başına aynı sınırları uygular
+Yorum = Annotated[str, Field(min_length=1, max_length=API_CONFIG["max_text_length"])]
+
+
+class YorumIstegi(BaseModel):
+    """Tek yorum isteği."""
+    yorum: Yorum
+
+
+class TopluIstek(BaseModel):
+    """Toplu yorum isteği (her öğe YorumIstegi ile aynı sınırlarda)."""
+    yorumlar: List[Yorum] = Field(..., min_length=1, max_length=API_CONFIG["max_batch_size"])
+
+
+# ============================================================
+# ÇIKARIM HAVUZU
+# ============================================================
+
+class CikarimHavuzu:
+    """
+    Analizciyi sınırlı bir iş parçacığı havuzunda çalıştırır.
+
+    NumPy/SciPy çekirdekleri GIL'i bırakır; modeller ve tekrar sayacı
+    iş parçacıkları arasında paylaşılır (ek bellek yok). Bekleyen istek
+    sayısı `max_pending`'e ulaşınca yeni istekler kuyruğa alınmaz.
+    Analizcide mikro gruplama açıksa tek yorumluk istekler havuz yerine
+    toplayıcıdan geçer.
+
+    Attributes:
+        analizci: Yüklü YorumAnalizcisi
+        max_workers: Havuzdaki iş parçacığı sayısı
+        max_pending: Aynı anda kabul edilen en fazla istek
+        bekleyen: Şu an havuzda bekleyen veya çalışan istek sayısı
+    """
+
+    def __init__(
+        self,
+        analizci: YorumAnalizcisi,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None
+    ):
+        self.analizci = analizci
+        self.max_workers = int(max_workers or API_CONFIG.get("max_workers", 4))
+        self.max_pending = int(max_pending or API_CONFIG.get("max_pending", 64))
+        self.bekleyen = 0
+        self._havuz = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cikarim")
+
+    async def calistir(self, yorumlar: List[str], **secim) -> List[Dict[str, Any]]:
+        """
+        analiz_kayitlari'nı havuzda çalıştırır, olay döngüsünü bloklamaz.
+
+        Raises:
+            HTTPException: 503, havuz doluysa
+        """
+        if self.bekleyen >= self.max_pending:
+            raise HTTPException(status_code=503, detail="Sunucu meşgul, daha sonra tekrar deneyin")
+
+        self.bekleyen += 1
+        try:
+            # Tek yorumluk istekler eşzamanlı diğerleriyle tek grupta işlenir
+            toplayici = self.analizci.toplayici
+            if toplayici is not None and len(yorumlar) == 1:
+                return [await toplayici.aisle(yorumlar[0], secim)]
+
+            dongu = asyncio.get_running_loop()
+            return await dongu.run_in_executor(
+                self._havuz, partial(self.analizci.analiz_kayitlari, yorumlar, **secim)
+            )
+        finally:
+            self.bekleyen -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Havuz, mikro toplayıcı ve sonuç önbelleği ölçümleri."""
+        toplayici = self.analizci.toplayici
+        onbellek = self.analizci.onbellek
+        return {
+            "havuz": {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "bekleyen": self.bekleyen
+            },
+            "mikro_gruplama": toplayici.stats() if toplayici is not None else None,
+            "sonuc_onbellegi": onbellek.stats() if onbellek is not None else None
+        }
+
+    def kapat(self):
+        """Havuzu ve mikro toplayıcıyı kapatır, tekrar sayacını diske yazar."""
+        self._havuz.shutdown(wait=True)
+        self.analizci.kapat()
+
+
+# ============================================================
+# MODEL BİLGİLERİ
+# ============================================================
+
+def _dosya_bilgisi(yol) -> Dict[str, Any]:
+    """
+    Model dosyasının yolunu, biçimini, boyutunu ve değiştirilme zamanını döndürür.
+
+    Artefakt dizinlerinde boyut dizideki dosyaların toplamıdır.
+    """
+    yol = str(yol)
+    if not os.path.exists(yol):
+        return {"yol": yol, "mevcut": False}
+    durum = os.stat(yol)
+    boyut = durum.st_size
+    if os.path.isdir(yol):
+        boyut = sum(os.path.getsize(os.path.join(yol, ad)) for ad in os.listdir(yol))
+    return {
+        "yol": yol,
+        "mevcut": True,
+        "bicim": "artefakt" if os.path.isdir(yol) else "joblib",
+        "boyut": boyut,
+        "degistirilme": datetime.fromtimestamp(durum.st_mtime, tz=timezone.utc).isoformat()
+    }
+
+
+def model_bilgileri(havuz: CikarimHavuzu) -> Dict[str, Any]:
+    """/model uç noktasının döndürdüğü üst veriyi oluşturur."""
+    analizci = havuz.analizci
+    duygu_modeli = analizci.duygu_modeli
+    spam_modeli = analizci.spam_modeli
+
+    duygu: Dict[str, Any] = {"yuklendi": duygu_modeli is not None, **_dosya_bilgisi(varsayilan_model_yolu("duygu"))}
+    if duygu_modeli is not None:
+        duygu.update({
+            "featurizer": duygu_modeli.featurizer,
+            "compacted": bool(getattr(duygu_modeli, "compacted", False)),
+            "siniflar": {str(k): v for k, v in SENTIMENT_CLASSES.items()},
+            "derlenmis_skorlayici": analizci.duygu_skorlayici is not None
+        })
+
+    spam: Dict[str, Any] = {"yuklendi": spam_modeli is not None, **_dosya_bilgisi(varsayilan_model_yolu("spam"))}
+    if spam_modeli is not None:
+        spam.update({
+            "rule_weight": spam_modeli.rule_weight,
+            "anomaly_weight": spam_modeli.anomaly_weight,
+            "siniflar": {str(k): v for k, v in spam_modeli.classes.items()},
+            "yakin_kopya_indeksi": spam_modeli.yakin_kopya_indeksi is not None
+        })
+
+    return {
+        "surum": __version__,
+        "model_surumu": analizci.model_surumu,
+        "duygu_modeli": duygu,
+        "spam_modeli": spam,
+        "aspektler": analizci.aspekt_motoru.aspektler if analizci.aspekt_motoru is not None else [],
+        "tekrar_sayaci": analizci.tekrar_sayaci.stats() if analizci.tekrar_sayaci is not None else None,
+        **havuz.stats(),
+        "limitler": {
+            "max_batch_size": API_CONFIG["max_batch_size"],
+            "max_text_length": API_CONFIG["max_text_length"]
+        }
+    }
+
+
+# ============================================================
+# UYGULAMA
+# ============================================================
+
+def uygulama_olustur(
+    analizci: Optional[YorumAnalizcisi] = None,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None
+) -> FastAPI:
+    """
+    FastAPI uygulamasını oluşturur.
+
+    Args:
+        analizci: Kullanılacak analizci (None ise modeller başlangıçta
+            config yollarından yüklenir)
+        max_workers: İş parçacığı havuzu boyutu (None ise API_CONFIG)
+        max_pending: Aynı anda kabul edilen istek (None ise API_CONFIG)
+
+    Returns:
+        FastAPI: Uygulama
+    """
+
+    @asynccontextmanager
+    async def yasam_dongusu(uygulama: FastAPI):
+        # Modeller import sırasında değil, sunucu başlarken yüklenir
+        uygulama.state.havuz = CikarimHavuzu(
+            analizci or YorumAnalizcisi.yukle(), max_workers, max_pending
+        )
+        yield
+        uygulama.state.havuz.kapat()
+
+    uygulama = FastAPI(
+        title="Türkçe E-Ticaret Yorum Analizi API",
+        version=__version__,
+        lifespan=yasam_dongusu
+    )
+
+    def _havuz() -> CikarimHavuzu:
+        return uygulama.state.havuz
+
+    def _model_gerekli(spam: bool = False, duygu: bool = False):
+        """İstenen model yüklü değilse 503 döndürür."""
+        analizci = _havuz().analizci
+        if spam and analizci.spam_modeli is None:
+            raise HTTPException(status_code=503, detail="Spam modeli yüklenmedi")
+        if duygu and analizci.duygu_modeli is None:
+            raise HTTPException(status_code=503, detail="Duygu modeli yüklenmedi")
+
+    async def _analiz(yorumlar: List[str], **secim) -> List[Dict[str, Any]]:
+        _model_gerekli(
+            spam=secim.get("spam", False),
+            duygu=secim.get("duygu", False) or secim.get("aspekt", False)
+        )
+        return await _havuz().calistir(yorumlar, **secim)
+
+    # ------------------------------------------------------------
+    # Durum
+    # ------------------------------------------------------------
+
+    @uygulama.get("/health")
+    async def health():
+        """Her iki model de yüklüyse 200, değilse 503 döndürür."""
+        analizci = _havuz().analizci
+        durum = {
+            "duygu_modeli": analizci.duygu_modeli is not None,
+            "spam_modeli": analizci.spam_modeli is not None
+        }
+        hazir = all(durum.values())
+        return JSONResponse(
+            status_code=200 if hazir else 503,
+            content={"durum": "ok" if hazir else "eksik_model", **durum}
+        )
+
+    @uygulama.get("/model")
+    async def model():
+        """Model dosyaları, ayarlar ve havuz durumu."""
+        return model_bilgileri(_havuz())
+
+    @uygulama.get("/metrics")
+    async def metrics():
+        """Kuyruk derinliği, grup boyutu ve bekleme süresi ölçümleri."""
+        return _havuz().stats()
+
+    # ------------------------------------------------------------
+    # Tam analiz
+    # ------------------------------------------------------------
+
+    @uygulama.post("/analyze")
+    async def analyze(istek: YorumIstegi):
+        """Tek yorum için spam, duygu ve aspekt analizi."""
+        return (await _analiz([istek.yorum], spam=True, duygu=True, aspekt=True))[0]
+
+    @uygulama.post("/analyze/batch")
+    async def analyze_batch(istek: TopluIstek):
+        """Yorum grubu için spam, duygu ve aspekt analizi."""
+        return {"sonuclar": await _analiz(istek.yorumlar, spam=True, duygu=True, aspekt=True)}
+
+    # ------------------------------------------------------------
+    # Tekil analizler
+    # ------------------------------------------------------------
+
+    @uygulama.post("/spam")
+    async def spam(istek: YorumIstegi):
+        """Tek yorum için spam analizi."""
+        return (await _analiz([istek.yorum], spam=True, duygu=False, aspekt=False))[0]
+
+    @uygulama.post("/spam/batch")
+    async def spam_batch(istek: TopluIstek):
+        """Yorum grubu için spam analizi."""
+        return {"sonuclar": await _analiz(istek.yorumlar, spam=True, duygu=False, aspekt=False)}
+
+    @uygulama.post("/sentiment")
+    async def sentiment(istek: YorumIstegi):
+        """Tek yorum için duygu analizi."""
+        return (await _analiz([istek.yorum], spam=False, duygu=True, aspekt=False))[0]
+
+    @uygulama.post("/sentiment/batch")
+    async def sentiment_batch(istek: TopluIstek):
+        """Yorum grubu için duygu analizi."""
+        return {"sonuclar": await _analiz(istek.yorumlar, spam=False, duygu=True, aspekt=False)}
+
+    @uygulama.post("/aspects")
+    async def aspects(istek: YorumIstegi):
+        """Tek yorum için aspekt bazlı duygu analizi."""
+        return (await _analiz([istek.yorum], spam=False, duygu=False, aspekt=True))[0]
+
+    @uygulama.post("/aspects/batch")
+    async def aspects_batch(istek: TopluIstek):
+        """Yorum grubu için aspekt bazlı duygu analizi."""
+        return {"sonuclar": await _analiz(istek.yorumlar, spam=False, duygu=False, aspekt=True)}
+
+    return uygulama
+
+
+# uvicorn src.api:app
+app = uygulama_olustur()
+
+
+# ============================================================
+# ANA FONKSİYON
+# ============================================================
+
+def main():
+    """REST API sunucusunu başlatır."""
+    import uvicorn
+
+    print("=" * 60)
+    print("TÜRKÇE E-TİCARET YORUM ANALİZİ - REST API")
+    print("=" * 60)
+
+    uvicorn.run(app, host=API_CONFIG["host"], port=int(os.environ.get("PORT", API_CONFIG["port"])))
+
+
+if __name__ == "__main__":
+    main()
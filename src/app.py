@@ -22,23 +22,13 @@ from typing import Dict, Any, Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.preprocessing import turkce_metin_normalize_et
-from src.model import SentimentModel
-from src.spam_detector import SpamDetector
+from src.analysis import YorumAnalizcisi
 
 # Konfigürasyon
 try:
-    from config import (
-        SENTIMENT_MODEL_PATH,
-        SPAM_MODEL_PATH,
-        GRADIO_CONFIG,
-        ASPECT_KEYWORDS,
-        SENTIMENT_CLASSES
-    )
+    from config import GRADIO_CONFIG, SENTIMENT_CLASSES
 except ImportError:
-    SENTIMENT_MODEL_PATH = "models/sentiment_model.pkl"
-    SPAM_MODEL_PATH = "models/spam_model.pkl"
-    GRADIO_CONFIG = {"title": "Türkçe E-Ticaret Yorum Analizi", "share": True}
-    ASPECT_KEYWORDS = {}
+    GRADIO_CONFIG = {"title": "Türkçe E-Ticaret Yorum Analizi", "share": True, "concurrency_limit": 16}
     SENTIMENT_CLASSES = {0: "Negatif", 1: "Nötr", 2: "Pozitif"}
 
 
@@ -46,28 +36,21 @@ except ImportError:
 # MODEL YÜKLEME
 # ============================================================
 
-duygu_modeli = None
-spam_modeli = None
+# Analiz mantığı src/analysis.py'dedir; arayüz yalnızca onu çağırır
+analizci: Optional[YorumAnalizcisi] = None
 
 def modelleri_yukle():
     """Eğitilmiş modelleri yükler."""
-    global duygu_modeli, spam_modeli
-    
-    try:
-        duygu_modeli = SentimentModel.load(str(SENTIMENT_MODEL_PATH))
-        print("[OK] Duygu modeli yüklendi")
-    except Exception as e:
-        print(f"[UYARI] Duygu modeli yüklenemedi: {e}")
-        print("        Önce 'python src/model.py' çalıştırın")
-        duygu_modeli = None
-    
-    try:
-        spam_modeli = SpamDetector.load(str(SPAM_MODEL_PATH))
-        print("[OK] Spam modeli yüklendi")
-    except Exception as e:
-        print(f"[UYARI] Spam modeli yüklenemedi: {e}")
-        print("        Önce 'python src/spam_detector.py' çalıştırın")
-        spam_modeli = None
+    global analizci
+    analizci = YorumAnalizcisi.yukle()
+
+
+def _analizci() -> YorumAnalizcisi:
+    """Yüklü analizciyi döndürür (modeller yoksa boş analizci)."""
+    global analizci
+    if analizci is None:
+        analizci = YorumAnalizcisi()
+    return analizci
 
 
 # ============================================================
@@ -84,25 +67,11 @@ def aspekt_analizi(yorum: str) -> dict:
     Returns:
         dict: Aspekt → Duygu eşlemesi
     """
-    if duygu_modeli is None:
-        return {}
-    
-    normalize_metin = turkce_metin_normalize_et(yorum)
-    cumleler = [c.strip() for c in normalize_metin.replace("!", ".").replace("?", ".").split(".") if c.strip()]
-    
-    aspekt_sonuclari = {}
-    
-    for aspekt_adi, anahtar_kelimeler in ASPECT_KEYWORDS.items():
-        for cumle in cumleler:
-            if any(kelime in cumle for kelime in anahtar_kelimeler):
-                tahmin = int(duygu_modeli.predict([cumle])[0])
-                aspekt_sonuclari[aspekt_adi] = {
-                    "cumle": cumle,
-                    "duygu": SENTIMENT_CLASSES[tahmin]
-                }
-                break
-    
-    return aspekt_sonuclari
+    sonuclar = _analizci().aspekt_analizi(turkce_metin_normalize_et(yorum))
+    return {
+        aspekt: {"cumle": detay["cumle"], "duygu": SENTIMENT_CLASSES[detay["duygu"]]}
+        for aspekt, detay in sonuclar.items()
+    }
 
 
 # ============================================================
@@ -119,54 +88,7 @@ def analiz_yap(yorum: str) -> Dict[str, Any]:
     Returns:
         dict: Analiz sonuçları
     """
-    if not yorum or not yorum.strip():
-        return {"hata": "Lütfen bir yorum girin."}
-    
-    normalize_metin = turkce_metin_normalize_et(yorum)
-    
-    sonuc: Dict[str, Any] = {
-        "girdi": yorum,
-        "normalize": normalize_metin
-    }
-    
-    # Spam analizi
-    if spam_modeli is not None:
-        spam_sonuc = spam_modeli.analyze(yorum, normalize_metin)
-        sonuc["spam_analizi"] = {
-            "olasilik": f"{spam_sonuc['spam_olasiligi']:.1%}",
-            "etiket": spam_sonuc["etiket"],
-            "aciklama": spam_sonuc["aciklama"]
-        }
-    else:
-        sonuc["spam_analizi"] = {"uyari": "Spam modeli yüklenmedi"}
-    
-    # Duygu analizi
-    if duygu_modeli is not None:
-        tahmin = int(duygu_modeli.predict([normalize_metin])[0])
-        olasiliklar = duygu_modeli.predict_proba([normalize_metin])[0]
-        
-        sonuc["duygu_analizi"] = {
-            "genel_duygu": SENTIMENT_CLASSES[tahmin],
-            "olasiliklar": {
-                "Negatif": f"{olasiliklar[0]:.1%}",
-                "Nötr": f"{olasiliklar[1]:.1%}",
-                "Pozitif": f"{olasiliklar[2]:.1%}"
-            }
-        }
-    else:
-        sonuc["duygu_analizi"] = {"uyari": "Duygu modeli yüklenmedi"}
-    
-    # Aspekt analizi
-    aspektler = aspekt_analizi(yorum)
-    if aspektler:
-        sonuc["aspekt_analizi"] = {}
-        for aspekt, detay in aspektler.items():
-            aspekt_isim = aspekt.replace("_", "/").title()
-            sonuc["aspekt_analizi"][aspekt_isim] = detay["duygu"]
-    else:
-        sonuc["aspekt_analizi"] = {"bilgi": "Spesifik aspekt bulunamadı"}
-    
-    return sonuc
+    return _analizci().analiz_yap(yorum)
 
 
 # ============================================================
@@ -229,7 +151,10 @@ def gradio_arayuzu_olustur():
         
         **Proje Ekibi**: Mustafa Arda Düşova, Fatih Çoban, Efe Ata  
         **Tarih**: Aralık 2025
-        """
+        """,
+        
+        # Eşzamanlı istekler analizcinin mikro toplayıcısında gruplanır
+        concurrency_limit=GRADIO_CONFIG.get("concurrency_limit", 16)
     )
     
     return arayuz
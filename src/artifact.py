@@ -0,0 +1,544 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Bellek Eşlemeli Model Artefaktı
+============================================================
+Eğitilmiş modelleri pickle kullanmadan, düz dizilerden oluşan
+bir dizine kaydeder ve bellek eşlemesiyle (mmap) yükler.
+
+joblib kaydı tüm Python nesnesini (sklearn Pipeline'ları, yüz
+binlerce anahtarlı sözlük) serileştirir; yükleme her şeyi sürecin
+özel belleğine açar ve diskteki dosyadaki kodu çalıştırır. Artefakt
+yalnızca veriyi tutar:
+
+- manifest.json: tür, biçim sürümü, vektörizör / sınıflandırıcı
+  parametreleri, kural ağırlıkları, dizi listesi ve içerik özeti
+- <ad>.npy: sözlük (sıralı UTF-8 terim tablosu + ofsetler +
+  özellik indeksleri + hash yuvaları), idf, katsayılar,
+  kesişimler, SVD bileşenleri, derlenmiş anomali ormanı, yakın
+  kopya indeksi
+
+Diziler np.load(mmap_mode="r", allow_pickle=False) ile açılır:
+yükleme dosya boyutundan bağımsızdır, sayfalar ilk erişimde
+okunur ve aynı artefaktı açan süreçler sayfa önbelleğini paylaşır.
+Yükleyici aynı arayüzlü SentimentModel / SpamDetector nesnesi
+kurar; analiz, skorlayıcı ve servis katmanları değişmeden çalışır.
+TF-IDF sözlüğü Python sözlüğüne açılmaz, eşlenmiş diziler üzerinde
+KompaktSozluk olarak kalır (src/vocabulary.py).
+
+Artefakt çıkarım içindir: IsolationForest yerine derlenmiş orman
+saklanır, artımlı eğitim durumu saklanmaz. Eğitime devam etmek
+için joblib kaydı kullanılır.
+
+Kullanım:
+    from src.artifact import artefakt_kaydet, artefakt_yukle
+
+    artefakt_kaydet(model, "models/sentiment_model")
+    model = artefakt_yukle("models/sentiment_model")
+
+    python src/artifact.py          # kayıtlı .pkl modelleri dönüştürür
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import shutil
+from typing import Any, Dict, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.pipeline import Pipeline
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.decomposition import TruncatedSVD
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import (
+        ARTIFACT_CONFIG,
+        SENTIMENT_MODEL_PATH,
+        SPAM_MODEL_PATH,
+        SENTIMENT_ARTIFACT_PATH,
+        SPAM_ARTIFACT_PATH,
+        VOCABULARY_CONFIG
+    )
+except ImportError:
+    ARTIFACT_CONFIG = {"prefer": True, "mmap": True}
+    SENTIMENT_MODEL_PATH = "models/sentiment_model.pkl"
+    SPAM_MODEL_PATH = "models/spam_model.pkl"
+    SENTIMENT_ARTIFACT_PATH = "models/sentiment_model"
+    SPAM_ARTIFACT_PATH = "models/spam_model"
+    VOCABULARY_CONFIG = {"compact": True, "min_terms": 20000, "hot_terms": 4096, "filter": True}
+
+try:
+    from .model import SentimentModel
+    from .spam_detector import SpamDetector
+    from .near_duplicate import YakinKopyaIndeksi
+    from .anomaly import DerlenmisOrman
+    from .vocabulary import KompaktSozluk, terim_tablosu, yuva_tablosu
+except ImportError:
+    from model import SentimentModel  # type: ignore[no-redef]
+    from spam_detector import SpamDetector  # type: ignore[no-redef]
+    from near_duplicate import YakinKopyaIndeksi  # type: ignore[no-redef]
+    from anomaly import DerlenmisOrman  # type: ignore[no-redef]
+    from vocabulary import KompaktSozluk, terim_tablosu, yuva_tablosu  # type: ignore[no-redef]
+
+
+# Dizin düzeni değişirse artırılır; eski sürümlü artefakt yüklenmez
+BICIM_SURUMU = 1
+MANIFEST = "manifest.json"
+
+_SINIFLANDIRICILAR = {"LogisticRegression": LogisticRegression, "SGDClassifier": SGDClassifier}
+
+
+def artefakt_mi(path) -> bool:
+    """Yol bir model artefaktı dizini mi?"""
+    return os.path.isfile(os.path.join(str(path), MANIFEST))
+
+
+def artefakt_ozeti(path) -> Optional[str]:
+    """
+    Kayıtta hesaplanıp manifeste yazılan içerik özetini döndürür.
+
+    Yalnızca manifest okunur, diziler açılmaz. Özetten önce yazılmış
+    artefaktlarda None döner.
+    """
+    with open(os.path.join(str(path), MANIFEST), encoding="utf-8") as dosya:
+        return json.load(dosya).get("ozet")
+
+
+def varsayilan_model_yolu(tur: str) -> str:
+    """
+    Yüklenecek model yolunu seçer.
+
+    ARTIFACT_CONFIG["prefer"] açıksa ve artefakt varsa artefakt dizini,
+    değilse joblib dosyası döner.
+
+    Args:
+        tur: "duygu" veya "spam"
+    """
+    pkl_yolu, artefakt_yolu = {
+        "duygu": (SENTIMENT_MODEL_PATH, SENTIMENT_ARTIFACT_PATH),
+        "spam": (SPAM_MODEL_PATH, SPAM_ARTIFACT_PATH)
+    }[tur]
+    if ARTIFACT_CONFIG.get("prefer", True) and artefakt_mi(artefakt_yolu):
+        return str(artefakt_yolu)
+    return str(pkl_yolu)
+
+
+# ============================================================
+# YAZMA / OKUMA
+# ============================================================
+
+class _ArtefaktYazici:
+    """Dizileri ve manifesti toplayıp dizine atomik olarak yazar."""
+
+    def __init__(self, tur: str):
+        self.manifest: Dict[str, Any] = {"bicim": BICIM_SURUMU, "tur": tur}
+        self.diziler: Dict[str, np.ndarray] = {}
+
+    def dizi(self, ad: str, deger) -> str:
+        """Diziyi kaydedilecekler listesine ekler, adını döndürür."""
+        deger = np.ascontiguousarray(deger)
+        if deger.dtype == object:
+            raise ValueError(f"'{ad}' nesne dizisi; artefakt yalnızca sayısal dizi saklar")
+        self.diziler[ad] = deger
+        return ad
+
+    def yaz(self, path: str):
+        """
+        Dizini yazar.
+
+        Önce süreçe özgü geçici dizine yazılır, ardından yerine taşınır;
+        eski artefaktı bellek eşlemesiyle açmış süreçler çalışmaya devam eder.
+        Manifest ve dizilerin içerik özeti manifestin "ozet" alanına yazılır;
+        sonuç önbelleği sürümü (analysis.model_surumu) yüklemede dizileri
+        yeniden okumadan bunu kullanır.
+        """
+        path = str(path).rstrip(os.sep)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        gecici = f"{path}.{os.getpid()}.tmp"
+        shutil.rmtree(gecici, ignore_errors=True)
+        os.makedirs(gecici)
+
+        self.manifest["diziler"] = {}
+        for ad, deger in self.diziler.items():
+            np.save(os.path.join(gecici, ad + ".npy"), deger, allow_pickle=False)
+            self.manifest["diziler"][ad] = {"dtype": deger.dtype.str, "shape": list(deger.shape)}
+
+        # Diziler zaten bellekte: özet yazarken bir kez hesaplanır
+        ozet = hashlib.blake2b(digest_size=16)
+        self.manifest.pop("ozet", None)
+        ozet.update(json.dumps(self.manifest, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        for ad in sorted(self.diziler):
+            ozet.update(b"\x00")
+            ozet.update(self.diziler[ad].reshape(-1).view(np.uint8))
+        self.manifest["ozet"] = ozet.hexdigest()
+
+        with open(os.path.join(gecici, MANIFEST), "w", encoding="utf-8") as dosya:
+            json.dump(self.manifest, dosya, ensure_ascii=False, indent=2)
+
+        eski = f"{path}.{os.getpid()}.eski"
+        if os.path.exists(path):
+            os.replace(path, eski)
+        os.replace(gecici, path)
+        shutil.rmtree(eski, ignore_errors=True)
+
+
+class _ArtefaktOkuyucu:
+    """Manifesti okur, dizileri (istenirse) bellek eşlemesiyle açar."""
+
+    def __init__(self, path: str, mmap: bool):
+        self.path = str(path)
+        self.mmap = mmap
+        with open(os.path.join(self.path, MANIFEST), encoding="utf-8") as dosya:
+            self.manifest: Dict[str, Any] = json.load(dosya)
+        if self.manifest.get("bicim") != BICIM_SURUMU:
+            raise ValueError(
+                f"Artefakt biçim sürümü {self.manifest.get('bicim')}, beklenen {BICIM_SURUMU}: {self.path}"
+            )
+
+    def dizi(self, ad: str) -> np.ndarray:
+        """Diziyi açar; boş diziler eşlenemediği için belleğe okunur."""
+        bilgi = self.manifest["diziler"][ad]
+        dosya = os.path.join(self.path, ad + ".npy")
+        eslem = "r" if self.mmap and int(np.prod(bilgi["shape"])) > 0 else None
+        deger = np.load(dosya, mmap_mode=eslem, allow_pickle=False)
+        # np.memmap alt sınıfı işlemlerde kendini çoğaltır; düz ndarray
+        # görünümü aynı eşlemeyi kullanır
+        return deger.view(np.ndarray) if isinstance(deger, np.memmap) else deger
+
+
+# ============================================================
+# PARAMETRELER VE SÖZLÜK
+# ============================================================
+
+def _parametreler(tahminci) -> Dict[str, Any]:
+    """
+    Tahmincinin kurucu parametrelerini JSON'a uygun biçimde döndürür.
+
+    Çağrılabilir parametreler (özel tokenizer vb.) saklanamaz; sözlük
+    değerli class_weight yalnızca eğitimde kullanıldığı için atlanır.
+    """
+    sonuc: Dict[str, Any] = {}
+    for ad, deger in tahminci.get_params(deep=False).items():
+        if ad == "dtype":
+            sonuc[ad] = np.dtype(deger).name
+        elif deger is None or isinstance(deger, (bool, int, float, str)):
+            sonuc[ad] = deger
+        elif isinstance(deger, (list, tuple)) and all(isinstance(x, (int, float, str)) for x in deger):
+            sonuc[ad] = list(deger)
+        elif ad == "class_weight":
+            continue
+        else:
+            raise ValueError(f"{type(tahminci).__name__}.{ad} artefakta yazılamaz: {deger!r}")
+    return sonuc
+
+
+def _parametreleri_coz(parametreler: Dict[str, Any]) -> Dict[str, Any]:
+    """_parametreler() çıktısını kurucu argümanlarına çevirir."""
+    sonuc = dict(parametreler)
+    if "ngram_range" in sonuc:
+        sonuc["ngram_range"] = tuple(sonuc["ngram_range"])
+    if "dtype" in sonuc:
+        sonuc["dtype"] = np.dtype(sonuc["dtype"]).type
+    return sonuc
+
+
+def _ayarlar_json(ayarlar: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Model ayar sözlüğünü (tfidf_config vb.) JSON'a uygun hale getirir."""
+    if ayarlar is None:
+        return None
+    return {ad: list(deger) if isinstance(deger, tuple) else deger for ad, deger in ayarlar.items()}
+
+
+# ============================================================
+# SKLEARN BİLEŞENLERİ
+# ============================================================
+
+def _vektorizor_yaz(yazici: _ArtefaktYazici, onek: str, adimlar: Dict) -> Dict[str, Any]:
+    """Pipeline'ın özellik adımlarını (tfidf veya hashing + tfidf) yazar."""
+    tfidf = adimlar["tfidf"]
+    bilgi: Dict[str, Any] = {"tfidf": _parametreler(tfidf), "idf": yazici.dizi(f"{onek}_idf", tfidf.idf_)}
+    if "hashing" in adimlar:
+        bilgi["tur"] = "hashing"
+        bilgi["hashing"] = _parametreler(adimlar["hashing"])
+    else:
+        bilgi["tur"] = "tfidf"
+        baytlar, ofsetler, indeksler = terim_tablosu(tfidf.vocabulary_)
+        bilgi["sozluk"] = {
+            "baytlar": yazici.dizi(f"{onek}_terim_baytlari", baytlar),
+            "ofsetler": yazici.dizi(f"{onek}_terim_ofsetleri", ofsetler),
+            "indeksler": yazici.dizi(f"{onek}_terim_indeksleri", indeksler),
+            "yuvalar": yazici.dizi(f"{onek}_terim_yuvalari", yuva_tablosu(baytlar, ofsetler))
+        }
+    return bilgi
+
+
+def _vektorizor_oku(okuyucu: _ArtefaktOkuyucu, bilgi: Dict[str, Any]) -> list:
+    """_vektorizor_yaz() çıktısından Pipeline özellik adımlarını kurar."""
+    idf = okuyucu.dizi(bilgi["idf"])
+    if bilgi["tur"] == "hashing":
+        hashing = HashingVectorizer(**_parametreleri_coz(bilgi["hashing"]))
+        tfidf = TfidfTransformer(**_parametreleri_coz(bilgi["tfidf"]))
+        tfidf.idf_ = idf
+        tfidf.n_features_in_ = len(idf)
+        return [("hashing", hashing), ("tfidf", tfidf)]
+
+    vektorizor = TfidfVectorizer(**_parametreleri_coz(bilgi["tfidf"]))
+    # Sözlük dizilerin üzerinde kalır; eski artefaktlarda yuva tablosu yüklemede kurulur
+    sozluk = bilgi["sozluk"]
+    kompakt = KompaktSozluk(
+        okuyucu.dizi(sozluk["baytlar"]), okuyucu.dizi(sozluk["ofsetler"]), okuyucu.dizi(sozluk["indeksler"]),
+        okuyucu.dizi(sozluk["yuvalar"]) if "yuvalar" in sozluk else None
+    )
+    if VOCABULARY_CONFIG.get("compact", True) and len(kompakt) >= VOCABULARY_CONFIG.get("min_terms", 20000):
+        vektorizor.vocabulary_ = kompakt.hizlandir(idf)
+    else:
+        vektorizor.vocabulary_ = dict(kompakt.items())
+    vektorizor.idf_ = idf
+    vektorizor._tfidf.n_features_in_ = len(idf)
+    return [("tfidf", vektorizor)]
+
+
+def _siniflandirici_yaz(yazici: _ArtefaktYazici, onek: str, siniflandirici) -> Dict[str, Any]:
+    """Doğrusal sınıflandırıcının katsayılarını yazar (seyrek coef_ dahil)."""
+    tur = type(siniflandirici).__name__
+    if tur not in _SINIFLANDIRICILAR:
+        raise ValueError(f"Desteklenmeyen sınıflandırıcı: {tur}")
+    bilgi: Dict[str, Any] = {
+        "tur": tur,
+        "parametreler": _parametreler(siniflandirici),
+        "n_features_in": int(siniflandirici.n_features_in_),
+        "kesisim": yazici.dizi(f"{onek}_kesisim", siniflandirici.intercept_),
+        "siniflar": yazici.dizi(f"{onek}_siniflar", siniflandirici.classes_)
+    }
+    katsayilar = siniflandirici.coef_
+    if sparse.issparse(katsayilar):
+        katsayilar = sparse.csr_matrix(katsayilar)
+        bilgi["seyrek_katsayilar"] = {
+            "veri": yazici.dizi(f"{onek}_katsayi_verisi", katsayilar.data),
+            "indeksler": yazici.dizi(f"{onek}_katsayi_indeksleri", katsayilar.indices),
+            "indptr": yazici.dizi(f"{onek}_katsayi_indptr", katsayilar.indptr),
+            "shape": list(katsayilar.shape)
+        }
+    else:
+        bilgi["katsayilar"] = yazici.dizi(f"{onek}_katsayilar", katsayilar)
+    return bilgi
+
+
+def _siniflandirici_oku(okuyucu: _ArtefaktOkuyucu, bilgi: Dict[str, Any]):
+    """_siniflandirici_yaz() çıktısından tahmin için hazır sınıflandırıcı kurar."""
+    siniflandirici = _SINIFLANDIRICILAR[bilgi["tur"]](**_parametreleri_coz(bilgi["parametreler"]))
+    if "seyrek_katsayilar" in bilgi:
+        seyrek = bilgi["seyrek_katsayilar"]
+        siniflandirici.coef_ = sparse.csr_matrix(
+            (okuyucu.dizi(seyrek["veri"]), okuyucu.dizi(seyrek["indeksler"]), okuyucu.dizi(seyrek["indptr"])),
+            shape=tuple(seyrek["shape"])
+        )
+    else:
+        siniflandirici.coef_ = okuyucu.dizi(bilgi["katsayilar"])
+    siniflandirici.intercept_ = okuyucu.dizi(bilgi["kesisim"])
+    siniflandirici.classes_ = okuyucu.dizi(bilgi["siniflar"])
+    siniflandirici.n_features_in_ = bilgi["n_features_in"]
+    return siniflandirici
+
+
+# ============================================================
+# MODELLER
+# ============================================================
+
+def _duygu_yaz(model: SentimentModel) -> _ArtefaktYazici:
+    """SentimentModel'i artefakt yazıcısına aktarır."""
+    yazici = _ArtefaktYazici("duygu")
+    adimlar = model.pipeline.named_steps
+    yazici.manifest["model"] = {
+        "featurizer": model.featurizer,
+        "incremental": bool(model.incremental),
+        "compacted": bool(getattr(model, "compacted", False)),
+        "tfidf_config": _ayarlar_json(model.tfidf_config),
+        "hashing_config": _ayarlar_json(model.hashing_config),
+        "ozellikler": _vektorizor_yaz(yazici, "duygu", adimlar),
+        "siniflandirici": _siniflandirici_yaz(yazici, "duygu", adimlar["classifier"])
+    }
+    return yazici
+
+
+def _duygu_oku(okuyucu: _ArtefaktOkuyucu) -> SentimentModel:
+    """Artefakttan SentimentModel kurar."""
+    bilgi = okuyucu.manifest["model"]
+    model = SentimentModel(
+        tfidf_config=_parametreleri_coz(bilgi["tfidf_config"]),
+        featurizer=bilgi["featurizer"],
+        hashing_config=_parametreleri_coz(bilgi["hashing_config"]),
+        incremental=bilgi["incremental"]
+    )
+    model.pipeline = Pipeline(
+        _vektorizor_oku(okuyucu, bilgi["ozellikler"])
+        + [("classifier", _siniflandirici_oku(okuyucu, bilgi["siniflandirici"]))]
+    )
+    model.compacted = bilgi["compacted"]
+    model.yalnizca_cikarim = True
+    model.is_trained = True
+    return model
+
+
+def _spam_yaz(model: SpamDetector) -> _ArtefaktYazici:
+    """SpamDetector'ı artefakt yazıcısına aktarır."""
+    yazici = _ArtefaktYazici("spam")
+    adimlar = model.pipeline.named_steps
+    bilgi: Dict[str, Any] = {
+        "rule_weight": model.rule_weight,
+        "anomaly_weight": model.anomaly_weight,
+        "siniflar": [[int(k), v] for k, v in model.classes.items()],
+        "asama_sureleri": dict(getattr(model, "asama_sureleri", {})),
+        "ozellikler": _vektorizor_yaz(yazici, "spam", adimlar),
+        "siniflandirici": _siniflandirici_yaz(yazici, "spam", adimlar["classifier"])
+    }
+
+    svd = getattr(model, "svd", None)
+    if svd is not None:
+        bilgi["svd"] = {
+            "parametreler": _parametreler(svd),
+            "bilesenler": yazici.dizi("svd_bilesenleri", svd.components_)
+        }
+
+    # IsolationForest ağaçları derlenmiş orman dizileri olarak saklanır
+    if model.anomali_modeli_var:
+        orman = model._orman()
+        bilgi["orman"] = {
+            "derinlik": int(orman.derinlik),
+            "payda": float(orman.payda),
+            "esik": float(orman.esik),
+            "n_features": int(orman.n_features)
+        }
+        for ad in ("kokler", "sol", "sag", "ozellik", "esik_degeri", "yaprak_degeri"):
+            bilgi["orman"][ad] = yazici.dizi(f"orman_{ad}", getattr(orman, ad))
+
+    indeks = getattr(model, "yakin_kopya_indeksi", None)
+    if indeks is not None:
+        ayarlar, diziler = indeks.durum()
+        bilgi["yakin_kopya"] = {
+            "ayarlar": ayarlar,
+            "diziler": {ad: yazici.dizi(f"yakin_kopya_{ad}", deger) for ad, deger in diziler.items()}
+        }
+
+    yazici.manifest["model"] = bilgi
+    return yazici
+
+
+def _spam_oku(okuyucu: _ArtefaktOkuyucu) -> SpamDetector:
+    """Artefakttan SpamDetector kurar."""
+    bilgi = okuyucu.manifest["model"]
+    model = SpamDetector(rule_weight=bilgi["rule_weight"], anomaly_weight=bilgi["anomaly_weight"])
+    model.classes = {k: v for k, v in bilgi["siniflar"]}
+    model.asama_sureleri = bilgi["asama_sureleri"]
+
+    adimlar = _vektorizor_oku(okuyucu, bilgi["ozellikler"])
+    model.tfidf_vectorizer = adimlar[0][1]
+    model.pipeline = Pipeline(adimlar + [("classifier", _siniflandirici_oku(okuyucu, bilgi["siniflandirici"]))])
+
+    if "svd" in bilgi:
+        model.svd = TruncatedSVD(**_parametreleri_coz(bilgi["svd"]["parametreler"]))
+        model.svd.components_ = okuyucu.dizi(bilgi["svd"]["bilesenler"])
+        model.svd.n_features_in_ = model.svd.components_.shape[1]
+
+    if "orman" in bilgi:
+        orman = bilgi["orman"]
+        model._derlenmis_orman = DerlenmisOrman(
+            **{ad: okuyucu.dizi(orman[ad]) for ad in ("kokler", "sol", "sag", "ozellik", "esik_degeri", "yaprak_degeri")},
+            derinlik=orman["derinlik"],
+            payda=orman["payda"],
+            esik=orman["esik"],
+            n_features=orman["n_features"]
+        )
+
+    if "yakin_kopya" in bilgi:
+        yakin = bilgi["yakin_kopya"]
+        model.yakin_kopya_indeksi = YakinKopyaIndeksi.durumdan(
+            yakin["ayarlar"], {ad: okuyucu.dizi(dizi) for ad, dizi in yakin["diziler"].items()}
+        )
+
+    model.is_trained = True
+    return model
+
+
+# ============================================================
+# GENEL ARAYÜZ
+# ============================================================
+
+def artefakt_kaydet(model, path: Optional[str] = None) -> str:
+    """
+    Eğitilmiş modeli artefakt dizinine kaydeder.
+
+    Args:
+        model: Eğitilmiş SentimentModel veya SpamDetector
+        path: Hedef dizin (None ise config'deki artefakt yolu)
+
+    Returns:
+        str: Yazılan dizin
+    """
+    if not model.is_trained or model.pipeline is None:
+        raise ValueError("Model henüz eğitilmedi! Önce fit() çağırın.")
+    # Sınıf adına göre seçilir: modül betik olarak çalıştırıldığında
+    # (python src/model.py) sınıf __main__ altında tanımlıdır
+    tur = type(model).__name__
+    if tur == "SentimentModel":
+        yazici = _duygu_yaz(model)
+        path = str(path or SENTIMENT_ARTIFACT_PATH)
+    elif tur == "SpamDetector":
+        yazici = _spam_yaz(model)
+        path = str(path or SPAM_ARTIFACT_PATH)
+    else:
+        raise TypeError(f"Artefakt olarak kaydedilemeyen model türü: {tur}")
+
+    yazici.yaz(path)
+    boyut = sum(d.nbytes for d in yazici.diziler.values())
+    print(f"[OK] Model artefaktı kaydedildi: {path} ({len(yazici.diziler)} dizi, {boyut / 2**20:.1f} MB)")
+    return path
+
+
+def artefakt_yukle(path, mmap: Optional[bool] = None):
+    """
+    Artefakt dizininden modeli kurar.
+
+    Args:
+        path: Artefakt dizini
+        mmap: True ise diziler bellek eşlemesiyle açılır (None ise ARTIFACT_CONFIG)
+
+    Returns:
+        SentimentModel veya SpamDetector
+    """
+    mmap = ARTIFACT_CONFIG.get("mmap", True) if mmap is None else mmap
+    okuyucu = _ArtefaktOkuyucu(str(path), mmap)
+    tur = okuyucu.manifest.get("tur")
+    if tur == "duygu":
+        return _duygu_oku(okuyucu)
+    if tur == "spam":
+        return _spam_oku(okuyucu)
+    raise ValueError(f"Bilinmeyen artefakt türü: {tur}")
+
+
+# ============================================================
+# KOMUT SATIRI
+# ============================================================
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MODEL ARTEFAKTI DÖNÜŞTÜRME")
+    print("=" * 60)
+
+    for sinif, pkl_yolu, artefakt_yolu in (
+        (SentimentModel, SENTIMENT_MODEL_PATH, SENTIMENT_ARTIFACT_PATH),
+        (SpamDetector, SPAM_MODEL_PATH, SPAM_ARTIFACT_PATH)
+    ):
+        if not os.path.exists(pkl_yolu):
+            print(f"[UYARI] Model dosyası bulunamadı, atlandı: {pkl_yolu}")
+            continue
+        artefakt_kaydet(sinif.load(str(pkl_yolu)), str(artefakt_yolu))
+
+        baslangic = time.perf_counter()
+        artefakt_yukle(artefakt_yolu)
+        print(f"[BİLGİ] Artefakt yükleme süresi: {(time.perf_counter() - baslangic) * 1000:.1f} ms\n")
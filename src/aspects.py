@@ -0,0 +1,217 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Aspekt Motoru
+============================================================
+Normalize edilmiş yorumlarda aspekt (kargo, fiyat, kalite...)
+geçen cümleleri bulur ve bu cümlelerin duygusunu toplu olarak
+hesaplar.
+
+Her metin ortak anahtar kelime otomatından tek kez geçirilir;
+eşleşme konumları cümle aralıklarına eşlenir. Bir gruptaki tüm
+metinlerin eşleşen cümleleri tekilleştirilip tek bir
+predict_proba çağrısıyla skorlanır.
+
+Kullanım:
+    from src.aspects import AspektMotoru
+
+    motor = AspektMotoru(duygu_modeli)
+    motor.analiz("kargo hizli geldi. fiyat biraz pahali")
+    tablo = motor.analiz_et(normalize_metinler)
+"""
+
+import os
+import re
+import sys
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .keyword_matcher import AnahtarKelimeEslestirici, varsayilan_eslestirici, aspekt_grubu
+except ImportError:
+    from keyword_matcher import AnahtarKelimeEslestirici, varsayilan_eslestirici, aspekt_grubu  # type: ignore[no-redef]
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import ASPECT_KEYWORDS
+except ImportError:
+    ASPECT_KEYWORDS = {}
+
+
+# Cümle sınırları: ".", "!" ve "?"
+CUMLE_PATTERN = re.compile(r"[^.!?]+")
+
+
+# ============================================================
+# ASPEKT MOTORU
+# ============================================================
+
+class AspektMotoru:
+    """
+    Toplu aspekt bazlı duygu analizi.
+
+    Her aspekt için metindeki ilk eşleşen cümle seçilir (arayüzdeki
+    önceki davranışla aynı). Cümleler boşluklardan arındırılmış
+    aralıklar olarak tutulur; bir eşleşme yalnızca tamamen tek bir
+    cümlenin içindeyse sayılır.
+
+    Attributes:
+        aspektler: Aspekt adları (config sırasıyla)
+        eslestirici: Ortak anahtar kelime otomatı
+    """
+
+    # Bu sayıya kadar cümle derlenmiş skorlayıcıyla, üstü Pipeline ile skorlanır
+    KUCUK_GRUP = 32
+
+    def __init__(
+        self,
+        duygu_modeli,
+        skorlayici=None,
+        eslestirici: Optional[AnahtarKelimeEslestirici] = None,
+        aspektler: Optional[Iterable[str]] = None
+    ):
+        """
+        Args:
+            duygu_modeli: Eğitilmiş SentimentModel
+            skorlayici: Aynı modelden derlenmiş LinearScorer (opsiyonel;
+                küçük gruplarda Pipeline ek yükünü atlar)
+            eslestirici: Anahtar kelime otomatı (None ise varsayilan_eslestirici())
+            aspektler: Aspekt adları (None ise ASPECT_KEYWORDS)
+        """
+        self.duygu_modeli = duygu_modeli
+        self.skorlayici = skorlayici
+        self.eslestirici = eslestirici or varsayilan_eslestirici()
+        self.aspektler: List[str] = list(ASPECT_KEYWORDS if aspektler is None else aspektler)
+        self._grup_aspekt = {aspekt_grubu(ad): sira for sira, ad in enumerate(self.aspektler)}
+
+        # Boş anahtar kelimeli gruplar her cümlede eşleşir
+        self._her_zaman = sorted(
+            self._grup_aspekt[g] for g in self.eslestirici.gruplari_bul("") if g in self._grup_aspekt
+        )
+
+    # ============================================================
+    # CÜMLE / ASPEKT EŞLEŞTİRME
+    # ============================================================
+
+    @staticmethod
+    def cumle_araliklari(metin: str) -> List[Tuple[int, int]]:
+        """
+        Metni cümlelere böler.
+
+        Returns:
+            List: Baştaki/sondaki boşluklar atılmış, boş olmayan cümlelerin
+            (başlangıç, bitiş) aralıkları
+        """
+        araliklar = []
+        for eslesme in CUMLE_PATTERN.finditer(metin):
+            parca = eslesme.group()
+            bas = eslesme.start() + len(parca) - len(parca.lstrip())
+            son = eslesme.start() + len(parca.rstrip())
+            if son > bas:
+                araliklar.append((bas, son))
+        return araliklar
+
+    def eslestir(self, metin: str) -> Dict[int, Tuple[int, int]]:
+        """
+        Metni tek otomat geçişiyle tarar.
+
+        Returns:
+            dict: Aspekt sırası → aspektin geçtiği ilk cümlenin aralığı
+        """
+        araliklar = self.cumle_araliklari(metin)
+        if not araliklar:
+            return {}
+
+        ilk_cumle: Dict[int, int] = {a: 0 for a in self._her_zaman}
+        baslangiclar = [bas for bas, _ in araliklar]
+        for bas, son, gruplar in self.eslestirici.grup_konumlari(metin):
+            cumle = bisect_right(baslangiclar, bas) - 1
+            if cumle < 0 or son > araliklar[cumle][1]:
+                continue
+            for grup in gruplar:
+                aspekt = self._grup_aspekt.get(grup)
+                if aspekt is not None and cumle < ilk_cumle.get(aspekt, len(araliklar)):
+                    ilk_cumle[aspekt] = cumle
+
+        return {aspekt: araliklar[cumle] for aspekt, cumle in ilk_cumle.items()}
+
+    # ============================================================
+    # SKORLAMA
+    # ============================================================
+
+    def _olasiliklar(self, cumleler: List[str]) -> np.ndarray:
+        """Cümlelerin sınıf olasılıklarını tek çağrıda hesaplar."""
+        if self.skorlayici is not None and len(cumleler) <= self.KUCUK_GRUP:
+            return self.skorlayici.predict_proba(cumleler)
+        return self.duygu_modeli.predict_proba(cumleler)
+
+    def analiz_dizileri(self, normalize_metinler: Sequence[str]) -> Dict[str, Any]:
+        """
+        analiz_et() ile aynı sütunları DataFrame kurmadan döndürür.
+
+        Grubun eşleşmeleri bulunur, tekil cümleler tek çağrıda skorlanır
+        ve satırlara geri dağıtılır.
+
+        Returns:
+            dict: Sütun adı → liste/dizi
+        """
+        metin_indeksleri: List[int] = []
+        aspekt_siralari: List[int] = []
+        cumle_kimlikleri: List[int] = []
+        cumle_kimligi: Dict[str, int] = {}
+
+        for i, metin in enumerate(normalize_metinler):
+            for aspekt, (bas, son) in sorted(self.eslestir(metin).items()):
+                metin_indeksleri.append(i)
+                aspekt_siralari.append(aspekt)
+                cumle_kimlikleri.append(cumle_kimligi.setdefault(metin[bas:son], len(cumle_kimligi)))
+
+        cumleler = list(cumle_kimligi)
+        if cumleler:
+            olasiliklar = self._olasiliklar(cumleler)[cumle_kimlikleri]
+        else:
+            olasiliklar = np.empty((0, 3))
+
+        return {
+            "metin": np.asarray(metin_indeksleri, dtype=np.int64),
+            "aspekt": [self.aspektler[a] for a in aspekt_siralari],
+            "cumle": [cumleler[k] for k in cumle_kimlikleri],
+            "duygu": olasiliklar.argmax(axis=1).astype(np.int64),
+            "olasilik_negatif": olasiliklar[:, 0],
+            "olasilik_notr": olasiliklar[:, 1],
+            "olasilik_pozitif": olasiliklar[:, 2]
+        }
+
+    def analiz_et(self, normalize_metinler: Sequence[str]) -> pd.DataFrame:
+        """
+        Bir metin grubundaki tüm aspektleri analiz eder.
+
+        Args:
+            normalize_metinler: Normalize edilmiş metinler
+
+        Returns:
+            pd.DataFrame: Metin ve aspekt başına bir satır: metin (girdi
+            indeksi), aspekt, cumle, duygu, olasilik_negatif,
+            olasilik_notr, olasilik_pozitif
+        """
+        d = self.analiz_dizileri(normalize_metinler)
+        d["aspekt"] = pd.Series(d["aspekt"], dtype=object)
+        d["cumle"] = pd.Series(d["cumle"], dtype=object)
+        return pd.DataFrame(d)
+
+    def analiz(self, normalize_metin: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Tek bir metnin aspektlerini analiz eder.
+
+        Returns:
+            dict: Aspekt → {"cumle", "duygu" (sınıf kimliği), "olasiliklar"}
+        """
+        d = self.analiz_dizileri([normalize_metin])
+        olasiliklar = np.column_stack([d["olasilik_negatif"], d["olasilik_notr"], d["olasilik_pozitif"]])
+        return {
+            aspekt: {"cumle": cumle, "duygu": int(duygu), "olasiliklar": olasilik}
+            for aspekt, cumle, duygu, olasilik in zip(d["aspekt"], d["cumle"], d["duygu"], olasiliklar)
+        }
@@ -0,0 +1,258 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Mikro Gruplama
+============================================================
+Eşzamanlı gelen tek yorumluk istekleri kısa bir süre toplayıp
+tek bir toplu çağrıyla işler.
+
+Yük altında her istek tek satırlık predict_proba çağırır ve
+sklearn'ün çağrı başına sabit ek yükünü saniyede yüzlerce kez
+öder. Toplayıcı ilk istekten sonra en fazla `max_wait_ms`
+bekler veya `max_batch_size` isteğe ulaşınca grubu tek çağrıyla
+işler, sonuçları her çağırana geri dağıtır.
+
+Hem iş parçacıklı (Gradio) hem asyncio (FastAPI) çağıranlarla
+çalışır: her istek bir concurrent.futures.Future'dır.
+
+Kullanım:
+    from src.batching import MikroToplayici
+
+    toplayici = MikroToplayici(analizci.analiz_kayitlari)
+    kayit = toplayici.isle("Kargo hızlı geldi")            # iş parçacığı
+    kayit = await toplayici.aisle("Kargo hızlı geldi")     # asyncio
+    toplayici.stats()
+"""
+
+import os
+import sys
+import time
+import queue
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import MICRO_BATCH_CONFIG
+except ImportError:
+    MICRO_BATCH_CONFIG = {"enabled": True, "max_wait_ms": 2, "max_batch_size": 64}
+
+
+# Kuyruğa konunca toplayıcı iş parçacığını durdurur
+_DUR = object()
+
+
+class _Istek:
+    """Kuyruktaki tek istek."""
+
+    __slots__ = ("veri", "secim", "anahtar", "gelis", "future")
+
+    def __init__(self, veri: Any, secim: Dict[str, Any]):
+        self.veri = veri
+        self.secim = secim
+        self.anahtar = tuple(sorted(secim.items()))
+        self.gelis = time.perf_counter()
+        self.future: Future = Future()
+
+
+# ============================================================
+# MİKRO TOPLAYICI
+# ============================================================
+
+class MikroToplayici:
+    """
+    Tek öğelik istekleri gruplayıp toplu fonksiyona veren zamanlayıcı.
+
+    Toplu fonksiyon bir öğe listesi alır ve aynı sırayla sonuç listesi
+    döndürür (ör. YorumAnalizcisi.analiz_kayitlari). Farklı anahtar
+    kelime argümanlı (`secim`) istekler aynı grupta ayrı çağrılara
+    bölünür. Fonksiyon tek bir arka plan iş parçacığında çalışır;
+    bir grup işlenirken gelen istekler sıradaki grubu oluşturur.
+    Eşzamanlı istek yokken (önceki grup tek istekti, kuyruk boş)
+    beklenmez; tek çağıran gecikme ödemez.
+
+    Attributes:
+        max_wait_ms: Grubun ilk isteğinden sonra beklenecek en uzun süre
+        max_batch_size: Gruptaki en fazla istek
+    """
+
+    # Gecikme yüzdelikleri için tutulan son ölçüm sayısı
+    OLCUM_PENCERESI = 2048
+
+    def __init__(
+        self,
+        fonksiyon: Callable[..., Sequence[Any]],
+        max_wait_ms: Optional[float] = None,
+        max_batch_size: Optional[int] = None
+    ):
+        """
+        Args:
+            fonksiyon: Öğe listesi → sonuç listesi toplu fonksiyon
+            max_wait_ms: En uzun bekleme (None ise MICRO_BATCH_CONFIG)
+            max_batch_size: En büyük grup (None ise MICRO_BATCH_CONFIG)
+        """
+        self.fonksiyon = fonksiyon
+        self.max_wait_ms = float(MICRO_BATCH_CONFIG.get("max_wait_ms", 5) if max_wait_ms is None else max_wait_ms)
+        self.max_batch_size = int(max_batch_size or MICRO_BATCH_CONFIG.get("max_batch_size", 64))
+
+        self._kuyruk: "queue.Queue" = queue.Queue()
+        self._kilit = threading.Lock()
+        self._bekleme: deque = deque(maxlen=self.OLCUM_PENCERESI)
+        self._isleme: deque = deque(maxlen=self.OLCUM_PENCERESI)
+        self._grup_boyutlari: deque = deque(maxlen=self.OLCUM_PENCERESI)
+        self.istek_sayisi = 0
+        self.grup_sayisi = 0
+        self.hata_sayisi = 0
+        self.en_buyuk_grup = 0
+
+        self._kapali = False
+        self._is_parcacigi = threading.Thread(target=self._dongu, name="mikro-toplayici", daemon=True)
+        self._is_parcacigi.start()
+
+    # ============================================================
+    # İSTEK GÖNDERME
+    # ============================================================
+
+    def gonder(self, veri: Any, secim: Optional[Dict[str, Any]] = None) -> Future:
+        """
+        Bir öğeyi kuyruğa koyar.
+
+        Args:
+            veri: Tek öğe (ör. ham yorum)
+            secim: Toplu fonksiyona geçecek anahtar kelime argümanları
+
+        Returns:
+            Future: Öğenin sonucu
+        """
+        if self._kapali:
+            raise RuntimeError("Mikro toplayıcı kapatıldı")
+        istek = _Istek(veri, secim or {})
+        self._kuyruk.put(istek)
+        return istek.future
+
+    def isle(self, veri: Any, secim: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+        """İş parçacıklı çağıranlar için: öğeyi gönderir ve sonucu bekler."""
+        return self.gonder(veri, secim).result(timeout)
+
+    async def aisle(self, veri: Any, secim: Optional[Dict[str, Any]] = None) -> Any:
+        """asyncio çağıranlar için: olay döngüsünü bloklamadan sonucu bekler."""
+        return await asyncio.wrap_future(self.gonder(veri, secim))
+
+    # ============================================================
+    # TOPLAYICI DÖNGÜSÜ
+    # ============================================================
+
+    def _dongu(self):
+        """İstekleri gruplar; kapatılana kadar arka planda çalışır."""
+        son_grup = 0
+        while True:
+            ilk = self._kuyruk.get()
+            if ilk is _DUR:
+                return
+
+            grup = [ilk]
+            # Tek başına gelen istek beklemez: önceki grup tekse ve kuyruk
+            # boşsa eşzamanlı istek yoktur, bekleme yalnızca gecikme ekler
+            if son_grup > 1 or not self._kuyruk.empty():
+                son_an = ilk.gelis + self.max_wait_ms / 1000.0
+            else:
+                son_an = 0.0
+            dur = False
+            while len(grup) < self.max_batch_size:
+                kalan = son_an - time.perf_counter()
+                try:
+                    # Süre dolduysa yalnızca kuyrukta hazır bekleyenler alınır
+                    istek = self._kuyruk.get(timeout=kalan) if kalan > 0 else self._kuyruk.get_nowait()
+                except queue.Empty:
+                    break
+                if istek is _DUR:
+                    dur = True
+                    break
+                grup.append(istek)
+
+            self._grubu_isle(grup)
+            son_grup = len(grup)
+            if dur:
+                return
+
+    def _grubu_isle(self, grup: List[_Istek]):
+        """Grubu seçim anahtarına göre böler, her parça için tek çağrı yapar."""
+        baslangic = time.perf_counter()
+        # İptal edilen istekler (ör. bağlantısı kopan asyncio çağıranı) atlanır
+        grup = [istek for istek in grup if istek.future.set_running_or_notify_cancel()]
+        if not grup:
+            return
+
+        parcalar: Dict[tuple, List[_Istek]] = {}
+        for istek in grup:
+            parcalar.setdefault(istek.anahtar, []).append(istek)
+
+        hata = 0
+        for istekler in parcalar.values():
+            try:
+                sonuclar = self.fonksiyon([istek.veri for istek in istekler], **istekler[0].secim)
+                if len(sonuclar) != len(istekler):
+                    raise ValueError(f"{len(istekler)} öğe için {len(sonuclar)} sonuç döndü")
+            except Exception as e:
+                hata += len(istekler)
+                for istek in istekler:
+                    istek.future.set_exception(e)
+                continue
+            for istek, sonuc in zip(istekler, sonuclar):
+                istek.future.set_result(sonuc)
+
+        sure = time.perf_counter() - baslangic
+        with self._kilit:
+            self.istek_sayisi += len(grup)
+            self.grup_sayisi += 1
+            self.hata_sayisi += hata
+            self.en_buyuk_grup = max(self.en_buyuk_grup, len(grup))
+            self._grup_boyutlari.append(len(grup))
+            self._isleme.append(sure)
+            self._bekleme.extend(baslangic - istek.gelis for istek in grup)
+
+    # ============================================================
+    # DURUM
+    # ============================================================
+
+    def stats(self) -> dict:
+        """
+        Kuyruk derinliği, grup boyutu ve bekleme süresi ölçümleri.
+
+        Yüzdelikler son OLCUM_PENCERESI grup / istek üzerindendir.
+        """
+        with self._kilit:
+            bekleme = np.array(self._bekleme) * 1000.0
+            isleme = np.array(self._isleme) * 1000.0
+            boyutlar = np.array(self._grup_boyutlari)
+            sonuc = {
+                "kuyruk": self._kuyruk.qsize(),
+                "istek": self.istek_sayisi,
+                "grup": self.grup_sayisi,
+                "hata": self.hata_sayisi,
+                "en_buyuk_grup": self.en_buyuk_grup,
+                "max_wait_ms": self.max_wait_ms,
+                "max_batch_size": self.max_batch_size
+            }
+
+        sonuc["ortalama_grup"] = float(boyutlar.mean()) if len(boyutlar) else 0.0
+        for ad, olcum in (("bekleme_ms", bekleme), ("isleme_ms", isleme)):
+            sonuc[ad] = {
+                "p50": float(np.percentile(olcum, 50)) if len(olcum) else 0.0,
+                "p99": float(np.percentile(olcum, 99)) if len(olcum) else 0.0,
+                "maks": float(olcum.max()) if len(olcum) else 0.0
+            }
+        return sonuc
+
+    def kapat(self, timeout: Optional[float] = None):
+        """Kuyruktaki istekleri işler ve toplayıcı iş parçacığını durdurur."""
+        if self._kapali:
+            return
+        self._kapali = True
+        self._kuyruk.put(_DUR)
+        self._is_parcacigi.join(timeout)
@@ -0,0 +1,252 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Ortak Özellik Çıkarımı
+============================================================
+Duygu ve spam modelleri aynı normalize metni ayrı ayrı
+tokenize edip n-gram'lara ayırır. Bu modül metni tek bir
+analizör geçişinde tokenize eder ve her iki modelin TF-IDF
+özellik matrislerini aynı n-gram listesinden üretir.
+
+Kullanım:
+    from src.features import OrtakOzellikCikarici
+
+    cikarici = OrtakOzellikCikarici(duygu_modeli, spam_modeli)
+    paket = cikarici.donustur(normalize_metinler)
+    duygu_olasiliklari = cikarici.duygu_olasiliklari(paket)
+    spam_olasiliklari = cikarici.spam_olasiliklari(paket)
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+from sklearn.utils import murmurhash3_32
+
+
+def hash_indeksi(ngram: str, n_features: int) -> int:
+    """HashingVectorizer ile aynı özellik indeksini döndürür."""
+    h = murmurhash3_32(ngram, seed=0, positive=False)
+    if h == -2147483648:
+        return (2147483647 - (n_features - 1)) % n_features
+    return abs(h) % n_features
+
+
+# Aynı tokenizasyonu üreten vektörizörleri belirleyen parametreler
+_ANALIZOR_PARAMETRELERI = (
+    "analyzer", "preprocessor", "tokenizer", "lowercase",
+    "strip_accents", "token_pattern", "stop_words"
+)
+
+
+# ============================================================
+# ÖZELLİK UZAYI
+# ============================================================
+
+class OzellikUzayi:
+    """
+    Tek bir modelin TF-IDF özellik uzayı.
+
+    Sözlük (TfidfVectorizer) veya hash uzayı (HashingVectorizer +
+    TfidfTransformer) üzerinden n-gram → sütun eşlemesi, idf vektörü
+    ve satır normu bilgilerini tutar.
+    """
+
+    def __init__(self, adimlar: Dict):
+        """
+        Args:
+            adimlar: Pipeline.named_steps ("tfidf" ve varsa "hashing")
+        """
+        tfidf = adimlar["tfidf"]
+        vektorizor = adimlar.get("hashing", tfidf)
+
+        self.vektorizor = vektorizor
+        self.ngram_araligi: Tuple[int, int] = tuple(vektorizor.ngram_range)
+        self.idf = np.asarray(tfidf.idf_)
+        self.norm = tfidf.norm
+        self.sublinear_tf = tfidf.sublinear_tf
+        self.dtype = np.dtype(vektorizor.dtype)
+
+        if "hashing" in adimlar:
+            if vektorizor.alternate_sign:
+                raise ValueError("alternate_sign=True ile hashing uzayı desteklenmez!")
+            self.sozluk: Optional[Dict[str, int]] = None
+            self.n_features = vektorizor.n_features
+        else:
+            self.sozluk = tfidf.vocabulary_
+            self.n_features = len(tfidf.idf_)
+
+    def analizor_anahtari(self) -> Tuple:
+        """Tokenizasyonu belirleyen parametreler (paylaşım kontrolü için)."""
+        return tuple(
+            repr(getattr(self.vektorizor, ad, None)) for ad in _ANALIZOR_PARAMETRELERI
+        )
+
+    def indeks(self, ngram: str) -> Optional[int]:
+        """n-gram'ın sütun indeksini döndürür (sözlük dışıysa None)."""
+        if self.sozluk is not None:
+            return self.sozluk.get(ngram)
+        return hash_indeksi(ngram, self.n_features)
+
+    def matris(self, ngram_listeleri: List[List[str]]) -> sparse.csr_matrix:
+        """
+        n-gram listelerinden normalize TF-IDF matrisi kurar.
+
+        Sonuç, modelin kendi vektörizörünün transform() çıktısıyla aynıdır.
+        """
+        indptr = [0]
+        indeksler: List[int] = []
+        degerler: List[int] = []
+        for ngramlar in ngram_listeleri:
+            sayimlar: Dict[int, int] = {}
+            for ngram in ngramlar:
+                i = self.indeks(ngram)
+                if i is not None:
+                    sayimlar[i] = sayimlar.get(i, 0) + 1
+            indeksler.extend(sayimlar.keys())
+            degerler.extend(sayimlar.values())
+            indptr.append(len(indeksler))
+
+        X = sparse.csr_matrix(
+            (np.asarray(degerler, dtype=self.dtype),
+             np.asarray(indeksler, dtype=np.int64),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(ngram_listeleri), self.n_features)
+        )
+        X.sort_indices()
+
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1.0
+        X.data *= self.idf[X.indices]
+        if self.norm is not None:
+            X = normalize(X, norm=self.norm, copy=False)
+        return X
+
+
+# ============================================================
+# ORTAK ÖZELLİK ÇIKARICI
+# ============================================================
+
+class OrtakOzellikCikarici:
+    """
+    Duygu ve spam modelleri için tek geçişli özellik çıkarıcı.
+
+    Metin bir kez ön işlenip tokenize edilir; n-gram'lar en geniş
+    aralık için bir kez üretilir ve her model kendi aralığındaki
+    n-gram'ları kendi sözlüğüne eşler. Tokenizasyon parametreleri
+    uyuşmayan bir model kendi analizörüyle çalışmaya devam eder.
+
+    Attributes:
+        uzaylar: Model adı ("duygu", "spam") → OzellikUzayi
+    """
+
+    def __init__(self, duygu_modeli=None, spam_modeli=None):
+        """
+        Args:
+            duygu_modeli: Eğitilmiş SentimentModel (opsiyonel)
+            spam_modeli: Eğitilmiş SpamDetector (opsiyonel)
+        """
+        self.siniflandiricilar: Dict = {}
+        self.uzaylar: Dict[str, OzellikUzayi] = {}
+
+        for ad, model in (("duygu", duygu_modeli), ("spam", spam_modeli)):
+            if model is None or not model.is_trained or model.pipeline is None:
+                continue
+            self.uzaylar[ad] = OzellikUzayi(model.pipeline.named_steps)
+            self.siniflandiricilar[ad] = model.pipeline.named_steps["classifier"]
+
+        if not self.uzaylar:
+            raise ValueError("En az bir eğitilmiş model gerekli!")
+
+        # Ortak analizör ilk modelin tokenizasyonunu kullanır
+        ilk = next(iter(self.uzaylar.values()))
+        self._on_isleyici: Callable[[str], str] = ilk.vektorizor.build_preprocessor()
+        self._tokenizer: Callable[[str], List[str]] = ilk.vektorizor.build_tokenizer()
+        self._ortak = {
+            ad for ad, uzay in self.uzaylar.items()
+            if uzay.analizor_anahtari() == ilk.analizor_anahtari()
+            and uzay.vektorizor.analyzer == "word"
+            and uzay.vektorizor.stop_words is None
+        }
+        self._ayri_analizorler = {
+            ad: uzay.vektorizor.build_analyzer()
+            for ad, uzay in self.uzaylar.items() if ad not in self._ortak
+        }
+        araliklar = [self.uzaylar[ad].ngram_araligi for ad in self._ortak]
+        self._ngram_araligi = (
+            min(a[0] for a in araliklar), max(a[1] for a in araliklar)
+        ) if araliklar else (1, 1)
+
+    def tokenle(self, metin: str) -> List[str]:
+        """Metni ortak analizörle tokenize eder."""
+        return self._tokenizer(self._on_isleyici(metin))
+
+    @staticmethod
+    def _ngramlar(tokenler: List[str], aralik: Tuple[int, int]) -> List[str]:
+        """Tokenlerden n-gram listesi üretir (sklearn _word_ngrams sırası)."""
+        en_kucuk, en_buyuk = aralik
+        if en_buyuk == 1:
+            return list(tokenler)
+        ngramlar = list(tokenler) if en_kucuk == 1 else []
+        uzunluk = len(tokenler)
+        for n in range(max(en_kucuk, 2), min(en_buyuk, uzunluk) + 1):
+            for i in range(uzunluk - n + 1):
+                ngramlar.append(" ".join(tokenler[i:i + n]))
+        return ngramlar
+
+    def _model_ngramlari(self, ad: str, metin: str, tokenler: List[str],
+                         ngramlar: List[str]) -> List[str]:
+        """Ortak n-gram listesinden modelin kendi aralığını seçer."""
+        if ad not in self._ortak:
+            return self._ayri_analizorler[ad](metin)
+        aralik = self.uzaylar[ad].ngram_araligi
+        if aralik == self._ngram_araligi:
+            return ngramlar
+        return self._ngramlar(tokenler, aralik)
+
+    def donustur(
+        self,
+        metinler: List[str],
+        ngram_dondur: bool = False,
+        matrissiz: Sequence[str] = ()
+    ) -> Dict:
+        """
+        Metinleri tek analizör geçişiyle tüm modellerin özelliklerine çevirir.
+
+        Args:
+            metinler: Normalize edilmiş metinler
+            ngram_dondur: True ise model başına n-gram listeleri de döner
+                (LinearScorer ile tek yorum skorlamak için)
+            matrissiz: Özellik matrisi kurulmayacak modeller (ör. LinearScorer
+                ile skorlanacak "duygu"; n-gram listeleri yine döner)
+
+        Returns:
+            dict: "tokenler" (metin başına token listesi), her model için
+            CSR özellik matrisi ("duygu", "spam") ve istenirse "ngramlar"
+        """
+        tokenler = [self.tokenle(metin) for metin in metinler]
+        ortak_ngramlar = [self._ngramlar(t, self._ngram_araligi) for t in tokenler]
+
+        paket: Dict = {"tokenler": tokenler}
+        model_ngramlari = {}
+        for ad, uzay in self.uzaylar.items():
+            listeler = [
+                self._model_ngramlari(ad, metin, t, n)
+                for metin, t, n in zip(metinler, tokenler, ortak_ngramlar)
+            ]
+            if ad not in matrissiz:
+                paket[ad] = uzay.matris(listeler)
+            model_ngramlari[ad] = listeler
+
+        if ngram_dondur:
+            paket["ngramlar"] = model_ngramlari
+        return paket
+
+    def duygu_olasiliklari(self, paket: Dict) -> np.ndarray:
+        """Paketteki duygu özelliklerinden sınıf olasılıklarını hesaplar."""
+        return self.siniflandiricilar["duygu"].predict_proba(paket["duygu"])
+
+    def spam_olasiliklari(self, paket: Dict) -> np.ndarray:
+        """Paketteki spam özelliklerinden spam olasılıklarını hesaplar."""
+        return self.siniflandiricilar["spam"].predict_proba(paket["spam"])
@@ -0,0 +1,305 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Canlı Tekrar Sayacı
+============================================================
+Servis sırasında gelen normalize yorumların son zaman
+penceresinde kaç kez görüldüğünü tahmin eder. Eğitimdeki
+"10+ kez tekrar eden yorum" kuralının canlı karşılığıdır:
+yeni başlayan bir bot kampanyası yeniden eğitimi beklemeden
+görünür olur.
+
+Pencereli count-min sketch kullanılır: sayaçlar [kova, derinlik,
+genişlik] boyutunda sabit bir dizidir, trafik ne olursa olsun
+bellek değişmez. Pencere `buckets` alt pencereye bölünür; süresi
+dolan kova sıfırlanarak yeniden kullanılır. Durum .npz olarak
+diske yazılır (pickle yok), yeniden başlatmada kaybolmaz.
+
+Kullanım:
+    from src.frequency_sketch import TekrarSayaci
+
+    sayac = TekrarSayaci()
+    sayac.ekle("urun harika kesinlikle alin")   # 1
+    sayac.tahmin("urun harika kesinlikle alin") # 1
+    sayac.save()
+"""
+
+import os
+import sys
+import mmap
+import time
+import threading
+import multiprocessing
+from hashlib import blake2b
+from typing import List, Optional
+
+import numpy as np
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import STREAM_FREQUENCY_CONFIG
+except ImportError:
+    STREAM_FREQUENCY_CONFIG = {
+        "enabled": True, "width": 131072, "depth": 4,
+        "window_seconds": 3600, "buckets": 6, "min_count": 10,
+        "path": "models/frequency_sketch.npz", "snapshot_every": 5000, "snapshot_interval": 60
+    }
+
+
+_MASKE_64 = 0xFFFFFFFFFFFFFFFF
+
+
+# ============================================================
+# PENCERELİ COUNT-MIN SKETCH
+# ============================================================
+
+class TekrarSayaci:
+    """
+    Zaman pencereli count-min sketch.
+
+    Her metin blake2b ile iki 64 bitlik hash'e indirgenir ve
+    derinlik başına bir sütun çift hash'leme ile seçilir. Tahmin,
+    satırlar arasında pencere toplamlarının en küçüğüdür; gerçek
+    sayıdan asla küçük değildir. Ekleme "muhafazakâr güncelleme"
+    yapar (yalnızca en küçük sayaçlar artırılır), bu da çakışma
+    kaynaklı fazla sayımı azaltır.
+
+    İş parçacığı güvenlidir (Gradio istekleri eşzamanlı gelir).
+    paylasimli_yap() sonrası çatallanan süreçler de aynı sayaçları
+    günceller (src/serve.py).
+
+    Attributes:
+        width: Satır başına sayaç sayısı
+        depth: Hash satırı sayısı
+        window_seconds: Pencere uzunluğu (saniye)
+        buckets: Pencerenin bölündüğü alt pencere sayısı
+        eklenen: Başlatmadan (veya yüklemeden) bu yana eklenen metin sayısı
+    """
+
+    def __init__(
+        self,
+        width: Optional[int] = None,
+        depth: Optional[int] = None,
+        window_seconds: Optional[float] = None,
+        buckets: Optional[int] = None
+    ):
+        """
+        Args:
+            width: Satır başına sayaç sayısı
+            depth: Hash satırı sayısı
+            window_seconds: Pencere uzunluğu (saniye)
+            buckets: Alt pencere sayısı
+        """
+        self.width = int(width or STREAM_FREQUENCY_CONFIG.get("width", 131072))
+        self.depth = int(depth or STREAM_FREQUENCY_CONFIG.get("depth", 4))
+        self.window_seconds = float(window_seconds or STREAM_FREQUENCY_CONFIG.get("window_seconds", 3600))
+        self.buckets = int(buckets or STREAM_FREQUENCY_CONFIG.get("buckets", 6))
+        self.kova_suresi = self.window_seconds / self.buckets
+
+        self._sayaclar = np.zeros((self.buckets, self.depth, self.width), dtype=np.uint32)
+        self._satirlar = np.arange(self.depth)
+        # Son kullanılan kova (-1 = henüz yok); paylaşılabilsin diye dizi
+        self._son_kova = np.full(1, -1, dtype=np.int64)
+        self._kilit = threading.Lock()
+        self.paylasimli = False
+        self.eklenen = 0
+
+    # ============================================================
+    # İÇ YARDIMCILAR
+    # ============================================================
+
+    def _sutunlar(self, metin: str) -> List[int]:
+        """Metnin her satırdaki sayaç sütununu döndürür (çift hash'leme)."""
+        ozet = blake2b(metin.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(ozet[:8], "little")
+        h2 = int.from_bytes(ozet[8:], "little") | 1
+        return [((h1 + i * h2) & _MASKE_64) % self.width for i in range(self.depth)]
+
+    def _dondur(self, zaman: float) -> int:
+        """Kilit altında çağrılır; süresi dolan kovaları sıfırlar, güncel kovayı döndürür."""
+        kova = int(zaman // self.kova_suresi)
+        son_kova = int(self._son_kova[0])
+        if son_kova < 0:
+            self._son_kova[0] = kova
+        elif kova > son_kova:
+            gecen = kova - son_kova
+            if gecen >= self.buckets:
+                self._sayaclar.fill(0)
+            else:
+                for k in range(son_kova + 1, kova + 1):
+                    self._sayaclar[k % self.buckets] = 0
+            self._son_kova[0] = kova
+        # Geri giden saat: güncel kovaya yazılır
+        return int(self._son_kova[0]) % self.buckets
+
+    # ============================================================
+    # EKLEME / TAHMİN
+    # ============================================================
+
+    def ekle(self, metin: str, zaman: Optional[float] = None) -> int:
+        """
+        Metni bir kez sayar ve penceredeki tahmini sayısını döndürür.
+
+        Args:
+            metin: Normalize edilmiş metin
+            zaman: Unix zamanı (None ise şimdiki zaman)
+
+        Returns:
+            int: Bu ekleme dahil, pencerede tahmini görülme sayısı
+        """
+        sutunlar = self._sutunlar(metin)
+        with self._kilit:
+            kova = self._dondur(time.time() if zaman is None else zaman)
+            guncel = self._sayaclar[kova, self._satirlar, sutunlar]
+            # Muhafazakâr güncelleme: yalnızca en küçük sayaçlar artar
+            en_kucuk = guncel.min()
+            artacak = guncel == en_kucuk
+            if en_kucuk < np.iinfo(np.uint32).max:
+                self._sayaclar[kova, self._satirlar[artacak], np.asarray(sutunlar)[artacak]] += 1
+            tahmin = int(self._sayaclar[:, self._satirlar, sutunlar].sum(axis=0).min())
+            self.eklenen += 1
+        return tahmin
+
+    def tahmin(self, metin: str, zaman: Optional[float] = None) -> int:
+        """
+        Metnin penceredeki tahmini görülme sayısını döndürür (saymadan).
+
+        Args:
+            metin: Normalize edilmiş metin
+            zaman: Unix zamanı (None ise şimdiki zaman)
+        """
+        sutunlar = self._sutunlar(metin)
+        with self._kilit:
+            self._dondur(time.time() if zaman is None else zaman)
+            return int(self._sayaclar[:, self._satirlar, sutunlar].sum(axis=0).min())
+
+    # ============================================================
+    # SÜREÇLER ARASI PAYLAŞIM
+    # ============================================================
+
+    def paylasimli_yap(self):
+        """
+        Sayaçları süreçler arası paylaşılan anonim belleğe taşır.
+
+        os.fork() öncesi çağrılır. Çatallanan işçiler aynı sayaçları
+        günceller; her işçi trafiğin tamamını görür ve "son N dakikada
+        X kez" sinyali işçi sayısına bölünmez. Kilit süreçler arası
+        kilitle değiştirilir; `eklenen` süreç başına kalır.
+        """
+        if self.paylasimli:
+            return
+        with self._kilit:
+            sayac_bellegi = mmap.mmap(-1, self._sayaclar.nbytes)
+            sayaclar = np.frombuffer(sayac_bellegi, dtype=np.uint32).reshape(self._sayaclar.shape)
+            sayaclar[...] = self._sayaclar
+            kova_bellegi = mmap.mmap(-1, self._son_kova.nbytes)
+            son_kova = np.frombuffer(kova_bellegi, dtype=np.int64)
+            son_kova[...] = self._son_kova
+            self._sayaclar, self._son_kova = sayaclar, son_kova
+        self._kilit = multiprocessing.Lock()
+        self.paylasimli = True
+
+    # ============================================================
+    # DURUM
+    # ============================================================
+
+    @property
+    def bellek_boyutu(self) -> int:
+        """Sayaç dizisinin bayt cinsinden boyutu (sabit)."""
+        return int(self._sayaclar.nbytes)
+
+    def stats(self) -> dict:
+        """Sayaç boyutlarını ve doluluğunu döndürür."""
+        with self._kilit:
+            dolu = int(np.count_nonzero(self._sayaclar[:, 0]))
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "window_seconds": self.window_seconds,
+            "buckets": self.buckets,
+            "bytes": self.bellek_boyutu,
+            "eklenen": self.eklenen,
+            "paylasimli": self.paylasimli,
+            "doluluk": dolu / (self.buckets * self.width)
+        }
+
+    def clear(self):
+        """Tüm sayaçları sıfırlar."""
+        with self._kilit:
+            self._sayaclar.fill(0)
+            self._son_kova[0] = -1
+            self.eklenen = 0
+
+    def save(self, path: Optional[str] = None):
+        """
+        Sayaçları .npz anlık görüntüsü olarak kaydeder.
+
+        Dosya önce süreçe özgü geçici bir ada yazılır ve atomik olarak
+        yerine taşınır; yazma sırasında çökme eski görüntüyü bozmaz,
+        aynı sayacı paylaşan işçiler birbirinin dosyasına yazmaz.
+        """
+        path = str(path or STREAM_FREQUENCY_CONFIG["path"])
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        with self._kilit:
+            sayaclar = self._sayaclar.copy()
+            son_kova = int(self._son_kova[0])
+
+        gecici = f"{path}.{os.getpid()}.tmp"
+        with open(gecici, "wb") as dosya:
+            np.savez(
+                dosya,
+                sayaclar=sayaclar,
+                son_kova=np.int64(son_kova),
+                pencere=np.float64(self.window_seconds)
+            )
+        os.replace(gecici, path)
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """
+        Kaydedilmiş anlık görüntüyü yükler.
+
+        Boyutlar veya pencere ayarı değiştiyse görüntü yok sayılır.
+
+        Returns:
+            bool: Görüntü yüklendiyse True
+        """
+        path = str(path or STREAM_FREQUENCY_CONFIG["path"])
+        with np.load(path, allow_pickle=False) as veri:
+            sayaclar = veri["sayaclar"]
+            son_kova = int(veri["son_kova"])
+            pencere = float(veri["pencere"])
+
+        if sayaclar.shape != self._sayaclar.shape or pencere != self.window_seconds:
+            print(f"[UYARI] Tekrar sayacı ayarları değişmiş, görüntü yok sayıldı: {path}")
+            return False
+
+        with self._kilit:
+            self._sayaclar[...] = sayaclar
+            self._son_kova[0] = son_kova
+        return True
+
+
+# ============================================================
+# YARDIMCI FONKSİYONLAR
+# ============================================================
+
+def tekrar_sayaci_olustur(path: Optional[str] = None) -> Optional[TekrarSayaci]:
+    """
+    Servis için tekrar sayacını oluşturur, varsa diskteki görüntüyü yükler.
+
+    Returns:
+        TekrarSayaci veya STREAM_FREQUENCY_CONFIG["enabled"] kapalıysa None
+    """
+    if not STREAM_FREQUENCY_CONFIG.get("enabled", True):
+        return None
+
+    sayac = TekrarSayaci()
+    path = str(path or STREAM_FREQUENCY_CONFIG["path"])
+    if os.path.exists(path):
+        try:
+            if sayac.load(path):
+                print(f"[OK] Tekrar sayacı yüklendi: {path}")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[UYARI] Tekrar sayacı yüklenemedi: {e}")
+    return sayac
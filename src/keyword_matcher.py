@@ -0,0 +1,242 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Anahtar Kelime Eşleştirici
+============================================================
+config.py'deki jenerik ifade, şikayet ve aspekt kelime
+listelerinden tek bir Aho–Corasick otomatı kurar. Metin tek
+geçişte taranır ve hangi gruplardaki kelimelerin geçtiği
+bulunur; spam kuralları ve aspekt analizi aynı otomatı kullanır.
+
+pyahocorasick kuruluysa C uygulaması, değilse saf Python
+otomatı kullanılır. Eşleşme anlamı `kelime in metin` ile
+aynıdır (alt dize, örtüşen eşleşmeler dahil).
+
+Kullanım:
+    from src.keyword_matcher import varsayilan_eslestirici
+
+    eslestirici = varsayilan_eslestirici()
+    eslestirici.gruplari_bul("kargo hizli geldi, harika")
+    # frozenset({'aspekt:kargo_paket', 'jenerik_pozitif'})
+"""
+
+import os
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# pyahocorasick kuruluysa C otomatı kullanılır (opsiyonel)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import (
+        GENERIC_POSITIVE_PHRASES,
+        GENERIC_NEGATIVE_PHRASES,
+        COMPLAINT_KEYWORDS,
+        ASPECT_KEYWORDS
+    )
+except ImportError:
+    GENERIC_POSITIVE_PHRASES = ["harika", "mukemmel", "super"]
+    GENERIC_NEGATIVE_PHRASES = ["berbat", "rezalet"]
+    COMPLAINT_KEYWORDS = ["iade", "degisim", "kirik", "bozuk", "gecikti"]
+    ASPECT_KEYWORDS = {}
+
+
+# Grup adları
+JENERIK_POZITIF = "jenerik_pozitif"
+JENERIK_NEGATIF = "jenerik_negatif"
+SIKAYET = "sikayet"
+ASPEKT_ONEKI = "aspekt:"
+JENERIK_GRUPLARI = frozenset({JENERIK_POZITIF, JENERIK_NEGATIF})
+
+
+def aspekt_grubu(aspekt_adi: str) -> str:
+    """Aspekt adından eşleştirici grup adını üretir."""
+    return ASPEKT_ONEKI + aspekt_adi
+
+
+# ============================================================
+# ÇOKLU KALIP EŞLEŞTİRİCİ
+# ============================================================
+
+class AnahtarKelimeEslestirici:
+    """
+    Gruplanmış anahtar kelimeler için Aho–Corasick eşleştirici.
+
+    Bir kelime birden fazla gruba ait olabilir. Saf Python otomatı
+    hata bağlantıları önceden çözülmüş bir DFA'dır; karakter başına
+    tek sözlük araması yapar.
+
+    Attributes:
+        gruplar: Grup adı → kelimeler
+        motor: "pyahocorasick" veya "python"
+    """
+
+    def __init__(self, gruplar: Dict[str, Iterable[str]], motor: Optional[str] = None):
+        """
+        Args:
+            gruplar: Grup adı → anahtar kelime listesi
+            motor: "pyahocorasick", "python" veya None (kuruluysa pyahocorasick)
+        """
+        self.gruplar = {ad: tuple(kelimeler) for ad, kelimeler in gruplar.items()}
+
+        kelime_gruplari: Dict[str, set] = {}
+        for ad, kelimeler in self.gruplar.items():
+            for kelime in kelimeler:
+                kelime_gruplari.setdefault(kelime, set()).add(ad)
+
+        # `"" in metin` her zaman doğrudur; boş kelimeli gruplar hep eşleşir
+        self._her_zaman = frozenset(kelime_gruplari.pop("", ()))
+        self._kelime_gruplari = {k: frozenset(g) for k, g in kelime_gruplari.items()}
+
+        if motor is None:
+            motor = "pyahocorasick" if AHOCORASICK_AVAILABLE else "python"
+        if motor == "pyahocorasick" and not AHOCORASICK_AVAILABLE:
+            raise ImportError("pyahocorasick kurulu değil. 'pip install pyahocorasick' ile kurun.")
+        if motor not in ("pyahocorasick", "python"):
+            raise ValueError(f"Bilinmeyen motor: {motor}")
+        self.motor = motor
+
+        if motor == "pyahocorasick":
+            self._otomat_kur_c()
+        else:
+            self._otomat_kur_python()
+
+    def _otomat_kur_c(self):
+        """pyahocorasick otomatını kurar."""
+        self._otomat = ahocorasick.Automaton()
+        for kelime, gruplar in self._kelime_gruplari.items():
+            self._otomat.add_word(kelime, (kelime, gruplar))
+        if self._kelime_gruplari:
+            self._otomat.make_automaton()
+
+    def _otomat_kur_python(self):
+        """Trie + hata bağlantılarından tam geçişli DFA kurar."""
+        gecis: List[Dict[str, int]] = [{}]
+        kelime_cikis: List[Tuple[str, ...]] = [()]
+
+        for kelime in self._kelime_gruplari:
+            durum = 0
+            for karakter in kelime:
+                sonraki = gecis[durum].get(karakter)
+                if sonraki is None:
+                    sonraki = len(gecis)
+                    gecis[durum][karakter] = sonraki
+                    gecis.append({})
+                    kelime_cikis.append(())
+                durum = sonraki
+            kelime_cikis[durum] += (kelime,)
+
+        # Genişlik öncelikli: hata bağlantıları ve çıkışların birleştirilmesi
+        hata = [0] * len(gecis)
+        alfabe = {k for kelime in self._kelime_gruplari for k in kelime}
+        dfa: List[Dict[str, int]] = [dict() for _ in gecis]
+        dfa[0] = dict(gecis[0])
+        kuyruk = deque(gecis[0].values())
+        while kuyruk:
+            durum = kuyruk.popleft()
+            kelime_cikis[durum] += kelime_cikis[hata[durum]]
+            for karakter in alfabe:
+                cocuk = gecis[durum].get(karakter)
+                if cocuk is not None:
+                    hata[cocuk] = dfa[hata[durum]].get(karakter, 0)
+                    dfa[durum][karakter] = cocuk
+                    kuyruk.append(cocuk)
+                else:
+                    hedef = dfa[hata[durum]].get(karakter, 0)
+                    if hedef:
+                        dfa[durum][karakter] = hedef
+
+        self._dfa = dfa
+        self._kelime_cikis = kelime_cikis
+        self._grup_cikis: List[FrozenSet[str]] = [
+            frozenset().union(*(self._kelime_gruplari[k] for k in kelimeler))
+            for kelimeler in kelime_cikis
+        ]
+
+    def eslesmeler(self, metin: str) -> List[Tuple[int, str]]:
+        """
+        Metindeki tüm kelime geçişlerini bulur.
+
+        Returns:
+            List: (bitiş indeksi, kelime) çiftleri; bitiş indeksi dahildir
+        """
+        if self.motor == "pyahocorasick":
+            if not self._kelime_gruplari:
+                return []
+            return [(son, kelime) for son, (kelime, _) in self._otomat.iter(metin)]
+
+        dfa, cikis = self._dfa, self._kelime_cikis
+        sonuc = []
+        durum = 0
+        for i, karakter in enumerate(metin):
+            durum = dfa[durum].get(karakter, 0)
+            for kelime in cikis[durum]:
+                sonuc.append((i, kelime))
+        return sonuc
+
+    def grup_konumlari(self, metin: str) -> List[Tuple[int, int, FrozenSet[str]]]:
+        """
+        Eşleşmeleri konum ve grup bilgisiyle döndürür.
+
+        Returns:
+            List: (başlangıç, bitiş (hariç), gruplar) üçlüleri, bitişe göre sıralı
+        """
+        gruplar = self._kelime_gruplari
+        return [
+            (son - len(kelime) + 1, son + 1, gruplar[kelime])
+            for son, kelime in self.eslesmeler(metin)
+        ]
+
+    def gruplari_bul(self, metin: str) -> FrozenSet[str]:
+        """
+        Metinde kelimesi geçen tüm grupları tek geçişte bulur.
+
+        Args:
+            metin: Taranacak metin
+
+        Returns:
+            frozenset: Eşleşen grup adları
+        """
+        bulunan = set(self._her_zaman)
+        if self.motor == "pyahocorasick":
+            if self._kelime_gruplari:
+                for _, (_, gruplar) in self._otomat.iter(metin):
+                    bulunan |= gruplar
+            return frozenset(bulunan)
+
+        dfa, cikis = self._dfa, self._grup_cikis
+        durum = 0
+        for karakter in metin:
+            durum = dfa[durum].get(karakter, 0)
+            if cikis[durum]:
+                bulunan |= cikis[durum]
+        return frozenset(bulunan)
+
+    def toplu_gruplari_bul(self, metinler: Iterable[str]) -> List[FrozenSet[str]]:
+        """Her metin için gruplari_bul() sonucunu döndürür."""
+        return [self.gruplari_bul(metin) for metin in metinler]
+
+
+@lru_cache(maxsize=1)
+def varsayilan_eslestirici() -> AnahtarKelimeEslestirici:
+    """
+    config.py listelerinden kurulan ortak eşleştiriciyi döndürür.
+
+    Gruplar: jenerik_pozitif, jenerik_negatif, sikayet ve her aspekt
+    için "aspekt:<ad>". Otomat süreç başına bir kez kurulur.
+    """
+    gruplar: Dict[str, Iterable[str]] = {
+        JENERIK_POZITIF: GENERIC_POSITIVE_PHRASES,
+        JENERIK_NEGATIF: GENERIC_NEGATIVE_PHRASES,
+        SIKAYET: COMPLAINT_KEYWORDS,
+    }
+    for aspekt_adi, kelimeler in ASPECT_KEYWORDS.items():
+        gruplar[aspekt_grubu(aspekt_adi)] = kelimeler
+    return AnahtarKelimeEslestirici(gruplar)
@@ -13,15 +13,18 @@ Kullanım:
 
 import os
 import sys
+import copy
 import time
+import pickle
 import joblib
 import numpy as np
 import pandas as pd
-from typing import List, Tuple, Optional, cast
+from typing import List, Tuple, Optional, Iterable, cast
 
+from sklearn.base import clone
 from sklearn.pipeline import Pipeline
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import (
     classification_report, 
@@ -39,6 +42,10 @@ try:
         RANDOM_SEED,
         TRAIN_SIZE,
         TFIDF_CONFIG,
+        SENTIMENT_FEATURIZER,
+        HASHING_CONFIG,
+        INCREMENTAL_CONFIG,
+        COMPACTION_CONFIG,
         SENTIMENT_MODEL_PATH,
         SENTIMENT_CLASSES
     )
@@ -46,6 +53,10 @@ except ImportError:
     RANDOM_SEED = 42
     TRAIN_SIZE = 0.8
     TFIDF_CONFIG = {"ngram_range": (1, 2), "min_df": 2, "max_df": 0.9}
+    SENTIMENT_FEATURIZER = "tfidf"
+    HASHING_CONFIG = {"n_features": 2 ** 20, "ngram_range": (1, 2), "alternate_sign": False}
+    INCREMENTAL_CONFIG = {"loss": "log_loss", "alpha": 1e-6, "chunk_size": 50000, "idf_warmup_docs": 50000}
+    COMPACTION_CONFIG = {"min_weight": 1e-2, "dtype": "float32"}
     SENTIMENT_MODEL_PATH = "models/sentiment_model.pkl"
     SENTIMENT_CLASSES = {0: "Negatif", 1: "Nötr", 2: "Pozitif"}
 
@@ -60,8 +71,20 @@ class SentimentModel:
     
     TF-IDF + Logistic Regression tabanlı sınıflandırıcı.
     
+    İki özellik çıkarıcı modu vardır:
+    - "tfidf": TfidfVectorizer; sözlük ve model boyutu korpusla büyür
+    - "hashing": HashingVectorizer + eğitilmiş IDF vektörü; sözlük tutulmaz,
+      bellek kullanımı yalnızca n_features ile belirlenir
+    
+    incremental=True ile (hashing modunda) sınıflandırıcı SGDClassifier
+    olur ve model partial_fit() / fit_incremental() ile parça parça,
+    tüm veri belleğe alınmadan eğitilebilir.
+    
     Attributes:
         pipeline: Eğitilmiş sklearn Pipeline
+        featurizer: "tfidf" veya "hashing"
+        incremental: Artımlı (SGD) eğitim modu mu?
+        compacted: compact() uygulandı mı?
         classes: Sınıf isimleri
         is_trained: Model eğitildi mi?
     
@@ -72,30 +95,81 @@ class SentimentModel:
         >>> print(tahmin)  # [2] (Pozitif)
     """
     
-    def __init__(self, tfidf_config: Optional[dict] = None):
+    def __init__(
+        self,
+        tfidf_config: Optional[dict] = None,
+        featurizer: Optional[str] = None,
+        hashing_config: Optional[dict] = None,
+        incremental: bool = False
+    ):
         """
         Model oluşturur.
         
         Args:
             tfidf_config: TF-IDF vektörizör ayarları
+            featurizer: "tfidf" veya "hashing" (None ise config'den)
+            hashing_config: Hashing modu ayarları (n_features, ngram_range, ...)
+            incremental: True ise SGDClassifier ile artımlı eğitim modu
+                (hashing modunu gerektirir; featurizer verilmezse seçilir)
         """
+        if incremental and featurizer is None:
+            featurizer = "hashing"
+        
         self.tfidf_config = tfidf_config or TFIDF_CONFIG
+        self.featurizer = featurizer or SENTIMENT_FEATURIZER
+        self.hashing_config = hashing_config or HASHING_CONFIG
+        self.incremental = incremental
         self.pipeline: Optional[Pipeline] = None
         self.classes = SENTIMENT_CLASSES
         self.is_trained = False
+        self.compacted = False
+        # Artefakttan yüklenen model: eşlenmiş salt okunur diziler, eğitim durumu yok
+        self.yalnizca_cikarim = False
+        
+        # Artımlı modda IDF için belge frekansı sayaçları
+        self._df_sayilari: Optional[np.ndarray] = None
+        self._belge_sayisi = 0
+        
+        if self.featurizer not in ("tfidf", "hashing"):
+            raise ValueError(f"Bilinmeyen özellik çıkarıcı: {self.featurizer}")
+        if self.incremental and self.featurizer != "hashing":
+            raise ValueError("Artımlı eğitim yalnızca hashing modunda desteklenir!")
         
         self._build_pipeline()
     
+    def _ozellik_adimlari(self) -> list:
+        """Seçilen moda göre özellik çıkarma adımlarını döndürür."""
+        if self.featurizer == "hashing":
+            return [
+                ("hashing", HashingVectorizer(**self.hashing_config, norm=None)),
+                ("tfidf", TfidfTransformer())
+            ]
+        return [("tfidf", TfidfVectorizer(**self.tfidf_config))]
+    
     def _build_pipeline(self):
         """Sklearn pipeline oluşturur."""
-        self.pipeline = Pipeline([
-            ("tfidf", TfidfVectorizer(**self.tfidf_config)),
-            ("classifier", LogisticRegression(
+        if self.incremental:
+            siniflandirici = SGDClassifier(
+                loss=INCREMENTAL_CONFIG.get("loss", "log_loss"),
+                alpha=INCREMENTAL_CONFIG.get("alpha", 1e-6),
+                random_state=RANDOM_SEED
+            )
+        else:
+            siniflandirici = LogisticRegression(
                 max_iter=1000,
                 random_state=RANDOM_SEED,
                 class_weight=None
-            ))
-        ])
+            )
+        self.pipeline = Pipeline(self._ozellik_adimlari() + [("classifier", siniflandirici)])
+    
+    def ozellik_sayisi(self) -> int:
+        """Özellik uzayı boyutunu döndürür (sözlük veya hash uzayı)."""
+        if self.pipeline is None:
+            return 0
+        tfidf = self.pipeline.named_steps["tfidf"]
+        if hasattr(tfidf, "vocabulary_"):
+            return len(tfidf.vocabulary_)
+        return int(len(tfidf.idf_))
     
     def fit(self, X: List[str], y: List[int]) -> "SentimentModel":
         """
@@ -111,6 +185,10 @@ class SentimentModel:
         print(f"[EĞİTİM] Model eğitiliyor ({len(X):,} örnek)...")
         
         baslangic = time.time()
+        if self.pipeline is None or self.compacted or getattr(self, "yalnizca_cikarim", False):
+            self._build_pipeline()
+            self.compacted = False
+            self.yalnizca_cikarim = False
         if self.pipeline is None:
             raise ValueError("Pipeline oluşturulamadı!")
         self.pipeline.fit(X, y)
@@ -118,12 +196,103 @@ class SentimentModel:
         
         self.is_trained = True
         
-        # TF-IDF özellik sayısı
+        print(f"[OK] Eğitim tamamlandı! Süre: {gecen_sure:.2f} saniye")
+        print(f"[BİLGİ] TF-IDF özellik sayısı ({self.featurizer}): {self.ozellik_sayisi():,}")
+        
+        return self
+    
+    def partial_fit(self, X: List[str], y: List[int]) -> "SentimentModel":
+        """
+        Modeli bir veri parçasıyla artımlı olarak günceller.
+        
+        Hashing özellikleri durumsuz olduğu için yalnızca belge frekansı
+        sayaçları ve SGD ağırlıkları güncellenir. IDF vektörü ısınma süresince
+        (INCREMENTAL_CONFIG["idf_warmup_docs"] belge) o ana kadar görülen tüm
+        belgelerden yeniden hesaplanır, sonra dondurulur; böylece önceki
+        parçalarda öğrenilen ağırlıkların altında özellikler yeniden
+        ölçeklenmez. Joblib ile kaydedilmiş artımlı bir model yüklenip yeni
+        yorumlarla eğitilmeye devam edilebilir.
+        
+        Args:
+            X: Metin listesi (normalize edilmiş)
+            y: Etiket listesi (0, 1, 2)
+        
+        Returns:
+            self: Güncellenmiş model
+        """
+        if not getattr(self, "incremental", False):
+            raise ValueError(
+                "Bu model toplu (LogisticRegression) modda oluşturuldu! "
+                "Artımlı eğitim için SentimentModel(incremental=True) kullanın."
+            )
+        if self.pipeline is None:
+            raise ValueError("Pipeline oluşturulamadı!")
+        if getattr(self, "compacted", False):
+            raise ValueError("Sıkıştırılmış model artımlı olarak eğitilemez!")
+        if getattr(self, "yalnizca_cikarim", False):
+            raise ValueError(
+                "Artefakttan yüklenen model yalnızca çıkarım içindir (salt okunur "
+                "katsayılar, belge frekansı sayaçları saklanmaz)! Eğitime devam "
+                "etmek için joblib kaydını (.pkl) yükleyin."
+            )
+        
+        hashing = self.pipeline.named_steps["hashing"]
         tfidf = self.pipeline.named_steps["tfidf"]
-        kelime_sayisi = len(tfidf.vocabulary_)
+        siniflandirici = self.pipeline.named_steps["classifier"]
         
-        print(f"[OK] Eğitim tamamlandı! Süre: {gecen_sure:.2f} saniye")
-        print(f"[BİLGİ] TF-IDF özellik sayısı: {kelime_sayisi:,}")
+        sayimlar = hashing.transform(X)
+        
+        # Belge frekanslarını güncelle; ısınma bitene kadar IDF'i yeniden hesapla (smooth_idf)
+        if self._df_sayilari is None:
+            self._df_sayilari = np.zeros(sayimlar.shape[1], dtype=np.int64)
+            tfidf.fit(sayimlar)
+        isinma = INCREMENTAL_CONFIG.get("idf_warmup_docs", 50000)
+        idf_guncelle = isinma is None or self._belge_sayisi < isinma
+        sayimlar.sum_duplicates()
+        self._df_sayilari += np.bincount(sayimlar.indices, minlength=sayimlar.shape[1])
+        self._belge_sayisi += sayimlar.shape[0]
+        if idf_guncelle:
+            tfidf.idf_ = np.log((1 + self._belge_sayisi) / (1 + self._df_sayilari)) + 1.0
+        
+        siniflandirici.partial_fit(
+            tfidf.transform(sayimlar),
+            np.asarray(y),
+            classes=np.array(sorted(self.classes))
+        )
+        self.is_trained = True
+        
+        return self
+    
+    def fit_incremental(
+        self,
+        parcalar: Iterable[Tuple[List[str], List[int]]]
+    ) -> "SentimentModel":
+        """
+        Modeli (metinler, etiketler) parçalarından oluşan bir akışla eğitir.
+        
+        Bellekte aynı anda yalnızca bir parça bulunur; parçalar örneğin
+        preprocessing.egitim_parcalari() ile CSV'den doğrudan okunabilir.
+        
+        Args:
+            parcalar: (metin listesi, etiket listesi) çiftleri üreten iterable
+        
+        Returns:
+            self: Eğitilmiş model
+        """
+        print("[EĞİTİM] Model artımlı olarak eğitiliyor...")
+        
+        baslangic = time.time()
+        toplam = 0
+        for i, (X_parca, y_parca) in enumerate(parcalar, start=1):
+            if len(X_parca) == 0:
+                continue
+            self.partial_fit(X_parca, y_parca)
+            toplam += len(X_parca)
+            print(f"  Parça {i}: {len(X_parca):,} örnek (toplam {toplam:,})")
+        gecen_sure = time.time() - baslangic
+        
+        print(f"[OK] Artımlı eğitim tamamlandı! Süre: {gecen_sure:.2f} saniye")
+        print(f"[BİLGİ] Görülen belge sayısı: {self._belge_sayisi:,}")
         
         return self
     
@@ -202,18 +371,180 @@ class SentimentModel:
         
         return sonuc
     
-    def save(self, path: Optional[str] = None):
-        """Modeli dosyaya kaydeder."""
+    def _pipeline_boyutu(self) -> int:
+        """Pipeline'ın serileştirilmiş boyutunu (bayt) döndürür."""
+        return len(pickle.dumps(self.pipeline, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def compact(
+        self,
+        min_weight: Optional[float] = None,
+        X_val: Optional[List[str]] = None,
+        y_val: Optional[List[int]] = None
+    ) -> dict:
+        """
+        Modeli sıkıştırır: önemsiz özellikleri atar ve float32'ye çevirir.
+        
+        Tüm sınıflarda mutlak ağırlığı min_weight'in altında kalan özellikler
+        atılır. TF-IDF modunda sözlük yeniden numaralandırılır ve idf_/coef_
+        küçültülür; hashing modunda hash uzayı sabit olduğundan coef_ seyrek
+        matrise (sparsify) çevrilir. Atılan terimler satır normuna artık
+        katkı vermediğinden olasılıklar hafifçe değişebilir; bu yüzden
+        ayrılmış veri verilirse doğruluk farkı raporlanır. Sıkıştırılmış
+        model tahmin için kullanılır; fit() çağrılırsa pipeline baştan kurulur.
+        TF-IDF modunda vektörizör budanmış sözlükle yeniden kurulur (iç
+        TfidfTransformer durumuna doğrudan yazılmaz).
+        
+        Args:
+            min_weight: Ağırlık eşiği (None ise COMPACTION_CONFIG)
+            X_val: Doğruluk farkı için ayrılmış metinler (opsiyonel)
+            y_val: X_val etiketleri
+        
+        Returns:
+            dict: Özellik sayıları, boyutlar (bayt) ve doğruluk farkı
+        """
+        if not self.is_trained or self.pipeline is None:
+            raise ValueError("Model henüz eğitilmedi! Önce fit() çağırın.")
+        if self.compacted:
+            raise ValueError("Model zaten sıkıştırılmış!")
+        
+        min_weight = COMPACTION_CONFIG.get("min_weight", 1e-2) if min_weight is None else min_weight
+        dtype = np.dtype(COMPACTION_CONFIG.get("dtype", "float32"))
+        dogrulama = X_val is not None and y_val is not None
+        
+        rapor = {
+            "ozellik_once": self.ozellik_sayisi(),
+            "boyut_once": self._pipeline_boyutu()
+        }
+        if dogrulama:
+            rapor["accuracy_once"] = accuracy_score(y_val, self.predict(X_val))
+        
+        siniflandirici = self.pipeline.named_steps["classifier"]
+        tfidf = self.pipeline.named_steps["tfidf"]
+        katsayilar = np.asarray(siniflandirici.coef_)
+        tutulan = np.flatnonzero(np.abs(katsayilar).max(axis=0) >= min_weight)
+        if not len(tutulan):
+            raise ValueError(f"min_weight={min_weight:g} tüm özellikleri atıyor!")
+        
+        if self.featurizer == "tfidf":
+            # Sözlüğü tutulan sütunlara göre yeniden numaralandır
+            yeni_indeks = np.full(katsayilar.shape[1], -1, dtype=np.int64)
+            yeni_indeks[tutulan] = np.arange(len(tutulan))
+            sozluk = {
+                terim: int(yeni_indeks[i])
+                for terim, i in tfidf.vocabulary_.items()
+                if yeni_indeks[i] >= 0
+            }
+            # Aynı parametreli yeni vektörizör; idf_ setter'ı sözlük ve idf
+            # uzunluğunu doğrular, iç transformer'ı kendisi kurar
+            budanmis = clone(tfidf).set_params(vocabulary=sozluk, dtype=dtype)
+            budanmis.idf_ = tfidf.idf_[tutulan].astype(dtype)
+            # Sözlük vocabulary_'de; parametrede ikinci kopyası tutulmaz
+            budanmis.set_params(vocabulary=None)
+            self.pipeline.set_params(tfidf=budanmis)
+            siniflandirici.coef_ = katsayilar[:, tutulan].astype(dtype)
+            siniflandirici.n_features_in_ = len(tutulan)
+        else:
+            # Hash uzayı yeniden numaralandırılamaz; sıfırlanan ağırlıklar seyrek tutulur
+            maske = np.zeros(katsayilar.shape[1], dtype=bool)
+            maske[tutulan] = True
+            siniflandirici.coef_ = np.where(maske, katsayilar, 0).astype(dtype)
+            siniflandirici.sparsify()
+            self.pipeline.named_steps["hashing"].set_params(dtype=dtype)
+            tfidf.idf_ = tfidf.idf_.astype(dtype)
+        siniflandirici.intercept_ = siniflandirici.intercept_.astype(dtype)
+        self.compacted = True
+        
+        rapor["ozellik_sonra"] = len(tutulan)
+        rapor["boyut_sonra"] = self._pipeline_boyutu()
+        if dogrulama:
+            rapor["accuracy_sonra"] = accuracy_score(y_val, self.predict(X_val))
+            rapor["accuracy_farki"] = rapor["accuracy_sonra"] - rapor["accuracy_once"]
+        
+        print(f"[OK] Model sıkıştırıldı (eşik: {min_weight:g}, {dtype.name})")
+        print(f"  Özellik: {rapor['ozellik_once']:,} -> {rapor['ozellik_sonra']:,}")
+        print(f"  Boyut: {rapor['boyut_once'] / 1e6:.2f} MB -> {rapor['boyut_sonra'] / 1e6:.2f} MB")
+        if dogrulama:
+            print(f"  Accuracy: {rapor['accuracy_once']:.4f} -> {rapor['accuracy_sonra']:.4f} "
+                  f"({rapor['accuracy_farki']:+.4f})")
+        
+        return rapor
+    
+    def save(
+        self,
+        path: Optional[str] = None,
+        compact: bool = False,
+        X_val: Optional[List[str]] = None,
+        y_val: Optional[List[int]] = None
+    ) -> Optional[dict]:
+        """
+        Modeli dosyaya kaydeder.
+        
+        Args:
+            path: Kayıt yolu (None ise config'den)
+            compact: True ise modelin sıkıştırılmış bir kopyası kaydedilir;
+                bu nesne değişmez, eğitime devam edilebilir
+            X_val: Sıkıştırma raporu için ayrılmış metinler (opsiyonel)
+            y_val: X_val etiketleri
+        
+        Returns:
+            dict: compact() raporu (sıkıştırma yapılmadıysa None)
+        """
         path = path or str(SENTIMENT_MODEL_PATH)
+        model, rapor = self, None
+        if compact and not self.compacted:
+            model = copy.deepcopy(self)
+            rapor = model.compact(X_val=X_val, y_val=y_val)
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        joblib.dump(self, path)
+        joblib.dump(model, path)
         print(f"[OK] Model kaydedildi: {path}")
+        return rapor
+    
+    def save_artifact(self, path: Optional[str] = None) -> str:
+        """
+        Modeli pickle içermeyen, bellek eşlemeli artefakt dizinine kaydeder.
+        
+        Sözlük, idf ve katsayılar düz diziler olarak yazılır; load() dizini
+        tanır ve modeli kopyalamadan açar. Artefakt çıkarım içindir,
+        eğitime devam etmek için save() kullanılır.
+        
+        Args:
+            path: Hedef dizin (None ise SENTIMENT_ARTIFACT_PATH)
+        
+        Returns:
+            str: Yazılan dizin
+        """
+        try:
+            from .artifact import artefakt_kaydet
+        except ImportError:
+            from artifact import artefakt_kaydet  # type: ignore[no-redef]
+        return artefakt_kaydet(self, path)
     
     @classmethod
     def load(cls, path: Optional[str] = None) -> "SentimentModel":
-        """Modeli dosyadan yükler."""
+        """Modeli dosyadan (veya artefakt dizininden) yükler."""
         path = path or str(SENTIMENT_MODEL_PATH)
+        if os.path.isdir(path):
+            # Bellek eşlemeli artefakt dizini (save_artifact)
+            try:
+                from .artifact import artefakt_yukle
+            except ImportError:
+                from artifact import artefakt_yukle  # type: ignore[no-redef]
+            model = artefakt_yukle(path)
+            print(f"[OK] Model artefaktı yüklendi: {path}")
+            return model
         model = joblib.load(path)
+        
+        # Hashing / artımlı modlardan önce kaydedilmiş modeller
+        if not hasattr(model, "featurizer"):
+            model.featurizer = "tfidf"
+            model.hashing_config = HASHING_CONFIG
+        if not hasattr(model, "incremental"):
+            model.incremental = False
+            model._df_sayilari = None
+            model._belge_sayisi = 0
+        if not hasattr(model, "compacted"):
+            model.compacted = False
+        
         print(f"[OK] Model yüklendi: {path}")
         return model
 
@@ -225,7 +556,8 @@ class SentimentModel:
 def train_sentiment_model(
     X: List[str], 
     y: List[int],
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    featurizer: Optional[str] = None
 ) -> SentimentModel:
     """
     Duygu analizi modelini eğitir.
@@ -234,11 +566,12 @@ def train_sentiment_model(
         X: Metin listesi
         y: Etiket listesi
         save_path: Model kayıt yolu (None ise kaydetmez)
+        featurizer: "tfidf" veya "hashing" (None ise config'den)
     
     Returns:
         SentimentModel: Eğitilmiş model
     """
-    model = SentimentModel()
+    model = SentimentModel(featurizer=featurizer)
     model.fit(X, y)
     
     if save_path:
@@ -247,6 +580,47 @@ def train_sentiment_model(
     return model
 
 
+def train_sentiment_model_incremental(
+    parcalar: Iterable[Tuple[List[str], List[int]]],
+    save_path: Optional[str] = None,
+    model: Optional[SentimentModel] = None
+) -> SentimentModel:
+    """
+    Duygu modelini parça akışıyla artımlı olarak eğitir.
+    
+    Yalnızca SentimentModel(incremental=True) ile oluşturulup joblib ile
+    (.pkl) kaydedilmiş modellerin eğitimine devam edilebilir. Varsayılan
+    LogisticRegression modeli (python src/model.py ile eğitilen
+    models/sentiment_model.pkl) ve artefakttan yüklenen modeller
+    ValueError fırlatır.
+    
+    Args:
+        parcalar: (metin listesi, etiket listesi) çiftleri
+        save_path: Model kayıt yolu (None ise kaydetmez)
+        model: Eğitime devam edilecek artımlı model (None ise yeni model)
+    
+    Returns:
+        SentimentModel: Eğitilmiş model
+    
+    Örnek:
+        >>> from src.preprocessing import egitim_parcalari
+        >>> train_sentiment_model_incremental(
+        ...     egitim_parcalari("data/ilk.csv"), save_path="models/sentiment_incremental.pkl"
+        ... )
+        >>> model = SentimentModel.load("models/sentiment_incremental.pkl")
+        >>> train_sentiment_model_incremental(
+        ...     egitim_parcalari("data/yeni.csv"), save_path="models/sentiment_incremental.pkl", model=model
+        ... )
+    """
+    model = model or SentimentModel(incremental=True)
+    model.fit_incremental(parcalar)
+    
+    if save_path:
+        model.save(save_path)
+    
+    return model
+
+
 def load_sentiment_model(path: Optional[str] = None) -> SentimentModel:
     """Kayıtlı modeli yükler."""
     return SentimentModel.load(path)
@@ -308,7 +682,7 @@ if __name__ == "__main__":
     print("DUYGU ANALİZİ MODELİ EĞİTİMİ")
     print("=" * 60)
     
-    from preprocessing import veri_hazirla
+    from preprocessing import veri_hazirla, kok_onbellegini_kaydet
     
     # Veriyi hazırla
     print("\n[1/4] Veri hazırlanıyor...")
@@ -340,6 +714,8 @@ if __name__ == "__main__":
     # Kaydet
     print("\n[KAYIT]")
     model.save()
+    model.save_artifact()
+    kok_onbellegini_kaydet()
     
     print("\n" + "=" * 60)
     print("EĞİTİM TAMAMLANDI!")
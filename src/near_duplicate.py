@@ -0,0 +1,414 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Yakın Kopya İndeksi
+============================================================
+Bir kelimesi değiştirilmiş ya da emoji eklenmiş kampanya
+yorumlarını bulmak için MinHash imzaları ve LSH bantlama
+kullanır. İkili karşılaştırma yapılmaz: aynı bant anahtarını
+paylaşan yorumlar aday olur, imza benzerliğiyle doğrulanır ve
+bağlı bileşenler kümeleri oluşturur.
+
+İndeks eğitimde kurulur, modelle birlikte kaydedilir ve çıkarımda
+bant anahtarları üzerinde ikili arama ile (alt doğrusal) sorgulanır.
+
+Kullanım:
+    from src.near_duplicate import YakinKopyaIndeksi
+
+    indeks = YakinKopyaIndeksi()
+    kume_boyutlari = indeks.fit(normalize_metinler)
+    kume, boyut, benzerlik = indeks.sorgula("urun harika kesinlikle alin")
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import NEAR_DUPLICATE_CONFIG, RANDOM_SEED
+except ImportError:
+    NEAR_DUPLICATE_CONFIG = {
+        "shingle_size": 5, "num_perm": 64, "bands": 16,
+        "threshold": 0.6, "cluster_threshold": 0.4, "min_cluster_size": 10, "chunk_shingles": 2_000_000
+    }
+    RANDOM_SEED = 42
+
+
+# Yuvarlanan hash çarpanı (FNV-1 64 bit asal)
+_HASH_CARPANI = np.uint64(1099511628211)
+
+
+# ============================================================
+# YAKIN KOPYA İNDEKSİ
+# ============================================================
+
+class YakinKopyaIndeksi:
+    """
+    MinHash + LSH tabanlı yakın kopya yorum indeksi.
+
+    Normalize metnin UTF-8 baytları üzerinden k-baytlık parçalar
+    (shingle) çıkarılır, her biri çarp-kaydır hash aileleriyle
+    imzalanır. İmza `bands` banda bölünür; herhangi bir bandı aynı olan
+    yorumlar adaydır. Tahmini Jaccard benzerliği `threshold` altında
+    kalan adaylar birleştirilmez; bağlı bileşenin temsilcisine
+    benzerliği `cluster_threshold` altında kalan üyeler zincirleme
+    büyümeyi önlemek için kümeden ayrılır.
+
+    Yalnızca en az iki üyeli kümeler saklanır; tekil yorumlar
+    indeks boyutunu büyütmez.
+
+    Attributes:
+        kume_boyutlari: Saklanan küme kimliği → üye sayısı
+        kume_imzalari: Küme temsilcisinin MinHash imzası
+    """
+
+    def __init__(
+        self,
+        shingle_size: Optional[int] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        threshold: Optional[float] = None,
+        cluster_threshold: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            shingle_size: Parça uzunluğu (bayt)
+            num_perm: İmza uzunluğu (hash fonksiyonu sayısı)
+            bands: LSH bant sayısı (num_perm'i tam bölmeli)
+            threshold: Doğrulama için en düşük tahmini Jaccard benzerliği
+            cluster_threshold: Küme temsilcisine en düşük benzerlik
+            seed: Hash katsayıları için tohum
+        """
+        self.shingle_size = shingle_size or NEAR_DUPLICATE_CONFIG.get("shingle_size", 5)
+        self.num_perm = num_perm or NEAR_DUPLICATE_CONFIG.get("num_perm", 64)
+        self.bands = bands or NEAR_DUPLICATE_CONFIG.get("bands", 16)
+        self.threshold = NEAR_DUPLICATE_CONFIG.get("threshold", 0.6) if threshold is None else threshold
+        self.cluster_threshold = (
+            NEAR_DUPLICATE_CONFIG.get("cluster_threshold", 0.4)
+            if cluster_threshold is None else cluster_threshold
+        )
+
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm, bands sayısına tam bölünmelidir!")
+        self.rows = self.num_perm // self.bands
+
+        rastgele = np.random.default_rng(RANDOM_SEED if seed is None else seed)
+        # Çarp-kaydır hash: ((a * x + b) mod 2^64) >> 32, a tek sayı
+        self._a = rastgele.integers(1, 2 ** 63, self.num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rastgele.integers(0, 2 ** 63, self.num_perm, dtype=np.uint64)
+        self._bant_carpanlari = rastgele.integers(1, 2 ** 63, self.rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+        self.kume_boyutlari = np.zeros(0, dtype=np.int64)
+        self.kume_imzalari = np.zeros((0, self.num_perm), dtype=np.uint32)
+        self._bant_anahtarlari: List[np.ndarray] = []
+        self._bant_kumeleri: List[np.ndarray] = []
+
+    # ============================================================
+    # İMZALAR
+    # ============================================================
+
+    def _shingle_hashleri(self, metinler: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Metinlerin parça hash'lerini tek NumPy geçişiyle hesaplar.
+
+        Returns:
+            Tuple: (hash dizisi, her hash'in ait olduğu metin indeksi)
+        """
+        k = self.shingle_size
+        baytlar = [m.encode("utf-8") for m in metinler]
+        uzunluklar = np.fromiter(map(len, baytlar), dtype=np.int64, count=len(baytlar))
+        ofsetler = np.concatenate(([0], np.cumsum(uzunluklar)[:-1])) if len(baytlar) else np.zeros(0, np.int64)
+        tampon = np.frombuffer(b"".join(baytlar), dtype=np.uint8).astype(np.uint64)
+
+        # Tüm konumlar için k-baytlık yuvarlanan hash (taşma mod 2^64)
+        pencere = len(tampon) - k + 1
+        if pencere > 0:
+            hashler = np.zeros(pencere, dtype=np.uint64)
+            for j in range(k):
+                hashler = hashler * _HASH_CARPANI + tampon[j:j + pencere]
+        else:
+            hashler = np.zeros(0, dtype=np.uint64)
+
+        # Metin sınırını aşmayan pencereler
+        adetler = np.maximum(uzunluklar - k + 1, 0)
+        metin_ids = np.repeat(np.arange(len(baytlar)), adetler)
+        yerel = np.arange(int(adetler.sum())) - np.repeat(np.cumsum(adetler) - adetler, adetler)
+        sonuc = hashler[ofsetler[metin_ids] + yerel] if len(metin_ids) else np.zeros(0, dtype=np.uint64)
+
+        # k'dan kısa (boş olmayan) metinler tek parça olarak hash'lenir
+        kisalar = np.flatnonzero((uzunluklar > 0) & (uzunluklar < k))
+        if len(kisalar):
+            kisa_hashler = np.zeros(len(kisalar), dtype=np.uint64)
+            carpan = int(_HASH_CARPANI)
+            for i, j in enumerate(kisalar):
+                h = 0
+                for bayt in baytlar[j]:
+                    h = (h * carpan + bayt) & 0xFFFFFFFFFFFFFFFF
+                kisa_hashler[i] = h
+            sonuc = np.concatenate((sonuc, kisa_hashler))
+            metin_ids = np.concatenate((metin_ids, kisalar))
+            sira = np.argsort(metin_ids, kind="stable")
+            sonuc, metin_ids = sonuc[sira], metin_ids[sira]
+
+        return sonuc, metin_ids
+
+    def imzalar(self, metinler: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Metinlerin MinHash imzalarını hesaplar.
+
+        Büyük girdiler, parça sayısı NEAR_DUPLICATE_CONFIG["chunk_shingles"]
+        ile sınırlı gruplar halinde işlenir.
+
+        Returns:
+            Tuple: (imzalar [n, num_perm] uint32, geçerli mi [n] bool);
+            boş metinlerin imzası yoktur
+        """
+        n = len(metinler)
+        imzalar = np.full((n, self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        gecerli = np.zeros(n, dtype=bool)
+
+        butce = NEAR_DUPLICATE_CONFIG.get("chunk_shingles", 2_000_000)
+        ortalama = max(1, sum(map(len, metinler[:1000])) // max(1, min(n, 1000)))
+        parca = max(1, butce // ortalama)
+
+        for bas in range(0, n, parca):
+            hashler, metin_ids = self._shingle_hashleri(metinler[bas:bas + parca])
+            if not len(hashler):
+                continue
+            baslangiclar = np.flatnonzero(np.r_[True, metin_ids[1:] != metin_ids[:-1]])
+            satirlar = bas + metin_ids[baslangiclar]
+            # Hash fonksiyonları, ara matris bütçeyi aşmayacak bloklar halinde
+            blok = max(1, min(self.num_perm, butce // len(hashler)))
+            for i in range(0, self.num_perm, blok):
+                degerler = (self._a[i:i + blok] * hashler[:, None] + self._b[i:i + blok]) >> np.uint64(32)
+                imzalar[satirlar, i:i + blok] = np.minimum.reduceat(degerler, baslangiclar, axis=0)
+            gecerli[satirlar] = True
+
+        return imzalar, gecerli
+
+    def _bant_anahtarlari_hesapla(self, imzalar: np.ndarray) -> np.ndarray:
+        """İmzaları [n, bands] bant anahtarlarına indirger."""
+        bantlar = imzalar.reshape(len(imzalar), self.bands, self.rows).astype(np.uint64)
+        return (bantlar * self._bant_carpanlari).sum(axis=2, dtype=np.uint64)
+
+    # ============================================================
+    # EĞİTİM
+    # ============================================================
+
+    def fit(self, metinler: Sequence[str]) -> np.ndarray:
+        """
+        İndeksi kurar ve her metnin yakın kopya küme boyutunu döndürür.
+
+        Args:
+            metinler: Normalize edilmiş metinler
+
+        Returns:
+            np.ndarray: Metin başına küme boyutu (tekil ve boş metinler için 1)
+        """
+        n = len(metinler)
+        imzalar, gecerli = self.imzalar(metinler)
+        anahtarlar = self._bant_anahtarlari_hesapla(imzalar)
+        satirlar = np.flatnonzero(gecerli)
+
+        # Aynı bant anahtarını paylaşan adaylar grubun ilk üyesine bağlanır
+        kaynaklar, hedefler = [], []
+        for bant in range(self.bands):
+            bant_anahtarlari = anahtarlar[satirlar, bant]
+            sira = np.argsort(bant_anahtarlari, kind="stable")
+            sirali = bant_anahtarlari[sira]
+            grup_basi = np.r_[True, sirali[1:] != sirali[:-1]]
+            ilk = satirlar[sira][np.maximum.accumulate(np.where(grup_basi, np.arange(len(sira)), 0))]
+            uye = satirlar[sira]
+            aday = ~grup_basi
+            kaynaklar.append(ilk[aday])
+            hedefler.append(uye[aday])
+
+        kaynak = np.concatenate(kaynaklar) if kaynaklar else np.zeros(0, np.int64)
+        hedef = np.concatenate(hedefler) if hedefler else np.zeros(0, np.int64)
+
+        # Tahmini Jaccard ile doğrulama
+        if len(kaynak):
+            benzerlik = (imzalar[kaynak] == imzalar[hedef]).mean(axis=1)
+            dogrulanan = benzerlik >= self.threshold
+            kaynak, hedef = kaynak[dogrulanan], hedef[dogrulanan]
+
+        graf = sparse.coo_matrix(
+            (np.ones(len(kaynak), dtype=np.int8), (kaynak, hedef)), shape=(n, n)
+        )
+        _, etiketler = connected_components(graf, directed=False)
+
+        # Zincirleme birleşmeyi sınırla: her bileşenin temsilcisi en çok
+        # bağlantısı olan üyedir; temsilciden uzak üyeler bileşenden
+        # ayrılır (aynı imzalı, yani birebir aynı metinler birlikte kalır)
+        derece = np.bincount(np.concatenate((kaynak, hedef)), minlength=n)
+        sira = np.lexsort((-derece, etiketler))
+        grup_basi = np.r_[True, etiketler[sira][1:] != etiketler[sira][:-1]]
+        temsilci = np.empty(n, dtype=np.int64)
+        temsilci[etiketler[sira][grup_basi]] = sira[grup_basi]
+        temsilci = temsilci[etiketler]
+        uzak = np.flatnonzero(
+            (imzalar == imzalar[temsilci]).mean(axis=1) < self.cluster_threshold
+        )
+        if len(uzak):
+            _, ayri = np.unique(
+                np.column_stack((etiketler[uzak], imzalar[uzak])), axis=0, return_inverse=True
+            )
+            etiketler[uzak] = n + ayri.ravel()
+        boyutlar = np.bincount(etiketler, minlength=n + len(uzak))
+        metin_boyutlari = boyutlar[etiketler]
+        metin_boyutlari[~gecerli] = 1
+
+        # Yalnızca çok üyeli kümeler saklanır. Sorgular da üyeliğin ölçüldüğü
+        # temsilciyle karşılaştırılır; ayrılan uzak grupların imzaları
+        # birebir aynı olduğundan temsilcileri kendi (ilk) üyeleridir
+        saklanan = np.flatnonzero(gecerli & (metin_boyutlari >= 2))
+        kume_kimlikleri, kume_indeksi = np.unique(etiketler[saklanan], return_inverse=True)
+        kume_temsilcisi = temsilci.copy()
+        kume_temsilcisi[uzak] = uzak
+        temsilciler = np.zeros(len(kume_kimlikleri), dtype=np.int64)
+        temsilciler[kume_indeksi[::-1]] = kume_temsilcisi[saklanan[::-1]]
+
+        self.kume_boyutlari = boyutlar[kume_kimlikleri].astype(np.int64)
+        self.kume_imzalari = imzalar[temsilciler]
+        self._bant_anahtarlari, self._bant_kumeleri = [], []
+        for bant in range(self.bands):
+            ciftler = np.unique(
+                np.stack((anahtarlar[saklanan, bant], kume_indeksi.astype(np.uint64)), axis=1),
+                axis=0
+            )
+            self._bant_anahtarlari.append(ciftler[:, 0].copy())
+            self._bant_kumeleri.append(ciftler[:, 1].astype(np.int64))
+
+        return metin_boyutlari
+
+    # ============================================================
+    # SORGU
+    # ============================================================
+
+    def sorgula_toplu(self, metinler: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Metinleri saklanan kümelere karşı sorgular.
+
+        Her bantta bant anahtarı ikili aramayla bulunur; aday kümeler
+        temsilci imzasıyla (eğitimdeki üyelik ölçütü olan
+        `cluster_threshold` ile) doğrulanır ve en benzer küme seçilir.
+
+        Returns:
+            dict: "kume" (yoksa -1), "boyut" (yoksa 0), "benzerlik"
+        """
+        n = len(metinler)
+        sonuc = {
+            "kume": np.full(n, -1, dtype=np.int64),
+            "boyut": np.zeros(n, dtype=np.int64),
+            "benzerlik": np.zeros(n, dtype=np.float64)
+        }
+        if n == 0 or not len(self.kume_boyutlari):
+            return sonuc
+
+        imzalar, gecerli = self.imzalar(metinler)
+        anahtarlar = self._bant_anahtarlari_hesapla(imzalar)
+
+        adaylar = np.full((n, self.bands), -1, dtype=np.int64)
+        for bant in range(self.bands):
+            bant_anahtarlari = self._bant_anahtarlari[bant]
+            konum = np.searchsorted(bant_anahtarlari, anahtarlar[:, bant])
+            konum = np.minimum(konum, len(bant_anahtarlari) - 1)
+            bulundu = bant_anahtarlari[konum] == anahtarlar[:, bant]
+            adaylar[bulundu, bant] = self._bant_kumeleri[bant][konum[bulundu]]
+        adaylar[~gecerli] = -1
+
+        benzerlikler = np.zeros((n, self.bands))
+        var = adaylar >= 0
+        satir, bant = np.nonzero(var)
+        benzerlikler[satir, bant] = (
+            imzalar[satir] == self.kume_imzalari[adaylar[satir, bant]]
+        ).mean(axis=1)
+        benzerlikler[~var] = -1.0
+
+        en_iyi = benzerlikler.argmax(axis=1)
+        en_iyi_benzerlik = benzerlikler[np.arange(n), en_iyi]
+        eslesen = en_iyi_benzerlik >= self.cluster_threshold
+        kumeler = adaylar[np.arange(n), en_iyi]
+
+        sonuc["kume"][eslesen] = kumeler[eslesen]
+        sonuc["boyut"][eslesen] = self.kume_boyutlari[kumeler[eslesen]]
+        sonuc["benzerlik"][eslesen] = en_iyi_benzerlik[eslesen]
+        return sonuc
+
+    def sorgula(self, metin: str) -> Tuple[int, int, float]:
+        """
+        Tek bir metni sorgular.
+
+        Returns:
+            Tuple: (küme kimliği veya -1, küme boyutu, tahmini benzerlik)
+        """
+        sonuc = self.sorgula_toplu([metin])
+        return int(sonuc["kume"][0]), int(sonuc["boyut"][0]), float(sonuc["benzerlik"][0])
+
+    # ============================================================
+    # DİZİ DURUMU
+    # ============================================================
+
+    def durum(self) -> Tuple[Dict[str, float], Dict[str, np.ndarray]]:
+        """
+        İndeksi ayarlar ve düz diziler olarak döndürür (src/artifact.py).
+
+        Bant başına diziler uç uca eklenir; `bant_ofsetleri` her bandın
+        başlangıcını tutar.
+
+        Returns:
+            Tuple: (ayarlar, ad → dizi)
+        """
+        ayarlar = {
+            "shingle_size": self.shingle_size,
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "threshold": self.threshold,
+            "cluster_threshold": self.cluster_threshold
+        }
+        uzunluklar = [len(anahtarlar) for anahtarlar in self._bant_anahtarlari]
+        diziler = {
+            "a": self._a,
+            "b": self._b,
+            "bant_carpanlari": self._bant_carpanlari,
+            "kume_boyutlari": self.kume_boyutlari,
+            "kume_imzalari": self.kume_imzalari,
+            "bant_ofsetleri": np.concatenate(([0], np.cumsum(uzunluklar))).astype(np.int64),
+            "bant_anahtarlari": (
+                np.concatenate(self._bant_anahtarlari) if uzunluklar else np.zeros(0, np.uint64)
+            ),
+            "bant_kumeleri": (
+                np.concatenate(self._bant_kumeleri) if uzunluklar else np.zeros(0, np.int64)
+            )
+        }
+        return ayarlar, diziler
+
+    @classmethod
+    def durumdan(cls, ayarlar: Dict[str, float], diziler: Dict[str, np.ndarray]) -> "YakinKopyaIndeksi":
+        """
+        durum() çıktısından indeksi kurar.
+
+        Diziler kopyalanmaz; bellek eşlemeli dizilerle kurulan indeks
+        sayfaları süreçler arasında paylaşır.
+        """
+        indeks = cls(**ayarlar)
+        indeks._a = diziler["a"]
+        indeks._b = diziler["b"]
+        indeks._bant_carpanlari = diziler["bant_carpanlari"]
+        indeks.kume_boyutlari = diziler["kume_boyutlari"]
+        indeks.kume_imzalari = diziler["kume_imzalari"]
+        ofsetler = diziler["bant_ofsetleri"]
+        if len(ofsetler) > 1:
+            indeks._bant_anahtarlari = [
+                diziler["bant_anahtarlari"][ofsetler[i]:ofsetler[i + 1]] for i in range(len(ofsetler) - 1)
+            ]
+            indeks._bant_kumeleri = [
+                diziler["bant_kumeleri"][ofsetler[i]:ofsetler[i + 1]] for i in range(len(ofsetler) - 1)
+            ]
+        return indeks
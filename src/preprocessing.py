@@ -14,8 +14,15 @@ import os
 import sys
 import csv
 import re
+import glob
+import queue
+import json
+import hashlib
+import threading
 import unicodedata
-from typing import Optional, Tuple, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple, List, Iterable, Iterator, Dict
 import pandas as pd
 import numpy as np
 
@@ -29,6 +36,14 @@ except ImportError:
     STEMMER_AVAILABLE = False
     stemmer = None
 
+# pyarrow kuruluysa parçalı CSV okumada kullanılır (opsiyonel)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Proje konfigürasyonunu yükle
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
@@ -36,7 +51,13 @@ try:
         GENERIC_POSITIVE_PHRASES,
         GENERIC_NEGATIVE_PHRASES,
         LABEL_MAPPING,
-        SENTIMENT_CLASSES
+        SENTIMENT_CLASSES,
+        STEM_CACHE_CONFIG,
+        PARALLEL_NORMALIZATION_CONFIG,
+        CORPUS_CACHE_CONFIG,
+        INCREMENTAL_CONFIG,
+        LOCAL_DATASET_PATH,
+        RANDOM_SEED
     )
 except ImportError:
     # Varsayılan değerler
@@ -44,12 +65,290 @@ except ImportError:
     GENERIC_NEGATIVE_PHRASES = ["berbat", "rezalet"]
     LABEL_MAPPING = {}
     SENTIMENT_CLASSES = {0: "Negatif", 1: "Nötr", 2: "Pozitif"}
+    STEM_CACHE_CONFIG = {"max_size": 200000, "path": "models/stem_cache.json", "preload": True}
+    PARALLEL_NORMALIZATION_CONFIG = {"n_jobs": 1, "chunk_size": 10000, "min_parallel_size": 50000}
+    CORPUS_CACHE_CONFIG = {"enabled": True, "dir": "data/cache"}
+    INCREMENTAL_CONFIG = {"chunk_size": 50000}
+    LOCAL_DATASET_PATH = "data/TRSAv1.csv"
+    RANDOM_SEED = 42
+
+
+# Normalizasyon çıktısını değiştiren her düzenlemede artırılmalıdır;
+# korpus önbelleği bu sürüme göre geçersiz kılınır.
+NORMALIZER_VERSION = 1
+
+
+# ============================================================
+# DERLENMİŞ DÜZENLİ İFADELER
+# ============================================================
+
+# URL'ler (http://... veya www. ile başlayanlar)
+URL_PATTERN = re.compile(r"(https?://\S+|www\.\S+)")
+
+# E-posta adresleri
+EMAIL_PATTERN = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b")
+
+# Türk telefon numaraları (+90 5XX XXX XX XX formatı)
+PHONE_PATTERN = re.compile(r"\b(\+?90)?\s?(\(?\d{3}\)?)\s?\d{3}\s?\d{2}\s?\d{2}\b")
+
+# 3+ tekrar eden karakterler
+TEKRAR_PATTERN = re.compile(r"(.)\1{2,}")
+
+# URL/e-posta/telefon adayları: her etiket türü bu parçalardan birini
+# içermek zorunda olduğu için tek taramada hangi değişimlerin gerektiği
+# anlaşılır. Yorumların çoğunda aday yoktur ve üç değişim de atlanır.
+ETIKET_ADAY_PATTERN = re.compile(r"(?P<url>https?://|www\.)|(?P<email>@)|(?P<phone>\d{3})")
+
+
+# ============================================================
+# METİN NORMALİZASYONU
+# ============================================================
+
+def _etiketleri_yerlestir(sonuc: str) -> str:
+    """
+    URL, e-posta ve telefonları tek aday taramasıyla etiketler.
+    
+    Değişimler orijinal sırayla (URL -> e-posta -> telefon) ve yalnızca
+    metinde ilgili türün adayı varsa uygulanır; böylece çıktı ardışık
+    üç re.sub çağrısıyla birebir aynı kalır.
+    """
+    turler = {eslesme.lastgroup for eslesme in ETIKET_ADAY_PATTERN.finditer(sonuc)}
+    if not turler:
+        return sonuc
+    
+    if "url" in turler:
+        sonuc = URL_PATTERN.sub(" <url> ", sonuc)
+    if "email" in turler:
+        sonuc = EMAIL_PATTERN.sub(" <email> ", sonuc)
+    if "phone" in turler:
+        sonuc = PHONE_PATTERN.sub(" <phone> ", sonuc)
+    
+    return sonuc
+
+
+# ============================================================
+# KÖK (STEM) ÖNBELLEĞİ
+# ============================================================
+
+def _kelime_stemle(kelime: str) -> str:
+    """Tek bir kelimeyi TurkishStemmer ile köküne indirir."""
+    try:
+        kok = stemmer.stem(kelime)
+        return kok if kok else kelime
+    except Exception:
+        return kelime
+
+
+class StemCache:
+    """
+    TurkishStemmer için sınırlı boyutlu LRU kök önbelleği.
+    
+    E-ticaret yorumları küçük bir kelime dağarcığını ("kargo", "ürün",
+    "hızlı" ...) sürekli tekrar kullandığı için her kelime yalnızca ilk
+    görüldüğünde stemmer'dan geçer. Önbellek dolunca en uzun süredir
+    kullanılmayan kelime atılır.
+    
+    Attributes:
+        max_size: En fazla tutulacak kelime sayısı (0 = önbellek kapalı)
+        hits: Önbellekten karşılanan istek sayısı
+        misses: Stemmer'a giden istek sayısı
+        evictions: Yer açmak için atılan kelime sayısı
+    
+    Örnek:
+        >>> onbellek = StemCache(max_size=1000)
+        >>> onbellek.stem_many(["kargo", "kargo", "geldi"])
+        {'kargo': 'kargo', 'geldi': 'gelt'}
+        >>> onbellek.stats()["misses"]
+        2
+    """
+    
+    def __init__(self, max_size: int = 200000):
+        """
+        Önbellek oluşturur.
+        
+        Args:
+            max_size: En fazla tutulacak kelime sayısı
+        """
+        self.max_size = max_size
+        self._kokler: "OrderedDict[str, str]" = OrderedDict()
+        self._kilit = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._kokler)
+    
+    def _ekle(self, kelime: str, kok: str):
+        """Kilit altında çağrılır; gerekirse en eski kaydı atar."""
+        if self.max_size <= 0:
+            return
+        self._kokler[kelime] = kok
+        self._kokler.move_to_end(kelime)
+        while len(self._kokler) > self.max_size:
+            self._kokler.popitem(last=False)
+            self.evictions += 1
+    
+    def stem(self, kelime: str) -> str:
+        """Tek bir kelimenin kökünü önbellekten veya stemmer'dan döndürür."""
+        return self.stem_many([kelime])[kelime]
+    
+    def stem_many(self, kelimeler: Iterable[str]) -> Dict[str, str]:
+        """
+        Kelimeleri tekilleştirip köklerini döndürür.
+        
+        Her benzersiz kelime bir kez sayılır: önbellekte varsa hit,
+        yoksa stemmer'a gider ve miss olarak kaydedilir.
+        
+        Args:
+            kelimeler: Kelimeler (tekrar içerebilir)
+        
+        Returns:
+            dict: Kelime -> kök eşlemesi
+        """
+        harita: Dict[str, str] = {}
+        eksikler = []
+        
+        with self._kilit:
+            for kelime in kelimeler:
+                if kelime in harita:
+                    continue
+                kok = self._kokler.get(kelime)
+                if kok is None:
+                    harita[kelime] = kelime
+                    eksikler.append(kelime)
+                else:
+                    self._kokler.move_to_end(kelime)
+                    harita[kelime] = kok
+            self.hits += len(harita) - len(eksikler)
+            self.misses += len(eksikler)
+        
+        if not eksikler:
+            return harita
+        
+        # Stemmer kilit dışında çalışır, sonuçlar toplu eklenir
+        for kelime in eksikler:
+            harita[kelime] = _kelime_stemle(kelime)
+        
+        with self._kilit:
+            for kelime in eksikler:
+                self._ekle(kelime, harita[kelime])
+        
+        return harita
+    
+    def stats(self) -> dict:
+        """Önbellek sayaçlarını döndürür."""
+        toplam = self.hits + self.misses
+        return {
+            "size": len(self._kokler),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / toplam if toplam else 0.0
+        }
+    
+    def clear(self):
+        """Kayıtları ve sayaçları sıfırlar."""
+        with self._kilit:
+            self._kokler.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def save(self, path: Optional[str] = None):
+        """
+        Isınmış önbelleği JSON olarak kaydeder.
+        
+        Kayıtlar en eskiden en yeniye sıralanır, böylece yüklendiğinde
+        LRU sırası korunur.
+        """
+        path = str(path or STEM_CACHE_CONFIG["path"])
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        
+        with self._kilit:
+            kayitlar = list(self._kokler.items())
+        
+        with open(path, "w", encoding="utf-8") as dosya:
+            json.dump({"stemmer": "TurkishStemmer", "kayitlar": kayitlar}, dosya, ensure_ascii=False)
+        
+        print(f"[OK] Kök önbelleği kaydedildi: {path} ({len(kayitlar):,} kelime)")
+    
+    def load(self, path: Optional[str] = None) -> int:
+        """
+        Kaydedilmiş önbelleği yükler.
+        
+        Returns:
+            int: Yüklenen kelime sayısı
+        """
+        path = str(path or STEM_CACHE_CONFIG["path"])
+        with open(path, encoding="utf-8") as dosya:
+            kayitlar = json.load(dosya).get("kayitlar", [])
+        
+        with self._kilit:
+            for kelime, kok in kayitlar:
+                self._ekle(kelime, kok)
+        
+        return len(kayitlar)
+
+
+# Modül genelinde paylaşılan önbellek
+stem_cache = StemCache(int(STEM_CACHE_CONFIG.get("max_size", 0) or 0))
+
+if STEMMER_AVAILABLE and STEM_CACHE_CONFIG.get("preload") and os.path.exists(str(STEM_CACHE_CONFIG["path"])):
+    try:
+        stem_cache.load()
+    except (OSError, ValueError) as e:
+        print(f"[UYARI] Kök önbelleği yüklenemedi: {e}")
+
+
+def kok_onbellegi_istatistikleri() -> dict:
+    """Paylaşılan kök önbelleğinin sayaçlarını döndürür."""
+    return stem_cache.stats()
+
+
+def kok_onbellegini_kaydet(path: Optional[str] = None):
+    """Paylaşılan kök önbelleğini modellerin yanına kaydeder."""
+    stem_cache.save(path)
 
 
 # ============================================================
 # METİN NORMALİZASYONU
 # ============================================================
 
+def _etiket_mi(kelime: str) -> bool:
+    """Özel etiket (<url>, <email>, <phone>) kontrolü."""
+    return kelime.startswith("<") and kelime.endswith(">")
+
+
+def _kelimeleri_stemle(kelimeler: List[str]) -> List[str]:
+    """Kelimeleri köklerine indirir, özel etiketleri (<url> vb.) korur."""
+    kokler = stem_cache.stem_many(k for k in kelimeler if not _etiket_mi(k))
+    return [kokler.get(k, k) for k in kelimeler]
+
+
+def _on_isle(metin) -> List[str]:
+    """Stemming öncesi tüm adımları uygular ve kelime listesini döndürür."""
+    # Boş veya None kontrolü
+    if not isinstance(metin, str):
+        metin = "" if pd.isna(metin) else str(metin)
+    
+    # Unicode normalizasyonu + küçük harf
+    sonuc = unicodedata.normalize("NFKC", metin).strip().lower()
+    
+    # URL / e-posta / telefon etiketleri
+    sonuc = _etiketleri_yerlestir(sonuc)
+    
+    # 3+ tekrar eden karakterleri 2'ye indir ("çooook" -> "çook")
+    sonuc = TEKRAR_PATTERN.sub(r"\1\1", sonuc)
+    
+    # Tek tokenizasyon: boşluk temizliği ve stemming aynı listeyi kullanır
+    return sonuc.split()
+
+
+def _stemming_aktif(stemming_uygula: bool) -> bool:
+    return stemming_uygula and STEMMER_AVAILABLE and stemmer is not None
+
+
 def turkce_metin_normalize_et(metin: str, stemming_uygula: bool = True) -> str:
     """
     Türkçe metni makine öğrenmesi için uygun hale getirir.
@@ -64,6 +363,11 @@ def turkce_metin_normalize_et(metin: str, stemming_uygula: bool = True) -> str:
     7. Fazla boşlukları temizleme
     8. Stemming (kelime köküne indirgeme) - opsiyonel
     
+    Düzenli ifadeler modül yüklenirken derlenir, 3-5. adımlar tek aday
+    taramasıyla birleştirilir ve boşluk temizliği ile stemming aynı
+    kelime listesi üzerinden yapılır. Kökler paylaşılan stem_cache
+    üzerinden bulunur.
+    
     Args:
         metin: Ham metin
         stemming_uygula: True ise kelimelere stemming uygulanır
@@ -75,66 +379,155 @@ def turkce_metin_normalize_et(metin: str, stemming_uygula: bool = True) -> str:
         >>> turkce_metin_normalize_et("HARIKA BİR ÜRÜN!!! www.site.com")
         'harik bir ürün <url>'
     """
-    # Boş veya None kontrolü
-    if not isinstance(metin, str):
-        metin = "" if pd.isna(metin) else str(metin)
+    kelimeler = _on_isle(metin)
     
-    # Unicode normalizasyonu + küçük harf
-    sonuc = unicodedata.normalize("NFKC", metin).strip().lower()
+    # STEMMING: Kelimeleri köklerine indir (önbellek üzerinden)
+    if kelimeler and _stemming_aktif(stemming_uygula):
+        kelimeler = _kelimeleri_stemle(kelimeler)
     
-    # URL'leri değiştir (http://... veya www. ile başlayanlar)
-    sonuc = re.sub(r"(https?://\S+|www\.\S+)", " <url> ", sonuc)
+    return " ".join(kelimeler)
+
+
+def normalize_batch(metinler: Iterable, stemming_uygula: bool = True) -> List[str]:
+    """
+    Birden fazla metni toplu olarak normalize eder.
     
-    # E-posta adreslerini değiştir
-    sonuc = re.sub(r"\b[\w\.-]+@[\w\.-]+\.\w+\b", " <email> ", sonuc)
+    Çıktı, her metin için turkce_metin_normalize_et() çağırmakla birebir
+    aynıdır. Aynı ham metin grupta birden fazla geçiyorsa yalnızca bir kez
+    işlenir (tekrarlı yorumlar e-ticaret verisinde sık görülür); stemming
+    ise gruptaki benzersiz kelimeler üzerinden tek seferde yapılır.
     
-    # Türk telefon numaralarını değiştir (+90 5XX XXX XX XX formatı)
-    sonuc = re.sub(r"\b(\+?90)?\s?(\(?\d{3}\)?)\s?\d{3}\s?\d{2}\s?\d{2}\b", " <phone> ", sonuc)
+    Args:
+        metinler: Ham metinler (liste, pandas Series vb.)
+        stemming_uygula: True ise kelimelere stemming uygulanır
     
-    # 3+ tekrar eden karakterleri 2'ye indir ("çooook" -> "çook")
-    sonuc = re.sub(r"(.)\1{2,}", r"\1\1", sonuc)
-    
-    # Fazla boşlukları tek boşluğa indir
-    sonuc = re.sub(r"\s+", " ", sonuc).strip()
-    
-    # STEMMING: Kelimeleri köklerine indir
-    if stemming_uygula and sonuc and STEMMER_AVAILABLE and stemmer is not None:
-        kelimeler = sonuc.split()
-        kokler = []
-        for kelime in kelimeler:
-            # Özel etiketleri (url, email, phone) koruyalım
-            if kelime.startswith("<") and kelime.endswith(">"):
-                kokler.append(kelime)
-            else:
-                try:
-                    kok = stemmer.stem(kelime)
-                    kokler.append(kok if kok else kelime)
-                except:
-                    kokler.append(kelime)
-        sonuc = " ".join(kokler)
+    Returns:
+        List[str]: Normalize edilmiş metinler (girdi sırasıyla)
     
-    return sonuc
+    Örnek:
+        >>> normalize_batch(["Harika!!!", "Harika!!!", "Kargo geç geldi"])
+        ['harika!!', 'harika!!', 'kargo geç gelt']
+    """
+    # 1. Stemming öncesi adımlar (benzersiz ham metin başına bir kez)
+    indeksler: Dict[str, int] = {}
+    kelime_listeleri: List[List[str]] = []
+    sira: List[int] = []
+    
+    for metin in metinler:
+        indeks = indeksler.get(metin) if isinstance(metin, str) else None
+        if indeks is None:
+            indeks = len(kelime_listeleri)
+            kelime_listeleri.append(_on_isle(metin))
+            if isinstance(metin, str):
+                indeksler[metin] = indeks
+        sira.append(indeks)
+    
+    # 2. Gruptaki benzersiz kelimeleri tek seferde stemle
+    if _stemming_aktif(stemming_uygula):
+        kokler = stem_cache.stem_many(
+            kelime
+            for kelimeler in kelime_listeleri
+            for kelime in kelimeler
+            if not _etiket_mi(kelime)
+        )
+        benzersiz_sonuclar = [
+            " ".join([kokler.get(k, k) for k in kelimeler])
+            for kelimeler in kelime_listeleri
+        ]
+    else:
+        benzersiz_sonuclar = [" ".join(kelimeler) for kelimeler in kelime_listeleri]
+    
+    return [benzersiz_sonuclar[i] for i in sira]
 
 
 # ============================================================
-# CSV OKUMA
+# ÇOK ÇEKİRDEKLİ NORMALİZASYON
 # ============================================================
 
-def akilli_csv_oku(dosya_yolu: str) -> pd.DataFrame:
+# İşçi süreç ayarı: görev başına değil, işçi başına bir kez aktarılır
+_isci_stemming_uygula = True
+
+
+def _isci_baslat(stemming_uygula: bool):
     """
-    CSV dosyasını akıllı şekilde okur.
+    İşçi süreç başlatıcısı.
     
-    Bu fonksiyon:
-    1. Dosyanın ilk 4KB'ini okur (hız için)
-    2. Farklı encoding'leri dener (UTF-8, Latin1 vs.)
-    3. Ayırıcı karakteri otomatik tespit eder
-    4. Pandas DataFrame olarak döndürür
+    Stemmer ve kök önbelleği modül yüklenirken işçi başına bir kez
+    oluşur; görevlere yalnızca metin parçaları gönderilir.
+    """
+    global _isci_stemming_uygula
+    _isci_stemming_uygula = stemming_uygula
+
+
+def _parca_normalize_et(parca: List) -> List[str]:
+    """Bir metin parçasını işçi süreçte normalize eder."""
+    return normalize_batch(parca, _isci_stemming_uygula)
+
+
+def paralel_normalize_et(
+    metinler: Iterable,
+    stemming_uygula: bool = True,
+    n_jobs: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> List[str]:
+    """
+    Metinleri süreç havuzunda sıralı parçalar halinde normalize eder.
+    
+    Parçalar girdi sırasıyla birleştirildiği için sonuç, normalize_batch()
+    ile seri çalıştırmayla birebir aynıdır. Küçük girdilerde (veya
+    n_jobs=1 iken) süreç başlatma maliyetine girmeden seri çalışır.
+    Paralel modda kök önbelleği işçilerde ısınır, ana süreçtekine eklenmez.
     
     Args:
-        dosya_yolu: CSV dosyasının yolu
+        metinler: Ham metinler
+        stemming_uygula: True ise kelimelere stemming uygulanır
+        n_jobs: İşlem sayısı (-1 = tüm çekirdekler, None = config)
+        chunk_size: Görev başına metin sayısı (None = config)
     
     Returns:
-        pd.DataFrame: Okunan veri
+        List[str]: Normalize edilmiş metinler (girdi sırasıyla)
+    """
+    metinler = list(metinler)
+    
+    if n_jobs is None:
+        n_jobs = PARALLEL_NORMALIZATION_CONFIG.get("n_jobs", 1)
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    chunk_size = chunk_size or PARALLEL_NORMALIZATION_CONFIG.get("chunk_size", 10000)
+    en_az = PARALLEL_NORMALIZATION_CONFIG.get("min_parallel_size", 50000)
+    
+    parcalar = [metinler[i:i + chunk_size] for i in range(0, len(metinler), chunk_size)]
+    n_jobs = min(n_jobs or 1, len(parcalar))
+    
+    # Seri yedek yol
+    if n_jobs <= 1 or len(metinler) < en_az:
+        return normalize_batch(metinler, stemming_uygula)
+    
+    print(f"[BİLGİ] Normalizasyon: {n_jobs} işlem, {len(parcalar)} parça")
+    
+    sonuclar: List[str] = []
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_isci_baslat,
+        initargs=(stemming_uygula,)
+    ) as havuz:
+        # map() parça sırasını korur
+        for parca_sonucu in havuz.map(_parca_normalize_et, parcalar):
+            sonuclar.extend(parca_sonucu)
+    
+    return sonuclar
+
+
+# ============================================================
+# CSV OKUMA
+# ============================================================
+
+def _csv_bicimi_tespit(dosya_yolu: str) -> Tuple[str, str]:
+    """
+    Dosyanın ilk 4KB'ından karakter kodlamasını ve ayırıcıyı tespit eder.
+    
+    Returns:
+        tuple: (encoding, ayırıcı)
     """
     # Dosyanın ilk 4096 byte'ini oku (örnek olarak yeterli)
     with open(dosya_yolu, "rb") as dosya:
@@ -142,7 +535,7 @@ def akilli_csv_oku(dosya_yolu: str) -> pd.DataFrame:
     
     # Farklı encoding'leri dene
     denenen_encodingler = ["utf-8-sig", "utf-8", "latin1", "windows-1254"]
-    bulunan_encoding = None
+    bulunan_encoding = "utf-8"
     ornek_metin = ""
     
     for enc in denenen_encodingler:
@@ -165,15 +558,251 @@ def akilli_csv_oku(dosya_yolu: str) -> pd.DataFrame:
     ayirici_adi = {",": "virgül", ";": "noktalı virgül", "\t": "tab"}.get(ayirici, ayirici)
     print(f"[BİLGİ] Tespit edilen ayırıcı: {ayirici_adi} ({repr(ayirici)})")
     
+    return bulunan_encoding, ayirici
+
+
+def akilli_csv_oku(dosya_yolu: str, sutunlar: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    CSV dosyasını akıllı şekilde okur.
+    
+    Bu fonksiyon:
+    1. Dosyanın ilk 4KB'ini okur (hız için)
+    2. Farklı encoding'leri dener (UTF-8, Latin1 vs.)
+    3. Ayırıcı karakteri otomatik tespit eder
+    4. Pandas DataFrame olarak döndürür
+    
+    Okuma hızlı C motoruyla yapılır; dosya C motorunun ayrıştıramadığı
+    bir biçimdeyse Python motoruna geri dönülür. Tespit edilen biçim
+    csv_semasi() ile yan dosyaya yazılır ve tekrar okumalarda kullanılır.
+    Büyük dosyalar için akilli_csv_oku_parcali() kullanın.
+    
+    Args:
+        dosya_yolu: CSV dosyasının yolu
+        sutunlar: Yalnızca okunacak sütunlar (None = hepsi)
+    
+    Returns:
+        pd.DataFrame: Okunan veri
+    """
+    sema = csv_semasi(dosya_yolu)
+    bulunan_encoding, ayirici = sema["encoding"], sema["ayirici"]
+    
     # Pandas ile oku
-    veri_cercevesi = pd.read_csv(
+    try:
+        veri_cercevesi = pd.read_csv(
+            dosya_yolu,
+            sep=ayirici,
+            engine="c",
+            encoding=bulunan_encoding,
+            usecols=sutunlar
+        )
+    except pd.errors.ParserError:
+        veri_cercevesi = pd.read_csv(
+            dosya_yolu,
+            sep=ayirici,
+            engine="python",
+            encoding=bulunan_encoding,
+            usecols=sutunlar
+        )
+    
+    return veri_cercevesi
+
+
+# ============================================================
+# PARÇALI (STREAMING) CSV OKUMA
+# ============================================================
+
+def csv_dosyalarini_listele(kaynak: str) -> List[str]:
+    """
+    Dosya, klasör veya glob desenini CSV dosya listesine çevirir.
+    
+    Args:
+        kaynak: "data/yorumlar.csv", "data/exports/" veya "data/*.csv"
+    
+    Returns:
+        List[str]: Sıralı dosya yolları
+    """
+    if os.path.isdir(kaynak):
+        return sorted(glob.glob(os.path.join(kaynak, "*.csv")))
+    if glob.has_magic(kaynak):
+        return sorted(glob.glob(kaynak))
+    return [kaynak]
+
+
+def _projeksiyon_sutunlari(sema: dict) -> Optional[List[str]]:
+    """Şemadaki metin/etiket/puan sütunlarını okuma listesine çevirir."""
+    sutunlar: List[str] = []
+    for anahtar in ["metin_sutunu", "etiket_sutunu", "puan_sutunu"]:
+        sutun = sema.get(anahtar)
+        if sutun is not None and sutun not in sutunlar:
+            sutunlar.append(sutun)
+    return sutunlar or None
+
+
+def _pandas_parcalari(
+    dosya_yolu: str,
+    encoding: str,
+    ayirici: str,
+    sutunlar: Optional[List[str]],
+    chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Pandas C motoruyla parça parça okur."""
+    with pd.read_csv(
         dosya_yolu,
         sep=ayirici,
-        engine="python",
-        encoding=bulunan_encoding
+        engine="c",
+        encoding=encoding,
+        usecols=sutunlar,
+        chunksize=chunksize
+    ) as okuyucu:
+        for parca in okuyucu:
+            yield parca
+
+
+def _pyarrow_parcalari(
+    dosya_yolu: str,
+    encoding: str,
+    ayirici: str,
+    sutunlar: Optional[List[str]],
+    chunksize: int,
+    metin_sutunu: Optional[str]
+) -> Iterator[pd.DataFrame]:
+    """pyarrow akış okuyucusuyla parça parça okur."""
+    # Satır başına ortalama bayt sayısından blok boyutunu tahmin et
+    with open(dosya_yolu, "rb") as dosya:
+        ornek = dosya.read(1 << 20)
+    satir_bayt = max(1, len(ornek) // max(1, ornek.count(b"\n")))
+    blok_boyutu = max(1 << 20, min(chunksize * satir_bayt, 1 << 30))
+    
+    # Tip çıkarımı ilk bloktan yapılır: okunan tüm sütunlar her blokta
+    # string kalmalı, yoksa sonraki bloklar dönüşüm hatası verir (ör. ilk
+    # blokta tamsayı görünen etiket). Projeksiyon yoksa yalnızca metin
+    # sütunu bilinir
+    sabit_sutunlar = sutunlar or ([metin_sutunu] if metin_sutunu else [])
+    sutun_tipleri = {sutun: pa.string() for sutun in sabit_sutunlar} or None
+    
+    okuyucu = pa_csv.open_csv(
+        dosya_yolu,
+        read_options=pa_csv.ReadOptions(
+            encoding="utf8" if encoding.replace("-", "").lower().startswith("utf8") else encoding,
+            block_size=int(blok_boyutu)
+        ),
+        parse_options=pa_csv.ParseOptions(delimiter=ayirici, newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(include_columns=sutunlar, column_types=sutun_tipleri)
     )
+    for batch in okuyucu:
+        yield batch.to_pandas()
+
+
+def _dosya_parcalari(
+    dosya_yolu: str,
+    chunksize: int,
+    sutun_projeksiyonu: bool,
+    engine: Optional[str]
+) -> Iterator[pd.DataFrame]:
+    """Tek bir CSV dosyasını parça parça okur (parca.attrs["kaynak"] = dosya yolu)."""
+    sema = csv_semasi(dosya_yolu)
+    encoding, ayirici = sema["encoding"], sema["ayirici"]
+    metin_sutunu = sema.get("metin_sutunu")
+    sutunlar = _projeksiyon_sutunlari(sema) if sutun_projeksiyonu else None
+    
+    if sutunlar:
+        print(f"[BİLGİ] Okunan sütunlar: {sutunlar}")
+    
+    engine = engine or ("pyarrow" if PYARROW_AVAILABLE else "c")
+    if engine == "pyarrow":
+        parcalar = _pyarrow_parcalari(dosya_yolu, encoding, ayirici, sutunlar, chunksize, metin_sutunu)
+    else:
+        parcalar = _pandas_parcalari(dosya_yolu, encoding, ayirici, sutunlar, chunksize)
     
-    return veri_cercevesi
+    # Paralel okumada parçaların hangi dosyadan geldiği bilinsin
+    for parca in parcalar:
+        parca.attrs["kaynak"] = dosya_yolu
+        yield parca
+
+
+def akilli_csv_oku_parcali(
+    kaynak: str,
+    chunksize: int = 100000,
+    sutun_projeksiyonu: bool = True,
+    n_jobs: int = 1,
+    engine: Optional[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Büyük CSV dosyalarını DataFrame parçaları halinde okur.
+    
+    Bellekte aynı anda yalnızca birkaç parça tutulur:
+    1. Encoding, ayırıcı ve metin/etiket/puan sütunları csv_semasi() ile
+       bulunur (yan dosya varsa tespit atlanır)
+    2. Yalnızca bu sütunlar okunur (sütun projeksiyonu)
+    3. pyarrow kuruluysa akış okuyucusu, değilse pandas C motoru kullanılır
+    
+    Klasör veya glob deseni verilirse dosyalar n_jobs iş parçacığıyla
+    paralel okunur. Bu durumda dosyalar arası parça sırası garanti edilmez;
+    tek dosyada parçalar her zaman dosya sırasıyla gelir.
+    
+    Args:
+        kaynak: CSV dosyası, klasör veya glob deseni ("data/*.csv")
+        chunksize: Parça başına yaklaşık satır sayısı
+        sutun_projeksiyonu: True ise yalnızca metin/etiket/puan sütunları okunur
+        n_jobs: Aynı anda okunacak dosya sayısı
+        engine: "pyarrow", "c" veya None (otomatik)
+    
+    Returns:
+        Iterator[pd.DataFrame]: Veri parçaları
+    
+    Örnek:
+        >>> for parca in akilli_csv_oku_parcali("data/exports/*.csv", n_jobs=4):
+        ...     isle(parca)
+    """
+    dosyalar = csv_dosyalarini_listele(kaynak)
+    if not dosyalar:
+        raise FileNotFoundError(f"CSV dosyası bulunamadı: {kaynak}")
+    
+    if n_jobs <= 1 or len(dosyalar) == 1:
+        for dosya_yolu in dosyalar:
+            yield from _dosya_parcalari(dosya_yolu, chunksize, sutun_projeksiyonu, engine)
+        return
+    
+    # Paralel okuma: sınırlı kuyruk bellekteki parça sayısını sınırlar
+    kuyruk: "queue.Queue" = queue.Queue(maxsize=n_jobs * 2)
+    durdur = threading.Event()
+    bitti = object()
+    
+    def kuyruga_koy(oge) -> bool:
+        while not durdur.is_set():
+            try:
+                kuyruk.put(oge, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def dosya_oku(dosya_yolu: str):
+        try:
+            for parca in _dosya_parcalari(dosya_yolu, chunksize, sutun_projeksiyonu, engine):
+                if not kuyruga_koy(parca):
+                    return
+        except Exception as e:
+            kuyruga_koy(e)
+        finally:
+            kuyruga_koy(bitti)
+    
+    with ThreadPoolExecutor(max_workers=n_jobs) as havuz:
+        for dosya_yolu in dosyalar:
+            havuz.submit(dosya_oku, dosya_yolu)
+        
+        try:
+            kalan = len(dosyalar)
+            while kalan:
+                oge = kuyruk.get()
+                if oge is bitti:
+                    kalan -= 1
+                elif isinstance(oge, Exception):
+                    raise oge
+                else:
+                    yield oge
+        finally:
+            durdur.set()
 
 
 # ============================================================
@@ -200,6 +829,16 @@ PUAN_ANAHTAR_KELIMELERI = [
     "puan", "yildiz", "rating_score"
 ]
 
+# Sütun tespitinde incelenen en fazla satır sayısı
+SEMA_ORNEK_BOYUTU = 5000
+
+
+def _ornekle(veri: pd.DataFrame, ornek_boyutu: Optional[int]) -> pd.DataFrame:
+    """Sütun tespiti için sınırlı boyutlu rastgele satır örneği alır."""
+    if ornek_boyutu is None or len(veri) <= ornek_boyutu:
+        return veri
+    return veri.sample(n=ornek_boyutu, random_state=RANDOM_SEED)
+
 
 def isimden_sutun_bul(sutun_listesi, anahtar_kelimeler: list) -> Optional[str]:
     """
@@ -228,7 +867,10 @@ def isimden_sutun_bul(sutun_listesi, anahtar_kelimeler: list) -> Optional[str]:
     return None
 
 
-def metin_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Optional[str]:
+def metin_sutunu_bul(
+    veri_cercevesi: pd.DataFrame,
+    ornek_boyutu: Optional[int] = SEMA_ORNEK_BOYUTU
+) -> Optional[str]:
     """
     İçeriğe bakarak metin sütununu tespit eder.
     
@@ -237,6 +879,7 @@ def metin_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Optional[str]:
     
     Args:
         veri_cercevesi: pandas DataFrame
+        ornek_boyutu: İncelenecek en fazla satır (None = tümü)
     
     Returns:
         str veya None: Bulunan sütun adı
@@ -246,12 +889,13 @@ def metin_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Optional[str]:
     if isimden is not None:
         return isimden
     
-    # İsimden bulamadıysak içeriğe bak
+    # İsimden bulamadıysak içeriğe bak (rastgele örnek üzerinde)
+    ornek_cerceve = _ornekle(veri_cercevesi, ornek_boyutu)
     en_iyi_sutun = None
     en_iyi_skor = -1
     
-    for sutun in veri_cercevesi.columns:
-        seri = veri_cercevesi[sutun]
+    for sutun in ornek_cerceve.columns:
+        seri = ornek_cerceve[sutun]
         
         if seri.dtype != "object" and not str(seri.dtype).startswith("string"):
             continue
@@ -272,10 +916,17 @@ def metin_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Optional[str]:
     return en_iyi_sutun
 
 
-def etiket_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Tuple[Optional[str], Optional[str]]:
+def etiket_sutunu_bul(
+    veri_cercevesi: pd.DataFrame,
+    ornek_boyutu: Optional[int] = SEMA_ORNEK_BOYUTU
+) -> Tuple[Optional[str], Optional[str]]:
     """
     İçeriğe bakarak etiket sütununu tespit eder.
     
+    Args:
+        veri_cercevesi: pandas DataFrame
+        ornek_boyutu: İncelenecek en fazla satır (None = tümü)
+    
     Returns:
         tuple: (sütun_adı, tespit_yöntemi) veya (None, None)
     """
@@ -284,12 +935,13 @@ def etiket_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Tuple[Optional[str], Opti
     if isimden is not None:
         return isimden, "isim_eslesmesi"
     
-    # İsimden bulamadıysak içeriğe bak
+    # İsimden bulamadıysak içeriğe bak (rastgele örnek üzerinde)
+    ornek_cerceve = _ornekle(veri_cercevesi, ornek_boyutu)
     en_iyi_sutun = None
     en_iyi_skor = -1
     
-    for sutun in veri_cercevesi.columns:
-        skor = _etiket_sutunu_skorla(veri_cercevesi[sutun])
+    for sutun in ornek_cerceve.columns:
+        skor = _etiket_sutunu_skorla(ornek_cerceve[sutun])
         if skor > en_iyi_skor:
             en_iyi_skor = skor
             en_iyi_sutun = sutun
@@ -346,14 +998,18 @@ def _etiket_sutunu_skorla(seri: pd.Series) -> float:
     return skor
 
 
-def puan_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Optional[str]:
-    """Puan/yıldız (1-5) sütununu bulur."""
+def puan_sutunu_bul(
+    veri_cercevesi: pd.DataFrame,
+    ornek_boyutu: Optional[int] = SEMA_ORNEK_BOYUTU
+) -> Optional[str]:
+    """Puan/yıldız (1-5) sütununu bulur (rastgele örnek üzerinde)."""
     isimden = isimden_sutun_bul(veri_cercevesi.columns, PUAN_ANAHTAR_KELIMELERI)
     if isimden is not None:
         return isimden
     
-    for sutun in veri_cercevesi.columns:
-        sayisal: pd.Series = pd.to_numeric(veri_cercevesi[sutun], errors="coerce")  # type: ignore[assignment]
+    ornek_cerceve = _ornekle(veri_cercevesi, ornek_boyutu)
+    for sutun in ornek_cerceve.columns:
+        sayisal: pd.Series = pd.to_numeric(ornek_cerceve[sutun], errors="coerce")  # type: ignore[assignment]
         sayisal_temiz = sayisal.dropna()
         benzersiz = set(sayisal_temiz.unique().tolist()) if len(sayisal_temiz) > 0 else set()
         
@@ -363,6 +1019,107 @@ def puan_sutunu_bul(veri_cercevesi: pd.DataFrame) -> Optional[str]:
     return None
 
 
+# ============================================================
+# ŞEMA ÇIKARIMI (YAN DOSYA)
+# ============================================================
+
+# Yan dosya biçimi veya tespit örneklemesi değişirse artırılır
+SEMA_SURUMU = 2
+
+
+def _sema_yan_dosyasi(dosya_yolu: str) -> str:
+    return f"{dosya_yolu}.schema.json"
+
+
+def _ornek_satir_secici(dosya_yolu: str, ornek_boyutu: int):
+    """
+    Dosyadan tohumlu rastgele en fazla `ornek_boyutu` veri satırı seçen
+    read_csv skiprows çağrılabilirini döndürür.
+    
+    Satır sayısı dosyadaki satır sonlarından sayılır (ikili, parça parça);
+    dosya örnekten küçükse None döner ve tüm dosya okunur. Seçilen satır
+    indeksleri bir kümede tutulur, bellek örnek boyutuyla sınırlıdır.
+    """
+    satir_sonu = 0
+    son_bayt = b"\n"
+    with open(dosya_yolu, "rb") as dosya:
+        for parca in iter(lambda: dosya.read(1 << 20), b""):
+            satir_sonu += parca.count(b"\n")
+            son_bayt = parca[-1:]
+    # Başlık satırı (0) hariç veri satırları 1..veri_satiri
+    veri_satiri = satir_sonu + (son_bayt != b"\n") - 1
+    if veri_satiri <= ornek_boyutu:
+        return None
+    
+    rastgele = np.random.default_rng(RANDOM_SEED)
+    secilen = set((rastgele.choice(veri_satiri, size=ornek_boyutu, replace=False) + 1).tolist())
+    return lambda i: i != 0 and i not in secilen
+
+
+def csv_semasi(dosya_yolu: str, yenile: bool = False) -> dict:
+    """
+    CSV dosyasının şemasını tespit eder veya yan dosyadan okur.
+    
+    Şema; karakter kodlaması, ayırıcı ve metin/etiket/puan sütunlarından
+    oluşur. Sütunlar dosyanın tamamından tohumlu (RANDOM_SEED) rastgele
+    seçilen en fazla SEMA_ORNEK_BOYUTU satır üzerinden bulunur; dosyanın
+    başı sonundan farklı olsa da tespit yanlı olmaz. Sonuç dosyanın yanına "<dosya>.schema.json" olarak yazılır;
+    dosyanın boyutu ve değişiklik zamanı aynı kaldıkça sonraki okumalarda
+    tespit tamamen atlanır.
+    
+    Args:
+        dosya_yolu: CSV dosyasının yolu
+        yenile: True ise yan dosya yok sayılır ve şema yeniden tespit edilir
+    
+    Returns:
+        dict: encoding, ayirici, metin_sutunu, etiket_sutunu, puan_sutunu
+    """
+    bilgi = os.stat(dosya_yolu)
+    imza = {"surum": SEMA_SURUMU, "boyut": bilgi.st_size, "mtime_ns": bilgi.st_mtime_ns}
+    yan_dosya = _sema_yan_dosyasi(dosya_yolu)
+    
+    if not yenile and os.path.exists(yan_dosya):
+        try:
+            with open(yan_dosya, encoding="utf-8") as dosya:
+                sema = json.load(dosya)
+            if all(sema.get(k) == v for k, v in imza.items()):
+                print(f"[BİLGİ] Şema yan dosyadan okundu: {yan_dosya}")
+                return sema
+        except (OSError, ValueError):
+            pass
+    
+    encoding, ayirici = _csv_bicimi_tespit(dosya_yolu)
+    # Yalnızca seçilen satırlar ayrıştırılır; tırnak içi satır sonları
+    # sayımı şişirirse örnek biraz küçülür, nrows üst sınırı korur
+    atla = _ornek_satir_secici(dosya_yolu, SEMA_ORNEK_BOYUTU)
+    try:
+        ornek = pd.read_csv(
+            dosya_yolu, sep=ayirici, encoding=encoding, skiprows=atla, nrows=SEMA_ORNEK_BOYUTU
+        )
+    except pd.errors.ParserError:
+        ornek = pd.read_csv(
+            dosya_yolu, sep=ayirici, encoding=encoding, skiprows=atla, nrows=SEMA_ORNEK_BOYUTU,
+            engine="python"
+        )
+    
+    sema = dict(imza)
+    sema.update({
+        "encoding": encoding,
+        "ayirici": ayirici,
+        "metin_sutunu": metin_sutunu_bul(ornek, ornek_boyutu=None),
+        "etiket_sutunu": etiket_sutunu_bul(ornek, ornek_boyutu=None)[0],
+        "puan_sutunu": puan_sutunu_bul(ornek, ornek_boyutu=None)
+    })
+    
+    try:
+        with open(yan_dosya, "w", encoding="utf-8") as dosya:
+            json.dump(sema, dosya, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"[UYARI] Şema yan dosyası yazılamadı: {e}")
+    
+    return sema
+
+
 # ============================================================
 # ETİKET DÖNÜŞTÜRME
 # ============================================================
@@ -381,41 +1138,160 @@ def etiketi_duyguya_donustur(etiket_serisi: pd.Series) -> pd.Series:
     Returns:
         pandas Series: 0 (negatif), 1 (nötr), 2 (pozitif) değerleri
     """
-    sayisal_degerler: pd.Series = pd.to_numeric(etiket_serisi, errors="coerce")  # type: ignore[assignment]
+    # Etiket sütunlarında birkaç farklı değer olur: eşleme benzersiz
+    # değerler üzerinde yapılıp kodlarla tüm satırlara dağıtılır.
+    kodlar, benzersizler = pd.factorize(etiket_serisi, use_na_sentinel=True)
+    benzersiz_seri = pd.Series(benzersizler)
+    
+    # Sayısal: 0,1,2 olduğu gibi; -1,0,1 bir kaydırılır (int() gibi kesilerek)
+    sayisal = pd.to_numeric(benzersiz_seri, errors="coerce").to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        kesik = np.trunc(sayisal)
+    eslenen = np.where(
+        np.isin(kesik, [0, 1, 2]), kesik,
+        np.where(kesik == -1, 0.0, np.nan)
+    )
     
-    def sayisal_esle(deger):  # type: ignore[no-untyped-def]
-        if pd.isna(deger):
-            return None
-        try:
-            deger_int = int(deger)
-            if deger_int in [0, 1, 2]:
-                return deger_int
-            if deger_int in [-1, 0, 1]:
-                return deger_int + 1
-        except (ValueError, TypeError):
-            pass
-        return None
+    # Metinsel: LABEL_MAPPING
+    eksik = np.isnan(eslenen)
+    if eksik.any():
+        metinsel = benzersiz_seri.astype(str).str.lower().str.strip().map(LABEL_MAPPING)
+        eslenen = np.where(eksik, metinsel.to_numpy(dtype=float), eslenen)
     
-    duygu_degerleri: pd.Series = sayisal_degerler.apply(sayisal_esle)  # type: ignore[assignment]
+    # Benzersiz değerlerden satırlara (NaN etiketler -1 kodunu alır)
+    degerler = np.full(len(kodlar), np.nan)
+    gecerli = kodlar >= 0
+    degerler[gecerli] = eslenen[kodlar[gecerli]]
     
-    if duygu_degerleri.isna().any():
-        metin_degerler = etiket_serisi.astype(str).str.lower().str.strip()
-        metinsel_eslemeler = metin_degerler.map(LABEL_MAPPING)
-        duygu_degerleri = duygu_degerleri.fillna(metinsel_eslemeler)
+    duygu_degerleri = pd.Series(degerler, index=etiket_serisi.index)
     
     return duygu_degerleri
 
 
+# ============================================================
+# KORPUS ÖNBELLEĞİ
+# ============================================================
+
+def korpus_onbellek_anahtari(dosya_yolu: str, stemming_uygula: bool = True) -> str:
+    """
+    Normalize edilmiş korpus için önbellek anahtarı üretir.
+    
+    Anahtar; kaynak dosyanın içerik özetine, normalizasyon ayarlarına
+    (stemming açık/kapalı, stemmer kurulu mu), NORMALIZER_VERSION'a ve
+    etiket eşlemesine bağlıdır. Bunlardan biri değişince yeni anahtar
+    oluşur ve önbellek kendiliğinden geçersiz olur.
+    """
+    try:
+        from .utils import dosya_ozeti
+    except ImportError:
+        from utils import dosya_ozeti  # type: ignore[no-redef]
+    
+    bilesenler = {
+        "dosya": dosya_ozeti(dosya_yolu),
+        "normalizer_version": NORMALIZER_VERSION,
+        "stemming": bool(stemming_uygula),
+        "stemmer": bool(STEMMER_AVAILABLE),
+        "etiketler": sorted(LABEL_MAPPING.items())
+    }
+    return hashlib.sha256(json.dumps(bilesenler, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _korpus_onbellek_yolu(anahtar: str) -> str:
+    return os.path.join(str(CORPUS_CACHE_CONFIG["dir"]), f"korpus_{anahtar[:24]}.npz")
+
+
+def korpus_onbellegini_oku(anahtar: str) -> Optional[pd.DataFrame]:
+    """
+    Önbellekteki korpusu okur.
+    
+    Returns:
+        pd.DataFrame veya None: ham_metin, metin (ve varsa duygu) sütunları
+    """
+    try:
+        from .utils import metin_tablosunu_ac
+    except ImportError:
+        from utils import metin_tablosunu_ac  # type: ignore[no-redef]
+    
+    yol = _korpus_onbellek_yolu(anahtar)
+    if not os.path.exists(yol):
+        return None
+    
+    try:
+        with np.load(yol, allow_pickle=False) as arsiv:
+            if str(arsiv["anahtar"]) != anahtar:
+                return None
+            veri = pd.DataFrame({
+                "ham_metin": metin_tablosunu_ac(arsiv["ham_blob"], arsiv["ham_ofset"]),
+                "metin": metin_tablosunu_ac(arsiv["metin_blob"], arsiv["metin_ofset"])
+            })
+            if "duygu" in arsiv.files:
+                veri["duygu"] = arsiv["duygu"].astype(int)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[UYARI] Korpus önbelleği okunamadı: {e}")
+        return None
+    
+    return veri
+
+
+def korpus_onbellegine_yaz(anahtar: str, veri: pd.DataFrame):
+    """
+    ham_metin, metin ve duygu sütunlarını NumPy dizileri olarak kaydeder.
+    
+    Önbellek isteğe bağlıdır: yazılamazsa (disk hatası, kodlanamayan
+    metin vb.) uyarı verilir, veri hazırlığı devam eder.
+    """
+    try:
+        from .utils import metin_tablosu_olustur
+    except ImportError:
+        from utils import metin_tablosu_olustur  # type: ignore[no-redef]
+    
+    yol = _korpus_onbellek_yolu(anahtar)
+    try:
+        ham_blob, ham_ofset = metin_tablosu_olustur(veri["ham_metin"].tolist())
+        metin_blob, metin_ofset = metin_tablosu_olustur(veri["metin"].tolist())
+        
+        diziler = {
+            "anahtar": np.array(anahtar),
+            "ham_blob": ham_blob, "ham_ofset": ham_ofset,
+            "metin_blob": metin_blob, "metin_ofset": metin_ofset
+        }
+        if "duygu" in veri.columns:
+            diziler["duygu"] = veri["duygu"].to_numpy(dtype=np.int8)
+        
+        os.makedirs(os.path.dirname(yol), exist_ok=True)
+        gecici_yol = yol + ".tmp.npz"
+        np.savez(gecici_yol, **diziler)
+        os.replace(gecici_yol, yol)
+        print(f"[OK] Korpus önbelleğe yazıldı: {yol}")
+    except (OSError, UnicodeEncodeError, ValueError) as e:
+        print(f"[UYARI] Korpus önbelleği yazılamadı: {e}")
+
+
 # ============================================================
 # ANA FONKSİYON
 # ============================================================
 
-def veri_hazirla(dosya_yolu: Optional[str] = None) -> pd.DataFrame:
+def veri_hazirla(
+    dosya_yolu: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    stemming_uygula: bool = True,
+    onbellek_kullan: Optional[bool] = None
+) -> pd.DataFrame:
     """
     Veri setini indirir/okur ve ön işleme uygular.
     
+    Sonuç, kaynak dosyanın özeti ve normalizasyon ayarlarıyla anahtarlanan
+    bir önbelleğe (data/cache/) yazılır; sonraki çalıştırmalarda dosya
+    değişmediyse okuma ve normalizasyon atlanır. Önbellekten dönen veride
+    yalnızca ham_metin, metin ve duygu sütunları bulunur.
+    
     Args:
         dosya_yolu: CSV dosya yolu (None ise otomatik indirir)
+        n_jobs: Normalizasyon işlem sayısı (-1 = tüm çekirdekler, None = config)
+        chunk_size: Görev başına yorum sayısı (None = config)
+        stemming_uygula: True ise kelimelere stemming uygulanır
+        onbellek_kullan: Korpus önbelleği kullanılsın mı? (None = config)
     
     Returns:
         pd.DataFrame: Hazırlanmış veri
@@ -425,15 +1301,36 @@ def veri_hazirla(dosya_yolu: Optional[str] = None) -> pd.DataFrame:
     except ImportError:
         from utils import veri_indir  # type: ignore[no-redef]
     
+    if onbellek_kullan is None:
+        onbellek_kullan = bool(CORPUS_CACHE_CONFIG.get("enabled", True))
+    
+    # Önbellek kontrolü (kaynak dosya diskte varsa)
+    kaynak_yolu = dosya_yolu or str(LOCAL_DATASET_PATH)
+    onbellek_anahtari = None
+    if onbellek_kullan and os.path.exists(kaynak_yolu):
+        onbellek_anahtari = korpus_onbellek_anahtari(kaynak_yolu, stemming_uygula)
+        onbellekten = korpus_onbellegini_oku(onbellek_anahtari)
+        if onbellekten is not None:
+            print(f"[OK] Korpus önbellekten yüklendi: {len(onbellekten):,} yorum")
+            return onbellekten
+    
     # Veriyi indir veya oku
     if dosya_yolu is None:
         veri = veri_indir()
     else:
         veri = akilli_csv_oku(dosya_yolu)
     
-    # Sütunları tespit et
-    metin_sutunu = metin_sutunu_bul(veri)
-    etiket_sutunu, _ = etiket_sutunu_bul(veri)
+    # Sütunları tespit et (dosyanın şema yan dosyası varsa oradan)
+    metin_sutunu, etiket_sutunu = None, None
+    if os.path.exists(kaynak_yolu):
+        sema = csv_semasi(kaynak_yolu)
+        metin_sutunu, etiket_sutunu = sema.get("metin_sutunu"), sema.get("etiket_sutunu")
+    
+    if metin_sutunu not in veri.columns:
+        metin_sutunu = metin_sutunu_bul(veri)
+        etiket_sutunu, _ = etiket_sutunu_bul(veri)
+    elif etiket_sutunu is not None and etiket_sutunu not in veri.columns:
+        etiket_sutunu, _ = etiket_sutunu_bul(veri)
     
     if metin_sutunu is None:
         raise ValueError("Metin sütunu bulunamadı!")
@@ -444,7 +1341,12 @@ def veri_hazirla(dosya_yolu: Optional[str] = None) -> pd.DataFrame:
     # Veriyi hazırla
     veri = veri.copy()
     veri["ham_metin"] = veri[metin_sutunu].astype(str)
-    veri["metin"] = veri["ham_metin"].apply(turkce_metin_normalize_et)
+    veri["metin"] = paralel_normalize_et(
+        veri["ham_metin"],
+        stemming_uygula=stemming_uygula,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size
+    )
     
     # Boş metinleri temizle
     veri = veri[veri["metin"].str.len() > 0].reset_index(drop=True)
@@ -460,9 +1362,67 @@ def veri_hazirla(dosya_yolu: Optional[str] = None) -> pd.DataFrame:
     # DataFrame olduğundan emin ol
     if isinstance(veri, pd.Series):
         veri = veri.to_frame()
+    
+    # Önbelleğe yaz (veri yeni indirildiyse anahtar şimdi hesaplanır)
+    if onbellek_kullan and os.path.exists(kaynak_yolu):
+        if onbellek_anahtari is None:
+            onbellek_anahtari = korpus_onbellek_anahtari(kaynak_yolu, stemming_uygula)
+        korpus_onbellegine_yaz(onbellek_anahtari, veri)
+    
     return veri
 
 
+def egitim_parcalari(
+    kaynak: str,
+    chunksize: Optional[int] = None,
+    n_jobs: int = 1
+) -> Iterator[Tuple[List[str], List[int]]]:
+    """
+    CSV kaynağından normalize edilmiş (metinler, etiketler) parçaları üretir.
+    
+    Artımlı eğitim için tasarlanmıştır: akilli_csv_oku_parcali() ile okunan
+    her parça normalize edilir, etiketleri 0/1/2'ye dönüştürülür ve geçersiz
+    satırlar atılır. Bellekte aynı anda yalnızca birkaç parça bulunur.
+    
+    Metin ve etiket sütunları okumadan önce dosya başına bir kez, şemadan
+    (csv_semasi, yan dosya) alınır; tüm parçalar aynı sütunları kullanır.
+    
+    Args:
+        kaynak: CSV dosyası, klasör veya glob deseni
+        chunksize: Parça başına satır (None = INCREMENTAL_CONFIG["chunk_size"])
+        n_jobs: Aynı anda okunacak dosya sayısı
+    
+    Returns:
+        Iterator: (normalize metinler, duygu etiketleri) çiftleri
+    
+    Raises:
+        ValueError: Bir dosyanın şemasında metin veya etiket sütunu yoksa
+            (okumaya başlamadan önce)
+    """
+    chunksize = chunksize or INCREMENTAL_CONFIG.get("chunk_size", 50000)
+    
+    # Sütunlar içerik tabanlı tespit edildiğinden parça başına değil,
+    # dosya başına bir kez çözülür; eğitim ortasında sütun değişmez
+    dosya_sutunlari: Dict[str, Tuple[str, str]] = {}
+    for dosya_yolu in csv_dosyalarini_listele(kaynak):
+        sema = csv_semasi(dosya_yolu)
+        if sema.get("metin_sutunu") is None or sema.get("etiket_sutunu") is None:
+            raise ValueError(f"Şemada metin veya etiket sütunu bulunamadı: {dosya_yolu}")
+        dosya_sutunlari[dosya_yolu] = (sema["metin_sutunu"], sema["etiket_sutunu"])
+    
+    for parca in akilli_csv_oku_parcali(kaynak, chunksize=chunksize, n_jobs=n_jobs):
+        metin_sutunu, etiket_sutunu = dosya_sutunlari[parca.attrs["kaynak"]]
+        
+        duygular = etiketi_duyguya_donustur(parca[etiket_sutunu]).to_numpy()
+        metinler = normalize_batch(parca[metin_sutunu].astype(str))
+        
+        gecerli = [
+            i for i, (metin, duygu) in enumerate(zip(metinler, duygular))
+            if metin and duygu in (0, 1, 2)
+        ]
+        yield [metinler[i] for i in gecerli], [int(duygular[i]) for i in gecerli]
+
+
 # ============================================================
 # KOMUT SATIRI
 # ============================================================
@@ -0,0 +1,431 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Sonuç Önbelleği
+============================================================
+Normalize edilmiş metin başına model çıktılarını (duygu
+olasılıkları, aspekt sonuçları, spam modeli skorları) saklar.
+
+E-ticaret trafiğinde aynı kısa yorumlar ("çok güzel", "teşekkürler",
+kopyala-yapıştır kampanya metinleri) sürekli tekrar eder; normalize
+edilince daha da fazlası aynı metne düşer. Önbellekte bulunan
+metinler tokenize edilmez ve modellerden geçmez.
+
+Anahtar, model sürümü + bölüm + normalize metnin blake2b özetidir;
+modeller yeniden yüklenince sürüm değişir ve eski kayıtlar kendiliğinden
+geçersiz olur. Ham metne veya zamana bağlı sinyaller (kural skoru,
+canlı tekrar sayacı, açıklama) önbelleğe alınmaz, her istekte
+yeniden hesaplanır.
+
+İki katman vardır:
+- SonucOnbellegi: süreç içi, sınırlı boyutlu LRU (opsiyonel TTL)
+- DiskOnbellegi: sqlite tabanlı, aynı makinedeki işçi süreçlerinin
+  ortak kullandığı ikinci katman (RESULT_CACHE_CONFIG["backend"])
+
+Kullanım:
+    from src.result_cache import sonuc_onbellegi_olustur
+
+    onbellek = sonuc_onbellegi_olustur(surum="model-v1")
+    bulunan = onbellek.al_toplu("duygu", ["kargo hizli geldi"])
+    onbellek.ekle_toplu("duygu", {"kargo hizli geldi": (0.1, 0.2, 0.7)})
+    onbellek.stats()
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import RESULT_CACHE_CONFIG
+except ImportError:
+    RESULT_CACHE_CONFIG = {
+        "enabled": True,
+        "max_size": 100000,
+        "ttl_seconds": 0,
+        "backend": None,
+        "path": "data/cache/sonuc_onbellegi.sqlite",
+        "disk_max_size": 1000000
+    }
+
+
+# Saklanan değerlerin biçimi; yapıları değişince artırılır (eski disk kayıtları eşleşmez)
+BICIM_SURUMU = 1
+
+
+def onbellek_anahtari(surum: str, bolum: str, metin: str) -> bytes:
+    """Model sürümü, bölüm ve normalize metinden 16 baytlık anahtar üretir."""
+    girdi = f"{BICIM_SURUMU}\x00{surum}\x00{bolum}\x00{metin}"
+    return hashlib.blake2b(girdi.encode("utf-8"), digest_size=16).digest()
+
+
+# ============================================================
+# DİSK KATMANI (SÜREÇLER ARASI)
+# ============================================================
+
+class DiskOnbellegi:
+    """
+    sqlite tabanlı ortak sonuç deposu.
+
+    Aynı dosyayı açan işçi süreçleri birbirinin hesapladığı sonuçları
+    görür. WAL kipinde okuyucular yazıcıyı beklemez. Her iş parçacığı ve
+    süreç kendi bağlantısını açar (fork sonrası bağlantı devralınmaz).
+    Kayıt sayısı `max_size`'ı aşınca en uzun süredir erişilmeyenler
+    silinir; `ttl_seconds` eklenme zamanından itibaren sayılır.
+
+    Attributes:
+        path: sqlite dosyası (paylaşımlı bellek için /dev/shm altında olabilir)
+        max_size: En fazla kayıt
+        ttl_seconds: Kayıt ömrü (0 = süresiz)
+    """
+
+    # sqlite'ın sorgu başına parametre sınırının altında kalan parça boyu
+    PARCA = 500
+
+    def __init__(self, path: Optional[str] = None, max_size: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            path: sqlite dosyası (None ise RESULT_CACHE_CONFIG["path"])
+            max_size: En fazla kayıt (None ise RESULT_CACHE_CONFIG["disk_max_size"])
+            ttl_seconds: Kayıt ömrü (None ise RESULT_CACHE_CONFIG["ttl_seconds"])
+        """
+        self.path = str(path or RESULT_CACHE_CONFIG["path"])
+        self.max_size = int(RESULT_CACHE_CONFIG.get("disk_max_size", 1000000) if max_size is None else max_size)
+        self.ttl_seconds = float(RESULT_CACHE_CONFIG.get("ttl_seconds", 0) if ttl_seconds is None else ttl_seconds)
+
+        self._yerel = threading.local()
+        self._kilit = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._yazilan = 0
+
+        klasor = os.path.dirname(self.path)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        baglanti = self._baglanti()
+        baglanti.execute(
+            "CREATE TABLE IF NOT EXISTS sonuc ("
+            "anahtar BLOB PRIMARY KEY, deger TEXT NOT NULL, "
+            "eklenme REAL NOT NULL, erisim REAL NOT NULL) WITHOUT ROWID"
+        )
+        baglanti.execute("CREATE INDEX IF NOT EXISTS sonuc_erisim ON sonuc(erisim)")
+
+    def _baglanti(self) -> sqlite3.Connection:
+        """Bu iş parçacığının (ve sürecin) bağlantısını döndürür."""
+        kayit = getattr(self._yerel, "baglanti", None)
+        if kayit is not None and kayit[0] == os.getpid():
+            return kayit[1]
+        baglanti = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        baglanti.execute("PRAGMA journal_mode=WAL")
+        baglanti.execute("PRAGMA synchronous=NORMAL")
+        self._yerel.baglanti = (os.getpid(), baglanti)
+        return baglanti
+
+    def _toplu_yaz(self, sorgu: str, satirlar: List[tuple]):
+        """Satırları tek işlemde (tek kilit, tek WAL kaydı) yazar."""
+        baglanti = self._baglanti()
+        baglanti.execute("BEGIN IMMEDIATE")
+        try:
+            baglanti.executemany(sorgu, satirlar)
+        except BaseException:
+            baglanti.execute("ROLLBACK")
+            raise
+        baglanti.execute("COMMIT")
+
+    def al_toplu(self, anahtarlar: Sequence[bytes]) -> Dict[bytes, Any]:
+        """
+        Anahtarların disktekileri döndürür; bulunanların erişim zamanı güncellenir.
+
+        Returns:
+            dict: anahtar → değer (yalnızca bulunan ve süresi dolmamış kayıtlar)
+        """
+        baglanti = self._baglanti()
+        simdi = time.time()
+        sinir = simdi - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+        bulunan: Dict[bytes, Any] = {}
+        for bas in range(0, len(anahtarlar), self.PARCA):
+            parca = list(anahtarlar[bas:bas + self.PARCA])
+            yer = ",".join("?" * len(parca))
+            for anahtar, deger, eklenme in baglanti.execute(
+                f"SELECT anahtar, deger, eklenme FROM sonuc WHERE anahtar IN ({yer})", parca
+            ):
+                if eklenme >= sinir:
+                    bulunan[bytes(anahtar)] = json.loads(deger)
+
+        if bulunan:
+            self._toplu_yaz("UPDATE sonuc SET erisim = ? WHERE anahtar = ?",
+                            [(simdi, anahtar) for anahtar in bulunan])
+        with self._kilit:
+            self.hits += len(bulunan)
+            self.misses += len(anahtarlar) - len(bulunan)
+        return bulunan
+
+    def ekle_toplu(self, kayitlar: Dict[bytes, Any]):
+        """Kayıtları yazar; yazılan kayıtlar birikince boyut sınırını uygular."""
+        if not kayitlar:
+            return
+        simdi = time.time()
+        self._toplu_yaz(
+            "INSERT OR REPLACE INTO sonuc (anahtar, deger, eklenme, erisim) VALUES (?, ?, ?, ?)",
+            [(anahtar, json.dumps(deger, ensure_ascii=False, separators=(",", ":")), simdi, simdi)
+             for anahtar, deger in kayitlar.items()]
+        )
+        with self._kilit:
+            self._yazilan += len(kayitlar)
+            budanacak = self._yazilan >= max(1, self.max_size // 10)
+            if budanacak:
+                self._yazilan = 0
+        if budanacak:
+            self.buda()
+
+    def buda(self) -> int:
+        """Süresi dolan ve sınırı aşan (en eski erişimli) kayıtları siler."""
+        baglanti = self._baglanti()
+        silinen = 0
+        if self.ttl_seconds > 0:
+            silinen += baglanti.execute("DELETE FROM sonuc WHERE eklenme < ?",
+                                        (time.time() - self.ttl_seconds,)).rowcount
+        fazla = baglanti.execute("SELECT COUNT(*) FROM sonuc").fetchone()[0] - self.max_size
+        if fazla > 0:
+            silinen += baglanti.execute(
+                "DELETE FROM sonuc WHERE anahtar IN (SELECT anahtar FROM sonuc ORDER BY erisim LIMIT ?)",
+                (fazla,)
+            ).rowcount
+        with self._kilit:
+            self.evictions += silinen
+        return silinen
+
+    def __len__(self) -> int:
+        return int(self._baglanti().execute("SELECT COUNT(*) FROM sonuc").fetchone()[0])
+
+    def stats(self) -> dict:
+        """Disk katmanı sayaçlarını döndürür (sayaçlar bu sürece aittir)."""
+        toplam = self.hits + self.misses
+        return {
+            "path": self.path,
+            "size": len(self),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / toplam if toplam else 0.0
+        }
+
+    def clear(self):
+        """Tüm kayıtları (diğer süreçler için de) siler, sayaçları sıfırlar."""
+        self._baglanti().execute("DELETE FROM sonuc")
+        with self._kilit:
+            self.hits = self.misses = self.evictions = self._yazilan = 0
+
+    def kapat(self):
+        """Bu iş parçacığının bağlantısını kapatır."""
+        kayit = getattr(self._yerel, "baglanti", None)
+        if kayit is not None and kayit[0] == os.getpid():
+            kayit[1].close()
+        self._yerel.baglanti = None
+
+
+# ============================================================
+# SÜREÇ İÇİ LRU
+# ============================================================
+
+class SonucOnbellegi:
+    """
+    Normalize metin başına model çıktıları için sınırlı boyutlu LRU.
+
+    Kayıtlar bölüm ("spam", "duygu", "aspekt") ayrı tutulur; böylece
+    yalnızca duygu istenen bir çağrının sonucu, sonradan spam isteyen
+    çağrıda eksik bölüm olarak yeniden hesaplanır. Bellekte bulunmayan
+    anahtarlar (varsa) disk katmanına sorulur, bulunanlar belleğe alınır.
+
+    Attributes:
+        surum: Model sürümü; değişince bellek katmanı boşaltılır
+        max_size: En fazla kayıt (0 = bellek katmanı kapalı)
+        ttl_seconds: Kayıt ömrü (0 = süresiz)
+        disk: Opsiyonel süreçler arası katman
+        hits / misses / evictions / expirations: Bellek katmanı sayaçları
+        invalidations: Sürüm değişikliğiyle boşaltma sayısı
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        disk: Optional[DiskOnbellegi] = None,
+        surum: str = ""
+    ):
+        """
+        Args:
+            max_size: En fazla kayıt (None ise RESULT_CACHE_CONFIG)
+            ttl_seconds: Kayıt ömrü (None ise RESULT_CACHE_CONFIG)
+            disk: Süreçler arası disk katmanı (opsiyonel)
+            surum: Başlangıç model sürümü
+        """
+        self.max_size = int(RESULT_CACHE_CONFIG.get("max_size", 100000) if max_size is None else max_size)
+        self.ttl_seconds = float(RESULT_CACHE_CONFIG.get("ttl_seconds", 0) if ttl_seconds is None else ttl_seconds)
+        self.disk = disk
+        self.surum = surum
+
+        # anahtar → (eklenme zamanı, değer)
+        self._kayitlar: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._kilit = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+    def surum_ayarla(self, surum: str):
+        """
+        Model sürümünü değiştirir.
+
+        Anahtarlar sürümü içerdiği için eski kayıtlar zaten eşleşmez;
+        bellek katmanı yer kaplamasın diye hemen boşaltılır. Disk
+        katmanındaki eski kayıtlar LRU ile zamanla düşer (diğer işçiler
+        hâlâ eski modeli kullanıyor olabilir).
+        """
+        with self._kilit:
+            if surum == self.surum:
+                return
+            self.surum = surum
+            if self._kayitlar:
+                self._kayitlar.clear()
+                self.invalidations += 1
+
+    def _ekle(self, anahtar: bytes, deger: Any, zaman: float):
+        """Kilit altında çağrılır; gerekirse en eski kaydı atar."""
+        if self.max_size <= 0:
+            return
+        self._kayitlar[anahtar] = (zaman, deger)
+        self._kayitlar.move_to_end(anahtar)
+        while len(self._kayitlar) > self.max_size:
+            self._kayitlar.popitem(last=False)
+            self.evictions += 1
+
+    def al_toplu(self, bolum: str, metinler: Sequence[str]) -> Dict[str, Any]:
+        """
+        Bir bölümün önbellekteki sonuçlarını döndürür.
+
+        Args:
+            bolum: Sonuç bölümü ("spam", "duygu", "aspekt")
+            metinler: Tekil normalize metinler
+
+        Returns:
+            dict: metin → değer (yalnızca bulunanlar)
+        """
+        surum = self.surum
+        anahtarlar = [onbellek_anahtari(surum, bolum, metin) for metin in metinler]
+        simdi = time.time()
+        sinir = simdi - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+
+        bulunan: Dict[str, Any] = {}
+        eksikler: List[int] = []
+        with self._kilit:
+            for i, anahtar in enumerate(anahtarlar):
+                kayit = self._kayitlar.get(anahtar)
+                if kayit is not None and kayit[0] < sinir:
+                    del self._kayitlar[anahtar]
+                    self.expirations += 1
+                    kayit = None
+                if kayit is None:
+                    eksikler.append(i)
+                else:
+                    self._kayitlar.move_to_end(anahtar)
+                    bulunan[metinler[i]] = kayit[1]
+            self.hits += len(bulunan)
+            self.misses += len(eksikler)
+
+        # Bellekte olmayanlar diğer süreçlerin yazdığı disk katmanına sorulur
+        if eksikler and self.disk is not None:
+            try:
+                diskteki = self.disk.al_toplu([anahtarlar[i] for i in eksikler])
+            except sqlite3.Error as e:
+                print(f"[UYARI] Disk önbelleği okunamadı: {e}")
+                diskteki = {}
+            if diskteki:
+                with self._kilit:
+                    for i in eksikler:
+                        deger = diskteki.get(anahtarlar[i])
+                        if deger is not None:
+                            bulunan[metinler[i]] = deger
+                            self._ekle(anahtarlar[i], deger, simdi)
+        return bulunan
+
+    def ekle_toplu(self, bolum: str, degerler: Dict[str, Any]):
+        """
+        Yeni hesaplanan sonuçları bellek ve (varsa) disk katmanına yazar.
+
+        Args:
+            bolum: Sonuç bölümü
+            degerler: normalize metin → JSON'a yazılabilir değer
+        """
+        if not degerler:
+            return
+        surum = self.surum
+        kayitlar = {onbellek_anahtari(surum, bolum, metin): deger for metin, deger in degerler.items()}
+        simdi = time.time()
+        with self._kilit:
+            for anahtar, deger in kayitlar.items():
+                self._ekle(anahtar, deger, simdi)
+        if self.disk is not None:
+            try:
+                self.disk.ekle_toplu(kayitlar)
+            except sqlite3.Error as e:
+                print(f"[UYARI] Disk önbelleğine yazılamadı: {e}")
+
+    def stats(self) -> dict:
+        """Önbellek sayaçlarını döndürür."""
+        toplam = self.hits + self.misses
+        sonuc = {
+            "size": len(self._kayitlar),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / toplam if toplam else 0.0
+        }
+        if self.disk is not None:
+            sonuc["disk"] = self.disk.stats()
+        return sonuc
+
+    def clear(self):
+        """Bellek katmanını ve sayaçları sıfırlar (disk katmanına dokunmaz)."""
+        with self._kilit:
+            self._kayitlar.clear()
+            self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+
+def sonuc_onbellegi_olustur(surum: str = "") -> Optional[SonucOnbellegi]:
+    """
+    RESULT_CACHE_CONFIG'e göre sonuç önbelleği kurar.
+
+    Returns:
+        SonucOnbellegi veya önbellek kapalıysa None. Disk katmanı
+        açılamazsa uyarı verilir ve yalnızca bellek katmanı kullanılır.
+    """
+    if not RESULT_CACHE_CONFIG.get("enabled", True):
+        return None
+
+    disk = None
+    if RESULT_CACHE_CONFIG.get("backend") == "sqlite":
+        try:
+            disk = DiskOnbellegi()
+            print(f"[OK] Disk sonuç önbelleği: {disk.path}")
+        except (sqlite3.Error, OSError) as e:
+            print(f"[UYARI] Disk sonuç önbelleği açılamadı, yalnızca bellek kullanılacak: {e}")
+    return SonucOnbellegi(disk=disk, surum=surum)
@@ -0,0 +1,270 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Doğrusal Skorlayıcı
+============================================================
+Eğitilmiş bir SentimentModel'i tek yorumluk istekler için
+sklearn Pipeline'ını atlayan bir arama tablosuna derler.
+
+Pipeline her çağrıda seyrek matris kurar ve girdi doğrulaması
+yapar; tek bir yorum için bu ek yük hesaplamanın kendisinden
+büyüktür. LinearScorer n-gram → (idf, sınıf ağırlıkları)
+tablosuyla L2 normalize TF-IDF skorlarını doğrudan tokenlardan
+hesaplar ve etiket ile olasılıkları tek geçişte döndürür.
+
+Kullanım:
+    from src.scorer import LinearScorer
+
+    skorlayici = LinearScorer.from_model(model)
+    etiket, olasiliklar = skorlayici.skorla("urun harika kargo hizli")
+"""
+
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import LogisticRegression
+
+try:
+    from .features import hash_indeksi
+except ImportError:
+    from features import hash_indeksi  # type: ignore[no-redef]
+
+
+# ============================================================
+# DOĞRUSAL SKORLAYICI
+# ============================================================
+
+class LinearScorer:
+    """
+    TF-IDF + doğrusal sınıflandırıcı için derlenmiş skorlayıcı.
+
+    Tablo yalnızca sözlükteki (veya hash uzayındaki) terimlerin
+    idf değerlerini ve sıfırdan farklı ağırlık satırlarını tutar.
+    Analizör, modelin kendi vektörizöründen alınır; böylece
+    tokenizasyon Pipeline ile birebir aynıdır.
+
+    Attributes:
+        classes: Sınıf kimlikleri (ör. [0, 1, 2])
+        featurizer: "tfidf" veya "hashing"
+    """
+
+    def __init__(
+        self,
+        analizor: Callable[[str], List[str]],
+        idf: np.ndarray,
+        agirliklar: np.ndarray,
+        agirlik_satiri: np.ndarray,
+        kesisim: np.ndarray,
+        classes: np.ndarray,
+        softmax: bool,
+        norm: Optional[str] = "l2",
+        sublinear_tf: bool = False,
+        sozluk: Optional[Dict[str, int]] = None,
+        n_features: Optional[int] = None
+    ):
+        """
+        Skorlayıcı oluşturur. Genellikle from_model() kullanılır.
+
+        Args:
+            analizor: Metni n-gram listesine çeviren fonksiyon
+            idf: Özellik uzayı boyunca idf vektörü
+            agirliklar: Sıfırdan farklı özelliklerin ağırlıkları (satır x sınıf)
+            agirlik_satiri: Özellik indeksi → agirliklar satırı dizisi
+                (-1 = ağırlığı sıfır olan özellik)
+            kesisim: Sınıf başına sabit terim
+            classes: Sınıf kimlikleri
+            softmax: True ise çok terimli (softmax), değilse OvR olasılık
+            norm: "l2", "l1" veya None
+            sublinear_tf: tf yerine 1 + log(tf) kullanılır mı?
+            sozluk: n-gram → özellik indeksi (tfidf modu)
+            n_features: Hash uzayı boyutu (hashing modu)
+        """
+        self.analizor = analizor
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.agirliklar = np.asarray(agirliklar, dtype=np.float64)
+        self.agirlik_satiri = np.asarray(agirlik_satiri, dtype=np.int32)
+        self.kesisim = np.asarray(kesisim, dtype=np.float64)
+        self.classes = np.asarray(classes)
+        self.softmax = softmax
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+        self.sozluk = sozluk
+        self.n_features = n_features
+        self.featurizer = "tfidf" if sozluk is not None else "hashing"
+
+    @classmethod
+    def from_model(cls, model) -> "LinearScorer":
+        """
+        Eğitilmiş bir SentimentModel'den skorlayıcı derler.
+
+        Args:
+            model: Eğitilmiş SentimentModel (tfidf veya hashing modu)
+
+        Returns:
+            LinearScorer: Derlenmiş skorlayıcı
+        """
+        if not model.is_trained or model.pipeline is None:
+            raise ValueError("Model henüz eğitilmedi! Önce fit() çağırın.")
+
+        adimlar = model.pipeline.named_steps
+        tfidf = adimlar["tfidf"]
+        siniflandirici = adimlar["classifier"]
+
+        if model.featurizer == "hashing":
+            hashing = adimlar["hashing"]
+            if hashing.alternate_sign:
+                raise ValueError("alternate_sign=True ile hashing modeli derlenemez!")
+            analizor = hashing.build_analyzer()
+            sozluk = None
+            n_features = hashing.n_features
+        else:
+            analizor = tfidf.build_analyzer()
+            sozluk = tfidf.vocabulary_
+            n_features = None
+
+        # Yalnızca sıfırdan farklı ağırlık satırları saklanır. Eşleme
+        # Python sözlüğü değil düz bir dizidir: aramalar referans sayacı
+        # yazmaz, çatallanan işçiler sayfaları kopyalamadan paylaşır
+        katsayilar = siniflandirici.coef_
+        if sparse.issparse(katsayilar):
+            katsayilar = katsayilar.toarray()
+        katsayilar = np.asarray(katsayilar, dtype=np.float64).T
+        sifir_olmayan = np.flatnonzero(np.any(katsayilar != 0, axis=1))
+        agirlik_satiri = np.full(len(katsayilar), -1, dtype=np.int32)
+        agirlik_satiri[sifir_olmayan] = np.arange(len(sifir_olmayan), dtype=np.int32)
+
+        softmax = isinstance(siniflandirici, LogisticRegression) and len(siniflandirici.classes_) > 2
+
+        return cls(
+            analizor=analizor,
+            idf=tfidf.idf_,
+            agirliklar=katsayilar[sifir_olmayan],
+            agirlik_satiri=agirlik_satiri,
+            kesisim=siniflandirici.intercept_,
+            classes=siniflandirici.classes_,
+            softmax=softmax,
+            norm=tfidf.norm,
+            sublinear_tf=tfidf.sublinear_tf,
+            sozluk=sozluk,
+            n_features=n_features
+        )
+
+    def _ozellik_indeksi(self, ngram: str) -> Optional[int]:
+        """n-gram'ın özellik indeksini döndürür (sözlük dışıysa None)."""
+        if self.sozluk is not None:
+            return self.sozluk.get(ngram)
+        return hash_indeksi(ngram, self.n_features)
+
+    def karar_skorlari(self, metin: str, ngramlar: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Tek bir metin için sınıf karar skorlarını hesaplar.
+
+        Args:
+            metin: Normalize edilmiş metin
+            ngramlar: Önceden çıkarılmış n-gram'lar (OrtakOzellikCikarici);
+                verilirse analizör çalıştırılmaz
+
+        Returns:
+            np.ndarray: Sınıf başına doğrusal skor (decision_function)
+        """
+        if ngramlar is None:
+            ngramlar = self.analizor(metin)
+        sayimlar: Dict[int, int] = {}
+        for ngram, adet in Counter(ngramlar).items():
+            indeks = self._ozellik_indeksi(ngram)
+            if indeks is not None:
+                sayimlar[indeks] = sayimlar.get(indeks, 0) + adet
+
+        if not sayimlar:
+            return self.kesisim.copy()
+
+        indeksler = np.fromiter(sayimlar.keys(), dtype=np.int64, count=len(sayimlar))
+        tf = np.fromiter(sayimlar.values(), dtype=np.float64, count=len(sayimlar))
+        if self.sublinear_tf:
+            tf = np.log(tf) + 1.0
+        degerler = tf * self.idf[indeksler]
+
+        if self.norm == "l2":
+            bolen = np.sqrt(np.dot(degerler, degerler))
+        elif self.norm == "l1":
+            bolen = np.abs(degerler).sum()
+        else:
+            bolen = 1.0
+
+        satirlar = self.agirlik_satiri[indeksler]
+        secili = satirlar >= 0
+        return self.kesisim + (degerler[secili] / bolen) @ self.agirliklar[satirlar[secili]]
+
+    def olasiliklar(self, skorlar: np.ndarray) -> np.ndarray:
+        """Karar skorlarını sınıf olasılıklarına çevirir."""
+        if self.softmax:
+            ussel = np.exp(skorlar - skorlar.max())
+            return ussel / ussel.sum()
+
+        # OvR (SGDClassifier log_loss): sigmoid + normalizasyon
+        olasilik = 1.0 / (1.0 + np.exp(-skorlar))
+        return olasilik / olasilik.sum()
+
+    def skorla(self, metin: str, ngramlar: Optional[List[str]] = None) -> Tuple[int, np.ndarray]:
+        """
+        Tek bir metni tek geçişte etiketler.
+
+        Args:
+            metin: Normalize edilmiş metin
+            ngramlar: Önceden çıkarılmış n-gram'lar (opsiyonel)
+
+        Returns:
+            Tuple: (tahmin edilen sınıf, sınıf olasılıkları)
+        """
+        olasiliklar = self.olasiliklar(self.karar_skorlari(metin, ngramlar))
+        return int(self.classes[int(np.argmax(olasiliklar))]), olasiliklar
+
+    def predict(self, X: List[str]) -> np.ndarray:
+        """SentimentModel.predict ile aynı arayüz."""
+        return np.array([self.skorla(metin)[0] for metin in X])
+
+    def predict_proba(self, X: List[str]) -> np.ndarray:
+        """SentimentModel.predict_proba ile aynı arayüz."""
+        if not X:
+            return np.empty((0, len(self.classes)))
+        return np.vstack([self.olasiliklar(self.karar_skorlari(metin)) for metin in X])
+
+
+# ============================================================
+# PARİTE KONTROLÜ
+# ============================================================
+
+def parite_kontrolu(
+    model,
+    metinler: List[str],
+    skorlayici: Optional[LinearScorer] = None,
+    tolerans: float = 1e-6
+) -> float:
+    """
+    Skorlayıcının Pipeline ile aynı sonucu verdiğini doğrular.
+
+    Args:
+        model: Eğitilmiş SentimentModel
+        metinler: Kontrol metinleri
+        skorlayici: Kontrol edilecek skorlayıcı (None ise modelden derlenir)
+        tolerans: İzin verilen en büyük olasılık farkı
+
+    Returns:
+        float: En büyük mutlak olasılık farkı
+
+    Raises:
+        AssertionError: Fark toleransı aşarsa veya etiketler farklıysa
+    """
+    skorlayici = skorlayici or LinearScorer.from_model(model)
+
+    beklenen = model.predict_proba(metinler)
+    bulunan = skorlayici.predict_proba(metinler)
+    fark = float(np.abs(beklenen - bulunan).max()) if len(metinler) else 0.0
+
+    if fark > tolerans:
+        raise AssertionError(f"Skorlayıcı pipeline'dan sapıyor: en büyük fark {fark:.3e}")
+    if not np.array_equal(model.predict(metinler), skorlayici.predict(metinler)):
+        raise AssertionError("Skorlayıcı etiketleri pipeline ile uyuşmuyor!")
+
+    return fark
@@ -0,0 +1,391 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Ön-Çatallı Çok İşçili Servis
+============================================================
+Modelleri ana süreçte bir kez yükler, ardından REST servisini
+(src/api.py) çalıştıran N işçi sürecini os.fork() ile başlatır.
+İşçiler model sayfalarını yazmadıkça kopyalamadan paylaşır
+(copy-on-write); bir node'a kaç işçi sığacağını model boyutu
+değil, işçi başına benzersiz bellek (USS) belirler.
+
+Paylaşımı korumak için:
+- Çatallamadan önce bir ısınma analizi yapılır (tembel kurulan
+  önbellekler ortak belleğe düşer), ardından gc.freeze() tüm
+  nesneleri kalıcı nesile taşır; işçilerdeki GC taramaları model
+  nesnelerinin başlıklarına yazmaz
+- Büyük diziler numpy tamponlarında durur (skorlayıcının ağırlık
+  eşlemesi dahil); aramalar referans sayacı yazmaz
+- Tekrar sayacı paylaşılan anonim bellektedir, işçiler ortak sayar;
+  anlık görüntüsünü işçiler değil ana süreç periyodik olarak yazar
+- İş parçacıkları (mikro toplayıcı, çıkarım havuzu) çatallamadan
+  sonra her işçide ayrı kurulur
+
+Dinleme soketi ana süreçte açılır; çekirdek bağlantıları işçilere
+dağıtır. Beklenmedik şekilde sonlanan işçi yeniden başlatılır.
+Yalnızca os.fork() olan sistemlerde (Linux, macOS) çalışır; bellek
+raporu /proc gerektirir (Linux).
+
+Kullanım:
+    python src/serve.py                          # SERVE_CONFIG["workers"] işçi
+    python src/serve.py --workers 4 --port 8000
+    python src/serve.py --workers 4 --bellek-raporu 60
+"""
+
+import os
+import gc
+import sys
+import time
+import socket
+import signal
+import argparse
+from typing import Dict, List, Optional
+
+# Proje yolunu ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis import YorumAnalizcisi
+from src.api import uygulama_olustur
+
+# Konfigürasyon
+try:
+    from config import API_CONFIG, SERVE_CONFIG, MICRO_BATCH_CONFIG, STREAM_FREQUENCY_CONFIG
+except ImportError:
+    API_CONFIG = {"host": "0.0.0.0", "port": 8000}
+    SERVE_CONFIG = {
+        "workers": 2, "gc_freeze": True, "shared_sketch": True,
+        "graceful_timeout": 30, "report_interval": 0
+    }
+    MICRO_BATCH_CONFIG = {"enabled": True, "max_wait_ms": 2, "max_batch_size": 64}
+    STREAM_FREQUENCY_CONFIG = {"snapshot_interval": 60}
+
+
+# Isınma analizinde kullanılan örnek yorum (tüm aspekt ve spam yolları)
+ISINMA_YORUMU = "Kargo çok hızlı geldi, fiyatı uygun. Kalitesi harika, satıcıya teşekkürler!!!"
+
+
+# ============================================================
+# BELLEK ÖLÇÜMÜ
+# ============================================================
+
+def bellek_olcumu(pid: Optional[int] = None) -> Dict[str, float]:
+    """
+    Bir sürecin bellek kullanımını /proc üzerinden ölçer.
+
+    USS (benzersiz küme) yalnızca bu sürecin sayfalarıdır; süreç
+    sonlanınca serbest kalan bellek budur. PSS paylaşılan sayfaları
+    paylaşan süreç sayısına böler; tüm süreçlerin PSS toplamı
+    node'daki gerçek kullanımdır. Anonim bellek dosyaya dayanmayan
+    (yığın) sayfalardır; bellek eşlemeli model dosyaları buna girmez.
+
+    Args:
+        pid: Süreç kimliği (None ise bu süreç)
+
+    Returns:
+        dict: rss, pss, uss, paylasilan, anonim (MB)
+    """
+    pid = os.getpid() if pid is None else pid
+    alanlar: Dict[str, int] = {}
+    yol = f"/proc/{pid}/smaps_rollup"
+    if not os.path.exists(yol):
+        yol = f"/proc/{pid}/smaps"
+    with open(yol) as dosya:
+        for satir in dosya:
+            parcalar = satir.split()
+            if len(parcalar) == 3 and parcalar[2] == "kB":
+                ad = parcalar[0].rstrip(":")
+                alanlar[ad] = alanlar.get(ad, 0) + int(parcalar[1])
+
+    mb = 1024.0
+    return {
+        "rss": alanlar.get("Rss", 0) / mb,
+        "pss": alanlar.get("Pss", 0) / mb,
+        "uss": (alanlar.get("Private_Clean", 0) + alanlar.get("Private_Dirty", 0)) / mb,
+        "paylasilan": (alanlar.get("Shared_Clean", 0) + alanlar.get("Shared_Dirty", 0)) / mb,
+        "anonim": alanlar.get("Anonymous", 0) / mb
+    }
+
+
+def bellek_raporu(surecler: Dict[str, int]) -> List[Dict[str, object]]:
+    """
+    Süreç adı → pid eşlemesindeki her süreç için bellek ölçümü.
+
+    Sonlanmış süreçler atlanır.
+    """
+    satirlar: List[Dict[str, object]] = []
+    for ad, pid in surecler.items():
+        try:
+            satirlar.append({"surec": ad, "pid": pid, **bellek_olcumu(pid)})
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+    return satirlar
+
+
+def bellek_raporunu_yazdir(satirlar: List[Dict[str, object]]):
+    """bellek_raporu() çıktısını tablo olarak yazdırır."""
+    print(f"\n  {'Süreç':<10} {'PID':>7} {'RSS MB':>9} {'PSS MB':>9} {'USS MB':>9} {'Paylaşılan MB':>14}")
+    for satir in satirlar:
+        print(f"  {satir['surec']:<10} {satir['pid']:>7} {satir['rss']:>9.1f} {satir['pss']:>9.1f} "
+              f"{satir['uss']:>9.1f} {satir['paylasilan']:>14.1f}")
+    toplam_pss = sum(float(s["pss"]) for s in satirlar)
+    print(f"  Toplam PSS (node'daki gerçek kullanım): {toplam_pss:.1f} MB\n")
+
+
+# ============================================================
+# PAYLAŞIMA HAZIRLIK
+# ============================================================
+
+def paylasima_hazirla(analizci: YorumAnalizcisi, gc_dondur: Optional[bool] = None):
+    """
+    Yüklü analizciyi çatallamaya hazırlar.
+
+    Tekrar sayacını paylaşılan belleğe taşır, bir ısınma analizi
+    yapar ve (istenirse) gc.freeze() çağırır. Paylaşılan sayacın
+    görüntüsünü işçiler yazmaz; ana süreç calistir() döngüsünde yazar. Mikro toplayıcı gibi
+    iş parçacıkları çatallamadan sonra kurulmalıdır.
+
+    Args:
+        analizci: Yüklü YorumAnalizcisi (mikro gruplama başlatılmamış)
+        gc_dondur: gc.freeze() çağrılsın mı (None ise SERVE_CONFIG)
+    """
+    if analizci.toplayici is not None:
+        raise RuntimeError("Mikro toplayıcı çatallamadan önce başlatılmamalı")
+
+    # Isınma: tembel kurulan önbellekler ortak bellekte oluşur; canlı
+    # tekrar sayacı ve sonuç önbelleği bu yorumu saymaz
+    sayac = analizci.spam_modeli.tekrar_sayaci if analizci.spam_modeli is not None else None
+    onbellek = analizci.onbellek
+    if analizci.spam_modeli is not None:
+        analizci.spam_modeli.tekrar_sayaci = None
+    analizci.onbellek = None
+    try:
+        analizci.analiz_kayitlari([ISINMA_YORUMU])
+    finally:
+        if analizci.spam_modeli is not None:
+            analizci.spam_modeli.tekrar_sayaci = sayac
+        analizci.onbellek = onbellek
+
+    if analizci.tekrar_sayaci is not None and SERVE_CONFIG.get("shared_sketch", True):
+        analizci.tekrar_sayaci.paylasimli_yap()
+        analizci.goruntu_kaydedici = False
+
+    if SERVE_CONFIG.get("gc_freeze", True) if gc_dondur is None else gc_dondur:
+        # Çöpler dondurulmasın diye önce toplanır
+        gc.collect()
+        gc.freeze()
+
+
+# ============================================================
+# ÖN-ÇATALLI SUNUCU
+# ============================================================
+
+class OnCatalliSunucu:
+    """
+    Modelleri paylaşan işçi süreçlerini yöneten ana süreç.
+
+    Attributes:
+        analizci: Ana süreçte yüklenmiş, paylaşıma hazırlanmış analizci
+        workers: İşçi sayısı
+        host / port: Dinlenen adres
+        isciler: pid → işçi sırası
+    """
+
+    def __init__(
+        self,
+        analizci: YorumAnalizcisi,
+        workers: Optional[int] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None
+    ):
+        """
+        Args:
+            analizci: paylasima_hazirla() çağrılmış analizci
+            workers: İşçi sayısı (None ise SERVE_CONFIG)
+            host: Adres (None ise API_CONFIG)
+            port: Port (None ise PORT ortam değişkeni veya API_CONFIG)
+        """
+        self.analizci = analizci
+        self.workers = int(workers or SERVE_CONFIG.get("workers", 2))
+        self.host = host or API_CONFIG["host"]
+        self.port = int(port or os.environ.get("PORT", API_CONFIG["port"]))
+        self.isciler: Dict[int, int] = {}
+        self._soket: Optional[socket.socket] = None
+        self._duruyor = False
+
+    def soket_ac(self) -> socket.socket:
+        """Dinleme soketini ana süreçte açar; işçiler devralır."""
+        aile = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        soket = socket.socket(aile, socket.SOCK_STREAM)
+        soket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        soket.bind((self.host, self.port))
+        soket.listen(2048)
+        soket.set_inheritable(True)
+        self._soket = soket
+        return soket
+
+    # ------------------------------------------------------------
+    # İşçi süreci
+    # ------------------------------------------------------------
+
+    def _isci_baslat(self, sira: int) -> int:
+        """Bir işçi çatallar; ana süreçte işçinin pid'ini döndürür."""
+        pid = os.fork()
+        if pid == 0:
+            kod = 0
+            try:
+                self._isci(sira)
+            except BaseException as e:
+                print(f"[UYARI] İşçi {sira} hata ile sonlandı: {e}")
+                kod = 1
+            finally:
+                # Ana sürecin atexit işleyicileri işçide çalışmaz
+                os._exit(kod)
+        self.isciler[pid] = sira
+        return pid
+
+    def _isci(self, sira: int):
+        """İşçi süreci gövdesi: iş parçacıklarını kurar ve uvicorn'u çalıştırır."""
+        import uvicorn
+
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        if MICRO_BATCH_CONFIG.get("enabled", True):
+            self.analizci.mikro_gruplamayi_baslat()
+        uygulama = uygulama_olustur(analizci=self.analizci)
+
+        print(f"[OK] İşçi {sira} hazır (pid {os.getpid()})")
+        sunucu = uvicorn.Server(uvicorn.Config(uygulama, log_level="warning"))
+        sunucu.run(sockets=[self._soket])
+
+    # ------------------------------------------------------------
+    # Ana süreç döngüsü
+    # ------------------------------------------------------------
+
+    def _sinyal(self, signum, frame):
+        """SIGTERM / SIGINT: işçileri durdur."""
+        self._duruyor = True
+
+    def calistir(self, rapor_araligi: Optional[float] = None):
+        """
+        İşçileri başlatır ve kapanana kadar denetler.
+
+        Paylaşılan tekrar sayacının görüntüsü burada, her
+        `snapshot_interval` saniyede bir yazılır; istek işleyen
+        işçilerin gecikmesine disk yazımı girmez.
+
+        Args:
+            rapor_araligi: Bu kadar saniyede bir bellek raporu yazdırılır
+                (None ise SERVE_CONFIG, 0 = kapalı)
+        """
+        if self._soket is None:
+            self.soket_ac()
+        rapor_araligi = float(SERVE_CONFIG.get("report_interval", 0) if rapor_araligi is None else rapor_araligi)
+
+        signal.signal(signal.SIGTERM, self._sinyal)
+        signal.signal(signal.SIGINT, self._sinyal)
+
+        for sira in range(self.workers):
+            self._isci_baslat(sira)
+        print(f"[OK] {self.workers} işçi http://{self.host}:{self.port} adresini dinliyor")
+
+        sayac = self.analizci.tekrar_sayaci
+        goruntu_araligi = float(STREAM_FREQUENCY_CONFIG.get("snapshot_interval", 60))
+        goruntu_yaz = sayac is not None and sayac.paylasimli and goruntu_araligi > 0
+
+        son_rapor = son_goruntu = time.monotonic()
+        while not self._duruyor:
+            try:
+                pid, durum = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid, durum = 0, 0
+            if pid and pid in self.isciler:
+                sira = self.isciler.pop(pid)
+                if not self._duruyor:
+                    print(f"[UYARI] İşçi {sira} (pid {pid}) sonlandı (durum {durum}), yeniden başlatılıyor")
+                    time.sleep(1.0)
+                    self._isci_baslat(sira)
+                continue
+
+            if rapor_araligi > 0 and time.monotonic() - son_rapor >= rapor_araligi:
+                bellek_raporunu_yazdir(self.bellek_raporu())
+                son_rapor = time.monotonic()
+            if goruntu_yaz and time.monotonic() - son_goruntu >= goruntu_araligi:
+                self.analizci.tekrar_sayacini_kaydet()
+                son_goruntu = time.monotonic()
+            time.sleep(0.2)
+
+        self.durdur()
+
+    def bellek_raporu(self) -> List[Dict[str, object]]:
+        """Ana süreç ve işçilerin bellek ölçümleri."""
+        surecler = {"ana": os.getpid()}
+        surecler.update({f"isci-{sira}": pid for pid, sira in sorted(self.isciler.items(), key=lambda x: x[1])})
+        return bellek_raporu(surecler)
+
+    def durdur(self, timeout: Optional[float] = None):
+        """İşçilere SIGTERM gönderir; süre dolunca kalanları öldürür."""
+        self._duruyor = True
+        timeout = float(SERVE_CONFIG.get("graceful_timeout", 30) if timeout is None else timeout)
+        for pid in list(self.isciler):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.isciler.pop(pid, None)
+
+        son_an = time.monotonic() + timeout
+        while self.isciler and time.monotonic() < son_an:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid:
+                self.isciler.pop(pid, None)
+            else:
+                time.sleep(0.1)
+
+        for pid in list(self.isciler):
+            print(f"[UYARI] İşçi {pid} zamanında kapanmadı, sonlandırılıyor")
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self.isciler.clear()
+
+        if self._soket is not None:
+            self._soket.close()
+            self._soket = None
+        self.analizci.tekrar_sayacini_kaydet()
+
+
+# ============================================================
+# ANA FONKSİYON
+# ============================================================
+
+def main(argv: Optional[List[str]] = None):
+    """Modelleri yükler, paylaşıma hazırlar ve işçileri başlatır."""
+    ayristirici = argparse.ArgumentParser(description="Ön-çatallı çok işçili REST servisi")
+    ayristirici.add_argument("--workers", type=int, default=None, help="İşçi sayısı")
+    ayristirici.add_argument("--host", default=None, help="Dinlenecek adres")
+    ayristirici.add_argument("--port", type=int, default=None, help="Dinlenecek port")
+    ayristirici.add_argument("--bellek-raporu", type=float, default=None, metavar="SANIYE",
+                             help="Bu aralıkla işçi başına bellek raporu yazdır")
+    argumanlar = ayristirici.parse_args(argv)
+
+    if not hasattr(os, "fork"):
+        print("[UYARI] os.fork() yok; tek süreçli servis için: python src/api.py")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("TÜRKÇE E-TİCARET YORUM ANALİZİ - ÖN-ÇATALLI SERVİS")
+    print("=" * 60)
+
+    analizci = YorumAnalizcisi.yukle(mikro_gruplama=False)
+    paylasima_hazirla(analizci)
+
+    sunucu = OnCatalliSunucu(analizci, argumanlar.workers, argumanlar.host, argumanlar.port)
+    sunucu.calistir(argumanlar.bellek_raporu)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,12 +18,13 @@ import time
 import joblib
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional, cast
+from typing import List, Dict, Tuple, Optional, Sequence, cast
 
 from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import IsolationForest
+from sklearn.decomposition import TruncatedSVD
 from sklearn.metrics import classification_report, f1_score
 
 # Proje konfigürasyonunu yükle
@@ -34,8 +35,9 @@ try:
         SPAM_MODEL_PATH,
         SPAM_TFIDF_CONFIG,
         ISOLATION_FOREST_CONFIG,
-        GENERIC_POSITIVE_PHRASES,
-        GENERIC_NEGATIVE_PHRASES,
+        ANOMALY_PROJECTION_CONFIG,
+        NEAR_DUPLICATE_CONFIG,
+        STREAM_FREQUENCY_CONFIG,
         SPAM_CLASSES
     )
 except ImportError:
@@ -43,15 +45,47 @@ except ImportError:
     SPAM_MODEL_PATH = "models/spam_model.pkl"
     SPAM_TFIDF_CONFIG = {"max_features": 2000, "ngram_range": (1, 2)}
     ISOLATION_FOREST_CONFIG = {"n_estimators": 100, "contamination": 0.05}
-    GENERIC_POSITIVE_PHRASES = ["harika", "mukemmel", "super"]
-    GENERIC_NEGATIVE_PHRASES = ["berbat", "rezalet"]
+    ANOMALY_PROJECTION_CONFIG = {"n_components": 32, "fit_sample": 50000, "compiled_max_rows": 1000}
+    NEAR_DUPLICATE_CONFIG = {"enabled": True, "min_cluster_size": 10}
+    STREAM_FREQUENCY_CONFIG = {"min_count": 10, "window_seconds": 3600}
     SPAM_CLASSES = {0: "Gerçek", 1: "Spam", -1: "Belirsiz"}
 
+# Jenerik ifade / şikayet taraması için ortak Aho–Corasick otomatı
+try:
+    from .keyword_matcher import varsayilan_eslestirici, JENERIK_GRUPLARI, SIKAYET
+except ImportError:
+    from keyword_matcher import varsayilan_eslestirici, JENERIK_GRUPLARI, SIKAYET  # type: ignore[no-redef]
+
+try:
+    from .near_duplicate import YakinKopyaIndeksi
+    from .anomaly import DerlenmisOrman
+except ImportError:
+    from near_duplicate import YakinKopyaIndeksi  # type: ignore[no-redef]
+    from anomaly import DerlenmisOrman  # type: ignore[no-redef]
+
 
 # Emoji tespiti için düzenli ifade
 EMOJI_PATTERN = re.compile(r"[\U0001F300-\U0001FAFF]+", flags=re.UNICODE)
 
 
+def _aciklama_tablosu_olustur() -> np.ndarray:
+    """Dört göstergenin 16 birleşimi için açıklama metinleri."""
+    gostergeler = [
+        "URL/e-posta içeriyor",
+        "Çok fazla ünlem işareti",
+        "Çok fazla emoji",
+        "Çoğunlukla büyük harf"
+    ]
+    tablo = []
+    for kod in range(16):
+        secilen = [g for i, g in enumerate(gostergeler) if kod >> i & 1]
+        tablo.append("Spam göstergeleri: " + ", ".join(secilen) if secilen else "Normal yorum")
+    return np.array(tablo, dtype=object)
+
+
+ACIKLAMA_TABLOSU = _aciklama_tablosu_olustur()
+
+
 # ============================================================
 # SPAM TESPİT SINIFI
 # ============================================================
@@ -61,14 +95,18 @@ class SpamDetector:
     Hibrit spam tespit sistemi.
     
     İki yöntemi birleştirir:
-    1. Kural Tabanlı: URL, tekrar, jenerik ifade tespiti
+    1. Kural Tabanlı: URL, tekrar, yakın kopya, jenerik ifade tespiti
     2. IsolationForest: Anomali tespiti
     
     Attributes:
         rule_weight: Kural tabanlı skorun ağırlığı
         anomaly_weight: Anomali skorunun ağırlığı
         pipeline: TF-IDF + LogisticRegression pipeline
-        isolation_forest: IsolationForest modeli
+        isolation_forest: IsolationForest modeli (TF-IDF'nin SVD izdüşümü üzerinde)
+        svd: TF-IDF → yoğun izdüşüm (TruncatedSVD; None ise ham TF-IDF)
+        yakin_kopya_indeksi: MinHash/LSH yakın kopya indeksi
+        tekrar_sayaci: Servis sırasında bağlanan canlı tekrar sayacı
+            (TekrarSayaci); modelle birlikte kaydedilmez
     """
     
     def __init__(self, rule_weight: float = 0.6, anomaly_weight: float = 0.4):
@@ -84,11 +122,33 @@ class SpamDetector:
         
         self.pipeline: Optional[Pipeline] = None
         self.isolation_forest: Optional[IsolationForest] = None
+        self.svd: Optional[TruncatedSVD] = None
+        self._derlenmis_orman: Optional[DerlenmisOrman] = None
         self.tfidf_vectorizer: Optional[TfidfVectorizer] = None
+        self.yakin_kopya_indeksi: Optional[YakinKopyaIndeksi] = None
+        self.tekrar_sayaci = None
+        self.asama_sureleri: Dict[str, float] = {}
         
         self.is_trained = False
         self.classes = SPAM_CLASSES
     
+    def __getstate__(self):
+        """Canlı tekrar sayacı model dosyasına yazılmaz (kendi görüntüsü vardır)."""
+        durum = self.__dict__.copy()
+        durum["tekrar_sayaci"] = None
+        # Derlenmiş orman ormandan yeniden kurulur; artefakttan yüklenen
+        # modelde (isolation_forest yok) tek kopya odur
+        if self.isolation_forest is not None:
+            durum["_derlenmis_orman"] = None
+        return durum
+    
+    @staticmethod
+    def _gosterge_ekle(aciklama: str, gosterge: str) -> str:
+        """Kural açıklamasına ek bir spam göstergesi ekler."""
+        if aciklama == "Normal yorum":
+            return f"Spam göstergeleri: {gosterge}"
+        return f"{aciklama}, {gosterge}"
+    
     # ============================================================
     # KURAL TABANLI TESPİT
     # ============================================================
@@ -96,71 +156,131 @@ class SpamDetector:
     @staticmethod
     def _buyuk_harf_orani(metin: str) -> float:
         """Metindeki büyük harf oranını hesaplar."""
-        harfler = [k for k in metin if k.isalpha()]
-        if not harfler:
+        harf_sayisi = sum(map(str.isalpha, metin))
+        if not harf_sayisi:
             return 0.0
-        return sum(1 for k in harfler if k.isupper()) / len(harfler)
+        return sum(map(str.isalpha, filter(str.isupper, metin))) / harf_sayisi
     
-    def kural_tabanli_skor(self, ham_metin: str, normalize_metin: str) -> int:
+    @classmethod
+    def _kural_sinyalleri(
+        cls,
+        ham_metinler: Sequence,
+        normalize_metinler: Sequence[str]
+    ) -> Dict[str, np.ndarray]:
         """
-        Kural tabanlı spam skoru hesaplar.
+        Bir yorum grubu için tüm spam sinyallerini sütunlar halinde hesaplar.
         
-        Args:
-            ham_metin: Orijinal metin
-            normalize_metin: Normalize edilmiş metin
+        Her sinyal tek bir C seviyesinde geçişle (str metodları, derlenmiş
+        düzenli ifadeler) hesaplanır; puanlama ve açıklamalar NumPy dizileri
+        üzerinde yapılır.
         
         Returns:
-            int: 1 (spam), 0 (gerçek), -1 (belirsiz)
+            dict: Sinyal adı → metin başına değer dizisi
         """
-        metin = normalize_metin
-        ham = ham_metin if isinstance(ham_metin, str) else str(ham_metin)
-        
-        # Göstergeleri kontrol et
-        link_var = any(tag in metin for tag in ["<url>", "<email>", "<phone>"])
-        unlem_sayisi = ham.count("!")
-        emoji_sayisi = len(EMOJI_PATTERN.findall(ham))
-        buyuk_harf_orani = self._buyuk_harf_orani(ham)
-        kelime_sayisi = len(metin.split())
-        
-        # Jenerik ifade kontrolü
-        jenerik_var = (
-            any(ifade in metin for ifade in GENERIC_POSITIVE_PHRASES) or
-            any(ifade in metin for ifade in GENERIC_NEGATIVE_PHRASES)
-        )
+        hamlar = [h if isinstance(h, str) else str(h) for h in ham_metinler]
+        metinler = list(normalize_metinler)
+        n = len(metinler)
+        
+        def sutun(degerler, dtype=np.int64) -> np.ndarray:
+            return np.fromiter(degerler, dtype=dtype, count=n)
+        
+        # Jenerik ifadeler ve şikayet kelimeleri tek otomat geçişiyle
+        eslestirici = varsayilan_eslestirici()
+        gruplar = [eslestirici.gruplari_bul(m) for m in metinler]
         
-        # Puanlama
-        toplam_puan = 0
-        
-        if link_var:
-            toplam_puan += 3
-        if unlem_sayisi >= 4:
-            toplam_puan += 1
-        if emoji_sayisi >= 3:
-            toplam_puan += 1
-        if buyuk_harf_orani > 0.6 and len(ham) > 10:
-            toplam_puan += 1
-        if kelime_sayisi <= 3 and jenerik_var:
-            toplam_puan += 2
-        if len(metin) <= 20 and jenerik_var:
-            toplam_puan += 1
+        url_var = sutun(("<url>" in m for m in metinler), bool)
+        email_var = sutun(("<email>" in m for m in metinler), bool)
+        phone_var = sutun(("<phone>" in m for m in metinler), bool)
+        
+        return {
+            "url_var": url_var,
+            "email_var": email_var,
+            "link_var": url_var | email_var | phone_var,
+            "unlem_sayisi": sutun(h.count("!") for h in hamlar),
+            "emoji_sayisi": sutun(len(EMOJI_PATTERN.findall(h)) for h in hamlar),
+            "buyuk_harf_orani": sutun(map(cls._buyuk_harf_orani, hamlar), np.float64),
+            "kelime_sayisi": sutun(len(m.split()) for m in metinler),
+            "metin_uzunlugu": sutun(map(len, metinler)),
+            "ham_uzunlugu": sutun(map(len, hamlar)),
+            "jenerik_var": sutun((not g.isdisjoint(JENERIK_GRUPLARI) for g in gruplar), bool),
+            "sikayet_var": sutun((SIKAYET in g for g in gruplar), bool),
+        }
+    
+    @staticmethod
+    def _kural_skorlari(sinyaller: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sinyal tablosundan toplam puanı ve kural skorunu hesaplar.
+        
+        Returns:
+            Tuple: (toplam puan, kural skoru: 1 spam, 0 gerçek, -1 belirsiz)
+        """
+        jenerik = sinyaller["jenerik_var"]
+        kelime_sayisi = sinyaller["kelime_sayisi"]
+        
+        toplam_puan = (
+            3 * sinyaller["link_var"]
+            + (sinyaller["unlem_sayisi"] >= 4)
+            + (sinyaller["emoji_sayisi"] >= 3)
+            + ((sinyaller["buyuk_harf_orani"] > 0.6) & (sinyaller["ham_uzunlugu"] > 10))
+            + 2 * ((kelime_sayisi <= 3) & jenerik)
+            + ((sinyaller["metin_uzunlugu"] <= 20) & jenerik)
+        ).astype(np.int64)
         
         # Gerçek şikayetleri spam olarak etiketleme
-        sikayet_kelimeleri = ["iade", "degisim", "kirik", "bozuk", "gecikti"]
-        gercek_sikayet = (
-            "<url>" not in metin and
-            kelime_sayisi >= 6 and
-            any(k in metin for k in sikayet_kelimeleri)
+        gercek_sikayet = ~sinyaller["url_var"] & (kelime_sayisi >= 6) & sinyaller["sikayet_var"]
+        
+        skor = np.where(toplam_puan >= 3, 1, np.where(toplam_puan == 0, 0, -1))
+        skor[gercek_sikayet] = 0
+        return toplam_puan, skor.astype(np.int8)
+    
+    @staticmethod
+    def _aciklamalar(sinyaller: Dict[str, np.ndarray]) -> np.ndarray:
+        """Sinyal tablosundan metin başına açıklama üretir."""
+        kod = (
+            (sinyaller["url_var"] | sinyaller["email_var"]).astype(np.int64)
+            | (sinyaller["unlem_sayisi"] >= 4) << 1
+            | (sinyaller["emoji_sayisi"] >= 3) << 2
+            | (sinyaller["buyuk_harf_orani"] > 0.6) << 3
         )
+        return ACIKLAMA_TABLOSU[kod]
+    
+    def kural_tablosu(
+        self,
+        ham_metinler: Sequence,
+        normalize_metinler: Sequence[str]
+    ) -> pd.DataFrame:
+        """
+        Bir yorum grubu için kural tabanlı sinyal tablosu üretir.
         
-        if gercek_sikayet:
-            return 0
+        Args:
+            ham_metinler: Orijinal metinler
+            normalize_metinler: Normalize edilmiş metinler
         
-        if toplam_puan >= 3:
-            return 1
-        elif toplam_puan == 0:
-            return 0
-        else:
-            return -1
+        Returns:
+            pd.DataFrame: Sinyal sütunları + toplam_puan, kural_skoru, aciklama
+        """
+        sinyaller = self._kural_sinyalleri(ham_metinler, normalize_metinler)
+        toplam_puan, kural_skoru = self._kural_skorlari(sinyaller)
+        
+        tablo = pd.DataFrame(sinyaller)
+        tablo["toplam_puan"] = toplam_puan
+        tablo["kural_skoru"] = kural_skoru
+        tablo["aciklama"] = self._aciklamalar(sinyaller)
+        return tablo
+    
+    def kural_tabanli_skor(self, ham_metin: str, normalize_metin: str) -> int:
+        """
+        Kural tabanlı spam skoru hesaplar.
+        
+        Args:
+            ham_metin: Orijinal metin
+            normalize_metin: Normalize edilmiş metin
+        
+        Returns:
+            int: 1 (spam), 0 (gerçek), -1 (belirsiz)
+        """
+        sinyaller = self._kural_sinyalleri([ham_metin], [normalize_metin])
+        return int(self._kural_skorlari(sinyaller)[1][0])
     
     # ============================================================
     # MODEL EĞİTİMİ
@@ -182,71 +302,166 @@ class SpamDetector:
             self: Eğitilmiş model
         """
         print("[EĞİTİM] Spam tespit modeli eğitiliyor...")
+        sureler: Dict[str, float] = {}
         
         # 1. Kural tabanlı etiketler üret
-        print("  [1/3] Kural tabanlı etiketler oluşturuluyor...")
-        kural_etiketler = [
-            self.kural_tabanli_skor(ham, norm)
-            for ham, norm in zip(ham_metinler, normalize_metinler)
-        ]
-        
-        # 2. Tekrar eden yorumları tespit et
-        metin_sayilari: pd.Series = pd.Series(normalize_metinler).value_counts()  # type: ignore[assignment]
-        cok_tekrar = set(metin_sayilari[metin_sayilari >= 10].index.tolist())
-        
-        for i, metin in enumerate(normalize_metinler):
-            if metin in cok_tekrar:
-                kural_etiketler[i] = 1
-        
-        # 3. IsolationForest eğit
-        print("  [2/3] IsolationForest eğitiliyor...")
+        print("  [1/4] Kural tabanlı etiketler oluşturuluyor...")
+        baslangic = time.perf_counter()
+        _, kural_etiketler = self._kural_skorlari(
+            self._kural_sinyalleri(ham_metinler, normalize_metinler)
+        )
+        
+        # 2. Tekrar eden yorumları tespit et (>= 10 kez geçen metinler spam)
+        kodlar, _ = pd.factorize(pd.Series(normalize_metinler, dtype=object))
+        kural_etiketler[np.bincount(kodlar)[kodlar] >= 10] = 1
+        sureler["kurallar"] = time.perf_counter() - baslangic
+        
+        # Kelimesi değiştirilmiş kampanya kopyaları (MinHash + LSH)
+        if NEAR_DUPLICATE_CONFIG.get("enabled", True):
+            baslangic = time.perf_counter()
+            self.yakin_kopya_indeksi = YakinKopyaIndeksi()
+            kume_boyutlari = self.yakin_kopya_indeksi.fit(normalize_metinler)
+            kural_etiketler[kume_boyutlari >= NEAR_DUPLICATE_CONFIG.get("min_cluster_size", 10)] = 1
+            sureler["yakin_kopya"] = time.perf_counter() - baslangic
+        else:
+            self.yakin_kopya_indeksi = None
+        
+        # 3. Korpus bir kez vektörleştirilir; IsolationForest ve
+        #    LogisticRegression aynı matrisi kullanır
+        print("  [2/4] TF-IDF matrisi oluşturuluyor...")
+        baslangic = time.perf_counter()
         self.tfidf_vectorizer = TfidfVectorizer(**SPAM_TFIDF_CONFIG)
         tfidf_matris = self.tfidf_vectorizer.fit_transform(normalize_metinler)
+        sureler["vektorlestirme"] = time.perf_counter() - baslangic
         
+        # IsolationForest 2000 sütunluk seyrek matris yerine küçük bir yoğun
+        # izdüşüm üzerinde eğitilir; çıkarımda aynı izdüşüm kullanılır
+        print("  [3/4] IsolationForest eğitiliyor...")
+        baslangic = time.perf_counter()
+        izdusum = self._svd_egit(tfidf_matris)
         self.isolation_forest = IsolationForest(**ISOLATION_FOREST_CONFIG)
-        anomali_tahminleri = self.isolation_forest.fit_predict(tfidf_matris)
-        anomali_etiketler = (anomali_tahminleri == -1).astype(int)
-        
-        # 4. Hibrit etiketler oluştur
-        print("  [3/3] Hibrit etiketler birleştiriliyor...")
-        hibrit_etiketler = []
-        for kural, anomali in zip(kural_etiketler, anomali_etiketler):
-            if kural == 1:
-                hibrit_etiketler.append(1)
-            elif kural == 0 and anomali == 0:
-                hibrit_etiketler.append(0)
-            elif kural == 0 and anomali == 1:
-                hibrit_etiketler.append(-1)
-            elif kural == -1 and anomali == 1:
-                hibrit_etiketler.append(1)
-            else:
-                hibrit_etiketler.append(-1)
-        
-        # 5. Kesin etiketli verilerle LogisticRegression eğit
-        kesin_indeksler = [i for i, e in enumerate(hibrit_etiketler) if e != -1]
-        X_kesin = [normalize_metinler[i] for i in kesin_indeksler]
-        y_kesin = [hibrit_etiketler[i] for i in kesin_indeksler]
+        self.isolation_forest.fit(izdusum)
+        self._derlenmis_orman = None
+        anomali = self._anomali_skorlari_izdusumden(izdusum) > self._orman().esik
+        sureler["isolation_forest"] = time.perf_counter() - baslangic
+        
+        # 4. Hibrit etiketler:
+        #    kural=1 -> spam; kural=0 -> gerçek (anomaliyse belirsiz);
+        #    kural=-1 -> anomaliyse spam, değilse belirsiz
+        print("  [4/4] Hibrit etiketler birleştiriliyor, sınıflandırıcı eğitiliyor...")
+        baslangic = time.perf_counter()
+        hibrit_etiketler = np.full(len(kural_etiketler), -1, dtype=np.int8)
+        hibrit_etiketler[kural_etiketler == 1] = 1
+        hibrit_etiketler[(kural_etiketler == 0) & ~anomali] = 0
+        hibrit_etiketler[(kural_etiketler == -1) & anomali] = 1
+        
+        # 5. Kesin etiketli satırlar aynı matristen dilimlenir
+        kesin = hibrit_etiketler != -1
+        siniflandirici = LogisticRegression(
+            max_iter=1000,
+            class_weight="balanced",
+            random_state=RANDOM_SEED
+        )
+        siniflandirici.fit(tfidf_matris[kesin], hibrit_etiketler[kesin])
         
         self.pipeline = Pipeline([
-            ("tfidf", TfidfVectorizer(**SPAM_TFIDF_CONFIG)),
-            ("classifier", LogisticRegression(
-                max_iter=1000,
-                class_weight="balanced",
-                random_state=RANDOM_SEED
-            ))
+            ("tfidf", self.tfidf_vectorizer),
+            ("classifier", siniflandirici)
         ])
+        sureler["siniflandirici"] = time.perf_counter() - baslangic
         
-        self.pipeline.fit(X_kesin, y_kesin)
+        self.asama_sureleri = sureler
         self.is_trained = True
         
-        print(f"[OK] Eğitim tamamlandı!")
+        print(f"[OK] Eğitim tamamlandı! Süre: {sum(sureler.values()):.2f} saniye")
+        for asama, sure in sureler.items():
+            print(f"  {asama:<18} {sure:.2f} sn")
         print(f"  Toplam: {len(normalize_metinler):,} yorum")
-        print(f"  Spam: {sum(1 for e in hibrit_etiketler if e == 1):,}")
-        print(f"  Gerçek: {sum(1 for e in hibrit_etiketler if e == 0):,}")
-        print(f"  Belirsiz: {sum(1 for e in hibrit_etiketler if e == -1):,}")
+        print(f"  Spam: {int((hibrit_etiketler == 1).sum()):,}")
+        print(f"  Gerçek: {int((hibrit_etiketler == 0).sum()):,}")
+        print(f"  Belirsiz: {int((hibrit_etiketler == -1).sum()):,}")
         
         return self
     
+    # ============================================================
+    # ANOMALİ SKORU
+    # ============================================================
+    
+    def _svd_egit(self, tfidf_matris) -> np.ndarray:
+        """İzdüşümü (gerekirse örneklem üzerinde) öğrenir ve tüm korpusu dönüştürür."""
+        bilesen = int(ANOMALY_PROJECTION_CONFIG.get("n_components", 0) or 0)
+        if bilesen <= 0 or bilesen >= tfidf_matris.shape[1]:
+            self.svd = None
+            return tfidf_matris
+        
+        self.svd = TruncatedSVD(n_components=bilesen, random_state=RANDOM_SEED)
+        orneklem = int(ANOMALY_PROJECTION_CONFIG.get("fit_sample", 0) or 0)
+        if orneklem and tfidf_matris.shape[0] > orneklem:
+            secilen = np.random.default_rng(RANDOM_SEED).choice(
+                tfidf_matris.shape[0], orneklem, replace=False
+            )
+            self.svd.fit(tfidf_matris[np.sort(secilen)])
+            return self.svd.transform(tfidf_matris).astype(np.float32)
+        return self.svd.fit_transform(tfidf_matris).astype(np.float32)
+    
+    def _izdusum(self, tfidf_matris):
+        """TF-IDF satırlarını ormanın girdi uzayına taşır."""
+        svd = getattr(self, "svd", None)
+        if svd is None:
+            return tfidf_matris
+        # svd.transform ile aynı çarpım; tek satırda girdi doğrulaması atlanır
+        return np.asarray(tfidf_matris @ svd.components_.T, dtype=np.float32)
+    
+    def _orman(self) -> DerlenmisOrman:
+        """Derlenmiş ormanı (ilk kullanımda) kurar."""
+        orman = getattr(self, "_derlenmis_orman", None)
+        if orman is None:
+            orman = DerlenmisOrman.from_forest(self.isolation_forest)
+            self._derlenmis_orman = orman
+        return orman
+    
+    def _anomali_skorlari_izdusumden(self, izdusum) -> np.ndarray:
+        """
+        İzdüşümden 0-1 arası anomali skorları hesaplar.
+        
+        Küçük gruplar derlenmiş ormandan, büyük gruplar sklearn'ün
+        C ağaç gezintisinden geçer; iki yol aynı skorları üretir.
+        Artefakttan yüklenen modelde yalnızca derlenmiş orman vardır.
+        """
+        if (
+            self.isolation_forest is None
+            or izdusum.shape[0] <= ANOMALY_PROJECTION_CONFIG.get("compiled_max_rows", 1000)
+        ):
+            return self._orman().skorlar(izdusum)
+        return -self.isolation_forest.score_samples(izdusum)
+    
+    def anomali_skorlari(self, normalize_metinler: List[str], tfidf_matris=None) -> np.ndarray:
+        """
+        IsolationForest anomali skorlarını döndürür.
+        
+        Args:
+            normalize_metinler: Normalize edilmiş metinler
+            tfidf_matris: Önceden hesaplanmış spam TF-IDF matrisi (opsiyonel)
+        
+        Returns:
+            np.ndarray: 0-1 arası skorlar; `anomali_esigi` üstü anomali sayılır
+        """
+        if not self.is_trained or not self.anomali_modeli_var:
+            raise ValueError("Model henüz eğitilmedi!")
+        if tfidf_matris is None:
+            tfidf_matris = self.tfidf_vectorizer.transform(normalize_metinler)
+        return self._anomali_skorlari_izdusumden(self._izdusum(tfidf_matris))
+    
+    @property
+    def anomali_modeli_var(self) -> bool:
+        """IsolationForest veya (artefakttan yüklenen) derlenmiş orman var mı?"""
+        return self.isolation_forest is not None or getattr(self, "_derlenmis_orman", None) is not None
+    
+    @property
+    def anomali_esigi(self) -> float:
+        """Bu skorun üstü anomali sayılır (eğitimdeki contamination oranından)."""
+        return self._orman().esik
+    
     # ============================================================
     # TAHMİN
     # ============================================================
@@ -263,13 +478,120 @@ class SpamDetector:
             raise ValueError("Model henüz eğitilmedi!")
         return cast(np.ndarray, self.pipeline.predict_proba(metinler))
     
-    def analyze(self, ham_metin: str, normalize_metin: Optional[str] = None) -> Dict:
+    def model_skorlari(self, normalize_metinler: Sequence[str], ozellik=None) -> Dict[str, np.ndarray]:
+        """
+        Yalnızca normalize metne bağlı model çıktıları.
+        
+        Sınıflandırıcı olasılığı, anomali skoru ve yakın kopya kümesi aynı
+        normalize metin için her zaman aynıdır; sonuç önbelleği bu kısmı
+        saklar, kural sinyallerini ve tekrar sayacını her çağrıda yeniden
+        hesaplar (bkz. _analiz_dizileri).
+        
+        Args:
+            normalize_metinler: Normalize metinler
+            ozellik: Spam özellik matrisi (opsiyonel)
+        
+        Returns:
+            dict: anomali_skoru, anomali, kume_id, kume_boyutu; model
+            eğitilmişse ayrıca spam_olasiligi ve tahmin
+        """
+        n = len(normalize_metinler)
+        sonuc: Dict[str, np.ndarray] = {
+            "anomali_skoru": np.zeros(n, dtype=np.float64),
+            "anomali": np.zeros(n, dtype=bool),
+            "kume_id": np.full(n, -1, dtype=np.int64),
+            "kume_boyutu": np.zeros(n, dtype=np.int64)
+        }
+        
+        # Model tahmini ve anomali skoru aynı TF-IDF matrisinden
+        if self.is_trained and self.pipeline is not None:
+            siniflandirici = self.pipeline.named_steps["classifier"]
+            if ozellik is None:
+                ozellik = self.pipeline.named_steps["tfidf"].transform(normalize_metinler)
+            olasiliklar = siniflandirici.predict_proba(ozellik)
+            sonuc["tahmin"] = siniflandirici.classes_[olasiliklar.argmax(axis=1)].astype(np.int64)
+            sonuc["spam_olasiligi"] = olasiliklar[:, 1].astype(np.float64)
+            if self.anomali_modeli_var:
+                sonuc["anomali_skoru"] = self.anomali_skorlari(normalize_metinler, ozellik)
+                sonuc["anomali"] = sonuc["anomali_skoru"] > self.anomali_esigi
+        
+        # Eğitim korpusundaki yakın kopya kümesi
+        indeks = getattr(self, "yakin_kopya_indeksi", None)
+        if indeks is not None:
+            sorgu = indeks.sorgula_toplu(normalize_metinler)
+            sonuc["kume_id"], sonuc["kume_boyutu"] = sorgu["kume"], sorgu["boyut"]
+        return sonuc
+    
+    def _analiz_dizileri(
+        self,
+        ham_metinler: Sequence[str],
+        normalize_metinler: Sequence[str],
+        ozellik=None,
+        skorlar: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        analyze() ve analyze_batch() için ortak, sütunlu analiz.
+        
+        Kural sinyalleri, tekrar sayacı, sınıflandırıcı, anomali skoru
+        ve yakın kopya sorgusu tüm grup için birer kez çalışır. `skorlar`
+        verilirse (ör. önbellekten) model_skorlari() atlanır.
+        """
+        n = len(normalize_metinler)
+        
+        # Kural tabanlı skor ve açıklama aynı sinyallerden
+        sinyaller = self._kural_sinyalleri(ham_metinler, normalize_metinler)
+        kural_skor = self._kural_skorlari(sinyaller)[1].astype(np.int64)
+        aciklama = self._aciklamalar(sinyaller).astype(object)
+        
+        # Canlı tekrar sinyali: eğitimdeki "10+ tekrar" kuralının servis karşılığı
+        son_tekrar = np.zeros(n, dtype=np.int64)
+        sayac = getattr(self, "tekrar_sayaci", None)
+        if sayac is not None:
+            son_tekrar = np.fromiter((sayac.ekle(m) for m in normalize_metinler), dtype=np.int64, count=n)
+            dakika = int(sayac.window_seconds // 60)
+            for i in np.flatnonzero(son_tekrar >= STREAM_FREQUENCY_CONFIG.get("min_count", 10)):
+                kural_skor[i] = 1
+                aciklama[i] = self._gosterge_ekle(aciklama[i], f"son {dakika} dakikada {son_tekrar[i]} kez görüldü")
+        
+        if skorlar is None:
+            skorlar = self.model_skorlari(normalize_metinler, ozellik)
+        if "tahmin" in skorlar:
+            tahmin = skorlar["tahmin"]
+            spam_olasiligi = skorlar["spam_olasiligi"]
+        else:
+            tahmin = kural_skor.copy()
+            spam_olasiligi = (kural_skor == 1).astype(np.float64)
+        
+        kume_boyutu = skorlar["kume_boyutu"]
+        for i in np.flatnonzero(kume_boyutu >= NEAR_DUPLICATE_CONFIG.get("min_cluster_size", 10)):
+            aciklama[i] = self._gosterge_ekle(aciklama[i], f"{kume_boyutu[i]} yorumluk yakın kopya kümesi")
+        
+        return {
+            "spam_olasiligi": spam_olasiligi,
+            "tahmin": tahmin,
+            "kural_skoru": kural_skor,
+            "anomali_skoru": skorlar["anomali_skoru"],
+            "anomali": skorlar["anomali"],
+            "aciklama": aciklama,
+            "kume_id": skorlar["kume_id"],
+            "kume_boyutu": kume_boyutu,
+            "son_tekrar": son_tekrar
+        }
+    
+    def analyze(
+        self,
+        ham_metin: str,
+        normalize_metin: Optional[str] = None,
+        ozellik=None
+    ) -> Dict:
         """
         Tek bir yorumu analiz eder.
         
         Args:
             ham_metin: Orijinal metin
             normalize_metin: Normalize metin (None ise hesaplanır)
+            ozellik: OrtakOzellikCikarici'dan gelen 1 satırlık spam
+                özellik matrisi (verilirse metin yeniden tokenize edilmez)
         
         Returns:
             dict: Analiz sonuçları
@@ -282,42 +604,69 @@ class SpamDetector:
         if normalize_metin is None:
             normalize_metin = turkce_metin_normalize_et(ham_metin)
         
-        # Kural tabanlı skor
-        kural_skor = self.kural_tabanli_skor(ham_metin, normalize_metin)
-        
-        # Model tahmini
-        if self.is_trained:
-            model_tahmin = int(self.predict([normalize_metin])[0])
-            model_proba = float(self.predict_proba([normalize_metin])[0, 1])
-        else:
-            model_tahmin = kural_skor
-            model_proba = 1.0 if kural_skor == 1 else 0.0
+        d = self._analiz_dizileri([ham_metin], [normalize_metin], ozellik)
+        tahmin = int(d["tahmin"][0])
         
         return {
-            "spam_olasiligi": model_proba,
-            "tahmin": model_tahmin,
-            "etiket": self.classes[model_tahmin],
-            "kural_skoru": kural_skor,
-            "aciklama": self._aciklama_olustur(ham_metin, normalize_metin)
+            "spam_olasiligi": float(d["spam_olasiligi"][0]),
+            "tahmin": tahmin,
+            "etiket": self.classes[tahmin],
+            "kural_skoru": int(d["kural_skoru"][0]),
+            "anomali_skoru": float(d["anomali_skoru"][0]),
+            "anomali": bool(d["anomali"][0]),
+            "aciklama": str(d["aciklama"][0]),
+            "kume_id": int(d["kume_id"][0]),
+            "kume_boyutu": int(d["kume_boyutu"][0]),
+            "son_tekrar": int(d["son_tekrar"][0])
         }
     
-    def _aciklama_olustur(self, ham: str, norm: str) -> str:
-        """Spam göstergelerini açıklar."""
-        gostergeler = []
+    def analyze_batch(
+        self,
+        ham_metinler: Sequence[str],
+        normalize_metinler: Optional[Sequence[str]] = None,
+        ozellik=None,
+        as_frame: bool = True,
+        skorlar: Optional[Dict[str, np.ndarray]] = None
+    ):
+        """
+        Bir yorum grubunu tek geçişte analiz eder.
         
-        if "<url>" in norm or "<email>" in norm:
-            gostergeler.append("URL/e-posta içeriyor")
-        if ham.count("!") >= 4:
-            gostergeler.append("Çok fazla ünlem işareti")
-        if len(EMOJI_PATTERN.findall(ham)) >= 3:
-            gostergeler.append("Çok fazla emoji")
-        if self._buyuk_harf_orani(ham) > 0.6:
-            gostergeler.append("Çoğunlukla büyük harf")
+        Metinler bir kez normalize edilir, TF-IDF matrisi bir kez kurulur
+        ve grubun tamamı için tek predict_proba çağrılır. Sonuç analyze()
+        ile satır satır aynıdır.
         
-        if not gostergeler:
-            return "Normal yorum"
+        Args:
+            ham_metinler: Orijinal metinler
+            normalize_metinler: Normalize metinler (None ise normalize_batch ile)
+            ozellik: OrtakOzellikCikarici'dan gelen spam özellik matrisi (opsiyonel)
+            as_frame: False ise DataFrame yerine sütun adı → dizi sözlüğü
+                döndürür (küçük gruplarda pandas ek yükü olmadan)
+            skorlar: Önceden hesaplanmış model_skorlari() çıktısı (opsiyonel;
+                verilirse sınıflandırıcı ve anomali modeli çalışmaz)
         
-        return "Spam göstergeleri: " + ", ".join(gostergeler)
+        Returns:
+            pd.DataFrame: Satır başına spam_olasiligi, tahmin, etiket,
+            kural_skoru, anomali_skoru, anomali, aciklama, kume_id,
+            kume_boyutu, son_tekrar
+        """
+        if normalize_metinler is None:
+            try:
+                from .preprocessing import normalize_batch
+            except ImportError:
+                from preprocessing import normalize_batch  # type: ignore[no-redef]
+            normalize_metinler = normalize_batch(ham_metinler)
+        
+        d = self._analiz_dizileri(list(ham_metinler), list(normalize_metinler), ozellik, skorlar)
+        if not as_frame:
+            d["etiket"] = np.array([self.classes[t] for t in d["tahmin"].tolist()], dtype=object)
+            return d
+        tablo = pd.DataFrame(d)
+        tablo.insert(2, "etiket", tablo["tahmin"].map(self.classes))
+        return tablo
+    
+    def _aciklama_olustur(self, ham: str, norm: str) -> str:
+        """Spam göstergelerini açıklar."""
+        return str(self._aciklamalar(self._kural_sinyalleri([ham], [norm]))[0])
     
     # ============================================================
     # KAYIT/YÜKLEME
@@ -330,11 +679,49 @@ class SpamDetector:
         joblib.dump(self, path)
         print(f"[OK] Spam modeli kaydedildi: {path}")
     
+    def save_artifact(self, path: Optional[str] = None) -> str:
+        """
+        Modeli pickle içermeyen, bellek eşlemeli artefakt dizinine kaydeder.
+        
+        IsolationForest derlenmiş orman dizileri olarak saklanır; artefakttan
+        yüklenen model anomali skorlarını her grup boyutunda derlenmiş
+        ormandan hesaplar.
+        
+        Args:
+            path: Hedef dizin (None ise SPAM_ARTIFACT_PATH)
+        
+        Returns:
+            str: Yazılan dizin
+        """
+        try:
+            from .artifact import artefakt_kaydet
+        except ImportError:
+            from artifact import artefakt_kaydet  # type: ignore[no-redef]
+        return artefakt_kaydet(self, path)
+    
     @classmethod
     def load(cls, path: Optional[str] = None) -> "SpamDetector":
-        """Modeli yükler."""
+        """Modeli dosyadan (veya artefakt dizininden) yükler."""
         path = path or str(SPAM_MODEL_PATH)
+        if os.path.isdir(path):
+            # Bellek eşlemeli artefakt dizini (save_artifact)
+            try:
+                from .artifact import artefakt_yukle
+            except ImportError:
+                from artifact import artefakt_yukle  # type: ignore[no-redef]
+            model = artefakt_yukle(path)
+            print(f"[OK] Spam modeli artefaktı yüklendi: {path}")
+            return model
         model = joblib.load(path)
+        # Yakın kopya indeksinden önce kaydedilmiş modeller
+        if not hasattr(model, "yakin_kopya_indeksi"):
+            model.yakin_kopya_indeksi = None
+        model.tekrar_sayaci = None
+        if model.isolation_forest is not None or not hasattr(model, "_derlenmis_orman"):
+            model._derlenmis_orman = None
+        # İzdüşümden önce kaydedilmiş modellerin ormanı ham TF-IDF üzerindedir
+        if not hasattr(model, "svd"):
+            model.svd = None
         print(f"[OK] Spam modeli yüklendi: {path}")
         return model
 
@@ -372,7 +759,7 @@ if __name__ == "__main__":
     print("SPAM TESPİT MODELİ EĞİTİMİ")
     print("=" * 60)
     
-    from preprocessing import veri_hazirla
+    from preprocessing import veri_hazirla, kok_onbellegini_kaydet
     
     # Veriyi hazırla
     print("\n[1/3] Veri hazırlanıyor...")
@@ -388,6 +775,8 @@ if __name__ == "__main__":
     # Kaydet
     print("\n[3/3] Model kaydediliyor...")
     detector.save()
+    detector.save_artifact()
+    kok_onbellegini_kaydet()
     
     # Örnek analiz
     print("\n" + "=" * 60)
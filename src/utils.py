@@ -7,11 +7,13 @@ Bu modül veri indirme, model kaydetme gibi yardımcı işlemleri içerir.
 
 import os
 import sys
+import hashlib
 import requests
 import joblib
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Union, Any, cast
+from typing import Optional, Union, Any, List, Tuple, cast
 
 # Proje konfigürasyonunu yükle
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -133,19 +135,23 @@ def veri_indir(hedef_yol: Optional[str] = None, kaynak: str = "auto") -> pd.Data
 # MODEL KAYDETME/YÜKLEME
 # ============================================================
 
-def model_kaydet(model, dosya_adi: str, klasor: Optional[str] = None):
+def model_kaydet(model, dosya_adi: str, klasor: Optional[str] = None, artefakt: bool = False):
     """
-    Modeli pickle formatında kaydeder.
+    Modeli pickle formatında (veya bellek eşlemeli artefakt olarak) kaydeder.
     
     Args:
         model: Kaydedilecek model
-        dosya_adi: Dosya adı (örn: "sentiment_model.pkl")
+        dosya_adi: Dosya adı (örn: "sentiment_model.pkl"); artefakt için dizin adı
         klasor: Hedef klasör (varsayılan: models/)
+        artefakt: True ise SentimentModel / SpamDetector pickle'sız
+            artefakt dizinine yazılır (src/artifact.py)
     """
     klasor = klasor or str(MODELS_DIR)
     os.makedirs(klasor, exist_ok=True)
     
     tam_yol = os.path.join(klasor, dosya_adi)
+    if artefakt:
+        return model.save_artifact(tam_yol)
     joblib.dump(model, tam_yol)
     
     print(f"[OK] Model kaydedildi: {tam_yol}")
@@ -157,7 +163,7 @@ def model_yukle(dosya_adi: str, klasor: Optional[str] = None):
     Kaydedilmiş modeli yükler.
     
     Args:
-        dosya_adi: Dosya adı
+        dosya_adi: Dosya adı veya artefakt dizini adı
         klasor: Kaynak klasör
     
     Returns:
@@ -172,12 +178,66 @@ def model_yukle(dosya_adi: str, klasor: Optional[str] = None):
             f"Önce 'python src/model.py' ile modeli eğitin."
         )
     
-    model = joblib.load(tam_yol)
+    if os.path.isdir(tam_yol):
+        # Bellek eşlemeli artefakt dizini; pickle çalıştırılmaz
+        try:
+            from .artifact import artefakt_yukle
+        except ImportError:
+            from artifact import artefakt_yukle  # type: ignore[no-redef]
+        model = artefakt_yukle(tam_yol)
+    else:
+        model = joblib.load(tam_yol)
     print(f"[OK] Model yüklendi: {tam_yol}")
     
     return model
 
 
+# ============================================================
+# DOSYA ÖZETİ VE METİN TABLOLARI
+# ============================================================
+
+def dosya_ozeti(dosya_yolu: str, blok_boyutu: int = 8 << 20) -> str:
+    """
+    Dosya içeriğinin BLAKE2b özetini hesaplar.
+    
+    Args:
+        dosya_yolu: Dosya yolu
+        blok_boyutu: Okuma blok boyutu (byte)
+    
+    Returns:
+        str: Onaltılık özet
+    """
+    ozet = hashlib.blake2b(digest_size=20)
+    with open(dosya_yolu, "rb") as dosya:
+        for blok in iter(lambda: dosya.read(blok_boyutu), b""):
+            ozet.update(blok)
+    return ozet.hexdigest()
+
+
+def metin_tablosu_olustur(metinler: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Metin listesini tek bir UTF-8 bayt dizisi ve karakter ofsetlerine çevirir.
+    
+    Nesne dizisi (pickle) gerektirmeden np.save/np.savez ile saklanabilir.
+    Eşsiz vekil karakterler (ör. yarım kalmış emoji çiftleri) "surrogatepass"
+    ile yazılır ve metin_tablosunu_ac() aynı şekilde geri okur.
+    
+    Returns:
+        tuple: (uint8 bayt dizisi, int64 ofsetler [len(metinler) + 1])
+    """
+    ofsetler = np.zeros(len(metinler) + 1, dtype=np.int64)
+    np.cumsum([len(m) for m in metinler], out=ofsetler[1:])
+    blob = np.frombuffer("".join(metinler).encode("utf-8", "surrogatepass"), dtype=np.uint8)
+    return blob, ofsetler
+
+
+def metin_tablosunu_ac(blob: np.ndarray, ofsetler: np.ndarray) -> List[str]:
+    """metin_tablosu_olustur() çıktısını metin listesine geri çevirir."""
+    birlesik = blob.tobytes().decode("utf-8", "surrogatepass")
+    sinirlar = ofsetler.tolist()
+    return [birlesik[a:b] for a, b in zip(sinirlar[:-1], sinirlar[1:])]
+
+
 # ============================================================
 # DİĞER YARDIMCI FONKSİYONLAR
 # ============================================================
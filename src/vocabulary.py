@@ -0,0 +1,368 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Kompakt Terim Sözlüğü
+============================================================
+TfidfVectorizer.vocabulary_ için Python sözlüğü yerine düz
+dizilerden oluşan salt okunur terim → özellik indeksi eşlemesi.
+
+max_features=None ve bigramlarla duygu sözlüğü yüz binlerce
+terime ulaşır. Python sözlüğünde her kayıt bir str nesnesi, bir
+int nesnesi ve bir hash tablosu yuvası demektir (~100+ bayt);
+bunlar her işçinin özel belleğindedir ve referans sayaçları
+yazıldıkça çatallanan süreçlerde kopyalanır. KompaktSozluk aynı
+eşlemeyi dört diziyle tutar:
+
+- baytlar: kod noktası sırasıyla dizilmiş terimlerin uç uca
+  eklenmiş UTF-8 baytları (src/artifact.py terim tablosu)
+- ofsetler: terim i = baytlar[ofsetler[i]:ofsetler[i + 1]]
+- indeksler: terim i'nin özellik indeksi (vektörizörle birebir)
+- yuvalar: açık adreslemeli hash tablosu (murmurhash3, doğrusal
+  yoklama, doluluk <= %50); yuva, terim sırasını ve hash'in üst
+  31 bitini tutar, boşsa -1
+
+Arama terimin hash'inden yuvaya gider, hash'i tutan adayın
+baytlarını karşılaştırır; sözlük dışı terim boş yuvada biter.
+Diziler artefakttan bellek eşlemesiyle açılabilir, yükleme
+sırasında hiçbir Python nesnesi kurulmaz.
+
+Dizi araması Python sözlüğünden birkaç kat yavaştır; hizlandir()
+iki küçük katman ekler:
+
+- sıcak katman: terim sıklıkları Zipf dağılımına uyar, aramaların
+  çoğu birkaç bin sık terime (en düşük idf) düşer. Bu terimler
+  küçük bir Python sözlüğünde tutulur ve önce orada aranır.
+- süzgeç: sözlük dışı n-gram'lar (bigramlarda aramaların yarısı)
+  str nesnesinin önbellekli hash()'iyle bir bayt dizisinde
+  denetlenir; çoğu murmurhash3 hesaplanmadan elenir. hash()
+  süreç başına rastgele tohumlandığından süzgeç diske yazılmaz,
+  her süreçte (ön-çatallı serviste ana süreçte bir kez) kurulur.
+
+Sınıf bir Mapping'dir: sklearn'in transform() yolu ([] ve
+KeyError), OzellikUzayi / LinearScorer (.get), len() ve items()
+sözlükle aynı sonucu verir.
+
+Kullanım:
+    from src.vocabulary import KompaktSozluk, sozlukleri_kompaktla
+
+    sozluk = KompaktSozluk.sozlukten(tfidf.vocabulary_).hizlandir(tfidf.idf_)
+    sozluk.get("urun harika")       # sözlükteki indeks veya None
+
+    sozlukleri_kompaktla(duygu_modeli, spam_modeli)   # yerinde çevirir
+"""
+
+import os
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sklearn.utils import murmurhash3_32
+
+# Proje konfigürasyonunu yükle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from config import VOCABULARY_CONFIG
+except ImportError:
+    VOCABULARY_CONFIG = {"compact": True, "min_terms": 20000, "hot_terms": 4096, "filter": True}
+
+
+# Yuva tablosu hash tohumu (artefakta yazılan tablo buna bağlıdır)
+HASH_TOHUMU = 0x5EED
+BOS_YUVA = -1
+
+# Süzgeçte terim başına bayt (~%12 yanlış pozitif)
+_SUZGEC_CARPANI = 8
+
+
+# ============================================================
+# TERİM TABLOSU
+# ============================================================
+
+def terim_tablosu(sozluk: Mapping) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sözlüğü sıralı terim tablosuna çevirir.
+
+    Terimler kod noktası sırasıyla dizilir ve UTF-8 olarak uç uca
+    eklenir (bayt sırası kod noktası sırasıyla aynıdır, ikili arama
+    bayt karşılaştırmasıyla yapılabilir).
+
+    Returns:
+        Tuple: (uint8 terim baytları, int64 ofsetler [n+1], int32 özellik indeksleri)
+    """
+    if isinstance(sozluk, KompaktSozluk):
+        return np.asarray(sozluk.baytlar), np.asarray(sozluk.ofsetler), np.asarray(sozluk.indeksler)
+    terimler = sorted(sozluk)
+    kodlanmis = [terim.encode("utf-8") for terim in terimler]
+    ofsetler = np.zeros(len(kodlanmis) + 1, dtype=np.int64)
+    np.cumsum([len(k) for k in kodlanmis], out=ofsetler[1:])
+    baytlar = np.frombuffer(b"".join(kodlanmis), dtype=np.uint8)
+    indeksler = np.fromiter((sozluk[t] for t in terimler), dtype=np.int32, count=len(terimler))
+    return baytlar, ofsetler, indeksler
+
+
+def yuva_tablosu(baytlar: np.ndarray, ofsetler: np.ndarray) -> np.ndarray:
+    """
+    Terim tablosu için açık adreslemeli hash yuvalarını kurar.
+
+    Tablo boyutu terim sayısının en az iki katı olan ikinin kuvvetidir;
+    çakışan terim sonraki boş yuvaya yerleşir. Yuvadaki hash bitleri
+    sayesinde aramada hash'i farklı adayların baytları karşılaştırılmaz.
+
+    Returns:
+        np.ndarray: int64 yuvalar ((hash >> 1) << 32 | terim sırası, boşsa BOS_YUVA)
+    """
+    adet = len(ofsetler) - 1
+    boyut = 1 << max(3, int(2 * adet - 1).bit_length())
+    maske = boyut - 1
+    yuvalar = np.full(boyut, BOS_YUVA, dtype=np.int64)
+    veri = baytlar.tobytes()
+    ofs = ofsetler.tolist()
+    tablo = yuvalar.tolist()
+    for j in range(adet):
+        h = murmurhash3_32(veri[ofs[j]:ofs[j + 1]], HASH_TOHUMU, True)
+        yer = h & maske
+        while tablo[yer] != BOS_YUVA:
+            yer = (yer + 1) & maske
+        tablo[yer] = ((h >> 1) << 32) | j
+    yuvalar[:] = tablo
+    return yuvalar
+
+
+# ============================================================
+# KOMPAKT SÖZLÜK
+# ============================================================
+
+class KompaktSozluk(Mapping):
+    """
+    Dizilerle tutulan salt okunur terim → özellik indeksi eşlemesi.
+
+    Diziler numpy dizisi veya bellek eşlemeli .npy olabilir; aramalar
+    memoryview üzerinden yapılır, Python nesnesi yalnızca dönen indeks
+    için oluşur. Yineleme terimleri kod noktası sırasıyla verir.
+
+    Attributes:
+        baytlar: uint8 terim baytları
+        ofsetler: int64 terim ofsetleri [n+1]
+        indeksler: int32 özellik indeksleri [n]
+        yuvalar: int64 hash yuvaları
+        sicak: Sık terimler → özellik indeksi (sıcak katman, hizlandir())
+    """
+
+    def __init__(
+        self,
+        baytlar: np.ndarray,
+        ofsetler: np.ndarray,
+        indeksler: np.ndarray,
+        yuvalar: Optional[np.ndarray] = None
+    ):
+        """
+        Args:
+            baytlar: terim_tablosu() terim baytları
+            ofsetler: terim_tablosu() ofsetleri
+            indeksler: terim_tablosu() özellik indeksleri
+            yuvalar: yuva_tablosu() çıktısı (None ise kurulur)
+        """
+        if len(ofsetler) != len(indeksler) + 1:
+            raise ValueError("Ofset sayısı terim sayısından bir fazla olmalı!")
+        if yuvalar is None:
+            yuvalar = yuva_tablosu(baytlar, ofsetler)
+        if len(yuvalar) & (len(yuvalar) - 1) or len(yuvalar) < 2 * len(indeksler):
+            raise ValueError("Yuva tablosu terim sayısının en az iki katı, ikinin kuvveti olmalı!")
+
+        self.baytlar = baytlar
+        self.ofsetler = ofsetler
+        self.indeksler = indeksler
+        self.yuvalar = yuvalar
+
+        # Diziler memoryview ile okunur (indeksleme numpy skaleri değil int
+        # döndürür, kopya yok). Terim baytları tek bytes nesnesine kopyalanır:
+        # bytes dilimi karşılaştırması memoryview'den ~3 kat hızlıdır
+        self._veri = np.ascontiguousarray(baytlar, dtype=np.uint8).tobytes()
+        self._ofs = memoryview(np.ascontiguousarray(ofsetler, dtype=np.int64))
+        self._ind = memoryview(np.ascontiguousarray(indeksler, dtype=np.int32))
+        self._yuva = memoryview(np.ascontiguousarray(yuvalar, dtype=np.int64))
+        self._maske = len(yuvalar) - 1
+
+        self.sicak: Dict[str, int] = {}
+        self._suzgec: Optional[bytearray] = None
+        self._suzgec_maske = 0
+
+    @classmethod
+    def sozlukten(cls, sozluk: Dict[str, int]) -> "KompaktSozluk":
+        """Python sözlüğünden kompakt sözlük kurar."""
+        return cls(*terim_tablosu(sozluk))
+
+    def __reduce__(self):
+        # Bellek eşlemeli diziler pickle'da düz diziye döner; süzgeç
+        # hash() tohumuna bağlı olduğundan yeni süreçte yeniden kurulur
+        return (type(self), (
+            np.asarray(self.baytlar), np.asarray(self.ofsetler),
+            np.asarray(self.indeksler), np.asarray(self.yuvalar)
+        ), {"sicak": self.sicak, "suzgec": self._suzgec is not None})
+
+    def __setstate__(self, durum: Dict):
+        self.sicak = durum["sicak"]
+        if durum["suzgec"]:
+            self._suzgeci_kur()
+
+    # ------------------------------------------------------------
+    # Hızlandırıcı katmanlar
+    # ------------------------------------------------------------
+
+    def hizlandir(
+        self,
+        idf: Optional[np.ndarray] = None,
+        sicak_terim: Optional[int] = None,
+        suzgec: Optional[bool] = None
+    ) -> "KompaktSozluk":
+        """
+        Sıcak katmanı ve sözlük dışı süzgecini kurar.
+
+        Args:
+            idf: Özellik indeksi boyunca idf vektörü; en düşük idf'li
+                (en sık) terimler sıcak katmana alınır (None ise kurulmaz)
+            sicak_terim: Sıcak terim sayısı (None ise VOCABULARY_CONFIG["hot_terms"])
+            suzgec: Süzgeç kurulsun mu (None ise VOCABULARY_CONFIG["filter"])
+
+        Returns:
+            KompaktSozluk: self
+        """
+        sicak_terim = VOCABULARY_CONFIG.get("hot_terms", 4096) if sicak_terim is None else sicak_terim
+        self.sicak = {}
+        if idf is not None and sicak_terim > 0 and len(self):
+            secili = np.zeros(len(idf), dtype=bool)
+            secili[np.argsort(idf, kind="stable")[:sicak_terim]] = True
+            veri, ofs = self._veri, self._ofs
+            for j in np.flatnonzero(secili[np.asarray(self.indeksler)]).tolist():
+                self.sicak[veri[ofs[j]:ofs[j + 1]].decode("utf-8")] = self._ind[j]
+
+        if VOCABULARY_CONFIG.get("filter", True) if suzgec is None else suzgec:
+            self._suzgeci_kur()
+        else:
+            self._suzgec = None
+        return self
+
+    def _suzgeci_kur(self):
+        """Terimlerin hash() değerlerinden bayt süzgecini kurar."""
+        boyut = 1 << max(3, int(_SUZGEC_CARPANI * len(self) - 1).bit_length())
+        maske = boyut - 1
+        isaretler = np.zeros(boyut, dtype=np.uint8)
+        # Terimler tek tek çözülür; geçici str nesneleri birikmez
+        veri, ofs = self._veri, self._ofs
+        hashler = np.fromiter(
+            (hash(veri[ofs[j]:ofs[j + 1]].decode("utf-8")) for j in range(len(self))),
+            dtype=np.int64, count=len(self)
+        )
+        isaretler[hashler & maske] = 1
+        self._suzgec = bytearray(isaretler.tobytes())
+        self._suzgec_maske = maske
+
+    # ------------------------------------------------------------
+    # Arama
+    # ------------------------------------------------------------
+
+    def get(self, terim, varsayilan=None):
+        """Terimin özellik indeksini döndürür (sözlük dışıysa varsayilan)."""
+        indeks = self.sicak.get(terim)
+        if indeks is None:
+            indeks = self._dizide_ara(terim)
+        return varsayilan if indeks is None else indeks
+
+    def __getitem__(self, terim) -> int:
+        # sklearn transform() yolu; sıcak terimde tek çağrı
+        indeks = self.sicak.get(terim)
+        if indeks is None:
+            indeks = self._dizide_ara(terim)
+            if indeks is None:
+                raise KeyError(terim)
+        return indeks
+
+    def _dizide_ara(self, terim) -> Optional[int]:
+        """Süzgeç ve hash yuvaları üzerinden arar (sözlük dışıysa None)."""
+        # Sıcak katmandaki arama hash()'i str nesnesinde önbelleğe aldı
+        if self._suzgec is not None and not self._suzgec[hash(terim) & self._suzgec_maske]:
+            return None
+        try:
+            anahtar = terim.encode("utf-8")
+        except AttributeError:
+            return None
+        veri, ofs, yuva, maske = self._veri, self._ofs, self._yuva, self._maske
+        h = murmurhash3_32(anahtar, HASH_TOHUMU, True)
+        yer = h & maske
+        imza = h >> 1
+        deger = yuva[yer]
+        while deger != BOS_YUVA:
+            if deger >> 32 == imza:
+                j = deger & 0xFFFFFFFF
+                if veri[ofs[j]:ofs[j + 1]] == anahtar:
+                    return self._ind[j]
+            yer = (yer + 1) & maske
+            deger = yuva[yer]
+        return None
+
+    def __contains__(self, terim) -> bool:
+        return self.get(terim) is not None
+
+    def __len__(self) -> int:
+        return len(self._ind)
+
+    def terimler(self) -> List[str]:
+        """Terimleri kod noktası sırasıyla çözer."""
+        veri = self._veri
+        ofs = self._ofs.tolist()
+        return [veri[ofs[j]:ofs[j + 1]].decode("utf-8") for j in range(len(self))]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.terimler())
+
+    def items(self):
+        return zip(self.terimler(), self._ind.tolist())
+
+    def values(self):
+        return self._ind.tolist()
+
+    def bellek_boyutu(self) -> int:
+        """Dizilerin ve süzgecin toplam boyutu (bayt, sıcak katman hariç)."""
+        boyut = sum(d.nbytes for d in (self.baytlar, self.ofsetler, self.indeksler, self.yuvalar))
+        return int(boyut + (len(self._suzgec) if self._suzgec is not None else 0))
+
+    def __repr__(self) -> str:
+        return (f"KompaktSozluk({len(self):,} terim, {self.bellek_boyutu() / 2**20:.1f} MB, "
+                f"{len(self.sicak):,} sıcak terim)")
+
+
+# ============================================================
+# MODELLERE UYGULAMA
+# ============================================================
+
+def sozlukleri_kompaktla(*modeller, min_terim: Optional[int] = None) -> int:
+    """
+    Modellerin TF-IDF sözlüklerini yerinde KompaktSozluk'a çevirir.
+
+    SentimentModel ve SpamDetector pipeline'larındaki TfidfVectorizer
+    adımları çevrilir ve modelin idf'iyle hızlandırılır; hashing
+    modundaki modellerin sözlüğü yoktur. Skorlayıcı ve ortak özellik
+    çıkarıcı vocabulary_ referansını kurulumda aldığından fonksiyon
+    onlar kurulmadan çağrılmalıdır.
+
+    Args:
+        *modeller: Eğitilmiş modeller (None olanlar atlanır)
+        min_terim: Bundan küçük sözlükler dokunulmadan bırakılır
+            (None ise VOCABULARY_CONFIG["min_terms"])
+
+    Returns:
+        int: Çevrilen toplam terim sayısı
+    """
+    min_terim = VOCABULARY_CONFIG.get("min_terms", 20000) if min_terim is None else min_terim
+    cevrilen = 0
+    for model in modeller:
+        pipeline = getattr(model, "pipeline", None)
+        if pipeline is None:
+            continue
+        tfidf = pipeline.named_steps.get("tfidf")
+        sozluk = getattr(tfidf, "vocabulary_", None)
+        if not isinstance(sozluk, dict) or len(sozluk) < min_terim:
+            continue
+        tfidf.vocabulary_ = KompaktSozluk.sozlukten(sozluk).hizlandir(tfidf.idf_)
+        cevrilen += len(sozluk)
+    return cevrilen
@@ -0,0 +1,52 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Ortak Test Fixture'ları
+============================================================
+Testlerin paylaştığı sentetik yorum üreticisi ve küçük hashing
+ayarları. Proje kökü burada sys.path'e eklenir.
+"""
+
+import os
+import sys
+import random
+from typing import Callable, List, Tuple
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+KELIMELER = {
+    0: ["berbat", "kotu", "bozuk", "iade", "gec", "kirik", "rezalet", "pisman"],
+    1: ["idare", "normal", "fena", "degil", "ortalama", "fiyat", "beklenti", "olur"],
+    2: ["harika", "mukemmel", "hizli", "guzel", "kaliteli", "tavsiye", "super", "memnun"]
+}
+ORTAK = ["urun", "kargo", "satici", "paket", "renk", "beden", "siparis", "teslimat"]
+
+
+def _yorumlar(adet: int, tohum: int) -> Tuple[List[str], List[int]]:
+    """Sınıfa özgü ve ortak kelimelerden sentetik normalize yorumlar üretir."""
+    rastgele = random.Random(tohum)
+    metinler, etiketler = [], []
+    for _ in range(adet):
+        etiket = rastgele.randint(0, 2)
+        kelimeler = rastgele.choices(KELIMELER[etiket], k=rastgele.randint(1, 4))
+        kelimeler += rastgele.choices(ORTAK, k=rastgele.randint(1, 4))
+        # Sınıflar arası gürültü, olasılıklar 0/1'e yapışmasın
+        kelimeler += rastgele.choices(KELIMELER[rastgele.randint(0, 2)], k=1)
+        rastgele.shuffle(kelimeler)
+        metinler.append(" ".join(kelimeler))
+        etiketler.append(etiket)
+    return metinler, etiketler
+
+
+@pytest.fixture(scope="session")
+def yorum_uret() -> Callable[[int, int], Tuple[List[str], List[int]]]:
+    """(adet, tohum) → (metinler, etiketler) üreten fonksiyon."""
+    return _yorumlar
+
+
+@pytest.fixture(scope="session")
+def hashing_config() -> dict:
+    """Testler için küçük hash uzayı (2^16)."""
+    return {"n_features": 2 ** 16, "ngram_range": (1, 2), "alternate_sign": False}
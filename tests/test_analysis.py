@@ -0,0 +1,167 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - YorumAnalizcisi Testleri
+============================================================
+`snapshot_every` sınırını geçen isteğin sayacı diske kendisi
+yazmadığını, görüntünün arka plan iş parçacığında alındığını ve
+ön-çatallı serviste işçilerin görüntü yazmadığını doğrular.
+
+Tek yorumun (ve KUCUK_GRUP'a kadar küçük grupların) duygu skorunun
+Pipeline yerine LinearScorer ile, toplu yoldan önceki tek yorum
+yoluyla aynı sonuç ve en az onun kadar düşük gecikmeyle
+hesaplandığını doğrular.
+
+Kullanım:
+    python -m pytest tests/test_analysis.py -q
+"""
+
+import time
+import threading
+
+import numpy as np
+import pytest
+
+import src.analysis as analiz_modulu
+from src.analysis import YorumAnalizcisi
+from src.aspects import AspektMotoru
+from src.frequency_sketch import TekrarSayaci
+from src.model import SentimentModel
+from src.preprocessing import turkce_metin_normalize_et
+from src.serve import paylasima_hazirla
+
+
+class YavasSayac(TekrarSayaci):
+    """Diske yazmak yerine yavaş bir kaydı taklit eder, kaydeden iş parçacığını not alır."""
+
+    def __init__(self):
+        super().__init__(width=1024, depth=2)
+        self.kaydedenler = []
+        self.kaydedildi = threading.Event()
+
+    def save(self, path=None):
+        time.sleep(0.2)
+        self.kaydedenler.append(threading.current_thread().name)
+        self.kaydedildi.set()
+
+
+@pytest.fixture()
+def sayac(monkeypatch):
+    monkeypatch.setitem(analiz_modulu.STREAM_FREQUENCY_CONFIG, "snapshot_every", 10)
+    return YavasSayac()
+
+
+def test_goruntu_istek_is_parcaciginda_yazilmaz(sayac):
+    analizci = YorumAnalizcisi(tekrar_sayaci=sayac)
+    sayac.eklenen = 12
+
+    baslangic = time.perf_counter()
+    analizci._tekrar_sayacini_kontrol_et(onceki=8)
+    gecen = time.perf_counter() - baslangic
+
+    assert gecen < 0.1
+    assert sayac.kaydedildi.wait(2)
+    assert sayac.kaydedenler == ["tekrar-sayaci-goruntu"]
+
+    analizci.kapat()
+    assert analizci._goruntu_is_parcacigi is None
+    assert sayac.kaydedenler[-1] == threading.current_thread().name
+
+
+def test_sinir_gecilmezse_goruntu_alinmaz(sayac):
+    analizci = YorumAnalizcisi(tekrar_sayaci=sayac)
+    sayac.eklenen = 9
+
+    analizci._tekrar_sayacini_kontrol_et(onceki=8)
+
+    assert analizci._goruntu_is_parcacigi is None
+    assert sayac.kaydedenler == []
+
+
+def test_paylasilan_sayacta_isciler_goruntu_yazmaz(sayac):
+    analizci = YorumAnalizcisi(tekrar_sayaci=sayac)
+    paylasima_hazirla(analizci, gc_dondur=False)
+    sayac.eklenen = 12
+
+    analizci._tekrar_sayacini_kontrol_et(onceki=8)
+
+    assert sayac.paylasimli
+    assert not analizci.goruntu_kaydedici
+    assert analizci._goruntu_is_parcacigi is None
+    assert sayac.kaydedenler == []
+
+
+# ============================================================
+# TEK YORUM DUYGU SKORU
+# ============================================================
+
+@pytest.fixture(scope="module")
+def duygu_analizcisi(yorum_uret):
+    X, y = yorum_uret(2000, 1)
+    return YorumAnalizcisi(duygu_modeli=SentimentModel().fit(X, y))
+
+
+def eski_tek_yorum(analizci: YorumAnalizcisi, yorum: str) -> np.ndarray:
+    """Toplu yoldan önceki analiz_yap duygu adımları: normalize + n-gram + skorla."""
+    normalize = turkce_metin_normalize_et(yorum)
+    paket = analizci.ozellik_cikarici.donustur([normalize], ngram_dondur=True)
+    return analizci.duygu_skorlayici.skorla(normalize, paket["ngramlar"]["duygu"][0])[1]
+
+
+def duygu_olasiliklari(analizci: YorumAnalizcisi, yorumlar) -> np.ndarray:
+    kayitlar = analizci.analiz_kayitlari(yorumlar, spam=False, aspekt=False)
+    return np.array([list(kayit["duygu"]["olasiliklar"].values()) for kayit in kayitlar])
+
+
+def pipeline_yasak(*args, **kwargs):
+    raise AssertionError("Küçük grupta Pipeline çağrıldı")
+
+
+def test_tek_yorum_skorlayicidan_gecer(duygu_analizcisi, yorum_uret, monkeypatch):
+    yorumlar, _ = yorum_uret(50, 2)
+    beklenen_pipeline = duygu_analizcisi.duygu_modeli.predict_proba(
+        [turkce_metin_normalize_et(yorum) for yorum in yorumlar]
+    )
+    monkeypatch.setattr(duygu_analizcisi.duygu_modeli, "predict_proba", pipeline_yasak)
+    monkeypatch.setattr(duygu_analizcisi.ozellik_cikarici, "duygu_olasiliklari", pipeline_yasak)
+
+    for yorum, pipeline_olasiliklari in zip(yorumlar, beklenen_pipeline):
+        bulunan = duygu_olasiliklari(duygu_analizcisi, [yorum])[0]
+        np.testing.assert_array_equal(bulunan, eski_tek_yorum(duygu_analizcisi, yorum))
+        np.testing.assert_allclose(bulunan, pipeline_olasiliklari, rtol=0, atol=1e-12)
+
+
+def test_buyuk_grup_pipeline_kullanir(duygu_analizcisi, yorum_uret, monkeypatch):
+    yorumlar, _ = yorum_uret(AspektMotoru.KUCUK_GRUP + 8, 3)
+    cagrilar = []
+    asil = duygu_analizcisi.ozellik_cikarici.duygu_olasiliklari
+
+    def say(paket):
+        cagrilar.append(paket["duygu"].shape[0])
+        return asil(paket)
+
+    monkeypatch.setattr(duygu_analizcisi.ozellik_cikarici, "duygu_olasiliklari", say)
+    toplu = duygu_olasiliklari(duygu_analizcisi, yorumlar)
+
+    assert cagrilar == [len(set(turkce_metin_normalize_et(yorum) for yorum in yorumlar))]
+    tekli = np.vstack([eski_tek_yorum(duygu_analizcisi, yorum) for yorum in yorumlar])
+    np.testing.assert_allclose(toplu, tekli, rtol=0, atol=1e-12)
+
+
+def test_tek_yorum_gecikmesi_eski_yoldan_yuksek_degil(duygu_analizcisi, yorum_uret):
+    yorumlar, _ = yorum_uret(200, 4)
+
+    def medyan(islem) -> float:
+        for yorum in yorumlar[:20]:
+            islem(yorum)
+        sureler = []
+        for yorum in yorumlar:
+            baslangic = time.perf_counter()
+            islem(yorum)
+            sureler.append(time.perf_counter() - baslangic)
+        return float(np.median(sureler))
+
+    eski = medyan(lambda yorum: eski_tek_yorum(duygu_analizcisi, yorum))
+    yeni = medyan(lambda yorum: duygu_olasiliklari(duygu_analizcisi, [yorum]))
+
+    # Zamanlama gürültüsüne pay bırakılır; Pipeline'a düşen yol ~1.5x yavaştır
+    assert yeni < 1.25 * eski
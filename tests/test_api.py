@@ -0,0 +1,64 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - REST API İstek Doğrulama Testleri
+============================================================
+Tekil ve toplu uç noktaların yorum başına aynı uzunluk sınırlarını
+uyguladığını doğrular. Modeller yüklenmez: geçerli istekler 503,
+geçersiz istekler model kontrolünden önce 422 döndürür.
+
+Kullanım:
+    python -m pytest tests/test_api.py -q
+"""
+
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis import YorumAnalizcisi
+from src.api import API_CONFIG, uygulama_olustur
+
+
+TEKIL = ["/analyze", "/spam", "/sentiment", "/aspects"]
+TOPLU = [f"{yol}/batch" for yol in TEKIL]
+UZUN = "a" * (API_CONFIG["max_text_length"] + 1)
+
+
+@pytest.fixture(scope="module")
+def istemci():
+    with TestClient(uygulama_olustur(analizci=YorumAnalizcisi())) as istemci:
+        yield istemci
+
+
+@pytest.mark.parametrize("yol", TEKIL)
+@pytest.mark.parametrize("yorum", ["", UZUN], ids=["bos", "uzun"])
+def test_tekil_gecersiz_yorum(istemci, yol, yorum):
+    assert istemci.post(yol, json={"yorum": yorum}).status_code == 422
+
+
+@pytest.mark.parametrize("yol", TOPLU)
+@pytest.mark.parametrize("yorum", ["", UZUN], ids=["bos", "uzun"])
+def test_toplu_gecersiz_oge(istemci, yol, yorum):
+    yanit = istemci.post(yol, json={"yorumlar": ["guzel urun", yorum]})
+
+    assert yanit.status_code == 422
+    assert yanit.json()["detail"][0]["loc"] == ["body", "yorumlar", 1]
+
+
+@pytest.mark.parametrize("yol", TOPLU)
+def test_toplu_liste_boyutu(istemci, yol):
+    assert istemci.post(yol, json={"yorumlar": []}).status_code == 422
+    fazla = ["guzel urun"] * (API_CONFIG["max_batch_size"] + 1)
+    assert istemci.post(yol, json={"yorumlar": fazla}).status_code == 422
+
+
+@pytest.mark.parametrize("yol", TOPLU)
+def test_toplu_gecerli_istek_dogrulamadan_gecer(istemci, yol):
+    sinirda = "a" * API_CONFIG["max_text_length"]
+    yanit = istemci.post(yol, json={"yorumlar": ["guzel urun", sinirda]})
+
+    # Doğrulama geçti; modeller yüklü olmadığı için 503
+    assert yanit.status_code == 503
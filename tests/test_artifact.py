@@ -0,0 +1,132 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Model Artefaktı Testleri
+============================================================
+Artefakttan yüklenen modellerin joblib kaydıyla aynı tahminleri
+verdiğini ve yalnızca çıkarım için kullanılabildiğini doğrular:
+artımlı eğitim açık bir ValueError ile reddedilir (salt okunur
+eşlenmiş katsayılar üzerinde SGD güncellemesi yapılmaz).
+
+İçerik özetinin kayıtta manifeste yazıldığını ve sonuç önbelleği
+sürümünün dizileri okumadan bu özetten üretildiğini de doğrular.
+
+Kullanım:
+    python -m pytest tests/test_artifact.py -q
+"""
+
+import os
+import json
+
+import numpy as np
+import pytest
+
+import src.analysis as analiz_modulu
+from src.analysis import YorumAnalizcisi, model_surumu
+from src.artifact import MANIFEST, artefakt_ozeti
+from src.model import SentimentModel
+
+
+@pytest.fixture(scope="module")
+def artimli_model(yorum_uret, hashing_config):
+    X, y = yorum_uret(400, 3)
+    model = SentimentModel(incremental=True, hashing_config=hashing_config)
+    model.partial_fit(X[:200], y[:200])
+    model.partial_fit(X[200:], y[200:])
+    return model
+
+
+@pytest.fixture()
+def artefakt_modeli(artimli_model, tmp_path):
+    return SentimentModel.load(artimli_model.save_artifact(str(tmp_path / "duygu")))
+
+
+def test_artefakt_tahminleri_ayni(artimli_model, artefakt_modeli, yorum_uret):
+    metinler, _ = yorum_uret(100, 4)
+
+    np.testing.assert_allclose(
+        artefakt_modeli.predict_proba(metinler), artimli_model.predict_proba(metinler), rtol=0, atol=1e-12
+    )
+    assert artefakt_modeli.yalnizca_cikarim
+    assert not artimli_model.yalnizca_cikarim
+
+
+def test_artefakt_modeli_artimli_egitilemez(artefakt_modeli, yorum_uret):
+    X, y = yorum_uret(50, 5)
+    katsayilar = np.array(artefakt_modeli.pipeline.named_steps["classifier"].coef_)
+
+    with pytest.raises(ValueError, match="yalnızca çıkarım"):
+        artefakt_modeli.partial_fit(X, y)
+    with pytest.raises(ValueError, match="yalnızca çıkarım"):
+        artefakt_modeli.fit_incremental([(X, y)])
+
+    np.testing.assert_array_equal(artefakt_modeli.pipeline.named_steps["classifier"].coef_, katsayilar)
+
+
+def test_joblib_kaydi_egitime_devam_eder(artimli_model, tmp_path, yorum_uret):
+    yol = str(tmp_path / "duygu.pkl")
+    artimli_model.save(yol)
+    model = SentimentModel.load(yol)
+    X, y = yorum_uret(50, 5)
+
+    model.partial_fit(X, y)
+
+    assert model._belge_sayisi == artimli_model._belge_sayisi + len(X)
+
+
+def test_artefakt_modeli_fit_ile_yeniden_kurulur(artefakt_modeli, yorum_uret):
+    X, y = yorum_uret(200, 6)
+
+    artefakt_modeli.fit(X, y)
+
+    assert not artefakt_modeli.yalnizca_cikarim
+    assert artefakt_modeli.pipeline.named_steps["classifier"].coef_.flags.writeable
+    artefakt_modeli.partial_fit(X[:50], y[:50])
+
+
+def test_icerik_ozeti_kayitta_yazilir(artimli_model, tmp_path, yorum_uret):
+    ilk = artimli_model.save_artifact(str(tmp_path / "ilk"))
+    ikinci = artimli_model.save_artifact(str(tmp_path / "ikinci"))
+    X, y = yorum_uret(200, 9)
+    farkli = SentimentModel(featurizer="tfidf").fit(X, y).save_artifact(str(tmp_path / "farkli"))
+
+    assert artefakt_ozeti(ilk) is not None
+    assert artefakt_ozeti(ilk) == artefakt_ozeti(ikinci)
+    assert artefakt_ozeti(ilk) != artefakt_ozeti(farkli)
+    assert model_surumu(ilk) == model_surumu(ikinci)
+    assert model_surumu(ilk) != model_surumu(farkli)
+
+
+def test_model_surumu_dizileri_okumaz(artimli_model, tmp_path):
+    yol = artimli_model.save_artifact(str(tmp_path / "duygu"))
+    surum = model_surumu(yol)
+
+    # Diziler değişse de sürüm yalnızca manifestteki özetten gelir
+    for ad in os.listdir(yol):
+        if ad.endswith(".npy"):
+            with open(os.path.join(yol, ad), "r+b") as dosya:
+                dosya.seek(-1, os.SEEK_END)
+                dosya.write(b"\xff")
+    assert model_surumu(yol) == surum
+
+    with open(os.path.join(yol, MANIFEST), encoding="utf-8") as dosya:
+        manifest = json.load(dosya)
+    manifest["ozet"] = "0" * 32
+    with open(os.path.join(yol, MANIFEST), "w", encoding="utf-8") as dosya:
+        json.dump(manifest, dosya)
+    assert model_surumu(yol) != surum
+
+
+def test_onbelleksiz_yuklemede_surum_hesaplanmaz(artimli_model, tmp_path, monkeypatch):
+    yol = artimli_model.save_artifact(str(tmp_path / "duygu"))
+
+    def surum_yasak(*yollar):
+        raise AssertionError("Önbellek yokken model_surumu çağrıldı")
+
+    monkeypatch.setattr(analiz_modulu, "model_surumu", surum_yasak)
+    analizci = YorumAnalizcisi.yukle(
+        duygu_yolu=yol, spam_yolu=str(tmp_path / "yok.pkl"),
+        tekrar_sayaci=False, mikro_gruplama=False, onbellek=False
+    )
+
+    assert analizci.duygu_modeli is not None
+    assert analizci.onbellek is None
@@ -0,0 +1,92 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Artımlı Eğitim Testleri
+============================================================
+SentimentModel(incremental=True) ile parça parça eğitimi doğrular:
+IDF ısınmadan sonra dondurulur, belge sayaçları birikmeye devam
+eder ve toplu (LogisticRegression) model artımlı eğitilemez.
+compact() budanmış sözlükle tutarlı bir vektörizör kurar;
+save(compact=True) canlı modeli değil kopyasını sıkıştırır.
+
+Kullanım:
+    python -m pytest tests/test_model.py -q
+"""
+
+import numpy as np
+import pytest
+
+import src.model as model_modulu
+from src.model import SentimentModel
+
+
+def idf_gecmisi(yorum_uret, hashing_config: dict, parca_sayisi: int) -> list:
+    """200'lük parçalarla eğitir, her parçadan sonraki idf_ kopyasını döndürür."""
+    X, y = yorum_uret(200 * parca_sayisi, 7)
+    model = SentimentModel(incremental=True, hashing_config=hashing_config)
+    gecmis = []
+    for baslangic in range(0, len(X), 200):
+        model.partial_fit(X[baslangic:baslangic + 200], y[baslangic:baslangic + 200])
+        gecmis.append(model.pipeline.named_steps["tfidf"].idf_.copy())
+    assert model._belge_sayisi == len(X)
+    assert model._df_sayilari.sum() > 0
+    return gecmis
+
+
+def test_idf_isinmadan_sonra_donar(monkeypatch, yorum_uret, hashing_config):
+    monkeypatch.setitem(model_modulu.INCREMENTAL_CONFIG, "idf_warmup_docs", 400)
+    gecmis = idf_gecmisi(yorum_uret, hashing_config, 4)
+
+    # İlk iki parça (400 belge) IDF'i günceller, sonrakiler değiştirmez
+    assert not np.array_equal(gecmis[0], gecmis[1])
+    np.testing.assert_array_equal(gecmis[1], gecmis[2])
+    np.testing.assert_array_equal(gecmis[1], gecmis[3])
+
+
+def test_idf_dondurulmadan_her_parcada_guncellenir(monkeypatch, yorum_uret, hashing_config):
+    monkeypatch.setitem(model_modulu.INCREMENTAL_CONFIG, "idf_warmup_docs", None)
+    gecmis = idf_gecmisi(yorum_uret, hashing_config, 3)
+
+    assert not np.array_equal(gecmis[1], gecmis[2])
+
+
+def test_toplu_model_artimli_egitilemez(yorum_uret):
+    X, y = yorum_uret(100, 8)
+    model = SentimentModel(featurizer="tfidf").fit(X, y)
+
+    with pytest.raises(ValueError, match="incremental=True"):
+        model.partial_fit(X, y)
+
+
+def test_compact_vektorizoru_tutarli_kurar(yorum_uret):
+    X, y = yorum_uret(600, 9)
+    model = SentimentModel(featurizer="tfidf").fit(X, y)
+    parametreler = model.pipeline.named_steps["tfidf"].get_params()
+
+    model.compact(min_weight=0.05)
+
+    tfidf = model.pipeline.named_steps["tfidf"]
+    katsayilar = model.pipeline.named_steps["classifier"].coef_
+    assert len(tfidf.vocabulary_) == len(tfidf.idf_) == katsayilar.shape[1]
+    assert tfidf.transform(X[:5]).shape[1] == katsayilar.shape[1]
+    # Parametrelerde yalnızca dtype değişir, sözlük ikinci kez saklanmaz
+    parametreler["dtype"] = np.float32
+    assert tfidf.get_params() == parametreler
+
+
+def test_sikistirarak_kaydetmek_canli_modeli_degistirmez(yorum_uret, tmp_path, monkeypatch):
+    monkeypatch.setitem(model_modulu.COMPACTION_CONFIG, "min_weight", 0.05)
+    X, y = yorum_uret(600, 10)
+    model = SentimentModel(featurizer="tfidf").fit(X, y)
+    olasiliklar = model.predict_proba(X)
+    ozellik = model.ozellik_sayisi()
+    yol = str(tmp_path / "duygu.pkl")
+
+    rapor = model.save(yol, compact=True)
+
+    assert not model.compacted
+    assert model.ozellik_sayisi() == ozellik
+    np.testing.assert_array_equal(model.predict_proba(X), olasiliklar)
+    kayitli = SentimentModel.load(yol)
+    assert kayitli.compacted
+    assert kayitli.ozellik_sayisi() == rapor["ozellik_sonra"] < ozellik
+    assert model.save(yol) is None
@@ -0,0 +1,65 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Yakın Kopya İndeksi Testleri
+============================================================
+Saklanan küme imzasının eğitimde üyeliği belirleyen temsilcinin
+(en çok bağlantılı üye) imzası olduğunu ve eğitim üyelerinin
+sorguda kendi kümelerine döndüğünü doğrular.
+
+Kullanım:
+    python -m pytest tests/test_near_duplicate.py -q
+"""
+
+import random
+
+import numpy as np
+
+from src.near_duplicate import YakinKopyaIndeksi
+
+
+def kampanya_metinleri(tohum: int):
+    """
+    Merkez metin ve türevleri: ilk metin baştaki, diğerleri sondaki
+    kelimeleri değiştirir. İlk metin diğer türevlere uzaktır; temsilci
+    onlardan biri veya merkez olur.
+    """
+    rastgele = random.Random(tohum)
+
+    def kelime() -> str:
+        return "".join(rastgele.choice("abcdefghijklmnoprstuvyz") for _ in range(6))
+
+    merkez = [kelime() for _ in range(20)]
+
+    def turev(baslangic: int, bitis: int) -> str:
+        kelimeler = list(merkez)
+        for i in range(baslangic, bitis):
+            kelimeler[i] = kelime()
+        return " ".join(kelimeler)
+
+    return [turev(0, 4)] + [turev(16, 20) for _ in range(6)] + [" ".join(merkez)]
+
+
+def test_egitim_uyeleri_kendi_kumesine_doner():
+    metinler = kampanya_metinleri(tohum=2)
+    indeks = YakinKopyaIndeksi()
+    boyutlar = indeks.fit(metinler)
+
+    assert (boyutlar == len(metinler)).all()
+    sonuc = indeks.sorgula_toplu(metinler)
+    np.testing.assert_array_equal(sonuc["kume"], 0)
+    np.testing.assert_array_equal(sonuc["boyut"], boyutlar)
+    assert (sonuc["benzerlik"] >= indeks.cluster_threshold).all()
+
+
+def test_kume_imzasi_temsilcinin_imzasidir():
+    metinler = kampanya_metinleri(tohum=2)
+    indeks = YakinKopyaIndeksi()
+    indeks.fit(metinler)
+
+    imzalar, _ = indeks.imzalar(metinler)
+    # En düşük indeksli (uçtaki) üyenin değil, tüm üyelere yeterince
+    # yakın olan temsilcinin imzası saklanır
+    assert not np.array_equal(indeks.kume_imzalari[0], imzalar[0])
+    assert any(np.array_equal(indeks.kume_imzalari[0], imza) for imza in imzalar[1:])
+    benzerlik = (imzalar == indeks.kume_imzalari[0]).mean(axis=1)
+    assert (benzerlik >= indeks.cluster_threshold).all()
@@ -0,0 +1,149 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - Eğitim Parçaları Testleri
+============================================================
+egitim_parcalari()'nın metin/etiket sütunlarını dosya başına bir
+kez şemadan aldığını, farklı sütun adlı dosyaları paralel okurken
+karıştırmadığını ve sütunu bulunamayan dosyada okumadan önce
+ValueError verdiğini doğrular. csv_semasi()'nın sütun tespitini
+dosyanın başından değil, tamamından alınan tohumlu ve sınırlı bir
+rastgele örnek üzerinde yaptığını da doğrular.
+
+Kullanım:
+    python -m pytest tests/test_preprocessing.py -q
+"""
+
+import pandas as pd
+import pytest
+
+import src.preprocessing as on_isleme
+import src.utils as yardimcilar
+from src.preprocessing import (
+    csv_semasi, egitim_parcalari, korpus_onbellegine_yaz, korpus_onbellegini_oku, normalize_batch
+)
+from src.utils import metin_tablosu_olustur, metin_tablosunu_ac
+
+
+def csv_yaz(yol, metin_sutunu: str, etiket_sutunu: str, metinler, etiketler):
+    pd.DataFrame({metin_sutunu: metinler, etiket_sutunu: etiketler}).to_csv(yol, index=False)
+
+
+def test_sutunlar_dosya_basina_semadan_alinir(tmp_path, yorum_uret):
+    metinler, etiketler = yorum_uret(300, 11)
+    csv_yaz(tmp_path / "a.csv", "yorum", "duygu", metinler[:150], etiketler[:150])
+    csv_yaz(tmp_path / "b.csv", "text", "label", metinler[150:], etiketler[150:])
+
+    parcalar = list(egitim_parcalari(str(tmp_path), chunksize=50, n_jobs=2))
+
+    bulunan = sorted(zip(
+        (m for metin_listesi, _ in parcalar for m in metin_listesi),
+        (e for _, etiket_listesi in parcalar for e in etiket_listesi)
+    ))
+    assert bulunan == sorted(zip(normalize_batch(metinler), etiketler))
+
+
+def test_sutunu_olmayan_dosya_okumadan_once_reddedilir(tmp_path, yorum_uret):
+    metinler, etiketler = yorum_uret(100, 12)
+    csv_yaz(tmp_path / "a.csv", "yorum", "duygu", metinler, etiketler)
+    csv_yaz(tmp_path / "b.csv", "aciklama", "label", metinler, etiketler)
+
+    with pytest.raises(ValueError, match="b.csv"):
+        next(egitim_parcalari(str(tmp_path), chunksize=50))
+
+
+@pytest.fixture()
+def sema_ornekleri(monkeypatch):
+    """Örnek boyutunu 200'e indirir, sütun tespitine giden satırların "sira" değerlerini toplar."""
+    monkeypatch.setattr(on_isleme, "SEMA_ORNEK_BOYUTU", 200)
+    ornekler = []
+    asil = on_isleme.metin_sutunu_bul
+
+    def yakala(veri_cercevesi, **kwargs):
+        ornekler.append(veri_cercevesi["sira"].tolist())
+        return asil(veri_cercevesi, **kwargs)
+
+    monkeypatch.setattr(on_isleme, "metin_sutunu_bul", yakala)
+    return ornekler
+
+
+def test_sema_ornegi_dosyanin_tamamindan_alinir(tmp_path, yorum_uret, sema_ornekleri):
+    metinler, etiketler = yorum_uret(2000, 13)
+    yol = tmp_path / "a.csv"
+    pd.DataFrame({"sira": range(2000), "yorum": metinler, "duygu": etiketler}).to_csv(yol, index=False)
+
+    sema = csv_semasi(str(yol))
+    csv_semasi(str(yol), yenile=True)
+
+    assert sema["metin_sutunu"] == "yorum"
+    assert len(sema_ornekleri[0]) == 200
+    assert len(set(sema_ornekleri[0])) == 200
+    # İlk 200 satır değil, dosyanın sonuna kadar yayılmış tohumlu örnek
+    assert sema_ornekleri[0] != list(range(200))
+    assert max(sema_ornekleri[0]) >= 1800
+    assert sema_ornekleri[0] == sema_ornekleri[1]
+
+
+def test_kucuk_dosyada_tum_satirlar_okunur(tmp_path, yorum_uret, sema_ornekleri):
+    metinler, etiketler = yorum_uret(100, 14)
+    yol = tmp_path / "a.csv"
+    pd.DataFrame({"sira": range(100), "yorum": metinler, "duygu": etiketler}).to_csv(yol, index=False)
+
+    csv_semasi(str(yol))
+
+    assert sema_ornekleri == [list(range(100))]
+
+
+def test_pyarrow_bloklari_ayni_tipte_okunur(tmp_path, yorum_uret):
+    pytest.importorskip("pyarrow")
+    metinler, etiketler = yorum_uret(40000, 15)
+    # İlk blokta tamsayı görünen etiketler sonradan metinsel olur;
+    # pyarrow tipi ilk bloktan çıkarır
+    etiketler = [str(e) if i < 30000 else ["olumsuz", "notr", "olumlu"][e] for i, e in enumerate(etiketler)]
+    csv_yaz(tmp_path / "a.csv", "yorum", "duygu", metinler, etiketler)
+
+    parcalar = list(on_isleme.akilli_csv_oku_parcali(str(tmp_path / "a.csv"), chunksize=5000, engine="pyarrow"))
+
+    assert len(parcalar) > 1
+    assert sum(len(parca) for parca in parcalar) == 40000
+    assert all(parca["duygu"].map(type).eq(str).all() for parca in parcalar)
+
+
+
+def test_metin_tablosu_vekil_karakterleri_korur():
+    # Yarım kalmış emoji çifti (eşsiz vekil) strict UTF-8 ile kodlanamaz
+    metinler = ["harika \ud83d urun", "", "Kargo hızlı 😍", "\udc80"]
+
+    assert metin_tablosunu_ac(*metin_tablosu_olustur(metinler)) == metinler
+
+
+def test_korpus_onbellegi_vekil_karakterle_yazilir(tmp_path, monkeypatch, capsys):
+    monkeypatch.setitem(on_isleme.CORPUS_CACHE_CONFIG, "dir", str(tmp_path))
+    veri = pd.DataFrame({
+        "ham_metin": ["harika \ud83d urun", "Kargo hızlı 😍"],
+        "metin": ["harika \ud83d urun", "kargo hizli"],
+        "duygu": [2, 2]
+    }, dtype=object)
+
+    korpus_onbellegine_yaz("a" * 64, veri)
+    assert "Korpus önbelleğe yazıldı" in capsys.readouterr().out
+
+    # pyarrow destekli string sütunları vekil tutamaz; o durumda okuma
+    # hata vermeden önbellek ıskalaması olur
+    okunan = korpus_onbellegini_oku("a" * 64)
+    if okunan is not None:
+        assert okunan["ham_metin"].tolist() == veri["ham_metin"].tolist()
+
+
+def test_korpus_onbellegi_yazilamazsa_devam_edilir(tmp_path, monkeypatch, capsys):
+    monkeypatch.setitem(on_isleme.CORPUS_CACHE_CONFIG, "dir", str(tmp_path))
+
+    def kodlanamaz(metinler):
+        raise UnicodeEncodeError("utf-8", "\ud83d", 0, 1, "surrogates not allowed")
+
+    monkeypatch.setattr(yardimcilar, "metin_tablosu_olustur", kodlanamaz)
+    veri = pd.DataFrame({"ham_metin": ["a", "b"], "metin": ["a", "b"], "duygu": [1, 2]})
+
+    korpus_onbellegine_yaz("b" * 64, veri)
+
+    assert "Korpus önbelleği yazılamadı" in capsys.readouterr().out
+    assert korpus_onbellegini_oku("b" * 64) is None
@@ -0,0 +1,79 @@
+"""
+============================================================
+Türkçe E-Ticaret Yorum Analizi - LinearScorer Parite Testleri
+============================================================
+Derlenmiş skorlayıcının olasılıklarının ve etiketlerinin
+SentimentModel Pipeline'ı ile aynı olduğunu doğrular: TF-IDF,
+hashing, artımlı (SGD) ve compact() ile sıkıştırılmış modeller.
+
+Kullanım:
+    python -m pytest tests/test_scorer.py -q
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from src.model import SentimentModel
+from src.scorer import LinearScorer
+
+
+# float64 modellerde fark ~1e-16; compact() float32'ye çevirdiği için ~1e-7
+TOLERANS = 1e-12
+TOLERANS_FLOAT32 = 1e-5
+
+
+@pytest.fixture(scope="module")
+def veri(yorum_uret):
+    egitim = yorum_uret(600, 1)
+    kontrol, _ = yorum_uret(200, 2)
+    # Sözlük dışı terimler ve boş metin de kontrol edilir
+    kontrol += ["", "tamamen bilinmeyen kelimeler", "harika xyzq kargo"]
+    return egitim, kontrol
+
+
+def modeli_egit(tur: str, egitim: Tuple[List[str], List[int]], hashing_config: dict) -> SentimentModel:
+    """Türüne göre küçük bir model eğitir."""
+    X, y = egitim
+    if tur == "artimli":
+        model = SentimentModel(incremental=True, hashing_config=hashing_config)
+        for baslangic in range(0, len(X), 200):
+            model.partial_fit(X[baslangic:baslangic + 200], y[baslangic:baslangic + 200])
+        return model
+    featurizer = "hashing" if tur == "hashing" else "tfidf"
+    return SentimentModel(featurizer=featurizer, hashing_config=hashing_config).fit(X, y)
+
+
+def pariteyi_dogrula(model: SentimentModel, metinler: List[str], tolerans: float):
+    """Skorlayıcı olasılıkları ve etiketleri Pipeline ile eşleşmeli."""
+    skorlayici = LinearScorer.from_model(model)
+    beklenen = model.predict_proba(metinler)
+    bulunan = skorlayici.predict_proba(metinler)
+
+    assert bulunan.shape == beklenen.shape
+    np.testing.assert_allclose(bulunan, beklenen, rtol=0, atol=tolerans)
+    np.testing.assert_array_equal(skorlayici.predict(metinler), model.predict(metinler))
+
+
+@pytest.mark.parametrize("tur", ["tfidf", "hashing", "artimli"])
+def test_pipeline_paritesi(veri, hashing_config, tur):
+    egitim, kontrol = veri
+    pariteyi_dogrula(modeli_egit(tur, egitim, hashing_config), kontrol, TOLERANS)
+
+
+@pytest.mark.parametrize("tur", ["tfidf", "hashing", "artimli"])
+def test_sikistirilmis_model_paritesi(veri, hashing_config, tur):
+    egitim, kontrol = veri
+    model = modeli_egit(tur, egitim, hashing_config)
+    model.compact(min_weight=0.05)
+    assert model.compacted
+
+    pariteyi_dogrula(model, kontrol, TOLERANS_FLOAT32)
+
+
+def test_bos_girdi(veri, hashing_config):
+    egitim, _ = veri
+    skorlayici = LinearScorer.from_model(modeli_egit("tfidf", egitim, hashing_config))
+
+    assert skorlayici.predict_proba([]).shape == (0, 3)